@@ -0,0 +1,74 @@
+import threading
+import time
+
+class AlgorithmJob:
+    """Classe permettant d'exécuter un algorithme de traitement de maillage dans un thread secondaire"""
+
+    def __init__(self, object_name, algorithm_factory):
+        # Nom de l'objet Blender sur lequel les résultats de l'algorithme seront appliqués
+        self.object_name = object_name
+        # Fonction (sans paramètre) retournant une instance de l'algorithme à exécuter (Router ou PyMeshApi)
+        self.algorithm_factory = algorithm_factory
+        # Structure de données résultante de l'algorithme
+        self.result = None
+        # Profil de l'algorithme (durées des phases en nanosecondes et compteurs)
+        self.profile = None
+        # Eventuelle exception levée lors de l'exécution de l'algorithme
+        self.error = None
+        # Instance de l'algorithme en cours d'exécution (permet de suivre son avancement et de l'interrompre)
+        self.algorithm = None
+        # Evènement permettant de signaler l'annulation de la tâche
+        self.cancel_event = threading.Event()
+        self.start_time = None
+        self.end_time = None
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self):
+        """Lancement de l'exécution de l'algorithme dans le thread secondaire"""
+        self.start_time = time.perf_counter()
+        self.thread.start()
+
+    def run(self):
+        """Instanciation et exécution de l'algorithme (exécutée dans le thread secondaire)"""
+        try:
+            algorithm = self.algorithm_factory()
+            self.algorithm = algorithm
+            # Les données du maillage ayant été récupérées au préalable, il est inutile de démarrer l'algorithme
+            # si l'utilisateur a annulé la tâche entre temps
+            if not self.cancel_event.is_set():
+                algorithm.init()
+                self.result = algorithm.get_result()
+                profile = getattr(algorithm, "profile", None)
+                if profile is not None:
+                    self.profile = {"phases": dict(profile["phases"]), "counters": dict(profile["counters"])}
+        except Exception as err:
+            self.error = err
+        self.end_time = time.perf_counter()
+
+    def cancel(self):
+        """Demande d'annulation de la tâche : les résultats de l'algorithme seront ignorés. Les algorithmes natifs (et les enchaînements)
+        sont de plus interrompus au plus tôt"""
+        self.cancel_event.set()
+        algorithm = self.algorithm
+        if algorithm is not None and hasattr(algorithm, "cancel"):
+            algorithm.cancel()
+
+    def progress(self):
+        """Avancement de l'algorithme ({"fraction", "stage", "counters", ...}) ou None si l'algorithme ne le fournit pas"""
+        algorithm = self.algorithm
+        if algorithm is None:
+            return None
+        return getattr(algorithm, "progress", None)
+
+    def is_cancelled(self):
+        return self.cancel_event.is_set()
+
+    def is_finished(self):
+        return self.end_time is not None
+
+    def elapsed_time(self):
+        """Temps écoulé (en secondes) depuis le lancement de la tâche"""
+        if self.start_time is None:
+            return 0.0
+        end_time = self.end_time if self.end_time is not None else time.perf_counter()
+        return end_time - self.start_time
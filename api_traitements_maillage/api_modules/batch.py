@@ -0,0 +1,292 @@
+"""Traitement par lots (en dehors de Blender) des maillages d'un dossier à l'aide d'un algorithme de config.json.
+
+Les paramètres de l'algorithme sont lus dans une configuration exportée depuis l'extension (bouton "Sauvegarder") : les propriétés
+absentes de la configuration conservent leur valeur par défaut. Les fichiers PLY, OBJ et OFF du dossier d'entrée sont traités en
+parallèle par un ensemble de processus ; les maillages résultants sont écrits dans le dossier de sortie et l'état de chaque fichier
+(durées, compteurs, erreur éventuelle) est ajouté au manifeste JSONL du dossier de sortie au fur et à mesure. Une exécution
+interrompue peut être reprise : les fichiers déjà traités avec la même configuration sont ignorés.
+
+Exemple (depuis le dossier api_traitements_maillage) :
+    python -m api_modules.batch scans/ resultats/ --configuration simplification.json --workers 8
+"""
+import argparse
+import concurrent.futures
+import hashlib
+import json
+import os
+import sys
+import time
+
+from api_modules import registry
+
+# Extensions des fichiers traités
+MESH_EXTENSIONS = (".ply", ".obj", ".off")
+# Nom du manifeste écrit dans le dossier de sortie
+MANIFEST_NAME = "manifest.jsonl"
+# Extensions des fichiers pouvant être projetés en mémoire par le module natif (fichiers binaires)
+NATIVE_EXTENSIONS = (".ply", ".off")
+# Opérations de préparation des données nécessitant les faces du maillage
+FACE_INPUTS = ("triangulation", "face_indices", "loop_triangles", "native_repair")
+# Distance de fusion des sommets lors de la réparation native des maillages (opération "native_repair")
+REPAIR_TOLERANCE = 1e-4
+
+
+def list_meshes(input_directory, recursive=False):
+    """Liste (triée) des chemins relatifs des maillages du dossier d'entrée"""
+    paths = []
+    for root, directories, files in os.walk(input_directory):
+        directories.sort()
+        for file in files:
+            if file.lower().endswith(MESH_EXTENSIONS):
+                paths.append(os.path.relpath(os.path.join(root, file), input_directory))
+        if not recursive:
+            break
+    return sorted(paths)
+
+
+def load_configuration(path, algorithm_name=None):
+    """Lecture d'une configuration exportée depuis l'extension ({"algorithm": ..., "properties": {...}}). L'algorithme peut être
+    précisé (ou remplacé) par algorithm_name"""
+    configuration = {"algorithm": algorithm_name, "properties": {}}
+    if path is not None:
+        with open(path, encoding="utf-8") as f:
+            configuration.update(json.load(f))
+        if algorithm_name is not None:
+            configuration["algorithm"] = algorithm_name
+    if configuration["algorithm"] is None:
+        raise RuntimeError("Aucun algorithme n'est précisé (option --algorithm ou champ 'algorithm' de la configuration).")
+    configuration["algorithm"] = configuration["algorithm"].lower()
+    configuration.setdefault("properties", {})
+    return configuration
+
+
+def get_configuration_signature(configuration):
+    """Empreinte de la configuration : un fichier n'est considéré comme traité que s'il l'a été avec la même configuration"""
+    text = json.dumps(configuration, sort_keys=True)
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+def read_manifest(manifest_path):
+    """Lecture du manifeste : dernier état connu de chaque fichier (les lignes incomplètes d'une exécution interrompue sont ignorées)"""
+    records = {}
+    if not os.path.exists(manifest_path):
+        return records
+    with open(manifest_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            records[record["file"]] = record
+    return records
+
+
+def read_mesh(path, native=False):
+    """Lecture d'un maillage (PLY, OBJ ou OFF) : retourne les tableaux des sommets, des faces et des éventuelles couleurs des sommets.
+    Pour un algorithme natif (native), les fichiers PLY et OFF binaires sont projetés en mémoire par le module natif (les tableaux sont
+    alors des vues en lecture seule sur le fichier, lues sans copie par l'algorithme) ; les autres fichiers sont lus à l'aide de MeshLab"""
+    if native and path.lower().endswith(NATIVE_EXTENSIONS):
+        from api_modules.algorithms_api import read_mesh_file
+        try:
+            return read_mesh_file(path)
+        except ValueError:
+            # Fichier texte ou maillage non triangulaire : lecture par MeshLab
+            pass
+    import pymeshlab
+    import numpy as np
+    ms = pymeshlab.MeshSet()
+    ms.load_new_mesh(path)
+    mesh = ms.current_mesh()
+    data = {"vertices": np.ravel(mesh.vertex_matrix(), order="C"),
+            "faces": np.ravel(mesh.face_matrix(), order="C")}
+    if mesh.has_vertex_color():
+        data["vertex_color"] = np.ravel(mesh.vertex_color_matrix(), order="C")
+    return data
+
+
+def write_mesh(path, vertices, faces, vertex_color=None, face_color=None, native=False):
+    """Ecriture d'un maillage (le format est déduit de l'extension du fichier). Pour un algorithme natif (native), les fichiers PLY
+    sont écrits (en binaire) par le module natif directement à partir des tableaux résultants"""
+    import numpy as np
+    if native and path.lower().endswith(".ply"):
+        from api_modules.algorithms_api import write_mesh_file
+        write_mesh_file(path, np.asarray(vertices), np.asarray(faces), vertex_color, face_color)
+        return
+    import pymeshlab
+    mesh_arrays = {"vertex_matrix": np.reshape(np.asarray(vertices, dtype=np.float64), (-1, 3)),
+                   "face_matrix": np.reshape(np.asarray(faces, dtype=np.int32), (-1, 3))}
+    if vertex_color is not None:
+        mesh_arrays["v_color_matrix"] = np.reshape(np.asarray(vertex_color, dtype=np.float64), (-1, 4))
+    if face_color is not None:
+        mesh_arrays["f_color_matrix"] = np.reshape(np.asarray(face_color, dtype=np.float64), (-1, 4))
+    ms = pymeshlab.MeshSet()
+    ms.add_mesh(pymeshlab.Mesh(**mesh_arrays))
+    ms.save_current_mesh(path)
+
+
+def create_algorithm(algorithm, data):
+    """Instanciation de l'algorithme (Router pour les algorithmes natifs, PyMeshApi pour les algorithmes MeshLab)"""
+    if algorithm["language_id"] == 1:
+        from api_modules.py_mesh import PyMeshApi
+        return PyMeshApi(data)
+    from api_modules.algorithms_api import Router
+    return Router(algorithm["id_name"], data)
+
+
+def write_results(results, mesh_data, output_base, output_extension, native=False):
+    """Ecriture des maillages résultants : retourne la liste des fichiers écrits"""
+    outputs = []
+    output_results = results.get("output_result", [])
+    vertices = results["vertices"] if "replace_mesh" in output_results else mesh_data["vertices"]
+    faces = results["faces"] if "replace_mesh" in output_results else mesh_data["faces"]
+    vertex_color = results.get("colors", None) if "vertex_coloration" in output_results else None
+    face_color = results.get("colors", None) if "face_coloration" in output_results else None
+    # Le maillage traité n'est écrit que s'il a été modifié (géométrie ou couleurs)
+    if "replace_mesh" in output_results or vertex_color is not None or face_color is not None:
+        path = output_base + output_extension
+        write_mesh(path, vertices, faces, vertex_color, face_color, native)
+        outputs.append(path)
+    if "add_mesh" in output_results:
+        path = output_base + results.get("name_suffix", "_result") + output_extension
+        write_mesh(path, results["vertices"], results["faces"], native=native)
+        outputs.append(path)
+    if "lod_meshes" in output_results:
+        for level in results.get("levels", []):
+            path = output_base + level["name_suffix"] + output_extension
+            write_mesh(path, level["vertices"], level["faces"], native=native)
+            outputs.append(path)
+    if "segment_meshes" in output_results:
+        for segment in results.get("segments", []):
+            path = output_base + segment["name_suffix"] + output_extension
+            write_mesh(path, segment["vertices"], segment["faces"], native=native)
+            outputs.append(path)
+    return outputs
+
+
+def process_mesh(input_path, output_base, output_extension, configuration):
+    """Traitement d'un maillage (exécuté dans un processus de l'ensemble) : retourne l'enregistrement du manifeste"""
+    record = {"status": "error", "outputs": [], "timings": {}, "counters": {}, "result_infos": None, "error": None}
+    timings = record["timings"]
+    start = time.perf_counter()
+    try:
+        config = registry.load_config()
+        algorithm = registry.get_algorithm(config, configuration["algorithm"])
+        if algorithm is None:
+            raise RuntimeError(f"L'algorithme '{configuration['algorithm']}' n'existe pas dans config.json.")
+
+        native = algorithm["language_id"] == 0
+        step_start = time.perf_counter()
+        mesh_data = read_mesh(input_path, native)
+        timings["read"] = time.perf_counter() - step_start
+
+        # Données envoyées à l'algorithme (mêmes champs que ceux préparés par l'extension)
+        converters = None
+        if algorithm["language_id"] == 1:
+            import pymeshlab
+            converters = registry.meshlab_converters(pymeshlab)
+        params, options = registry.default_parameters(algorithm, converters, configuration["properties"])
+        data = {"vertices": mesh_data["vertices"], "params": params, "options": options, "function": algorithm["functions_name"]}
+        if any(operation in FACE_INPUTS for operation in algorithm["input"]):
+            data["faces"] = mesh_data["faces"]
+        if "color_data" in algorithm["input"] and "vertex_color" in mesh_data:
+            data["vertex_color"] = mesh_data["vertex_color"]
+        # Réparation du maillage par le module natif : le maillage réparé remplace le maillage lu (y compris pour l'écriture des résultats)
+        if "native_repair" in algorithm["input"]:
+            from api_modules.algorithms_api import repair_mesh
+            step_start = time.perf_counter()
+            repaired = repair_mesh(data["vertices"], data["faces"], REPAIR_TOLERANCE)
+            timings["repair"] = time.perf_counter() - step_start
+            mesh_data = {"vertices": repaired["vertices"], "faces": repaired["faces"]}
+            data["vertices"] = mesh_data["vertices"]
+            data["faces"] = mesh_data["faces"]
+            record["counters"].update({"repair." + counter: value for counter, value in repaired["report"].items()})
+
+        step_start = time.perf_counter()
+        instance = create_algorithm(algorithm, data)
+        instance.init()
+        results = instance.get_result()
+        timings["algorithm"] = time.perf_counter() - step_start
+        profile = getattr(instance, "profile", None)
+        if profile is not None:
+            timings.update({"algorithm." + phase: duration / 1e9 for phase, duration in profile["phases"].items()})
+            record["counters"].update(profile["counters"])
+
+        step_start = time.perf_counter()
+        record["outputs"] = write_results(results, mesh_data, output_base, output_extension, native)
+        timings["write"] = time.perf_counter() - step_start
+        if "message" in results.get("output_result", []):
+            record["result_infos"] = results.get("result_infos", "")
+        record["status"] = "done"
+    except Exception as err:
+        record["error"] = f"{type(err).__name__}: {err}"
+    timings["total"] = time.perf_counter() - start
+    return record
+
+
+def run_batch(args):
+    configuration = load_configuration(args.configuration, args.algorithm)
+    config = registry.load_config()
+    algorithm = registry.get_algorithm(config, configuration["algorithm"])
+    if algorithm is None:
+        raise RuntimeError(f"L'algorithme '{configuration['algorithm']}' n'existe pas dans config.json.")
+    # Les algorithmes multi-threads sont limités à un thread par processus (sauf indication contraire de la configuration)
+    # afin de ne pas multiplier le nombre de threads par le nombre de processus
+    if args.workers > 1 and any(property["id_name"] == "threads" for property in algorithm["properties"]):
+        configuration["properties"].setdefault("threads", 1)
+    signature = get_configuration_signature(configuration)
+
+    os.makedirs(args.output_directory, exist_ok=True)
+    manifest_path = os.path.join(args.output_directory, MANIFEST_NAME)
+    previous_records = read_manifest(manifest_path)
+
+    # Fichiers restant à traiter : ceux qui n'ont pas encore été traités avec succès avec la même configuration
+    paths = list_meshes(args.input_directory, args.recursive)
+    pending = []
+    for path in paths:
+        record = previous_records.get(path, None)
+        if record is not None and record["status"] == "done" and record.get("configuration") == signature and not args.force:
+            continue
+        pending.append(path)
+    print(f"{len(paths)} maillages trouvés, {len(paths) - len(pending)} déjà traités, {len(pending)} à traiter ({args.workers} processus).")
+
+    failures = 0
+    with open(manifest_path, "a", encoding="utf-8") as manifest, concurrent.futures.ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures = {}
+        for path in pending:
+            stem, extension = os.path.splitext(path)
+            output_base = os.path.join(args.output_directory, stem)
+            os.makedirs(os.path.dirname(output_base), exist_ok=True)
+            output_extension = "." + args.format if args.format else extension.lower()
+            futures[executor.submit(process_mesh, os.path.join(args.input_directory, path), output_base, output_extension, configuration)] = path
+        for i, future in enumerate(concurrent.futures.as_completed(futures)):
+            path = futures[future]
+            record = {"file": path, "configuration": signature, "algorithm": configuration["algorithm"]}
+            record.update(future.result())
+            # Chaque enregistrement est écrit dès la fin du traitement du fichier afin de pouvoir reprendre une exécution interrompue
+            manifest.write(json.dumps(record) + "\n")
+            manifest.flush()
+            if record["status"] != "done":
+                failures += 1
+            print(f"[{i + 1}/{len(pending)}] {path} : {record['status']} ({record['timings']['total']:.2f}s)" + (f" - {record['error']}" if record["error"] else ""))
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("input_directory", help="dossier contenant les maillages à traiter (PLY, OBJ, OFF)")
+    parser.add_argument("output_directory", help="dossier dans lequel sont écrits les maillages résultants et le manifeste")
+    parser.add_argument("--configuration", default=None, help="configuration de l'algorithme exportée depuis l'extension (JSON)")
+    parser.add_argument("--algorithm", default=None, help="identifiant de l'algorithme de config.json (remplace celui de la configuration)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="nombre de processus")
+    parser.add_argument("--format", default=None, choices=["ply", "obj", "off"], help="format des maillages écrits (celui du maillage d'entrée par défaut)")
+    parser.add_argument("--recursive", action="store_true", help="parcourt également les sous-dossiers du dossier d'entrée")
+    parser.add_argument("--force", action="store_true", help="traite de nouveau les fichiers déjà traités")
+    args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("le nombre de processus doit être strictement positif")
+    failures = run_batch(args)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
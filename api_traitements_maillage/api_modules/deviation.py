@@ -0,0 +1,110 @@
+import time
+import numpy as np
+
+# Nombre de points échantillonnés par défaut sur chacune des deux surfaces (identique à celui du module natif)
+DEFAULT_SAMPLES = 100000
+# Rampe de couleurs des écarts des sommets (du plus faible au plus élevé) : bleu, cyan, vert, jaune puis rouge
+DEVIATION_COLORS = np.array([[0.0, 0.0, 1.0, 1.0],
+                             [0.0, 1.0, 1.0, 1.0],
+                             [0.0, 1.0, 0.0, 1.0],
+                             [1.0, 1.0, 0.0, 1.0],
+                             [1.0, 0.0, 0.0, 1.0]], dtype=np.float32)
+
+
+def get_deviation_colors(distances, max_distance):
+    """Couleurs (RGBA, une ligne par sommet) des distances ramenées à l'intervalle [0, max_distance] par interpolation linéaire dans la rampe"""
+    distances = np.asarray(distances, dtype=np.float64)
+    ratios = np.clip(distances / max_distance, 0.0, 1.0) if max_distance > 0 else np.zeros(len(distances))
+    positions = ratios * (len(DEVIATION_COLORS) - 1)
+    lower = np.minimum(positions.astype(np.int64), len(DEVIATION_COLORS) - 2)
+    weights = (positions - lower)[:, None].astype(np.float32)
+    return DEVIATION_COLORS[lower] * (1.0 - weights) + DEVIATION_COLORS[lower + 1] * weights
+
+
+def format_deviation(deviation):
+    """Message décrivant l'écart mesuré (valeurs absolues et relatives à la diagonale de la boîte englobante du maillage d'origine)"""
+    diagonal = deviation["diagonal"]
+    relative = lambda value: f" ({value / diagonal * 100:.3f} % de la diagonale)" if diagonal > 0 else ""
+    return (f"Écart au maillage d'origine ({deviation['samples']} points échantillonnés) :\n"
+            f"Hausdorff : {deviation['hausdorff']:.4g}{relative(deviation['hausdorff'])}\n"
+            f"Origine vers résultat : {deviation['forward_max']:.4g}, résultat vers origine : {deviation['backward_max']:.4g}\n"
+            f"Écart moyen : {deviation['mean']:.4g}, écart quadratique moyen : {deviation['rms']:.4g}{relative(deviation['rms'])}")
+
+
+class DeviationAlgorithm:
+    """Exécution d'un algorithme (ou d'un enchaînement) suivie de la mesure de l'écart entre le maillage d'origine et le maillage obtenu
+    (distance de Hausdorff symétrique et écart quadratique moyen estimés par le module natif à partir d'un nombre borné de points échantillonnés).
+    L'écart est ajouté au message des résultats et, si demandé, les sommets du maillage obtenu sont colorés selon leur distance au maillage
+    d'origine. Possède la même interface que Router, PyMeshApi, Pipeline et SubsetAlgorithm"""
+
+    def __init__(self, data, create_algorithm, samples=DEFAULT_SAMPLES, coloration=False):
+        # Données du maillage d'origine (conservées jusqu'à la fin de l'algorithme)
+        self.data = data
+        # Fonction instanciant l'algorithme à partir des données du maillage
+        self.create_algorithm = create_algorithm
+        self.samples = samples
+        self.coloration = coloration
+        self.algorithm = None
+        self.result = {}
+        self.profile = {"phases": {}, "counters": {}}
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+        algorithm = self.algorithm
+        if algorithm is not None and hasattr(algorithm, "cancel"):
+            algorithm.cancel()
+
+    @property
+    def progress(self):
+        algorithm = self.algorithm
+        return getattr(algorithm, "progress", None) if algorithm is not None else None
+
+    def init(self):
+        # Les tableaux du maillage d'origine sont conservés avant l'exécution (certains algorithmes modifient les données reçues)
+        original_vertices = self.data["vertices"]
+        original_faces = self.data["faces"]
+        self.algorithm = self.create_algorithm(self.data)
+        if self.cancelled:
+            raise RuntimeError("Exécution de l'algorithme annulée.")
+        self.algorithm.init()
+        self.result = dict(self.algorithm.get_result())
+        profile = getattr(self.algorithm, "profile", None)
+        if profile is not None:
+            self.profile = {"phases": dict(profile["phases"]), "counters": dict(profile["counters"])}
+
+        # L'écart n'est mesuré que si l'algorithme a remplacé le maillage
+        output_results = list(self.result.get("output_result", []))
+        if "replace_mesh" not in output_results or self.cancelled:
+            return
+        from api_modules.algorithms_api import measure_deviation
+        # Les couleurs de l'écart ne remplacent pas celles calculées par l'algorithme
+        coloration = self.coloration and "colors" not in self.result
+        start = time.perf_counter_ns()
+        deviation = measure_deviation(original_vertices, original_faces, self.result["vertices"], self.result["faces"], self.samples, coloration)
+        self.profile["phases"]["deviation"] = time.perf_counter_ns() - start
+        for phase, duration in deviation["profile"]["phases"].items():
+            self.profile["phases"]["deviation." + phase] = duration
+        for counter, value in deviation["profile"]["counters"].items():
+            self.profile["counters"]["deviation." + counter] = value
+
+        message = format_deviation(deviation)
+        result_infos = self.result.get("result_infos", "")
+        self.result["result_infos"] = result_infos + "\n" + message if result_infos else message
+        if "message" not in output_results:
+            output_results.append("message")
+        else:
+            pass
+        # Les couleurs sont appliquées après le remplacement du maillage (ordre des sorties)
+        if coloration:
+            distances = deviation["vertex_distances"]
+            max_distance = max(deviation["hausdorff"], float(np.max(distances)) if len(distances) > 0 else 0.0)
+            self.result["colors"] = get_deviation_colors(distances, max_distance).reshape(-1)
+            output_results.append("vertex_coloration")
+        else:
+            pass
+        self.result["output_result"] = output_results
+        self.result["deviation"] = {key: deviation[key] for key in ("hausdorff", "forward_max", "backward_max", "mean", "rms", "samples", "diagonal")}
+
+    def get_result(self):
+        return self.result
@@ -0,0 +1,37 @@
+import importlib
+import sys
+import threading
+import time
+
+# Durées d'importation (en nanosecondes) des modules chargés à la demande, indexées par le nom du module
+import_times = {}
+_import_lock = threading.Lock()
+
+
+def load_module(name):
+    """Importation d'un module (si ce n'est pas déjà fait) et mesure de la durée de son importation"""
+    module = sys.modules.get(name, None)
+    if module is not None:
+        return module
+    with _import_lock:
+        module = sys.modules.get(name, None)
+        if module is None:
+            start = time.perf_counter_ns()
+            module = importlib.import_module(name)
+            import_times[name] = time.perf_counter_ns() - start
+    return module
+
+
+def is_loaded(name):
+    return name in sys.modules
+
+
+class LazyModule:
+    """Module dont l'importation est différée jusqu'au premier accès à l'un de ses attributs (les modules lourds, comme pymeshlab ou
+    le module natif, ne ralentissent ainsi pas le démarrage de Blender lorsque l'extension n'est pas utilisée)"""
+
+    def __init__(self, name):
+        self._name = name
+
+    def __getattr__(self, attribute):
+        return getattr(load_module(self._name), attribute)
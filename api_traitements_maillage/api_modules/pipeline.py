@@ -0,0 +1,204 @@
+import json
+import os
+import re
+import time
+
+# Chemin par défaut du fichier des enchaînements d'algorithmes prédéfinis
+DEFAULT_PIPELINES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), "pipelines.json")
+
+# Opérations de préparation des données remplacées dans un enchaînement : le maillage de l'utilisateur n'étant modifié qu'à la fin
+# de l'enchaînement, la triangulation est effectuée de façon non destructive
+INPUT_REPLACEMENTS = {"triangulation": "loop_triangles", "face_indices": "loop_triangles"}
+
+# Sorties pouvant être produites par une étape intermédiaire (les autres sorties ne sont acceptées que pour la dernière étape)
+INTERMEDIATE_OUTPUTS = ("replace_mesh", "vertex_coloration", "face_coloration", "message")
+
+
+def load_pipelines(path=DEFAULT_PIPELINES_PATH):
+    """Chargement des enchaînements prédéfinis. Chaque enchaînement possède un identifiant ("id_name"), un nom, une description
+    et une liste d'étapes ({"algorithm": identifiant de l'algorithme, "properties": valeurs de ses propriétés}), les propriétés ayant
+    le même format que les configurations exportées depuis l'extension"""
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as f:
+        return json.load(f).get("pipelines", [])
+
+
+def parse_pipeline(text):
+    """Lecture d'un enchaînement saisi par l'utilisateur sous la forme d'une liste d'identifiants d'algorithmes
+    (séparés par des virgules, des points-virgules ou des ">")"""
+    return [{"algorithm": name.lower(), "properties": {}} for name in re.split(r"[,;>\s]+", text) if name]
+
+
+def check_pipeline(steps, algorithms):
+    """Vérification des étapes d'un enchaînement : chaque algorithme doit exister (algorithms : table associant à l'identifiant
+    d'un algorithme ses données issues de config.json)"""
+    if not steps:
+        raise RuntimeError("L'enchaînement ne contient aucun algorithme.")
+    for i, step in enumerate(steps):
+        if step["algorithm"] not in algorithms:
+            raise RuntimeError(f"L'algorithme '{step['algorithm']}' de l'étape {i + 1} de l'enchaînement n'existe pas.")
+
+
+def get_pipeline_inputs(steps, input_pipelines):
+    """Opérations de préparation des données de l'enchaînement : celles de la première étape (la triangulation étant non destructive),
+    complétées par la récupération des couleurs et de la sélection si une étape les utilise (input_pipelines : table associant à l'identifiant d'un
+    algorithme la liste de ses opérations de préparation des données)"""
+    inputs = []
+    for operation in input_pipelines[steps[0]["algorithm"]]:
+        operation = INPUT_REPLACEMENTS.get(operation, operation)
+        if operation not in inputs:
+            inputs.append(operation)
+    if "color_data" not in inputs and any("color_data" in input_pipelines[step["algorithm"]] for step in steps):
+        inputs.append("color_data")
+    if "face_selection" not in inputs and any("face_selection" in input_pipelines[step["algorithm"]] for step in steps):
+        inputs.append("face_selection")
+    return inputs
+
+
+class Pipeline:
+    """Exécution d'une suite d'algorithmes (natifs ou MeshLab) sur un même maillage. Les maillages intermédiaires sont transmis
+    d'une étape à l'autre sous la forme des tableaux numpy retournés par les algorithmes : seul le résultat final est appliqué
+    dans Blender. Possède la même interface que Router et PyMeshApi (init, get_result et profile) ainsi que celle des algorithmes natifs
+    permettant de suivre leur avancement et de les interrompre (progress et cancel)"""
+
+    def __init__(self, steps, data, create_algorithm):
+        # Etapes de l'enchaînement : liste de dictionnaires contenant l'identifiant de l'algorithme ("algorithm") ainsi que les données
+        # propres à l'algorithme ("data" : paramètres, options et éventuellement fonctions MeshLab)
+        self.steps = steps
+        # Données du maillage récupérées depuis Blender (sommets, faces, couleurs, session native, ...)
+        self.data = data
+        # Fonction instanciant un algorithme à partir de son identifiant et de ses données
+        self.create_algorithm = create_algorithm
+        self.result = {}
+        self.profile = {"phases": {"ingest": 0, "build": 0, "compute": 0, "export": 0}, "counters": {}}
+        # Temps imparti (en secondes) à l'ensemble de l'enchaînement (0 : aucune limite), réparti au fur et à mesure entre les étapes
+        self.time_budget = data.get("time_budget", 0.0)
+        self.cancelled = False
+        # Etape en cours d'exécution (indice et instance de l'algorithme)
+        self.step_index = 0
+        self.algorithm = None
+
+    def cancel(self):
+        """Interruption de l'enchaînement : l'étape en cours est interrompue (algorithmes natifs) et les suivantes ne sont pas exécutées"""
+        self.cancelled = True
+        algorithm = self.algorithm
+        if algorithm is not None and hasattr(algorithm, "cancel"):
+            algorithm.cancel()
+
+    @property
+    def progress(self):
+        """Avancement de l'enchaînement : fraction globale (les étapes ayant le même poids) et étape en cours"""
+        step_index = self.step_index
+        algorithm = self.algorithm
+        step_progress = getattr(algorithm, "progress", None) if algorithm is not None else None
+        step_fraction = step_progress["fraction"] if step_progress is not None else 0.0
+        stage = f"{step_index + 1}/{len(self.steps)} {self.steps[step_index]['algorithm']}"
+        if step_progress is not None and step_progress["stage"]:
+            stage += f" ({step_progress['stage']})"
+        return {"fraction": min(1.0, (step_index + step_fraction) / len(self.steps)), "stage": stage,
+                "counters": step_progress["counters"] if step_progress is not None else {}, "cancelled": self.cancelled}
+
+    def init(self):
+        phases = self.profile["phases"]
+        counters = self.profile["counters"]
+        # Maillage courant de l'enchaînement (initialement celui envoyé par Blender)
+        geometry = {key: self.data[key] for key in ("vertices", "faces", "vertex_color", "face_color", "selected_faces") if key in self.data}
+        geometry_changed = False
+        colors = None
+        messages = []
+        last_result = {}
+        counters["faces_in"] = len(geometry["faces"]) // 3 if "faces" in geometry else 0
+        counters["steps"] = len(self.steps)
+        deadline = time.perf_counter() + self.time_budget if self.time_budget > 0 else None
+
+        for i, step in enumerate(self.steps):
+            algorithm_name = step["algorithm"]
+            is_last_step = i == len(self.steps) - 1
+            if self.cancelled:
+                raise RuntimeError("Exécution de l'enchaînement annulée.")
+            data = dict(step["data"])
+            data.update(geometry)
+            if deadline is not None:
+                remaining_time = deadline - time.perf_counter()
+                if remaining_time <= 0:
+                    raise RuntimeError(f"Le temps imparti à l'enchaînement est écoulé avant l'étape {i + 1} ({algorithm_name}).")
+                data["time_budget"] = remaining_time
+            # La session native (ou la réserve de MeshSet) de l'objet n'est utilisable que tant que le maillage n'a pas été modifié
+            if not geometry_changed:
+                for key in ("session", "pool_key"):
+                    if key in self.data:
+                        data[key] = self.data[key]
+            # Les bords du maillage restent protégés à chaque étape (sous-maillage des faces sélectionnées)
+            if "protect_borders" in self.data:
+                data["protect_borders"] = self.data["protect_borders"]
+
+            start = time.perf_counter_ns()
+            algorithm = self.create_algorithm(algorithm_name, data)
+            self.step_index = i
+            self.algorithm = algorithm
+            # Annulation demandée pendant l'instanciation de l'algorithme
+            if self.cancelled:
+                raise RuntimeError("Exécution de l'enchaînement annulée.")
+            algorithm.init()
+            last_result = algorithm.get_result()
+            step_time = time.perf_counter_ns() - start
+
+            # Cumul du profil de l'étape dans celui de l'enchaînement
+            step_profile = getattr(algorithm, "profile", None)
+            if step_profile is not None:
+                for phase in ("ingest", "build", "compute", "export"):
+                    phases[phase] += step_profile["phases"].get(phase, 0)
+            phases[f"compute.{i + 1}_{algorithm_name}"] = step_time
+
+            output_results = last_result.get("output_result", [])
+            for output_result in output_results:
+                if not is_last_step and output_result not in INTERMEDIATE_OUTPUTS:
+                    raise RuntimeError(f"La sortie '{output_result}' de l'algorithme '{algorithm_name}' ne peut être utilisée qu'à la dernière étape de l'enchaînement.")
+            if "replace_mesh" in output_results:
+                # Le maillage résultant devient le maillage courant : les couleurs des étapes précédentes ne lui correspondent plus
+                geometry = {"vertices": last_result["vertices"], "faces": last_result["faces"]}
+                # La sélection n'est conservée que si l'algorithme retourne les indices des faces sélectionnées du nouveau maillage
+                if "selected_faces" in last_result:
+                    geometry["selected_faces"] = last_result["selected_faces"]
+                geometry_changed = True
+                colors = None
+            if "vertex_coloration" in output_results or "face_coloration" in output_results:
+                output_result = "vertex_coloration" if "vertex_coloration" in output_results else "face_coloration"
+                colors = (output_result, last_result["colors"])
+                # Les couleurs sont transmises aux étapes suivantes (algorithmes MeshLab)
+                geometry.pop("vertex_color", None)
+                geometry.pop("face_color", None)
+                geometry["vertex_color" if output_result == "vertex_coloration" else "face_color"] = last_result["colors"]
+            if "message" in output_results:
+                messages.append(f"Etape {i + 1} ({algorithm_name}) :\n" + last_result.get("result_infos", ""))
+
+        # Construction du résultat final : seul le maillage obtenu à la fin de l'enchaînement est appliqué dans Blender
+        start = time.perf_counter_ns()
+        self.result = {"output_result": []}
+        if geometry_changed:
+            self.result["output_result"].append("replace_mesh")
+            self.result["vertices"] = geometry["vertices"]
+            self.result["faces"] = geometry["faces"]
+            if "selected_faces" in geometry:
+                self.result["selected_faces"] = geometry["selected_faces"]
+            counters["faces_out"] = len(geometry["faces"]) // 3
+        if colors is not None:
+            self.result["output_result"].append(colors[0])
+            self.result["colors"] = colors[1]
+        # Sorties propres à la dernière étape (niveaux de détail, ajout d'un maillage, ...)
+        final_outputs = [output_result for output_result in last_result.get("output_result", []) if output_result not in INTERMEDIATE_OUTPUTS]
+        if final_outputs:
+            if geometry_changed and "add_mesh" in final_outputs:
+                raise RuntimeError("L'ajout d'un maillage ne peut pas suivre une étape modifiant le maillage dans un enchaînement.")
+            self.result["output_result"] += final_outputs
+            for key, value in last_result.items():
+                if key not in ("output_result", "colors", "result_infos"):
+                    self.result.setdefault(key, value)
+        if messages:
+            self.result["output_result"].append("message")
+            self.result["result_infos"] = "\n\n".join(messages)
+        phases["export"] += time.perf_counter_ns() - start
+
+    def get_result(self):
+        return self.result
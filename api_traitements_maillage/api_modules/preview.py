@@ -0,0 +1,110 @@
+import threading
+import time
+import numpy as np
+from api_modules.background_job import AlgorithmJob
+
+# Délai (en secondes) sans nouvelle modification des propriétés avant le lancement d'un aperçu
+PREVIEW_DELAY = 0.3
+# Nombre de faces par défaut du maillage réduit sur lequel les aperçus sont calculés
+DEFAULT_PROXY_FACES = 20000
+
+
+def decimate_mesh(data, target_faces):
+    """Construction du maillage réduit (proxy) d'un maillage à l'aide de la décimation quadrique de MeshLab. Retourne les tableaux
+    à une dimension des sommets et des faces du maillage réduit (ceux du maillage d'origine s'il possède déjà peu de faces)"""
+    vertices = np.asarray(data["vertices"])
+    faces = np.asarray(data["faces"])
+    if len(faces) // 3 <= target_faces:
+        return {"vertices": vertices, "faces": faces}
+    # MeshLab n'est importé qu'à la première décimation (démarrage de Blender plus rapide)
+    import pymeshlab
+    from api_modules.py_mesh import to_flat_array
+    ms = pymeshlab.MeshSet()
+    ms.add_mesh(pymeshlab.Mesh(vertex_matrix=np.reshape(np.asarray(vertices, dtype=np.float64), (-1, 3)),
+                               face_matrix=np.reshape(faces, (-1, 3))))
+    ms.meshing_decimation_quadric_edge_collapse(targetfacenum=target_faces, preservenormal=True)
+    mesh = ms.current_mesh()
+    return {"vertices": to_flat_array(mesh.vertex_matrix()), "faces": to_flat_array(mesh.face_matrix()).astype(np.int32)}
+
+
+class ProxyCache:
+    """Maillages réduits des objets Blender, conservés tant que la géométrie de l'objet (identifiée par une signature) n'est pas modifiée.
+    Les maillages réduits sont construits dans le thread de l'aperçu"""
+
+    def __init__(self):
+        self.proxies = {}
+        self.lock = threading.Lock()
+
+    def get(self, key, signature):
+        """Maillage réduit d'un objet (None s'il n'existe pas ou si la géométrie de l'objet a changé)"""
+        with self.lock:
+            entry = self.proxies.get(key, None)
+        if entry is None or entry["signature"] != signature:
+            return None
+        return entry["data"]
+
+    def build(self, key, signature, data, target_faces, repair_tolerance=None):
+        """Construction (et conservation) du maillage réduit d'un objet à partir des données de son maillage. Si repair_tolerance est fourni,
+        le maillage réduit est réparé par le module natif (algorithmes dont les données passent par "native_repair") : la décimation de MeshLab
+        peut produire des faces non manifold que le maillage demi-arêtes rejetterait"""
+        proxy = decimate_mesh(data, target_faces)
+        if repair_tolerance is not None:
+            from api_modules.algorithms_api import repair_mesh
+            repaired = repair_mesh(proxy["vertices"], proxy["faces"], repair_tolerance)
+            proxy = {"vertices": repaired["vertices"], "faces": repaired["faces"]}
+        with self.lock:
+            self.proxies[key] = {"signature": signature, "data": proxy}
+        return proxy
+
+    def discard(self, key):
+        with self.lock:
+            self.proxies.pop(key, None)
+
+    def clear(self):
+        with self.lock:
+            self.proxies.clear()
+
+
+class PreviewScheduler:
+    """Planification des aperçus : les demandes rapprochées (modifications successives d'une propriété) sont regroupées et seule la plus
+    récente est exécutée une fois le délai écoulé. Un aperçu en cours d'exécution devenu obsolète est annulé (ses résultats sont ignorés)
+    et la demande suivante n'est lancée qu'à la fin de son exécution, afin que deux aperçus ne s'exécutent jamais simultanément"""
+
+    def __init__(self, delay=PREVIEW_DELAY):
+        self.delay = delay
+        # Demande en attente : date de la demande, nom de l'objet, fonction instanciant l'algorithme et données associées à l'aperçu
+        self.pending = None
+        # Tâche de l'aperçu en cours d'exécution et données associées
+        self.job = None
+        self.payload = None
+
+    def request(self, object_name, algorithm_factory, payload=None):
+        """Demande d'un nouvel aperçu (remplace la demande en attente et rend obsolète l'aperçu en cours d'exécution)"""
+        self.pending = (time.perf_counter(), object_name, algorithm_factory, payload)
+        if self.job is not None:
+            self.job.cancel()
+
+    def update(self):
+        """Mise à jour de l'état des aperçus (appelée régulièrement depuis le thread principal). Retourne la tâche terminée et ses données
+        associées si un aperçu doit être affiché, None sinon"""
+        finished = None
+        if self.job is not None and self.job.is_finished():
+            if not self.job.is_cancelled():
+                finished = (self.job, self.payload)
+            self.job = None
+            self.payload = None
+        if self.pending is not None and self.job is None and time.perf_counter() - self.pending[0] >= self.delay:
+            _, object_name, algorithm_factory, self.payload = self.pending
+            self.pending = None
+            self.job = AlgorithmJob(object_name, algorithm_factory)
+            self.job.start()
+        return finished
+
+    def cancel(self):
+        """Abandon de la demande en attente et annulation de l'aperçu en cours d'exécution"""
+        self.pending = None
+        if self.job is not None:
+            self.job.cancel()
+
+    def is_active(self):
+        return self.pending is not None or self.job is not None
@@ -1,98 +1,221 @@
 import pymeshlab
 import numpy as np
+import collections
+import hashlib
+import threading
+import time
+
+# Nombre maximal de MeshSet conservés dans la réserve (un par objet source)
+MESHSET_POOL_SIZE = 4
+
+
+def get_geometry_signature(arrays):
+    """Empreinte des tableaux du maillage (type, forme et contenu) identifiant la géométrie envoyée à MeshLab"""
+    signature = hashlib.blake2b(digest_size=16)
+    for array in arrays:
+        if array is None:
+            signature.update(b"-")
+            continue
+        array = np.ascontiguousarray(array)
+        signature.update(f"{array.dtype.str}{array.shape}".encode())
+        signature.update(memoryview(array).cast("B"))
+    return signature.hexdigest()
+
+
+def to_flat_array(matrix):
+    """Conversion d'une matrice retournée par MeshLab en tableau à une dimension (les matrices de MeshLab étant stockées
+    colonne par colonne, une copie est inévitable pour obtenir les composantes entrelacées attendues par Blender)"""
+    return np.ravel(matrix, order="C")
+
 
 class PyMeshApi:
     """Classe permettant de communiquer entre l'extension Blender et le module pymeshlab"""
 
+    # Réserve de MeshSet associant à un objet source (champ "pool_key" des données) l'empreinte de sa géométrie ainsi qu'un MeshSet
+    # contenant une copie intacte du maillage d'entrée (calque 0). Une nouvelle exécution sur la même géométrie part d'une copie interne
+    # de ce calque au lieu de reconvertir les tableaux numpy et de reconstruire le maillage MeshLab
+    meshset_pool = collections.OrderedDict()
+    pool_lock = threading.Lock()
+
     def __init__(self, data):
         self.data = data
         self.result = {}
+        # Profil de l'exécution (même structure que celui des algorithmes natifs) : durées en nanosecondes des phases de lecture
+        # des données, de construction du maillage MeshLab, d'exécution des filtres (une sous-phase "compute.<filtre>" par filtre)
+        # et d'exportation des résultats, ainsi que des compteurs
+        self.profile = {"phases": {"ingest": 0, "build": 0, "compute": 0}, "counters": {}}
+
+    @classmethod
+    def clear_pool(cls):
+        """Libération de l'ensemble des MeshSet conservés"""
+        with cls.pool_lock:
+            cls.meshset_pool.clear()
+
+    @classmethod
+    def get_pool_entry(cls, pool_key, signature, create_mesh):
+        """Récupération (ou création) de l'entrée de la réserve associée à un objet source. Retourne l'entrée et un booléen indiquant
+        si le maillage conservé a pu être réutilisé"""
+        with cls.pool_lock:
+            entry = cls.meshset_pool.get(pool_key, None)
+            if entry is not None and entry["signature"] == signature:
+                cls.meshset_pool.move_to_end(pool_key)
+                return entry, True
+        # Géométrie inconnue ou modifiée : un nouveau MeshSet remplace l'ancien. La construction du maillage (coûteuse) est effectuée
+        # en dehors du verrou de la réserve
+        meshset = pymeshlab.MeshSet()
+        meshset.add_mesh(create_mesh())
+        entry = {"signature": signature, "meshset": meshset, "lock": threading.Lock()}
+        with cls.pool_lock:
+            cls.meshset_pool[pool_key] = entry
+            cls.meshset_pool.move_to_end(pool_key)
+            while len(cls.meshset_pool) > MESHSET_POOL_SIZE:
+                cls.meshset_pool.popitem(last=False)
+        return entry, False
 
     def init(self):
         """Exécution de l'algorithme MeshLab choisi par l'utilisateur"""
+        phases = self.profile["phases"]
+        counters = self.profile["counters"]
+        start = time.perf_counter_ns()
         # Vérification de la présence des informations nécessaires à l'exécution d'un algorithme de MashLab dans l'attribut data
         # Récupération des coordonnées des sommets du maillage contenues dans un tableau numpy
         vertices = self.data.get("vertices", None)
-        if vertices is not None:
-            # Remise en forme des données du tableau de sorte à transformer le tableau initial à 1 dimension en un tableau à 
-            # 2 dimensions (nombre de sommmets pour la première dimension et les 3 coordonnées spatiales pour la seconde)
-            vertices = np.reshape(vertices, (vertices.shape[0] // 3, 3))
-        else:
+        if vertices is None:
             raise RuntimeError("Le dictionnaire des données ne possède pas les coordonnées des sommets.")
-        
+
         # Récupération du nom de la fonction MeshLab utilisée pour exécuter l'algorithme
         functions_name = self.data.get("function", None)
         if functions_name is None:
             raise RuntimeError("Le dictionnaire des données ne possède pas le nom de la fonction MeshLab à exécuter.")
 
         # Pareil pour les indices des sommets des faces
-        faces = self.data.get("faces", np.array([], dtype=np.int32))
-        faces = np.reshape(faces, (faces.shape[0] // 3, 3))
-        
-        # Récupération d'éventuelles informations de couleurs du maillage
-        # Pour les sommets
-        vertex_color = self.data.get("vertex_color", np.array([], dtype=np.float64))
-        vertex_color = np.reshape(vertex_color, (vertex_color.shape[0] // 4, 4))
-        
-        # Pour les faces
-        face_color = self.data.get("face_color", np.array([], dtype=np.float64))
-        face_color = np.reshape(face_color, (face_color.shape[0] // 4, 4))
-        
+        faces = self.data.get("faces", None)
+
+        # Récupération d'éventuelles informations de couleurs du maillage (pour les sommets ou pour les faces) : les matrices de couleurs
+        # ne sont transmises à MeshLab que si elles sont présentes
+        vertex_color = self.data.get("vertex_color", None)
+        face_color = self.data.get("face_color", None)
+
         # Récupération des éventuels paramètres utilisés pour la fonction MeshLab
         params = self.data.get("params")
 
-        # Création d'un MeshSet pour exécuter l'algorithme
-        ms = pymeshlab.MeshSet()
+        number_of_vertices = vertices.shape[0] // 3
+        counters["faces_in"] = faces.shape[0] // 3 if faces is not None else 0
+        counters["vertices_in"] = number_of_vertices
+
+        def create_mesh():
+            # Remise en forme des données des tableaux de sorte à transformer les tableaux initiaux à 1 dimension en des tableaux à
+            # 2 dimensions (nombre de sommmets pour la première dimension et les 3 coordonnées spatiales pour la seconde)
+            # (MeshLab travaillant en double précision, les coordonnées envoyées en float32 par Blender sont converties)
+            mesh_arrays = {"vertex_matrix": np.reshape(np.asarray(vertices, dtype=np.float64), (number_of_vertices, 3))}
+            if faces is not None:
+                mesh_arrays["face_matrix"] = np.reshape(faces, (faces.shape[0] // 3, 3))
+            # (les couleurs peuvent provenir d'un algorithme natif en simple précision dans le cas d'un enchaînement d'algorithmes)
+            if vertex_color is not None:
+                mesh_arrays["v_color_matrix"] = np.reshape(np.asarray(vertex_color, dtype=np.float64), (vertex_color.shape[0] // 4, 4))
+            if face_color is not None:
+                mesh_arrays["f_color_matrix"] = np.reshape(np.asarray(face_color, dtype=np.float64), (face_color.shape[0] // 4, 4))
+            # Création d'un maillage à partir des coordonnées des sommets et des indices des sommets des faces
+            return pymeshlab.Mesh(**mesh_arrays)
+
+        pool_key = self.data.get("pool_key", None)
+        if pool_key is not None:
+            signature = get_geometry_signature((vertices, faces, vertex_color, face_color))
+        phases["ingest"] = time.perf_counter_ns() - start
+        start = time.perf_counter_ns()
+
+        if pool_key is None:
+            # Création d'un MeshSet pour exécuter l'algorithme (aucune réutilisation possible)
+            ms = pymeshlab.MeshSet()
+            ms.add_mesh(create_mesh())
+            pool_hit = False
+        else:
+            entry, pool_hit = self.get_pool_entry(pool_key, signature, create_mesh)
+        counters["meshset_pool_hit"] = int(pool_hit)
+
+        if pool_key is None:
+            phases["build"] = time.perf_counter_ns() - start
+            self.apply_filters(ms, functions_name, params)
+            self.export_results(ms, functions_name, number_of_vertices)
+            return
 
-        # Création d'un maillage à partir des coordonnées des sommets et des indices des sommets des faces
-        mesh = pymeshlab.Mesh(vertex_matrix=vertices, face_matrix=faces, v_color_matrix=vertex_color, f_color_matrix=face_color)
+        with entry["lock"]:
+            ms = entry["meshset"]
+            # Les filtres sont appliqués sur une copie du maillage d'origine (calque 0), qui reste intact pour les exécutions suivantes
+            ms.set_current_mesh(0)
+            ms.generate_copy_of_current_mesh()
+            copy_id = ms.current_mesh_id()
 
-        # Ajout du maillage dans le MeshSet
-        ms.add_mesh(mesh)
+            phases["build"] = time.perf_counter_ns() - start
+            try:
+                self.apply_filters(ms, functions_name, params)
+                self.export_results(ms, functions_name, number_of_vertices)
+            finally:
+                # Suppression des calques créés lors de l'exécution (copie du maillage et maillages générés par les filtres)
+                mesh_id = copy_id
+                while ms.mesh_number() > 1:
+                    if ms.mesh_id_exists(mesh_id):
+                        ms.set_current_mesh(mesh_id)
+                        ms.delete_current_mesh()
+                    mesh_id += 1
 
-        # Exécution des sous-algorithmes de l'algorithme principal sur le maillage sous la forme d'un application de filtre
+    def apply_filters(self, ms, functions_name, params):
+        """Exécution des sous-algorithmes de l'algorithme principal sur le maillage sous la forme d'un application de filtre"""
+        phases = self.profile["phases"]
+        compute_start = time.perf_counter_ns()
         for function_name, param in zip(functions_name, params):
+            start = time.perf_counter_ns()
             ms.apply_filter(function_name, **param)
+            phase_name = "compute." + function_name
+            phases[phase_name] = phases.get(phase_name, 0) + time.perf_counter_ns() - start
+        phases["compute"] = time.perf_counter_ns() - compute_start
+
+    def export_results(self, ms, functions_name, number_of_vertices):
+        """Récupération des données du maillage résultant en fonction de la fonction MeshLab utilisée"""
+        phases = self.profile["phases"]
+        counters = self.profile["counters"]
+        start = time.perf_counter_ns()
 
         # Récupération du maillage résultant
         resulting_mesh = ms.current_mesh()
+        counters["faces_out"] = resulting_mesh.face_number()
+        counters["vertices_out"] = resulting_mesh.vertex_number()
 
         # Récupération des données en fonction de la fonction MeshLab utilisée
         if all(function_name in ["compute_curvature_and_color_apss_per_vertex", "compute_color_perlin_noise_per_vertex"] for function_name in functions_name):
             self.result["output_result"] = []
-            # Récupération des coordonnées du maillage résultant
-            resulting_vertices = resulting_mesh.vertex_matrix()
             # Si le nombre de sommets a varié entre le maillage initial et le maillage résultant
-            if resulting_vertices.shape[0] != vertices.shape[0]:
+            if resulting_mesh.vertex_number() != number_of_vertices:
                 # Nous demandons une recréation du maillage dans Blender
                 self.result["output_result"].append("replace_mesh")
-                self.result["vertices"] = resulting_vertices.flatten()
-                self.result["faces"] = resulting_mesh.face_matrix().flatten()
-            
+                self.result["vertices"] = to_flat_array(resulting_mesh.vertex_matrix())
+                self.result["faces"] = to_flat_array(resulting_mesh.face_matrix())
+
             self.result["output_result"].append("vertex_coloration")
-            self.result["colors"] = resulting_mesh.vertex_color_matrix().flatten()
-        
+            self.result["colors"] = to_flat_array(resulting_mesh.vertex_color_matrix())
+
         elif all(function_name in ["meshing_isotropic_explicit_remeshing", "create_fractal_terrain"] for function_name in functions_name):
             self.result["output_result"] = ["replace_mesh"]
-            self.result["vertices"] = resulting_mesh.vertex_matrix().flatten()
-            self.result["faces"] = resulting_mesh.face_matrix().flatten()
-        
+            self.result["vertices"] = to_flat_array(resulting_mesh.vertex_matrix())
+            self.result["faces"] = to_flat_array(resulting_mesh.face_matrix())
+
         elif all(function_name in ["generate_simplified_point_cloud", "compute_normal_for_point_clouds", "generate_surface_reconstruction_ball_pivoting"] for function_name in functions_name):
             self.result["output_result"] = ["replace_mesh"]
-            self.result["vertices"] = resulting_mesh.vertex_matrix().flatten()
-            self.result["faces"] = resulting_mesh.face_matrix().flatten()
+            self.result["vertices"] = to_flat_array(resulting_mesh.vertex_matrix())
+            self.result["faces"] = to_flat_array(resulting_mesh.face_matrix())
             # Récupération d'informations sur les couleurs si présentes
-            if resulting_mesh.has_vertex_color:
+            if resulting_mesh.has_vertex_color():
                 self.result["output_result"].append("vertex_coloration")
-                self.result["colors"] = resulting_mesh.vertex_color_matrix().flatten()
-            elif resulting_mesh.has_face_color:
+                self.result["colors"] = to_flat_array(resulting_mesh.vertex_color_matrix())
+            elif resulting_mesh.has_face_color():
                 self.result["output_result"].append("face_coloration")
-                self.result["colors"] = resulting_mesh.face_color_matrix().flatten()
+                self.result["colors"] = to_flat_array(resulting_mesh.face_color_matrix())
             else:
                 pass
         else:
             raise RuntimeError("La fonction MeshLab demandée n'est pas encore implantée dans l'extension.")
+        phases["export"] = time.perf_counter_ns() - start
+
 
-           
     def get_result(self):
         return self.result
@@ -0,0 +1,272 @@
+import json
+import os
+import pickle
+
+# Chemin par défaut du fichier de configuration des algorithmes de l'extension
+DEFAULT_CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), "config.json")
+
+# Valeurs par défaut des propriétés lorsque le champ "default" est absent (identiques à celles des fabriques de propriétés de l'extension)
+DEFAULT_VALUES = {"integer": 0,
+                  "float": 0,
+                  "boolean": False,
+                  "enum": "DEFAULT",
+                  "string": "",
+                  "percentage_value": 0,
+                  "pure_value": 0,
+                  "color": [0, 0, 0],
+                  "float_array": [0, 0, 0]}
+
+# Version du format du registre compilé (les registres conservés dans un format différent sont recompilés)
+REGISTRY_VERSION = 6
+
+# Tableaux (et leur type numpy) produits par chaque opération de préparation des données de l'extension. La triangulation destructive
+# ("triangulation") ne produit aucun tableau : elle modifie le maillage de l'utilisateur avant la récupération des faces. La réparation
+# native ("native_repair") produit à elle seule les sommets et les faces du maillage réparé. Les indices des faces sélectionnées
+# ("face_selection") se rapportent aux faces produites par les opérations précédentes
+INPUT_BUFFERS = {"triangulation": {},
+                 "loop_triangles": {"faces": "int32"},
+                 "native_repair": {"vertices": "float64", "faces": "int32"},
+                 "vertex_coordinates": {"vertices": "float32"},
+                 "face_indices": {"faces": "int32"},
+                 "color_data": {"vertex_color": "float64", "face_color": "float64"},
+                 "face_selection": {"selected_faces": "int32"}}
+# Opérations remplaçant la triangulation destructive lorsque le maillage de l'utilisateur n'a pas à être modifié
+NON_DESTRUCTIVE_INPUTS = {"triangulation": "loop_triangles", "face_indices": "loop_triangles"}
+
+# Registres compilés conservés en mémoire, indexés par le chemin du fichier de configuration
+_registries = {}
+
+
+def load_config(path=DEFAULT_CONFIG_PATH):
+    """Chargement du fichier de configuration des algorithmes"""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def iter_algorithms(config):
+    """Parcours des algorithmes décrits dans la configuration (indépendamment de Blender).
+    Chaque algorithme est retourné sous la forme d'un dictionnaire contenant son identifiant, son nom, l'identifiant du langage
+    de programmation, le nom de sa bibliothèque, la liste des opérations de préparation des données, son nombre d'étapes,
+    le nom des fonctions MeshLab utilisées ainsi que la liste des données de ses propriétés"""
+    for language in config.values():
+        language_id = language["language_id"]
+        for library in language.get("libraries", []):
+            for algorithm in library["algorithms"]:
+                yield {"id_name": algorithm["id_name"],
+                       "name": algorithm.get("name", algorithm["id_name"]),
+                       "description": algorithm.get("description", ""),
+                       "language_id": language_id,
+                       "library": library.get("id_name", ""),
+                       "input": algorithm.get("input", []),
+                       "steps": algorithm.get("steps", 1),
+                       "preview": algorithm.get("preview", False),
+                       "deviation": algorithm.get("deviation", False),
+                       "selection": algorithm.get("selection", True),
+                       "functions_name": algorithm.get("functions_name", []),
+                       "class_name": algorithm.get("properties", {}).get("class_name", None),
+                       "properties": algorithm.get("properties", {}).get("data", [])}
+
+
+def validate_config(config):
+    """Vérification de la structure de la configuration des algorithmes : une exception ValueError listant l'ensemble des erreurs
+    rencontrées est levée si la configuration est invalide"""
+    errors = []
+    if not isinstance(config, dict):
+        raise ValueError("La configuration doit être un dictionnaire de langages de programmation.")
+    identifiers = set()
+    for language_name, language in config.items():
+        if not isinstance(language, dict) or not isinstance(language.get("language_id", None), int):
+            errors.append(f"Le langage '{language_name}' doit posséder un champ 'language_id' entier.")
+            continue
+        for library in language.get("libraries", []):
+            library_name = library.get("id_name", "")
+            if not isinstance(library.get("algorithms", None), list):
+                errors.append(f"La bibliothèque '{library_name}' ne possède pas de champ 'algorithms'.")
+                continue
+            for algorithm in library["algorithms"]:
+                algorithm_name = algorithm.get("id_name", None)
+                if not algorithm_name:
+                    errors.append(f"Un algorithme de la bibliothèque '{library_name}' ne possède pas de champ 'id_name'.")
+                    continue
+                if algorithm_name in identifiers:
+                    errors.append(f"L'identifiant '{algorithm_name}' est utilisé par plusieurs algorithmes.")
+                identifiers.add(algorithm_name)
+                if "name" not in algorithm:
+                    errors.append(f"L'algorithme '{algorithm_name}' ne possède pas de champ 'name'.")
+                steps = algorithm.get("steps", 1)
+                if not isinstance(steps, int) or steps < 1:
+                    errors.append(f"Le nombre d'étapes de l'algorithme '{algorithm_name}' doit être un entier strictement positif.")
+                    steps = 1
+                properties = algorithm.get("properties", None)
+                if properties is None:
+                    continue
+                if "class_name" not in properties or "data" not in properties:
+                    errors.append(f"Les propriétés de l'algorithme '{algorithm_name}' doivent posséder les champs 'class_name' et 'data'.")
+                    continue
+                for property in properties["data"]:
+                    property_name = property.get("id_name", "?")
+                    if property.get("type", None) not in DEFAULT_VALUES:
+                        errors.append(f"Le type '{property.get('type', None)}' de la propriété '{property_name}' de l'algorithme '{algorithm_name}' est inconnu.")
+                    if "data" not in property:
+                        errors.append(f"La propriété '{property_name}' de l'algorithme '{algorithm_name}' ne possède pas de champ 'data'.")
+                    elif property.get("type", None) == "enum" and not property["data"].get("items", []):
+                        errors.append(f"La liste déroulante '{property_name}' de l'algorithme '{algorithm_name}' ne possède aucun élément.")
+                    step = property.get("algorithm_step", -1)
+                    if step != -1 and not (isinstance(step, int) and 1 <= step <= steps):
+                        errors.append(f"L'étape {step} de la propriété '{property_name}' de l'algorithme '{algorithm_name}' n'existe pas.")
+    if errors:
+        raise ValueError("Configuration des algorithmes invalide :\n- " + "\n- ".join(errors))
+
+
+def check_capabilities(algorithm, capabilities):
+    """Vérification des entrées d'un algorithme natif de la configuration à partir des données qu'il consomme (capabilities : dictionnaire
+    retourné par Router.capabilities() pour cet algorithme). Retourne la liste des erreurs rencontrées"""
+    errors = []
+    algorithm_name = algorithm["id_name"]
+    produced = {}
+    for operation in algorithm["input"]:
+        if operation not in INPUT_BUFFERS:
+            errors.append(f"L'opération de préparation des données '{operation}' de l'algorithme '{algorithm_name}' est inconnue.")
+        else:
+            produced.update(INPUT_BUFFERS[operation])
+    for buffer in capabilities["buffers"]:
+        if buffer not in produced:
+            errors.append(f"L'algorithme '{algorithm_name}' nécessite le tableau '{buffer}' qu'aucune de ses opérations de préparation ne fournit.")
+    if "vertices" in produced and capabilities["vertex_dtypes"] and produced["vertices"] not in capabilities["vertex_dtypes"]:
+        errors.append(f"L'algorithme '{algorithm_name}' n'accepte pas les sommets de type {produced['vertices']}.")
+    if "faces" in produced and capabilities["face_dtypes"] and produced["faces"] not in capabilities["face_dtypes"]:
+        errors.append(f"L'algorithme '{algorithm_name}' n'accepte pas les faces de type {produced['faces']}.")
+    if not capabilities["threads"] and any(property["id_name"] == "threads" for property in algorithm["properties"]):
+        errors.append(f"L'algorithme '{algorithm_name}' ne prend pas en charge le paramètre 'threads'.")
+    return errors
+
+
+def get_minimal_inputs(inputs, capabilities):
+    """Opérations de préparation des données strictement nécessaires à un algorithme natif : les opérations ne produisant aucun tableau
+    lu par l'algorithme sont ignorées et la triangulation destructive n'est conservée que pour les algorithmes remplaçant la topologie
+    du maillage (le maillage de l'utilisateur est sinon triangulé de façon non destructive)"""
+    if capabilities["mesh"] == "none":
+        return []
+    required = set(capabilities["buffers"])
+    minimal = []
+    for operation in inputs:
+        if not capabilities["topology_changing"]:
+            operation = NON_DESTRUCTIVE_INPUTS.get(operation, operation)
+        produced = INPUT_BUFFERS.get(operation, None)
+        if produced is None or (produced and not required.intersection(produced)):
+            continue
+        if operation not in minimal:
+            minimal.append(operation)
+    return minimal
+
+
+def compile_registry(config, native_capabilities=None):
+    """Construction du registre des algorithmes (configuration validée puis mise à plat : un dictionnaire par algorithme, voir iter_algorithms).
+    native_capabilities : table associant au nom de chaque algorithme natif les données qu'il consomme (Router.capabilities()). Si elle est
+    fournie, les entrées des algorithmes natifs sont vérifiées et réduites aux opérations nécessaires ("declared_input" conserve les
+    opérations déclarées dans la configuration)"""
+    validate_config(config)
+    algorithms = list(iter_algorithms(config))
+    errors = []
+    for algorithm in algorithms:
+        algorithm["declared_input"] = algorithm["input"]
+        algorithm["capabilities"] = None
+        if native_capabilities is None or algorithm["language_id"] != 0:
+            continue
+        capabilities = native_capabilities.get(algorithm["id_name"], None)
+        if capabilities is None:
+            errors.append(f"L'algorithme '{algorithm['id_name']}' n'existe pas dans l'API C++.")
+            continue
+        errors.extend(check_capabilities(algorithm, capabilities))
+        algorithm["capabilities"] = capabilities
+        algorithm["input"] = get_minimal_inputs(algorithm["input"], capabilities)
+    if errors:
+        raise ValueError("Configuration des algorithmes invalide :\n- " + "\n- ".join(errors))
+    return {"algorithms": algorithms}
+
+
+def load_registry(path=DEFAULT_CONFIG_PATH, cache_path=None, native_capabilities=None, dependencies=()):
+    """Chargement du registre compilé des algorithmes. Le registre est conservé en mémoire ainsi que, si cache_path est fourni, dans un
+    fichier : il n'est recompilé (lecture et validation du fichier de configuration) que si la date de modification ou la taille du fichier
+    de configuration, ou de l'un des fichiers dependencies (module natif), ont changé. native_capabilities : fonction retournant les données
+    consommées par les algorithmes natifs, appelée uniquement lors de la compilation (le module natif n'est donc pas importé si le registre
+    est à jour). Retourne le registre ainsi que sa provenance ("memory", "disk" ou "compiled")"""
+    signature = (REGISTRY_VERSION, os.path.realpath(path))
+    for file_path in (path,) + tuple(dependencies):
+        stat = os.stat(file_path)
+        signature += (stat.st_mtime_ns, stat.st_size)
+    entry = _registries.get(signature[1], None)
+    if entry is not None and entry[0] == signature:
+        return entry[1], "memory"
+    if cache_path is not None and os.path.isfile(cache_path):
+        try:
+            with open(cache_path, "rb") as f:
+                cached_signature, registry = pickle.load(f)
+            if cached_signature == signature:
+                _registries[signature[1]] = (signature, registry)
+                return registry, "disk"
+        except Exception:
+            # Un fichier de cache illisible (version de Python différente, écriture interrompue, ...) est simplement remplacé
+            pass
+    registry = compile_registry(load_config(path), native_capabilities() if native_capabilities is not None else None)
+    _registries[signature[1]] = (signature, registry)
+    if cache_path is not None:
+        try:
+            # Ecriture dans un fichier temporaire puis remplacement afin qu'un cache partiellement écrit ne soit jamais lu
+            temporary_path = cache_path + ".tmp"
+            with open(temporary_path, "wb") as f:
+                pickle.dump((signature, registry), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_path, cache_path)
+        except OSError as e:
+            print(f"Le registre des algorithmes n'a pas pu être conservé dans '{cache_path}' : {e}")
+    return registry, "compiled"
+
+
+def get_algorithm(config, algorithm_name):
+    """Récupération des données d'un algorithme à partir de son identifiant (None si l'algorithme n'existe pas)"""
+    for algorithm in iter_algorithms(config):
+        if algorithm["id_name"] == algorithm_name:
+            return algorithm
+    return None
+
+
+def default_value(property):
+    """Valeur par défaut d'une propriété. Pour une liste déroulante, la première option est retournée (l'option "DEFAULT"
+    de l'extension ne correspond à aucun traitement)"""
+    property_type = property["type"]
+    data = property.get("data", {})
+    if property_type == "enum":
+        items = data.get("items", [])
+        return items[0]["id"] if items else DEFAULT_VALUES["enum"]
+    return data.get("default", DEFAULT_VALUES.get(property_type))
+
+
+def default_parameters(algorithm, converters=None, values=None):
+    """Construction des paramètres ("params", un dictionnaire par étape de l'algorithme) et des options ("options", propriétés
+    non utilisées par l'algorithme) à envoyer à un algorithme, à partir des valeurs par défaut de ses propriétés.
+    converters : table associant à un type de propriété une fonction de conversion de la valeur (cas des types MeshLab)
+    values : table permettant de remplacer la valeur par défaut de certaines propriétés"""
+    converters = converters or {}
+    values = values or {}
+    params = [{} for _ in range(algorithm["steps"])]
+    options = {}
+    for property in algorithm["properties"]:
+        property_name = property["id_name"]
+        value = values.get(property_name, default_value(property))
+        step = property.get("algorithm_step", -1)
+        if step == -1:
+            options[property_name] = value
+        else:
+            converter = converters.get(property["type"], None)
+            params[step - 1][property_name] = converter(value) if converter is not None else value
+    return params, options
+
+
+def meshlab_converters(pymeshlab):
+    """Conversion des valeurs par défaut des propriétés vers les types MeshLab (identiques à ceux de l'extension). Le module pymeshlab
+    est passé en paramètre afin que ce module puisse être utilisé sans MeshLab"""
+    import numpy as np
+    return {"percentage_value": pymeshlab.PercentageValue,
+            "pure_value": pymeshlab.PureValue,
+            "color": lambda value: pymeshlab.Color(round(value[0] * 255), round(value[1] * 255), round(value[2] * 255)),
+            "float_array": lambda value: np.array(value, dtype=np.float64)}
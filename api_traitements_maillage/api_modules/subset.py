@@ -0,0 +1,215 @@
+import time
+import numpy as np
+
+# Couleur des faces (ou des sommets) non sélectionnées lorsque le maillage ne possède pas de couleurs à conserver
+DEFAULT_COLOR = (1.0, 1.0, 1.0, 1.0)
+# Identifiant de segment des faces non sélectionnées
+UNSELECTED_SEGMENT_ID = -1
+
+
+def get_default_colors(number_of_elements):
+    return np.tile(np.asarray(DEFAULT_COLOR, dtype=np.float32), (number_of_elements, 1))
+
+
+def get_edge_keys(faces, number_of_vertices):
+    """Clés (indices des deux sommets, le plus petit en premier) des arêtes des faces, une par côté de chaque face"""
+    edges = np.sort(faces[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2), axis=1)
+    return edges[:, 0] * number_of_vertices + edges[:, 1]
+
+
+class MeshSubset:
+    """Sous-maillage formé des faces sélectionnées d'un maillage triangulé : les sommets utilisés par ces faces sont renumérotés de façon
+    compacte (le coût de l'extraction ne dépend que du nombre de faces sélectionnées). Permet de reporter sur le maillage complet les résultats
+    d'un algorithme exécuté sur le sous-maillage"""
+
+    def __init__(self, vertices, faces, selected_faces):
+        self.vertices = np.asarray(vertices).reshape(-1, 3)
+        self.faces = np.asarray(faces).reshape(-1, 3)
+        # Indices (triés et sans doublon) des faces sélectionnées du maillage complet
+        self.face_map = np.unique(np.asarray(selected_faces, dtype=np.int64))
+        if len(self.face_map) == 0:
+            raise RuntimeError("Aucune face du maillage n'est sélectionnée.")
+        if self.face_map[0] < 0 or self.face_map[-1] >= len(self.faces):
+            raise RuntimeError(f"Les indices des faces sélectionnées doivent être compris entre 0 et {len(self.faces) - 1}.")
+        # Sommets du maillage complet utilisés par les faces sélectionnées (vertex_map[i] : indice dans le maillage complet du sommet i
+        # du sous-maillage) et faces du sous-maillage
+        self.vertex_map, inverse = np.unique(self.faces[self.face_map].reshape(-1), return_inverse=True)
+        self.subset_faces = inverse.astype(np.int32)
+        self.subset_vertices = self.vertices[self.vertex_map].reshape(-1)
+
+    def extract(self, data):
+        """Données envoyées à l'algorithme : celles du maillage complet dont les sommets, les faces et les couleurs sont remplacés
+        par ceux du sous-maillage"""
+        subset_data = {key: value for key, value in data.items() if key not in ("vertices", "faces", "polygon_index", "vertex_color",
+                                                                                 "face_color", "selected_faces")}
+        subset_data["vertices"] = self.subset_vertices
+        subset_data["faces"] = self.subset_faces
+        # Toutes les faces du sous-maillage sont sélectionnées
+        subset_data["selected_faces"] = np.arange(len(self.face_map), dtype=np.int32)
+        # Les bords du sous-maillage (dont la frontière de la sélection) doivent être conservés par les algorithmes natifs pour que le maillage
+        # obtenu puisse être raccordé aux faces non sélectionnées
+        subset_data["protect_borders"] = True
+        vertex_color = data.get("vertex_color", None)
+        if vertex_color is not None:
+            subset_data["vertex_color"] = np.asarray(vertex_color).reshape(-1, 4)[self.vertex_map].reshape(-1)
+        face_color = self.get_face_colors(data)
+        if face_color is not None:
+            subset_data["face_color"] = face_color[self.face_map].reshape(-1)
+        return subset_data
+
+    def get_face_colors(self, data):
+        """Couleurs (une ligne par face du maillage complet) des faces envoyées, ramenées aux triangles si elles ont été récupérées
+        par face du maillage de Blender (None si le maillage ne possède pas de couleurs des faces)"""
+        face_color = data.get("face_color", None)
+        if face_color is None:
+            return None
+        face_color = np.asarray(face_color).reshape(-1, 4)
+        if len(face_color) == len(self.faces):
+            return face_color
+        polygon_index = data.get("polygon_index", None)
+        if polygon_index is not None and len(polygon_index) == len(self.faces):
+            return face_color[polygon_index]
+        return None
+
+    def splice_mesh(self, vertices, faces):
+        """Remplacement des faces sélectionnées du maillage complet par le maillage obtenu sur le sous-maillage. Les sommets de la frontière
+        de la sélection conservés par l'algorithme (coordonnées identiques) sont fusionnés avec ceux des faces non sélectionnées. Une exception
+        est levée si une arête de la frontière n'a pas été conservée (le maillage obtenu serait séparé des faces non sélectionnées).
+        Retourne les sommets et les faces du maillage complet, les indices des faces issues du sous-maillage ainsi que l'indice dans le maillage
+        complet de chaque sommet du maillage obtenu"""
+        vertices = np.asarray(vertices, dtype=np.float64).reshape(-1, 3)
+        faces = np.asarray(faces, dtype=np.int64).reshape(-1, 3)
+        kept = np.ones(len(self.faces), dtype=bool)
+        kept[self.face_map] = False
+        kept_faces = self.faces[kept]
+        # Sommets utilisés par les faces non sélectionnées (renumérotés dans leur ordre d'origine)
+        used = np.zeros(len(self.vertices), dtype=bool)
+        used[kept_faces.reshape(-1)] = True
+        vertex_index = np.cumsum(used) - 1
+        number_of_kept_vertices = int(vertex_index[-1]) + 1 if len(vertex_index) else 0
+
+        # Sommets de la frontière de la sélection : sommets du sous-maillage également utilisés par une face non sélectionnée.
+        # Les coordonnées sont comparées en simple précision (celle des sommets de Blender)
+        border = self.vertex_map[used[self.vertex_map]]
+        new_index = np.empty(len(vertices), dtype=np.int64)
+        is_new = np.ones(len(vertices), dtype=bool)
+        if len(border) > 0 and len(vertices) > 0:
+            keys = np.ascontiguousarray(np.concatenate((self.vertices[border], vertices)).astype(np.float32))
+            keys = keys.view(np.dtype((np.void, keys.dtype.itemsize * 3))).reshape(-1)
+            _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+            # Un sommet résultant dont les coordonnées sont celles d'un sommet de la frontière est remplacé par ce dernier
+            match = first[inverse[len(border):]]
+            is_new = match >= len(border)
+            new_index[~is_new] = vertex_index[border[match[~is_new]]]
+        new_index[is_new] = number_of_kept_vertices + np.arange(int(np.count_nonzero(is_new)))
+
+        spliced_vertices = np.concatenate((self.vertices[used].astype(np.float64), vertices[is_new]))
+        number_of_spliced_vertices = len(spliced_vertices)
+        # Arêtes de la frontière de la sélection (partagées par une face sélectionnée et une face non sélectionnée) : elles doivent toutes
+        # appartenir aux faces du maillage obtenu une fois ses sommets fusionnés (la renumérotation des sommets conservés préservant leur
+        # ordre, les clés des arêtes sont directement converties)
+        frontier = np.intersect1d(get_edge_keys(self.faces[self.face_map], len(self.vertices)), get_edge_keys(kept_faces, len(self.vertices)))
+        frontier = vertex_index[frontier // len(self.vertices)] * number_of_spliced_vertices + vertex_index[frontier % len(self.vertices)]
+        missing = np.count_nonzero(~np.isin(frontier, get_edge_keys(new_index[faces], number_of_spliced_vertices)))
+        if missing > 0:
+            raise RuntimeError(f"L'algorithme a modifié {missing} arête(s) de la frontière de la sélection (sur {len(frontier)}) : le maillage obtenu "
+                               "ne peut pas être raccordé aux faces non sélectionnées.")
+        spliced_faces = np.concatenate((vertex_index[kept_faces], new_index[faces])).astype(np.int32)
+        selected_faces = np.arange(len(kept_faces), len(kept_faces) + len(faces), dtype=np.int32)
+        return spliced_vertices.reshape(-1), spliced_faces.reshape(-1), selected_faces, new_index
+
+    def splice_results(self, results, data):
+        """Report sur le maillage complet des résultats de l'algorithme exécuté sur le sous-maillage : géométrie remplacée, couleurs
+        et identifiants de segments des seules faces (ou sommets) sélectionnées, message complété. Les autres sorties (niveaux de détail,
+        objets ajoutés, ...) ne concernent que la sélection et sont conservées telles quelles"""
+        spliced = dict(results)
+        output_results = results.get("output_result", [])
+        if "replace_mesh" in output_results:
+            spliced["vertices"], spliced["faces"], selected_faces, vertex_index = self.splice_mesh(results["vertices"], results["faces"])
+            spliced["selected_faces"] = selected_faces
+            # Les couleurs calculées sur le maillage obtenu sont reportées sur ses faces (ou ses sommets) dans le maillage complet
+            if "face_coloration" in output_results:
+                colors = get_default_colors(len(spliced["faces"]) // 3)
+                colors[selected_faces] = np.asarray(results["colors"], dtype=np.float32).reshape(-1, 4)
+                spliced["colors"] = colors.reshape(-1)
+            if "vertex_coloration" in output_results:
+                colors = get_default_colors(len(spliced["vertices"]) // 3)
+                colors[vertex_index] = np.asarray(results["colors"], dtype=np.float32).reshape(-1, 4)
+                spliced["colors"] = colors.reshape(-1)
+        elif "face_coloration" in output_results:
+            # Les faces non sélectionnées conservent les couleurs envoyées à l'algorithme
+            colors = self.get_face_colors(data)
+            colors = np.array(colors, dtype=np.float32) if colors is not None else get_default_colors(len(self.faces))
+            colors[self.face_map] = np.asarray(results["colors"], dtype=np.float32).reshape(-1, 4)
+            spliced["colors"] = colors.reshape(-1)
+        elif "vertex_coloration" in output_results:
+            vertex_color = data.get("vertex_color", None)
+            colors = np.array(vertex_color, dtype=np.float32).reshape(-1, 4) if vertex_color is not None else get_default_colors(len(self.vertices))
+            colors[self.vertex_map] = np.asarray(results["colors"], dtype=np.float32).reshape(-1, 4)
+            spliced["colors"] = colors.reshape(-1)
+        else:
+            pass
+        if "face_segments" in output_results:
+            segments_ids = np.full(len(self.faces), UNSELECTED_SEGMENT_ID, dtype=np.int32)
+            segments_ids[self.face_map] = np.asarray(results["segments_ids"], dtype=np.int32).reshape(-1)
+            spliced["segments_ids"] = segments_ids
+        if "message" in output_results:
+            spliced["result_infos"] = f"Sélection ({len(self.face_map)} faces sur {len(self.faces)}) :\n" + results.get("result_infos", "")
+        return spliced
+
+
+class SubsetAlgorithm:
+    """Exécution d'un algorithme (ou d'un enchaînement) sur les seules faces sélectionnées du maillage : le sous-maillage est extrait,
+    traité puis ses résultats sont reportés sur le maillage complet. Possède la même interface que Router, PyMeshApi et Pipeline"""
+
+    def __init__(self, data, create_algorithm):
+        # Données du maillage complet (dont les indices des faces sélectionnées "selected_faces")
+        self.data = data
+        # Fonction instanciant l'algorithme à partir des données du sous-maillage
+        self.create_algorithm = create_algorithm
+        self.subset = None
+        self.algorithm = None
+        self.result = {}
+        self.profile = {"phases": {}, "counters": {}}
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+        algorithm = self.algorithm
+        if algorithm is not None and hasattr(algorithm, "cancel"):
+            algorithm.cancel()
+
+    @property
+    def progress(self):
+        algorithm = self.algorithm
+        return getattr(algorithm, "progress", None) if algorithm is not None else None
+
+    def init(self):
+        start = time.perf_counter_ns()
+        self.subset = MeshSubset(self.data["vertices"], self.data["faces"], self.data["selected_faces"])
+        subset_data = self.subset.extract(self.data)
+        extract_time = time.perf_counter_ns() - start
+        if self.cancelled:
+            raise RuntimeError("Exécution de l'algorithme annulée.")
+
+        self.algorithm = self.create_algorithm(subset_data)
+        if self.cancelled:
+            raise RuntimeError("Exécution de l'algorithme annulée.")
+        self.algorithm.init()
+        results = self.algorithm.get_result()
+
+        start = time.perf_counter_ns()
+        self.result = self.subset.splice_results(results, self.data)
+        splice_time = time.perf_counter_ns() - start
+
+        # Profil de l'algorithme complété par les durées de l'extraction et du report des résultats
+        profile = getattr(self.algorithm, "profile", None)
+        if profile is not None:
+            self.profile = {"phases": dict(profile["phases"]), "counters": dict(profile["counters"])}
+        self.profile["phases"]["subset.extract"] = extract_time
+        self.profile["phases"]["subset.splice"] = splice_time
+        self.profile["counters"]["subset_faces"] = len(self.subset.face_map)
+        self.profile["counters"]["subset_vertices"] = len(self.subset.vertex_map)
+
+    def get_result(self):
+        return self.result
@@ -1,1049 +1,2056 @@
-bl_info = {
-    "name": "Prototype API CGAL.",
-    "author": "Richard Leestmans",
-    "version": (1, 0),
-    "blender": (4, 0, 0),
-    "description": "Prototype d'API permettant d'éxécuter divers algorithmes provenant de CGAL.",
-    "location": "VIEW3D > UI > API C++",
-    "doc_url": "",
-    "tracker_url": "",
-    "category": "Mesh",
-}
-
-import bpy
-from bpy_extras.io_utils import ImportHelper, ExportHelper
-import bmesh
-from mathutils import Vector, Color
-import numpy as np
-import json
-import os
-from api_modules.algorithms_api import Router
-from api_modules.py_mesh import PyMeshApi
-import time
-import sys
-import subprocess
-import platform
-import pymeshlab
-
-# Fonction d'affichage des différentes propriétés suivant l'algorithme choisi par l'utilisateur
-def draw_properties(layout, context, algorithm_name):
-    # Récupération de la classe de propriétés associée à l'algorithme sélectionné
-    algorithm_properties = getattr(context.scene, algorithm_name.lower(), None)
-    if algorithm_properties is not None:
-        col = layout.column(align=True)
-        col.scale_y = 1.4
-        # affichage des propriétés de l'algorithme
-        for prop_attribute in Globals.algorithm_properties[algorithm_name.lower()][1].keys():
-            col.prop(algorithm_properties, prop_attribute)
-    else:
-        pass
-    # Ajout des boutons d'importation et d'exportation des configurations prédéfinies
-    row = layout.row(align=True)
-    row.scale_y = 1.4
-    col = row.column(align=True)
-    col.operator(VIEW3D_OT_load_configuration.bl_idname, text="Importer")
-    if algorithm_properties is not None:
-        col = row.column(align=True)
-        col.enabled = is_option_selected(context, algorithm_name)
-        col.operator(VIEW3D_OT_save_configuration.bl_idname, text="Sauvegarder")
-    else:
-        pass
-
-    # Ajout d'un bouton permettant à l'utilisateur de réinitialiser les valeurs des paramètres de l'algorithme courant
-    if algorithm_properties is not None:
-        row = layout.row()
-        row.scale_y = 1.2
-        row.operator(VIEW3D_OT_set_properties_to_default.bl_idname, text="Réinitialiser les paramètres de l'algorithme")
-    else:
-        pass
-
-    
-## Fonctions d'applications des traitements sur le maillage courant à partir des résultats retournés par l'algorithme choisi par l'utilisateur
-def display_results(context, data, output_result):
-    # Stockage du message de résultats dans la propriété permettant d'afficher des messages dans l'API
-    context.scene.api_properties.result_infos = data.get("result_infos", "")
-
-def set_new_mesh(context, data, output_result):
-    # Récupération de l'objet courant
-    object = context.active_object
-
-    # Récupération de toutes les transformations appliquées à l'objet courant (translation, rotation, mise à l'échelle)
-    translation = object.location.copy()
-    rotation = object.rotation_euler.copy()
-    scale = object.scale.copy()
-
-    # ainsi que le nom du maillage
-    mesh_name = object.data.name
-
-    # extraction des données de la structure (ici les nouvelles coordonnées des sommets restants du maillage ainsi que les nouveaux indices des faces)
-    resulting_mesh_vertices = data.get("vertices", None)
-    resulting_mesh_faces = data.get("faces", None)
-
-    if resulting_mesh_vertices is not None and resulting_mesh_faces is not None:
-        # Déselection de tous les objets de la scène
-        bpy.ops.object.select_all(action="DESELECT")
-        # Vérification si l'algorithme nécessite le remplacement du maillage courant par le nouveau maillage
-        if output_result == "replace_mesh":
-            # Sélection de l'objet à modifier
-            object.select_set(True)    
-            # Suppression de l'ancien maillage
-            bpy.ops.object.delete()
-        else:
-            pass
-
-        # Création d'un nouveau maillage
-        resulting_mesh = bpy.data.meshes.new(name=mesh_name)
-        # et construction de ce dernier avec les nouvelles données
-        # resulting_mesh.from_pydata(resulting_mesh_vertices, resulting_mesh_edges, resulting_mesh_faces)
-        resulting_mesh.vertices.add(len(resulting_mesh_vertices) // 3)
-        resulting_mesh.vertices.foreach_set("co", resulting_mesh_vertices)
-        
-        total_face_indices = len(resulting_mesh_faces)
-        resulting_mesh.loops.add(total_face_indices)
-        resulting_mesh.polygons.add(total_face_indices // 3)
-    
-        resulting_mesh.loops.foreach_set("vertex_index", resulting_mesh_faces) 
-        
-        loop_start = [i * 3 for i in range(total_face_indices // 3)]
-        loop_total = [3] * (total_face_indices // 3)
-        
-        resulting_mesh.polygons.foreach_set("loop_start", loop_start) 
-        resulting_mesh.polygons.foreach_set("loop_total", loop_total)
-        resulting_mesh.polygons.foreach_set("use_smooth", [0] * (total_face_indices // 3))
-
-        # mise à jour du maillage avec sa nouvelle structure
-        resulting_mesh.validate()
-        resulting_mesh.update()
-        
-        # Création d'un objet Blender auquel associer le maillage nouvellement créé
-        obj = bpy.data.objects.new(mesh_name, resulting_mesh)
-
-        # Application de l'ensemble des transformations de l'ancien maillage sur le nouveau
-        obj.location = translation
-        obj.rotation_euler = rotation
-        obj.scale = scale
-
-        # Ajout de l'objet à la scène
-        bpy.context.scene.collection.objects.link(obj)
-
-        # et sélection de l'objet dans la scène 3D comme nouvel objet courant
-        bpy.context.view_layer.objects.active = obj
-        obj.select_set(True)
-        # Et nous centrons la scène sur le nouvel objet créé (équivaut à Numpad .)
-        bpy.ops.view3d.view_selected(use_all_regions=False)
-    else:
-        raise RuntimeError("Une erreur s'est produite lors de la création du nouveau maillage.")
-
-
-def set_mesh_colors(context, data, output_result):
-    # Récupération de l'objet courant
-    object = context.active_object
-    # et de son maillage associé
-    mesh = object.data
-    
-    # Récupération du tableau des couleurs du maillage
-    colors = data.get("colors", None)
-    # Récupération du nombre de segments obtenus
-    # colors_number = data.get("colors_number", None)
-    if colors is not None:
-        # Récupération du nom de l'algorithme choisi par l'utilisateur
-        current_algorithm_name = context.scene.api_properties.algorithm_choice.lower()
-
-        # Récupération du groupe de propriétés associé à l'algorithme courant
-        property_group = getattr(context.scene, current_algorithm_name, None)
-
-        # Récupération si présente, l'option permettant de supprimer les matériaux déjà associés au maillage courant
-        delete_materials_option = getattr(property_group, "delete_materials", None)
-        # Vérification si l'utilisateur a souhaité supprimer les matériaux déjà associés au maillage
-        if delete_materials_option is not None and delete_materials_option:
-            mesh.materials.clear()
-            attributes = mesh.attributes
-            for i in range(len(attributes) - 1, -1, -1):
-                name = attributes[i].name
-                if name.split('.')[0] == "Face_Col" or name.split('.')[0] == "Vertex_Col":
-                    attributes.remove(attributes[i])
-        else:
-            pass
-
-        # Création de l'attribut de couleurs (vertex color layout) permettant de gérer les couleurs des faces ou des sommets du maillage
-        if output_result == "face_coloration":
-            color_layout = mesh.attributes.new(name="Face_Col", type="FLOAT_COLOR", domain="FACE")
-        elif output_result == "vertex_coloration":
-            color_layout = mesh.color_attributes.new(name="Vertex_Col", type="FLOAT_COLOR", domain="POINT")
-            # définition de l'attribut comme attribut de couleurs actif
-            setattr(mesh.color_attributes, "active_color", color_layout)
-        else:
-            raise RuntimeError("Le choix de sortie est inconnu.")
-
-        # Stockage des informations de couleurs dans l'attribut
-        color_layout.data.foreach_set("color", colors)
-
-        # Récupération du nombre de matériaux déjà associés au maillage (servira d'offset pour affecter le bon matériau à la bonne face)
-        nb_materials = len(mesh.materials)
-
-        # Création d'un nouveau matériau permettant d'afficher les couleurs du maillage
-        material = bpy.data.materials.new(name="Mesh_Color")
-
-        # affectation du nouveau matériau au maillage
-        mesh.materials.append(material)
-        # utilisation des noeuds pour ce matériau
-        material.use_nodes = True
-
-        # Récupération de l'ensemble des noeuds du matériau et de l'ensemble des liens inter-noeuds
-        nodes = material.node_tree.nodes
-        links = material.node_tree.links
-        
-        # Création d'un noeud "Attribut"
-        attribute = nodes.new(type="ShaderNodeAttribute")
-        # définition du nom de l'attribut sur "Face_Col" (couleurs des faces du maillage) ou "Vertex_Col" (couleurs des sommets du maillage)
-        attribute.attribute_name = color_layout.name
-        attribute.location = (60, 330)
-
-        # Récupération du noeud "Principled BSDF" (présent par défaut)
-        bsdf = nodes["Principled BSDF"]
-        # Création d'un lien entre la sortie "Color" du noeud "Attribut" et l'entrée "Base Color" du noeud "Principled BSDF"
-        links.new(bsdf.inputs["Base Color"], attribute.outputs["Color"])
-
-        # Désélection de tous les noeuds présents dans le matériau
-        for node in nodes:
-            node.select = False
-
-        # Affectation de l'indice du matériau nouvellement créé à toutes les faces du maillage
-        mesh.polygons.foreach_set("material_index", [nb_materials] * len(mesh.polygons))
-        # Définition de l'attribut créé comme attribut actif du maillage
-        mesh.update()
-
-        # Passage du mode de rendu sur "MATERIAL" afin de pouvoir visualiser le résultat
-        context.space_data.shading.type = "MATERIAL"
-    else:
-        raise RuntimeError("Une erreur s'est produite lors de l'affectation des couleurs aux faces du maillage.")
-
-
-## Fonctions de fabrication des propriétés Blender
-# Création d'une IntProperty à la volée
-def create_integer_property(data):
-    default_value = data.get("default", 0)
-    return bpy.props.IntProperty(name=data.get("name", ""),
-        description=data.get("description", ""),
-        default=default_value,  # Valeur par défaut
-        min=data.get("min", 0),  # Valeur minimale
-        max=data.get("max", 1),  # Valeur maximale
-        step=data.get("step", 1)), default_value  # Incrémentation pour le curseur
-
-
-# Création d'une FloatProperty à la volée
-def create_float_property(data):
-    default_value = data.get("default", 0)
-    return bpy.props.FloatProperty(name=data.get("name", ""),
-        description=data.get("description", ""),
-        default=default_value,  # Valeur par défaut
-        min=data.get("min", 0),  # Valeur minimale
-        max=data.get("max", 1),  # Valeur maximale
-        step=data.get("step", 1)), default_value  # Incrémentation pour le curseur (une valeur "step" de 1 pour une FloatProperty indique un pas de 0.01)
-
-
-# Création d'une BoolProperty à la volée
-def create_boolean_property(data):
-    default_value = data.get("default", False)
-    return bpy.props.BoolProperty(name=data.get("name", ""),
-        description=data.get("description", ""),
-        default=default_value), default_value  # Valeur par défaut
-
-
-# Création d'une EnumProperty à la volée
-def create_enum_property(data):
-    # Récupération des données des items de la liste déroulante
-    items_data = data["items"]
-    # Création d'une liste contenant le choix par défaut de la liste déroulante
-    items = [("DEFAULT", "--Choix de l'option--", "")]
-    # Remplissage de la liste avec toutes les options de sortie disponibles pour cet algorithme
-    for item in items_data:
-        items.append((item["id"], item["name"], item.get("description", "")))
-    return bpy.props.EnumProperty(name=data.get("name", ""),
-        items=items, 
-        default="DEFAULT"), "DEFAULT"
-
-
-# Création d'une FloatVectorProperty à la volée
-def create_float_vector_property(data):
-    default_value = tuple(data.get("default", [0,0,0]))
-    return bpy.props.FloatVectorProperty(name=data.get("name", ""),
-        description=data.get("description",""),
-        default=default_value,  # Valeur par défaut
-        min=data.get("min", 0),  # Valeur minimale
-        max=data.get("max", 1),  # Valeur maximale
-        subtype=data.get("subtype","none").upper()), default_value
-
-
-## Fonctions de préparation du maillage et de collecte des données à envoyer aux algorithmes côté C++
-# Fonction permettant de triangulariser un maillage en mode "OBJET"
-def triangulate_mesh(object, data):
-    # Récupération du maillage associé à l'objet courant
-    mesh = object.data
-    # Création d'un bmesh qui va contenir une copie virtuelle de notre maillage et sur lequel va s"appliquer la triangularisation des faces
-    bm = bmesh.new()
-    bm.from_mesh(mesh)
-        
-    # Vérification que le maillage ne possède pas de doublons en supprimant les sommets qui se superposent
-    bmesh.ops.remove_doubles(bm, verts=bm.verts[:], dist=0.0001)
-    # puis triangularisation des faces de la copie virtuelle du maillage
-    bmesh.ops.triangulate(bm, faces=bm.faces[:])
-    
-    # Mise à jour du maillage courant en écrasant ses anciennes données par celles contenues dans la copie virtuelle
-    bm.to_mesh(mesh)
-    # et suppression de la copie virtuelle
-    bm.free()
-
-
-def get_vertex_coordinates(object, data):
-    # Récupération du maillage associé à l'objet courant
-    mesh = object.data
-    # Récupération des coordonnées des sommets du maillage
-    vertices = np.zeros(len(mesh.vertices) * 3, dtype=np.float64)
-    mesh.vertices.foreach_get("co", vertices)
-    # et stockage du résultat dans le dictionnaire des données à envoyer
-    data["vertices"] = vertices
-
-
-def get_face_indices(object, data):
-    # Récupération du maillage associé à l'objet courant
-    mesh = object.data
-    # Récupération des indices des faces du maillage
-    faces = np.zeros(len(mesh.polygons) * 3, dtype=np.int32)
-    mesh.polygons.foreach_get("vertices", faces)
-    # et stockage du résultat dans le dictionnaire des données à envoyer
-    data["faces"] = faces
-
-
-def get_color_data(object, data):
-    # Récupération du maillage associé à l'objet courant
-    mesh = object.data
-    # Récupération de l'attribut de couleurs associé aux sommets actif (si présent)
-    active_vertex_colors = mesh.color_attributes.active_color
-    # S'il existe un attribut de couleurs associé aux sommets du maillage
-    if active_vertex_colors:
-        # Création d'un tableau numpy permettant de stocker les couleurs du maillage
-        vertex_color_array = np.zeros(len(mesh.vertices) * 4, dtype=np.float64)
-        # Stockage des couleurs de l'attribut dans le tableau numpy
-        active_vertex_colors.data.foreach_get("color", vertex_color_array)
-        data["vertex_color"] = vertex_color_array
-    # S'il n'y a pas d'attributs associant des couleurs aux sommets du maillage, nous essayons de voir
-    # s'il existe un attribut associant des couleurs aux faces du maillage
-    else:
-        # Récupération des attributs du maillage
-        attributes = mesh.attributes
-        # Parcours des attributs du dernier au premier de sorte à récupérer le dernier attribut créé associant
-        # des couleurs aux faces (si présent)
-        for i in range(len(attributes) - 1, -1, -1):
-            # Si l'attribut courant contient des couleurs (données de type FLOAT_COLOR) et les associe aux faces
-            # alors il s'agit de l'attribut recherché
-            current_attribute = attributes[i]
-            if current_attribute.data_type == "FLOAT_COLOR" and current_attribute.domain == "FACE":
-                # Création d'un tableau numpy permettant de stocker les informations des couleurs
-                face_color_array = np.zeros(len(mesh.polygons) * 4, dtype=np.float64)
-                current_attribute.data.foreach_get("color", face_color_array)
-                data["face_color"] = face_color_array
-                break
-            else:
-                pass
-
-
-## Fonctions permettant de transformer des types de données de Blender en types de données MeshLab
-def get_percentage_value_instance(value):
-    return pymeshlab.PercentageValue(value)
-
-
-def get_pure_value_instance(value):
-    return pymeshlab.PureValue(value)
-
-
-def get_color_instance(value):
-    return pymeshlab.Color(round(value.r * 255), round(value.g * 255), round(value.b * 255))
-
-
-def get_numpy_float_array(value):
-    return np.array(value, dtype=np.float64)
-
-
-# Variables globales
-class Globals:
-    # Fabrique à création de propriétés Blender
-    properties_factory = {"integer": create_integer_property,
-                         "float": create_float_property,
-                         "boolean": create_boolean_property,
-                         "enum": create_enum_property,
-                         "percentage_value": create_float_property,
-                         "pure_value": create_float_property,
-                         "color": create_float_vector_property,
-                         "float_array": create_float_vector_property}
-    # Fabrique à préparation du maillage et des données à envoyer côté C++
-    inputs_factory = {"triangulation": triangulate_mesh,
-                      "vertex_coordinates": get_vertex_coordinates,
-                      "face_indices": get_face_indices,
-                      "color_data": get_color_data}
-    # Table permettant de gérer les résultats retournés par l'API C++ et d'effectuer les traitements correspondants en fonction
-    # de la nature de la demande initiale de retour des données
-    outputs_table = {"message": display_results, # Affiche un message dans l'API donnant des informations sur les résultats du traitement effectué
-                     "face_coloration": set_mesh_colors, # Définit des nouvelles couleurs pour les faces du maillage
-                     "vertex_coloration": set_mesh_colors, # Définit des nouvelles couleurs pour les sommets du maillage
-                     "replace_mesh": set_new_mesh, # Remplace le maillage sélectionné par un nouveau maillage
-                     "add_mesh": set_new_mesh} # Ajoute le maillage créé dans la scène sans supprimer le maillage sélectionné
-    # Table permettant d'associer à un attribut (présent sous la forme d'un string) une classe de propriétés (héritant de PropertyGroup) que l'attribut
-    # référencera à l'aide d'un PointerProperty. Exemple : 'segmentation_cgal' : CgalSegmentationProperties
-    # Est utilisée retirer les classes de propriétés du registre de Blender et de supprimer les références à ces dernières par un objet de Blender lors de l'appel de la fonction "unregister"
-    properties_table = {}
-    # Table associant à chaque algorithme une liste contenant l'identifiant du langage de programmation de l'algorithme ainsi que la liste éventuelle de ses propriétes sous forme de dictionnaire et le nom de la function utilisée pour réaliser l'algorithme (cas de MeshLab). 
-    # Exemples : "segmentation_cgal" : [0, {"clusters" : 4, "smoothness" : 0.5, "output_options" : "DEFAULT", "delete_materials" : False}, ["integer", "float", "enum", "boolean"], []]
-    #            "colorize_curvature_apss" : [1, {"filterscale" : 2, "projectionaccuracy" : 0.01, "maxprojectioniters" : 15, "sphericalparameter" : 1, "curvaturetype" : "DEFAULT", "delete_materials" : False}, ["float", "float", "integer", "float", "enum", "boolean"], ["compute_curvature_and_color_apss_per_vertex"]]
-    algorithm_properties = {}
-    # Table associant au nouveau d'un algorithme une liste contenant le nombre d'étapes de l'algorithme (comprendre le nombre de sous-algorithmes utilisés) ainsi que la liste des n indices des sous-algorithmes dans lesquels les m paramètres sont présents
-    # -1 indique que le paramètre n'est pas présent dans un sous-algorithme sinon une valeur d'indice j à la position i dans la liste indique que le i-ème paramètre est présent dans le j-ème sous-algorithme
-    # Exemples : "segmentation_cgal" : [1, [1,1,-1,-1]]
-    #            "colorize_curvature_apss" : [1, [1,1,1,1,1,-1]]
-    algorithm_steps = {}
-    # Table associant à chaque algorithme la liste des opérations à effectuer avant d'envoyer les données côté C++ (traitement prélable du maillage, informations du maillage à récupérer, ...)
-    # Exemple : "segmentation_cgal' : ["triangulation", "vertex_coordinates", "face_indices"]
-    algorithm_input_pipeline = {}
-    # Table associant à chaque algorithme de l'API sa description associée
-    algorithm_description = {}
-    # Dernière configuration chargée par l'utilisateur
-    last_loaded_configuration = {}
-    # Table permettant de convertir les valeurs des propriétés Blender vers des types MeshLab
-    meshlab_types = {"percentage_value": get_percentage_value_instance,
-                     "pure_value": get_pure_value_instance,
-                     "color": get_color_instance,
-                     "float_array": get_numpy_float_array}
-
-
-def create_description(content):
-    # Définition du maximum de caractères à afficher par ligne
-    max_row_length = 75
-    # Définition du maximum de caractères à afficher dans l'info-bulle de l'algorithme
-    max_length = max_row_length * 5
-    # Séparation des mots de la description de l'algorithme
-    words = content.split(" ")
-    lines = []
-    current_line = ""
-    # Création d'un compteur sur le nombre de lignes extraites
-    i = 0
-    # Ainsi qu"un compteur sur le nombre de mots lus dans la description
-    word_count = 0
-    while i < (max_length/max_row_length) and word_count < len(words):
-        # Récupération du mot courant
-        word = words[word_count]
-        line_length = len(current_line) + len(word) + 1
-        # Si la somme des caractères de la ligne courante + la longueur du mot courant ne dépasse pas max_row_length
-        if line_length <= max_row_length:
-            # ajout du mot à la ligne courante
-            current_line += (word + " ")
-        else:
-            # Sinon ajout de la ligne courante dans la liste des lignes de la description
-            lines.append(current_line.strip())
-            i += 1
-            # et ajout du mot courant dans la prochaine ligne
-            current_line = word + " "
-        # mise à jour du compteur sur les mots lus
-        word_count += 1
-    # Si la description fait plus de 180 caractères
-    lines.append(current_line.strip())
-    i += 1
-    if i >= (max_length / max_row_length):        
-        # ajout de "..." à la fin de la dernière ligne de la description
-        lines[-1] = lines[-1][:-3] + "..."
-    return lines
-
-    
-# Fonctions d'exécution et d'application des traitements sur le maillage courant
-def compute_algorithm(context):
-     # Récupération de l'objet courant
-    object = context.active_object
-    if not object or object.type != "MESH":
-        raise RuntimeError("Aucun maillage n'est sélectionné")
-    else:
-        # Passage du contexte en mode "OBJET"
-        bpy.ops.object.mode_set(mode="OBJECT")
-        # et du mode de rendu à "SOLID"
-        context.space_data.shading.type = "SOLID"
-        # Préparation du maillage et récupération des données à envoyer à l'algorithme côté C++
-        # Récupération de la scène
-        scene = context.scene
-        # Récupération du groupe de propriétés de l'API Blender
-        api_properties = scene.api_properties
-        # Suppression du message
-        api_properties.result_infos = ""
-        # Récupération du nom de l'algorithme sélectionné par l'utilisateur
-        algorithm_name = api_properties.algorithm_choice.lower()
-        # Création d'un dictionnaire vide qui va contenir l'ensemble des données à envoyer
-        data = {}
-        # et exécution des différentes opérations pré-envoi des données
-        for operation in Globals.algorithm_input_pipeline[algorithm_name]:
-            Globals.inputs_factory[operation](object, data)
-
-        # Récupération des données des propriétés de l'algorithme courant
-        algorithm_data = Globals.algorithm_properties[algorithm_name]
-        # Récupération des étapes de l'algorithme courant
-        algorithm_steps = Globals.algorithm_steps[algorithm_name]
-        # Ajout du nom de la fonction utilisée pour réaliser l'algorithme (pour MeshLab)
-        data["function"] = algorithm_data[3]
-        params = [{} for _ in range(algorithm_steps[0])]
-        options = {}
-        # Récupération du groupe de propriété associé à l'algorithme choisi (si présent)
-        # et stockage des valeurs de l'ensemble des proprétés dans le dictionnaire data
-        property_group = getattr(scene, algorithm_name, None)
-        if property_group is not None:           
-            for i, property_name in enumerate(algorithm_data[1].keys()):
-                # Si le paramètre n'est pas utilisé dans l'algorithme
-                if algorithm_steps[1][i] == -1:
-                    options[property_name] = getattr(property_group, property_name)
-                else:
-                    # Vérification si la valeur n'est pas de type Meshlab
-                    if algorithm_data[2][i] not in ["percentage_value", "pure_value", "color", "float_array"]:
-                        params[algorithm_steps[1][i] - 1][property_name] = getattr(property_group, property_name)
-                    else:
-                        params[algorithm_steps[1][i] - 1][property_name] = Globals.meshlab_types[algorithm_data[2][i]](getattr(property_group, property_name))           
-        else:
-            pass
-        data["params"] = params
-        data["options"] = options
-                    
-        
-        start = time.time()
-
-        # Instanciation de l'algorithme de traitement de maillage
-        # Si l'algorithme provient de la bibliothèque MeshLab
-        if algorithm_data[0] == 1:
-            algorithm = PyMeshApi(data)
-        # Sinon il provient d'une autre bibliothèque
-        else:
-            algorithm = Router(algorithm_name, data)
-
-        # Exécution ensuite de l'algorithme choisi par l'utilisateur
-        try:
-            algorithm.init()
-        except Exception as err:
-            raise err
-        
-        # Récupération de la structure de données résultante de l'algorithme exécuté avec CGAL côté C++
-        results = algorithm.get_result()
-        end = time.time()
-        print(f"Temps d'exécution de l'algorithme : {end-start}s")
-        # gestion des résultats en fonction de la requête initiale de l'utilisateur
-        output_results = results.get("output_result", [])
-        for output_result in output_results:
-            Globals.outputs_table[output_result](context, results, output_result)
-
-
-def check_required_modules():
-    # Vérification que le ou les modules nécessaires à l'extension sont bien installés
-    # récupération du chemin absolu vers les modules tiers installés dans Blender
-    modules_path = bpy.utils.user_resource("SCRIPTS", path="modules")
-
-    # Si un des modules est manquant
-    if not os.path.isdir(os.path.join(modules_path, "pymeshlab")):
-        # mise à niveau de pip
-        subprocess.run([sys.executable, "-m", "ensurepip", "--user"])
-        subprocess.run([sys.executable, "-m", "pip", "install", "--upgrade", "pip"])
-        # Nous vérifions s'il est bien installé dans l'environnement python de Blender
-        # Cas particulier pour Windows, la dernière version installée avec pip install pymeshlab (2023.12.post2)
-        # fait planter Blender à l'importation. Donc installation de la version précédente sans les dépendances.
-        # numpy est déjà installé dans Blender et il semble qu'il y ait un conflit entre pymeshlab et MSVCP140 causant un plantage
-        # du programme notamment lors de l'appel du constructeur Mesh de pymeshlab.
-        os_name = os.name
-        if os_name == "nt": 
-            subprocess.run([sys.executable, "-m", "pip", "install", "pymeshlab==2023.12.post1", "--no-deps", "-t", modules_path])
-        elif os_name == "posix" and platform.system() == "Linux":
-            subprocess.run([sys.executable, "-m", "pip", "install", "pymeshlab", "-t", modules_path])
-        else:
-            raise RuntimeError("Votre système d'exploitation n'est pas pris en charge par l'extension.")
-        print("Installation des modules requis terminée. Merci de redémarrer Blender pour appliquer les changements...")
-    # Sinon le module est déjà installé
-    else:
-        print("Les modules requis sont déjà installés.")
-
-
-def load_algorithms():
-    # Récupération du chemin absolu d'où le script est exécuté
-    script_absolute_path = os.path.dirname(os.path.realpath(__file__))
-    # Chargement des données liées à tous les algorithmes contenus dans le fichier "config.json"
-    metadata = None
-    try:
-        with open(os.path.join(script_absolute_path, "config.json")) as f:
-            metadata = json.load(f)
-    except Exception as e:
-        print("Une erreur s'est produite lors de la tentative d'ouverture du fichier 'config.json'.")
-        raise e
-    
-    # Création des items de la liste déroulante permettant à l'utilisateur de choisir quel algorithme appliquer sur son maillage
-    algorithm_items = [("DEFAULT", "--Choix de l'algorithme--", "")]
-
-    # Parcours des données du fichier JSON
-    for data in metadata.values():
-        # Récupération de l'identifiant du langage de programmation courant
-        try:
-            programming_language = data["language_id"]
-        except Exception as e:
-            print("Chaque langage de programmation doit posséder son champ 'language'.")
-            raise e
-        # Récupération de la liste des bibliothèques associées au langage de programmation courant
-        libraries = data.get("libraries", None)
-        if libraries is not None:
-            # Parcours des bibliothèques associées à un langage donné dans le fichier JSON
-            for library in libraries:
-                # Récupération du nom de la bibliothèque courante
-                library_name = library.get("id_name", "")
-                # Récupération de la liste des algorithmes associés à la bibliothèque courante
-                algorithms = library.get("algorithms", None)
-                if algorithms is None:
-                    raise RuntimeError(f"La bibliothèque {library_name} ne possède pas de champ 'algorithms'.")
-                else:
-                    for algorithm in algorithms:
-                        # Récupération du nombre de l'algorithme courant
-                        algorithm_name = algorithm["id_name"]
-                        # Récupération de la description de l'algorithme
-                        description = algorithm.get("description", "")
-                        # création du choix dans a liste déroulante de l'API
-                        algorithm_items.append((algorithm_name.upper(), algorithm["name"], description))
-                        # Stockage de la description de l'algorithme pour l'API dans la table algorithm_description de la structure Globals
-                        Globals.algorithm_description[algorithm_name] = create_description(description)
-                        # récupération de la liste des opérations à effectuer avant d'envoyer les données côté C++
-                        Globals.algorithm_input_pipeline[algorithm_name] = algorithm.get("input", [])
-                        # Initialisation de la liste dans la table "algorithm_properties" avec le langage de programmation utilisé et qui contiendra le nom des propriétés de l'algorithme courant et leurs valeurs par défaut associées
-                        Globals.algorithm_properties[algorithm_name] = [programming_language]
-                        # Initialisation de la liste de la table "algorithm_steps" avec le nombre de sous-algorithmes permettant de mener à bien l'exécution de l'algorithme principal
-                        Globals.algorithm_steps[algorithm_name] = [algorithm.get("steps")]
-                        algorithm_props = Globals.algorithm_properties[algorithm_name]
-                        # Initialisation d'un dictionnaire permettant de stocker les propriétés de l'algorithme courant
-                        properties_dict = {}
-                        # Initialisation d'une liste stockant les types des propriétés de l'algorithme courant
-                        properties_types = []
-                        # Initialisation d'une liste permettant de stocker si les propriétés de l'algorithme sont utilisées ou non dans l'algorithme et, si oui, dans quel sous-algorithme ce paramètre est utilisé
-                        sub_algorithms_parameter = []
-                        # Récupération du dictionnaire des propriétés de l'algorithme courant
-                        properties = algorithm.get("properties", None)
-                        if properties is not None:
-                            # Récupération des données des propriétés de l'algorithme
-                            properties_data = properties["data"]
-                            # Création d'une classe de propriétés vide héritant de PropertyGroup qui englobera l'ensemble des propriétés de l'algorithme courant
-                            property_class = type(properties["class_name"], (bpy.types.PropertyGroup,), {})
-
-                            # Enregistrement de la classe dans le registre de Blender
-                            bpy.utils.register_class(property_class)
-                            # Ajout des différentes propriétés à la classe
-                            for property in properties_data:
-                                # Création de la propriété
-                                property_constructor, default_value = Globals.properties_factory[property["type"]](property["data"])
-                                setattr(property_class, property["id_name"], property_constructor)
-                                # Association du nom de la propriété courante à sa valeur par défaut dans la table des propriétés
-                                properties_dict[property["id_name"]] = default_value
-                                # Ajout du type de la propriété dans le conteneur correspondant
-                                properties_types.append(property["type"])
-                                # Récupération de la valeur permettant de savoir si la propriété courante est utilisée ou non dans l'algorithme et, si oui, dans quel sous-algorithme
-                                sub_algorithms_parameter.append(property.get("algorithm_step", -1))                 
-                            # Stockage de la classe nouvellement créée dans une table permettant de la désinscrire du registre de Blender lors de l'appel de la fonction "unregister"
-                            Globals.properties_table[algorithm_name] = property_class
-                            # Ajout du dictionnaire de propriétés dans la table algorithm_properties
-                            algorithm_props.append(properties_dict)
-                            # Ajout de la liste des types des propriétés dans la table algorithm_properties
-                            algorithm_props.append(properties_types)
-                            # Ainsi que la liste indiquant si les propriétés précédentes sont utilisées dans l'algorithme
-                            Globals.algorithm_steps[algorithm_name].append(sub_algorithms_parameter)
-                        
-                            # et référencement de la classe par un attribut
-                            setattr(bpy.types.Scene, algorithm_name, bpy.props.PointerProperty(type=property_class))
-                        else:
-                            algorithm_props.append(properties_dict)
-                            algorithm_props.append(properties_types)
-                            Globals.algorithm_steps[algorithm_name].append(sub_algorithms_parameter)
-                        # Ajout de la fonction utilisée pour l'algorithme (cas de MeshLab)
-                        algorithm_props.append(algorithm.get("functions_name", []))                   
-        else:
-            pass
-
-    
-    # Création de la classe de propriétés de l'API Blender qui contiendra une liste de choix laissant la possibilité à l'utilisateur
-    # soit de choisir un algorithme à appliquer sur un maillage en lui laissant la possibilité de personnaliser ses paramètres, soit d'importer la configuration
-    # pré-programmée d'un algorithme contenu dans un fichier au format json, la liste déroulante des algorithmes implémentés
-    # ainsi qu'une propriété contenant l'ensemble des messages pouvant être retournés par l'API interne (côté C++)
-    # Création de la classe vide
-    api_class = type("ApiProperties", (bpy.types.PropertyGroup,), {})
-
-    # Enregistrement de la classe dans le registre de Blender
-    bpy.utils.register_class(api_class)
-    
-    # Stockage de l'énumération matérialisant la liste déroulante et stockant tous les choix d'algorithme
-    setattr(api_class, "algorithm_choice", bpy.props.EnumProperty(name="", items=algorithm_items, default="DEFAULT"))
-    # ainsi que la propriété gérant les messages
-    setattr(api_class, "result_infos", bpy.props.StringProperty(
-        name="Résultat",
-        description="informations sur le ou les résultats de l'algorithme courant utilisé",
-        default=""))
-    # tout comme une propriété permettant d'afficher et de masquer la description des algorithmes dans l'API Blender
-    setattr(api_class, "description_is_hidden", bpy.props.BoolProperty(name="Afficher/Masquer la description de l'algorithme", default=True))
-    # Stockage de la classe nouvellement créée dans une table permettant de la désinscrire du registre de Blender lors de l'appel de la fonction "unregister"
-    Globals.properties_table["api_properties"] = api_class
-    # Référencement du groupe de propriétés par un objet de Blender (ici la scène)
-    bpy.types.Scene.api_properties = bpy.props.PointerProperty(type=api_class)
-
-
-# Fonction permettant de vérifier si l'utilisateur a choisi une option de sortie pour l'algorithme choisi (seulement si cette option est disponible)
-def is_option_selected(context, algorithm_name):
-    # Récupération du groupe de propriétés de l'algorithme courant
-    property_group = getattr(context.scene, algorithm_name.lower(), None)
-    if property_group is not None:
-        for property_name in Globals.algorithm_properties[algorithm_name.lower()][1].keys():
-            # Récupération du choix de l'option de l'utilisateur pour l'algorithme courant
-            if getattr(property_group, property_name) == "DEFAULT":
-                return False
-            else:
-                pass
-        return True
-    else:
-        return True
-    
-
-class VIEW3D_OT_execute_algorithm(bpy.types.Operator):
-    """Applique l'algorithme choisi sur le maillage sélectionné"""
-    bl_idname = "wm.execute_algorithm"
-    bl_label = "Exécution de l'algorithme"     
-    bl_options = {"REGISTER", "UNDO"} 
-    
-    def execute(self, context):
-        compute_algorithm(context)   
-        return {"FINISHED"}
-
-
-class VIEW3D_OT_display_description(bpy.types.Operator):
-    """Etendre ou réduire la description de l'algorithme courant"""
-    bl_idname = "wm.display_description"
-    bl_label = "Etendre la description"     
-    bl_options = {"REGISTER", "UNDO"} 
-    
-    def switch_visibility(self, context):
-        context.scene.api_properties.description_is_hidden = not context.scene.api_properties.description_is_hidden
-
-
-    def execute(self, context):
-        self.switch_visibility(context)  
-        return {"FINISHED"}
-    
-
-class VIEW3D_OT_load_configuration(bpy.types.Operator, ImportHelper):
-    """Charger une configuration prédéfinie d'un algorithme au format JSON"""
-    bl_idname = "wm.load_configuration"
-    bl_label = "Charger une configuration"     
-    bl_options = {"REGISTER", "UNDO"} 
-
-    filter_glob: bpy.props.StringProperty(
-        default="*.json",
-        options={"HIDDEN"},
-    )
-
-    def load_configuration(self, context):
-        # Récupération de la configuration chargée
-        config = Globals.last_loaded_configuration
-        # Récupération du nom de l'algorithme utilisé dans la configuration
-        algorithm_name = config.get("algorithm", None)
-        if algorithm_name is not None:
-            setattr(context.scene.api_properties, "algorithm_choice", algorithm_name.upper())
-            # Récupération de la classe de propriétés associée à l'algorithme chargé
-            algorithm_properties = getattr(context.scene, algorithm_name)
-            for property_name, value in config["properties"].items():
-                setattr(algorithm_properties, property_name, value)
-        else:
-            raise RuntimeError("Une erreur s'est produite lors de la lecture du fichier de configuration JSON. Vérifiez que la structure contient bien un champ 'algorithm'.")
-        # Nous forçons le rafraichissement de l'interface de l'extension
-        context.area.tag_redraw()
-
-    def execute(self, context):
-        # Récupération de l'extension du fichier chargé
-        file_extension = self.filepath.rsplit('.')[-1].lower()
-        if file_extension != "json":
-            raise RuntimeError("Le fichier importé doit être au format json.")
-        else:
-            print(f"Chargement du fichier: {self.filepath}...")
-            try:
-                with open(self.filepath) as f:
-                    Globals.last_loaded_configuration = json.load(f)
-                    self.load_configuration(context)
-            except Exception as e:
-                print(f"Une erreur s'est produite lors de la tentative d'ouverture du fichier {self.filepath}.")
-                raise e
-            setattr(context.scene.api_properties, "configuration_is_loaded", True)
-        return {"FINISHED"}
-
-    def invoke(self, context, event):
-        # Ouverture de l'explorateur de fichiers
-        context.window_manager.fileselect_add(self)
-        return {'RUNNING_MODAL'}
-    
-
-class VIEW3D_OT_save_configuration(bpy.types.Operator, ExportHelper):
-    """Exporter la configuration de l'algorithme courant au format JSON"""
-    bl_idname = "wm.export_configuration"
-    bl_label = "Exporter cette configuration"     
-    bl_options = {"REGISTER", "UNDO"} 
-
-    filter_glob: bpy.props.StringProperty(
-        default="*.json",
-        options={"HIDDEN"},
-    )
-    filename_ext = ".json"
-
-    def __init__(self):
-        self.data = {}
-
-    def get_current_configuration(self, context):
-        # Création d'une variable qui contiendra le nom du fichier à exporter
-        filename = ""
-        # Récupération du nom de l'algorithme courant
-        algorithm_name = context.scene.api_properties.algorithm_choice.lower()
-        # Ajout du nom de l'algorithme dans le nom du fichier
-        filename += algorithm_name + "_"
-        # et dans le dictionnaire
-        self.data["algorithm"] = algorithm_name
-        # Récupération de la classe de propriétés associée à l'algorithme sélectionné
-        algorithm_properties = getattr(context.scene, algorithm_name, None)
-        if algorithm_properties is not None:
-            # Création d'un champ dans le dictionnaire contenant l'ensemble des propriétés de l'algorithme
-            self.data["properties"] = {}
-            # Création d'une table permettant de remplacer des caractères par d'autres
-            translation_table = str.maketrans({'[': '_', ']': '_', '.': '_', ',': '_'})
-            # parcours des noms des propriétés associées à l'algorithme courant
-            for prop_attribute in Globals.algorithm_properties[algorithm_name][1].keys():
-                # Récupération de la valeur associée à la propriété courante
-                value = getattr(algorithm_properties, prop_attribute)
-                result = None
-                # Si le paramètre est un nombre à virgule, nous l'arrondissons à deux décimales après la virgule
-                if isinstance(value, (float,)):
-                    result = round(value,2)
-                # sinon si le paramètre est de type Vector ou Color (types issus des propriétés XVectorProperty)
-                elif isinstance(value, (Color, Vector)):
-                    if isinstance(value[0], (float,)):
-                        result = [round(value[0],2), round(value[1],2), round(value[2],2)]
-                    else:
-                        result = [value[0], value[1], value[2]]
-                else:
-                    result = value
-                # stockage de la valeur associée au nom de la propriété dans le dictionnaire des données
-                self.data["properties"][prop_attribute] = result
-                # et mise à jour du nom du fichier
-                filename += prop_attribute + "_" + str(result).translate(translation_table) + "_"
-        else:
-            pass
-        return filename[:-1]
-
-
-    def execute(self, context):
-        try:
-            with open(self.filepath, "w", encoding="utf-8") as f:
-                json.dump(self.data, f, indent=4)
-            print(f"Exportation du fichier: {self.filepath} réussie.")
-            return {"FINISHED"}
-        except Exception as e:
-            print(f"Une erreur s'est produite lors de l'exportation du fichier {self.filepath} : {e}.")
-            return {"CANCELLED"}        
-
-    def invoke(self, context, event):
-        # Récupération du nom du fichier à exporter
-        filename = self.get_current_configuration(context)
-        self.filepath = filename + self.filename_ext
-        # Ouverture du gestionnaire de fichier de Blender
-        context.window_manager.fileselect_add(self)
-        return {"RUNNING_MODAL"}
-    
-
-class VIEW3D_OT_set_properties_to_default(bpy.types.Operator):
-    """Réinitialiser les valeurs des propriétés de l'algorithme courant"""
-    bl_idname = "wm.set_properties_to_default"
-    bl_label = "Réinitialiser les paramètres"     
-    bl_options = {"REGISTER", "UNDO"} 
-
-    def reset_properties(self, context):
-        # Récupération du nom de l'algorithme courant
-        algorithm_name = getattr(context.scene.api_properties, "algorithm_choice").lower()
-        # Récupération de la classe de propriétés associées à l'algorithme courant
-        algorithm_properties = getattr(context.scene, algorithm_name, None)
-        if algorithm_properties is not None:
-            # Pracours du nom des propriétés et des valeurs par défaut de l'algorithme courant
-            for property_name, default_value in Globals.algorithm_properties[algorithm_name][1].items():
-                # remise de la valeur de la propriété courante par défaut
-                setattr(algorithm_properties, property_name, default_value)
-        else:
-            pass
-
-
-    def execute(self, context):
-        self.reset_properties(context)
-        return {"FINISHED"}
-
-class VIEW3D_OT_align_camera_to_view(bpy.types.Operator):
-    """Aligne la vue de la caméra sur la vue de la scène"""
-    bl_idname = "wm.camera_to_scene_view"
-    bl_label = "Aligner la vue caméra sur la vue de la scène"
-    bl_options = {"REGISTER", "UNDO"}
-
-    @classmethod
-    def poll(cls, context):
-        return bpy.ops.view3d.camera_to_view.poll()
-
-    def execute(self, context):
-        # alignement de la vue caméra sur la vue de la scène
-        bpy.ops.view3d.camera_to_view()
-        return {'FINISHED'}         
-
-
-class VIEW3D_PT_stereoscopy_panel(bpy.types.Panel):
-    bl_label = "Stéréoscopie"  # Titre du panneau latéral
-    bl_idname = "VIEW3D_PT_stereoscopy_panel"
-    bl_space_type = "VIEW_3D"  # espace dans lequel est situé le panneau
-    bl_region_type = "UI"  # région dans laquelle le panneau se situe
-
-    bl_category = "API C++"  # Nom de l'onglet auquel attacher le panneau
-
-    def draw(self, context):
-        # Récupération de la scène
-        scene = context.scene
-        layout = self.layout
-        layout.use_property_split = False
-
-        row = layout.row()
-        row.scale_y = 1.4
-        row.prop(scene.render, "use_multiview", text="Activer la stéréoscopie ?")
-        # Si l'utilisateur a choisi d'activer la stéréoscopie
-        if scene.render.use_multiview is True:
-            # Récupération des propriétés gérant les zones de clipping de la scène
-            space_data = context.space_data
-            row = layout.row()
-            row.scale_y = 1.4
-            col = row.column(align=True)
-            col.prop(space_data, "clip_start", text="Début du clipping (Scène)")
-            col.prop(space_data, "clip_end", text="Fin du clipping (Scène)")
-            col = layout.column(align=True)
-            col.scale_y = 1.4
-            col.prop(scene, "camera")
-            # Récupération de la référence contenue dans la propriété scene.camera
-            camera = scene.camera
-            # Si une caméra est sélectionnée
-            if camera is not None:
-                # Affichage des zones de clipping de la caméra courante
-                col.prop(camera.data, "clip_start", text="Début du clipping (Caméra)")
-                col.prop(camera.data, "clip_end", text="Fin du clipping (Caméra)")
-                # Affichage des options de la stéréoscopie de la caméra
-                col.prop(camera.data.stereo, "convergence_distance", text="Distance du plan de convergence")
-                col.prop(camera.data.stereo, "interocular_distance", text="Distance interoculaire")
-                col.prop(space_data, "lock_camera", text="Utiliser la vue caméra comme vue de la scène ?")
-                row = layout.row()
-                row.scale_y = 1.7
-                row.operator(VIEW3D_OT_align_camera_to_view.bl_idname, text="Aligner la vue caméra sur la vue de la scène")
-
-
-class VIEW3D_PT_cpp_api_panel(bpy.types.Panel):
-    bl_label = "Algorithmes de traitements de maillages"  # Titre du panneau latéral
-    bl_idname = "VIEW3D_PT_cpp_api_panel"
-    bl_space_type = "VIEW_3D"  # espace dans lequel est situé le panneau
-    bl_region_type = "UI"  # région dans laquelle le panneau se situe
-
-    bl_category = "API C++"  # Nom de l'onglet auquel attacher le panneau
-
-    def draw(self, context):
-        # Récupération du groupe de propriétés de l'API
-        api_properties = context.scene.api_properties
-        layout = self.layout
-        layout.use_property_split = False
-
-        row = layout.row()
-        row.label(text="Choisissez un algorithme à appliquer sur le maillage courant :")
-        row = layout.row()
-        row.scale_y = 1.4
-        row.prop(api_properties, "algorithm_choice")
-        
-        # affichage des propriétés en fonction de l'algorithme choisi par l'utilisateur
-        # Récupération du nom de l'algorithme courant (provenant soit d'une configuration prédéfinie soit d'un choix de l'utilisateur)
-        algorithm_name = api_properties.algorithm_choice
-        # Globals.algorithm_properties[current_choice.algorithm_choice]["drawing_properties"](layout, context)
-        # création d'une nouvelle ligne dans laquelle nous ajoutons un bouton (instance de la classe VIEW3D_OT_api_cgal)
-        if algorithm_name != "DEFAULT":
-            draw_properties(layout, context, algorithm_name)
-            # Récupération de la description de l'algorithme
-            description = Globals.algorithm_description[algorithm_name.lower()]
-            row = layout.row()
-            row.label(text="Description de l'algorithme :", icon="QUESTION")
-            box = layout.box()
-            col = box.column()
-            # Récupération du booléen gérant l'affichage ou le masquage partiel de la description de l'algorithme
-            description_is_hidden = api_properties.description_is_hidden                 
-            if description_is_hidden:
-                col.label(text=description[0][:-3] + "...")
-            else:
-                for line in description:
-                    col.label(text=line)
-            row = box.row()
-            row.scale_y = 1.2
-            row.operator(VIEW3D_OT_display_description.bl_idname, text="Etendre la description" if description_is_hidden else "Réduire la description")
-
-            if api_properties.result_infos != "":
-                for line in api_properties.result_infos.splitlines():
-                    layout.label(text=line)
-            else:
-                pass
-            row = layout.row()
-            row.enabled = is_option_selected(context, algorithm_name)
-            row.scale_y = 1.7
-            # l'opérateur est référencé par un nom correspondant à la valeur de l'attribut bl_idname de la classe
-            row.operator(VIEW3D_OT_execute_algorithm.bl_idname, text="Appliquer l'algorithme")
-        else:
-            pass
-
-
-
-## Fonctions d'enregistrement, de désincription et de référencement des groupe de propriétés des classes de l'API
-classes = (VIEW3D_PT_cpp_api_panel, VIEW3D_PT_stereoscopy_panel, VIEW3D_OT_align_camera_to_view, VIEW3D_OT_set_properties_to_default, VIEW3D_OT_load_configuration, VIEW3D_OT_save_configuration, VIEW3D_OT_display_description, VIEW3D_OT_execute_algorithm)
-
-def algorithm_properties_registering():
-    # Enregistrement toutes les classes de propriétés des algorithmes de l'API
-    for property_class in Globals.properties_table.values():
-        bpy.utils.register_class(property_class)
-
-
-def unregister_algorithm_properties():
-    # Désinscription des classes de propriétés des algorithmes de l'API
-    for property_class in reversed(list(Globals.properties_table.values())):
-        bpy.utils.unregister_class(property_class)
-
-
-def create_property_pointers():
-    # et pour tous les algorithmes présents dans l'API
-    for attribute, property_class in Globals.properties_table.items():
-        setattr(bpy.types.Scene, attribute, bpy.props.PointerProperty(type=property_class))
-
-
-def delete_property_pointers():
-    # ainsi que les attributs référençant toutes les classes de propriétés des algorithmes présents dans Blender
-    for attribute in Globals.properties_table.keys():
-        delattr(bpy.types.Scene, attribute)
-
-
-def register():
-    check_required_modules()
-    # Enregistrement des classes basiques (panneau, boutons, ...) dans le registre de Blender
-    for cls in classes:
-        bpy.utils.register_class(cls)
-    load_algorithms()
-    # Enregistrement des classes de propriétés des différents algorithmes de l'API ainsi que la liste déroulante
-    # algorithm_properties_registering()
-    # Création des pointeurs permettant de référencer les propriétés des algorithmes de l'API dans le registre de Blender
-    # create_property_pointers()
-
-
-def unregister():
-    # Désinscription des classes de propriétés des algorithmes de l'API
-    unregister_algorithm_properties()
-    # Désinscription de la liste déroulante
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
-    # Suppression des pointeurs référençant les propriétés des algorithmes de l'API
-    delete_property_pointers()
-
-
-if __name__ == "__main__":
-    register()
+bl_info = {
+    "name": "Prototype API CGAL.",
+    "author": "Richard Leestmans",
+    "version": (1, 0),
+    "blender": (4, 0, 0),
+    "description": "Prototype d'API permettant d'éxécuter divers algorithmes provenant de CGAL.",
+    "location": "VIEW3D > UI > API C++",
+    "doc_url": "",
+    "tracker_url": "",
+    "category": "Mesh",
+}
+
+import bpy
+from bpy_extras.io_utils import ImportHelper, ExportHelper
+import bmesh
+from mathutils import Vector, Color
+import numpy as np
+import json
+import os
+from api_modules.lazy_import import LazyModule, is_loaded, import_times
+from api_modules.registry import load_registry
+from api_modules.background_job import AlgorithmJob
+from api_modules.pipeline import Pipeline, load_pipelines, parse_pipeline, check_pipeline, get_pipeline_inputs
+from api_modules.preview import ProxyCache, PreviewScheduler, DEFAULT_PROXY_FACES
+from api_modules.subset import SubsetAlgorithm
+from api_modules.deviation import DeviationAlgorithm, DEFAULT_SAMPLES
+import time
+import sys
+import importlib.util
+
+# Modules importés lors de leur première utilisation (l'importation de pymeshlab et du module natif ralentit le démarrage de Blender)
+algorithms_api = LazyModule("api_modules.algorithms_api")
+py_mesh = LazyModule("api_modules.py_mesh")
+pymeshlab = LazyModule("pymeshlab")
+
+# Fonction d'affichage des différentes propriétés suivant l'algorithme choisi par l'utilisateur
+def draw_properties(layout, context, algorithm_name):
+    # Récupération de la classe de propriétés associée à l'algorithme sélectionné
+    algorithm_properties = getattr(context.scene, algorithm_name.lower(), None)
+    if algorithm_properties is not None:
+        col = layout.column(align=True)
+        col.scale_y = 1.4
+        # affichage des propriétés de l'algorithme
+        for prop_attribute in Globals.algorithm_properties[algorithm_name.lower()][1].keys():
+            col.prop(algorithm_properties, prop_attribute)
+    else:
+        pass
+    # Ajout des boutons d'importation et d'exportation des configurations prédéfinies
+    row = layout.row(align=True)
+    row.scale_y = 1.4
+    col = row.column(align=True)
+    col.operator(VIEW3D_OT_load_configuration.bl_idname, text="Importer")
+    if algorithm_properties is not None:
+        col = row.column(align=True)
+        col.enabled = is_option_selected(context, algorithm_name)
+        col.operator(VIEW3D_OT_save_configuration.bl_idname, text="Sauvegarder")
+    else:
+        pass
+
+    # Ajout d'un bouton permettant à l'utilisateur de réinitialiser les valeurs des paramètres de l'algorithme courant
+    if algorithm_properties is not None:
+        row = layout.row()
+        row.scale_y = 1.2
+        row.operator(VIEW3D_OT_set_properties_to_default.bl_idname, text="Réinitialiser les paramètres de l'algorithme")
+    else:
+        pass
+
+    
+## Fonctions d'applications des traitements sur le maillage courant à partir des résultats retournés par l'algorithme choisi par l'utilisateur
+def display_results(context, data, output_result):
+    # Stockage du message de résultats dans la propriété permettant d'afficher des messages dans l'API
+    context.scene.api_properties.result_infos = data.get("result_infos", "")
+
+def fill_mesh_geometry(mesh, vertices, faces, validate):
+    """Remplissage d'un maillage vide à partir des tableaux (à une dimension) des coordonnées des sommets et des indices des sommets des faces triangulaires"""
+    # Conversion (sans copie si les types correspondent déjà) des données vers les types attendus par Blender
+    vertices = np.asarray(vertices, dtype=np.float32).reshape(-1)
+    faces = np.asarray(faces, dtype=np.int32).reshape(-1)
+    number_of_faces = len(faces) // 3
+
+    mesh.vertices.add(len(vertices) // 3)
+    mesh.vertices.foreach_set("co", vertices)
+
+    mesh.loops.add(len(faces))
+    mesh.polygons.add(number_of_faces)
+    mesh.loops.foreach_set("vertex_index", faces)
+
+    # Toutes les faces sont des triangles : les indices de leur première boucle sont donc des multiples de 3
+    mesh.polygons.foreach_set("loop_start", np.arange(0, len(faces), 3, dtype=np.int32))
+    mesh.polygons.foreach_set("loop_total", np.full(number_of_faces, 3, dtype=np.int32))
+    mesh.polygons.foreach_set("use_smooth", np.zeros(number_of_faces, dtype=bool))
+
+    # Vérification (optionnelle) de la validité du maillage puis mise à jour du maillage avec sa nouvelle structure (création des arêtes)
+    if validate:
+        mesh.validate()
+    else:
+        pass
+    mesh.update(calc_edges=True)
+
+
+def set_new_mesh(context, data, output_result):
+    # Récupération de l'objet courant
+    object = context.active_object
+    # Récupération des options de mise à jour du maillage
+    api_properties = context.scene.api_properties
+
+    # extraction des données de la structure (ici les nouvelles coordonnées des sommets restants du maillage ainsi que les nouveaux indices des faces)
+    resulting_mesh_vertices = data.get("vertices", None)
+    resulting_mesh_faces = data.get("faces", None)
+
+    if resulting_mesh_vertices is not None and resulting_mesh_faces is not None:
+        # Vérification si l'algorithme nécessite le remplacement du maillage courant par le nouveau maillage
+        if output_result == "replace_mesh":
+            mesh = object.data
+            # Si le maillage est partagé par plusieurs objets, un nouveau maillage est associé à l'objet courant afin de ne pas modifier les autres objets
+            if mesh.users > 1:
+                mesh = bpy.data.meshes.new(name=mesh.name)
+                object.data = mesh
+            else:
+                # Sinon la géométrie est remplacée directement dans le maillage existant : l'objet, ses transformations, ses modificateurs
+                # et ses matériaux sont conservés
+                mesh.clear_geometry()
+            fill_mesh_geometry(mesh, resulting_mesh_vertices, resulting_mesh_faces, api_properties.validate_mesh)
+            # Les faces retournées comme sélectionnées (par exemple issues du remaillage de la sélection) le restent dans le nouveau maillage
+            selected_faces = data.get("selected_faces", None)
+            if selected_faces is not None:
+                selected = np.zeros(len(mesh.polygons), dtype=bool)
+                selected[selected_faces] = True
+                mesh.polygons.foreach_set("select", selected)
+            else:
+                pass
+            # Sélection de l'objet modifié (nécessaire pour centrer la vue sur ce dernier)
+            object.select_set(True)
+        else:
+            # Création d'un nouveau maillage (dont le nom est complété par un éventuel suffixe, par exemple pour distinguer les niveaux de détail)
+            mesh_name = object.data.name + data.get("name_suffix", "")
+            resulting_mesh = bpy.data.meshes.new(name=mesh_name)
+            # et construction de ce dernier avec les nouvelles données
+            fill_mesh_geometry(resulting_mesh, resulting_mesh_vertices, resulting_mesh_faces, api_properties.validate_mesh)
+
+            # Création d'un objet Blender auquel associer le maillage nouvellement créé
+            obj = bpy.data.objects.new(mesh_name, resulting_mesh)
+
+            # Application de l'ensemble des transformations de l'objet courant sur le nouvel objet
+            obj.location = object.location.copy()
+            obj.rotation_euler = object.rotation_euler.copy()
+            obj.scale = object.scale.copy()
+
+            # Ajout de l'objet à la scène
+            context.scene.collection.objects.link(obj)
+
+            # Déselection de tous les objets de la scène
+            for selected_object in context.selected_objects:
+                selected_object.select_set(False)
+            # et sélection de l'objet dans la scène 3D comme nouvel objet courant
+            context.view_layer.objects.active = obj
+            obj.select_set(True)
+
+        # Et nous centrons éventuellement la scène sur l'objet (équivaut à Numpad .)
+        if api_properties.frame_result:
+            bpy.ops.view3d.view_selected(use_all_regions=False)
+        else:
+            pass
+    else:
+        raise RuntimeError("Une erreur s'est produite lors de la création du nouveau maillage.")
+
+
+def add_lod_meshes(context, data, output_result):
+    # Récupération de l'objet courant à partir duquel les niveaux de détail ont été calculés
+    object = context.active_object
+    levels = data.get("levels", None)
+    if object is not None and levels:
+        # Chaque niveau de détail est ajouté dans la scène sous la forme d'un nouvel objet
+        for level in levels:
+            # L'objet d'origine redevient l'objet courant afin que chaque niveau hérite de ses transformations et de son nom
+            context.view_layer.objects.active = object
+            set_new_mesh(context, level, "add_mesh")
+    else:
+        raise RuntimeError("Une erreur s'est produite lors de la création des niveaux de détail du maillage.")
+
+
+def set_mesh_colors(context, data, output_result):
+    # Récupération de l'objet courant
+    object = context.active_object
+    # et de son maillage associé
+    mesh = object.data
+    
+    # Récupération du tableau des couleurs du maillage
+    colors = data.get("colors", None)
+    # Récupération du nombre de segments obtenus
+    # colors_number = data.get("colors_number", None)
+    if colors is not None:
+        # Récupération du nom de l'algorithme choisi par l'utilisateur
+        current_algorithm_name = context.scene.api_properties.algorithm_choice.lower()
+
+        # Récupération du groupe de propriétés associé à l'algorithme courant
+        property_group = getattr(context.scene, current_algorithm_name, None)
+
+        # Récupération si présente, l'option permettant de supprimer les matériaux déjà associés au maillage courant
+        delete_materials_option = getattr(property_group, "delete_materials", None)
+        # Vérification si l'utilisateur a souhaité supprimer les matériaux déjà associés au maillage
+        if delete_materials_option is not None and delete_materials_option:
+            mesh.materials.clear()
+            attributes = mesh.attributes
+            for i in range(len(attributes) - 1, -1, -1):
+                name = attributes[i].name
+                if name.split('.')[0] == "Face_Col" or name.split('.')[0] == "Vertex_Col":
+                    attributes.remove(attributes[i])
+        else:
+            pass
+
+        # Création de l'attribut de couleurs (vertex color layout) permettant de gérer les couleurs des faces ou des sommets du maillage
+        if output_result == "face_coloration":
+            color_layout = mesh.attributes.new(name="Face_Col", type="FLOAT_COLOR", domain="FACE")
+        elif output_result == "vertex_coloration":
+            color_layout = mesh.color_attributes.new(name="Vertex_Col", type="FLOAT_COLOR", domain="POINT")
+            # définition de l'attribut comme attribut de couleurs actif
+            setattr(mesh.color_attributes, "active_color", color_layout)
+        else:
+            raise RuntimeError("Le choix de sortie est inconnu.")
+
+        # Les couleurs calculées par triangle (maillage triangulé via "loop_triangles") sont ramenées aux faces du maillage
+        if output_result == "face_coloration":
+            colors = get_polygon_colors(object, colors)
+        else:
+            pass
+
+        # Stockage des informations de couleurs dans l'attribut
+        color_layout.data.foreach_set("color", colors)
+
+        # Récupération du nombre de matériaux déjà associés au maillage (servira d'offset pour affecter le bon matériau à la bonne face)
+        nb_materials = len(mesh.materials)
+
+        # Création d'un nouveau matériau permettant d'afficher les couleurs du maillage
+        material = bpy.data.materials.new(name="Mesh_Color")
+
+        # affectation du nouveau matériau au maillage
+        mesh.materials.append(material)
+        # utilisation des noeuds pour ce matériau
+        material.use_nodes = True
+
+        # Récupération de l'ensemble des noeuds du matériau et de l'ensemble des liens inter-noeuds
+        nodes = material.node_tree.nodes
+        links = material.node_tree.links
+        
+        # Création d'un noeud "Attribut"
+        attribute = nodes.new(type="ShaderNodeAttribute")
+        # définition du nom de l'attribut sur "Face_Col" (couleurs des faces du maillage) ou "Vertex_Col" (couleurs des sommets du maillage)
+        attribute.attribute_name = color_layout.name
+        attribute.location = (60, 330)
+
+        # Récupération du noeud "Principled BSDF" (présent par défaut)
+        bsdf = nodes["Principled BSDF"]
+        # Création d'un lien entre la sortie "Color" du noeud "Attribut" et l'entrée "Base Color" du noeud "Principled BSDF"
+        links.new(bsdf.inputs["Base Color"], attribute.outputs["Color"])
+
+        # Désélection de tous les noeuds présents dans le matériau
+        for node in nodes:
+            node.select = False
+
+        # Affectation de l'indice du matériau nouvellement créé à toutes les faces du maillage
+        mesh.polygons.foreach_set("material_index", [nb_materials] * len(mesh.polygons))
+        # Définition de l'attribut créé comme attribut actif du maillage
+        mesh.update()
+
+        # Passage du mode de rendu sur "MATERIAL" afin de pouvoir visualiser le résultat
+        context.space_data.shading.type = "MATERIAL"
+    else:
+        raise RuntimeError("Une erreur s'est produite lors de l'affectation des couleurs aux faces du maillage.")
+
+
+def get_polygon_values(object, values):
+    """Report sur les faces du maillage de valeurs calculées par face (une ligne du tableau par face ou par triangle de la triangulation)"""
+    mesh = object.data
+    # Une valeur par face du maillage : aucune conversion n'est nécessaire
+    if len(values) == len(mesh.polygons):
+        return values
+    # Sinon les valeurs correspondent aux triangles de la triangulation non destructive du maillage : chaque face reçoit la valeur de ses triangles
+    # ou aux triangles du maillage réparé côté C++ ("native_repair" : les triangles supprimés par la réparation ne transmettent aucune valeur)
+    cache = Globals.loop_triangles_cache.get(object.name, None)
+    polygon_index = None
+    if cache is not None and len(cache["polygon_index"]) == len(values):
+        polygon_index = cache["polygon_index"]
+    elif cache is not None and "repair" in cache and len(cache["repair"]["polygon_index"]) == len(values):
+        polygon_index = cache["repair"]["polygon_index"]
+    else:
+        raise RuntimeError("Le nombre de valeurs retournées ne correspond pas au nombre de faces du maillage.")
+    polygon_values = np.zeros((len(mesh.polygons),) + values.shape[1:], dtype=values.dtype)
+    polygon_values[polygon_index] = values
+    return polygon_values
+
+
+def get_polygon_colors(object, colors):
+    colors = np.asarray(colors, dtype=np.float32).reshape(-1, 4)
+    return get_polygon_values(object, colors).reshape(-1)
+
+
+def set_face_segments(context, data, output_result):
+    # Stockage de l'identifiant du segment de chaque face dans un attribut entier du maillage de l'objet courant
+    object = context.active_object
+    mesh = object.data
+    segments_ids = data.get("segments_ids", None)
+    if segments_ids is not None:
+        segments_ids = get_polygon_values(object, np.asarray(segments_ids, dtype=np.int32).reshape(-1))
+        # L'attribut d'une segmentation précédente est remplacé
+        attribute = mesh.attributes.get("Segment_Id", None)
+        if attribute is not None:
+            mesh.attributes.remove(attribute)
+        else:
+            pass
+        attribute = mesh.attributes.new(name="Segment_Id", type="INT", domain="FACE")
+        attribute.data.foreach_set("value", segments_ids)
+        context.scene.api_properties.result_infos = f"Nombre de segments obtenus : {data.get('segments_number', 0)}.\nIdentifiants stockés dans l'attribut \"Segment_Id\" des faces."
+    else:
+        raise RuntimeError("Une erreur s'est produite lors de la récupération des identifiants des segments.")
+
+
+def add_segment_meshes(context, data, output_result):
+    # Création d'un objet par segment : les sous-maillages (sommets renumérotés) sont construits côté C++, les objets sont regroupés
+    # dans une nouvelle collection et créés sans passer par les opérateurs de Blender
+    object = context.active_object
+    segments = data.get("segments", None)
+    if object is not None and segments:
+        api_properties = context.scene.api_properties
+        collection = bpy.data.collections.new(object.name + "_segments")
+        context.scene.collection.children.link(collection)
+        for selected_object in context.selected_objects:
+            selected_object.select_set(False)
+        for segment in segments:
+            mesh_name = object.data.name + segment["name_suffix"]
+            mesh = bpy.data.meshes.new(name=mesh_name)
+            fill_mesh_geometry(mesh, segment["vertices"], segment["faces"], api_properties.validate_mesh)
+            # Les matériaux de l'objet d'origine sont conservés
+            for material in object.data.materials:
+                mesh.materials.append(material)
+            obj = bpy.data.objects.new(mesh_name, mesh)
+            obj.matrix_world = object.matrix_world.copy()
+            obj["segment_id"] = segment["segment_id"]
+            collection.objects.link(obj)
+            obj.select_set(True)
+        # L'objet d'origine est masqué et le premier segment devient l'objet courant
+        object.hide_set(True)
+        context.view_layer.objects.active = collection.objects[0]
+        if api_properties.frame_result:
+            bpy.ops.view3d.view_selected(use_all_regions=False)
+        else:
+            pass
+        api_properties.result_infos = f"{len(segments)} objets créés dans la collection \"{collection.name}\"."
+    else:
+        raise RuntimeError("Une erreur s'est produite lors de la séparation des segments du maillage.")
+
+
+## Fonctions de fabrication des propriétés Blender
+# Création d'une IntProperty à la volée
+def create_integer_property(data, update=None):
+    default_value = data.get("default", 0)
+    return bpy.props.IntProperty(name=data.get("name", ""),
+        description=data.get("description", ""),
+        update=update,  # Fonction appelée à chaque modification de la valeur (aperçu de l'algorithme)
+        default=default_value,  # Valeur par défaut
+        min=data.get("min", 0),  # Valeur minimale
+        max=data.get("max", 1),  # Valeur maximale
+        step=data.get("step", 1)), default_value  # Incrémentation pour le curseur
+
+
+# Création d'une FloatProperty à la volée
+def create_float_property(data, update=None):
+    default_value = data.get("default", 0)
+    return bpy.props.FloatProperty(name=data.get("name", ""),
+        description=data.get("description", ""),
+        update=update,  # Fonction appelée à chaque modification de la valeur (aperçu de l'algorithme)
+        default=default_value,  # Valeur par défaut
+        min=data.get("min", 0),  # Valeur minimale
+        max=data.get("max", 1),  # Valeur maximale
+        step=data.get("step", 1)), default_value  # Incrémentation pour le curseur (une valeur "step" de 1 pour une FloatProperty indique un pas de 0.01)
+
+
+# Création d'une BoolProperty à la volée
+def create_boolean_property(data, update=None):
+    default_value = data.get("default", False)
+    return bpy.props.BoolProperty(name=data.get("name", ""),
+        description=data.get("description", ""),
+        update=update,
+        default=default_value), default_value  # Valeur par défaut
+
+
+# Création d'une EnumProperty à la volée
+def create_enum_property(data, update=None):
+    # Récupération des données des items de la liste déroulante
+    items_data = data["items"]
+    # Création d'une liste contenant le choix par défaut de la liste déroulante
+    items = [("DEFAULT", "--Choix de l'option--", "")]
+    # Remplissage de la liste avec toutes les options de sortie disponibles pour cet algorithme
+    for item in items_data:
+        items.append((item["id"], item["name"], item.get("description", "")))
+    return bpy.props.EnumProperty(name=data.get("name", ""),
+        items=items, 
+        update=update,
+        default="DEFAULT"), "DEFAULT"
+
+
+# Création d'une StringProperty à la volée
+def create_string_property(data, update=None):
+    default_value = data.get("default", "")
+    return bpy.props.StringProperty(name=data.get("name", ""),
+        description=data.get("description", ""),
+        update=update,
+        default=default_value), default_value  # Valeur par défaut
+
+
+# Création d'une FloatVectorProperty à la volée
+def create_float_vector_property(data, update=None):
+    default_value = tuple(data.get("default", [0,0,0]))
+    return bpy.props.FloatVectorProperty(name=data.get("name", ""),
+        description=data.get("description",""),
+        update=update,
+        default=default_value,  # Valeur par défaut
+        min=data.get("min", 0),  # Valeur minimale
+        max=data.get("max", 1),  # Valeur maximale
+        subtype=data.get("subtype","none").upper()), default_value
+
+
+## Fonctions de préparation du maillage et de collecte des données à envoyer aux algorithmes côté C++
+# Fonction permettant de triangulariser un maillage en mode "OBJET"
+def triangulate_mesh(object, data):
+    # Récupération du maillage associé à l'objet courant
+    mesh = object.data
+    # Création d'un bmesh qui va contenir une copie virtuelle de notre maillage et sur lequel va s"appliquer la triangularisation des faces
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+        
+    # Vérification que le maillage ne possède pas de doublons en supprimant les sommets qui se superposent
+    bmesh.ops.remove_doubles(bm, verts=bm.verts[:], dist=0.0001)
+    # puis triangularisation des faces de la copie virtuelle du maillage
+    bmesh.ops.triangulate(bm, faces=bm.faces[:])
+    
+    # Mise à jour du maillage courant en écrasant ses anciennes données par celles contenues dans la copie virtuelle
+    bm.to_mesh(mesh)
+    # et suppression de la copie virtuelle
+    bm.free()
+
+
+# Fonction permettant de récupérer les faces triangulées du maillage sans le modifier (alternative non destructive à "triangulation" + "face_indices")
+def get_loop_triangles(object, data):
+    # Récupération du maillage associé à l'objet courant
+    mesh = object.data
+    # Signature permettant de vérifier que la triangulation conservée correspond toujours au maillage (les modifications de la géométrie
+    # sont par ailleurs détectées par le gestionnaire "invalidate_loop_triangles_cache")
+    signature = (mesh.as_pointer(), len(mesh.vertices), len(mesh.loops), len(mesh.polygons))
+    cache = Globals.loop_triangles_cache.get(object.name, None)
+    if cache is None or cache["signature"] != signature:
+        # Calcul de la triangulation des faces (effectué par Blender, le maillage de l'utilisateur n'est pas modifié)
+        mesh.calc_loop_triangles()
+        number_of_triangles = len(mesh.loop_triangles)
+        # Récupération des indices des sommets des triangles
+        faces = np.empty(number_of_triangles * 3, dtype=np.int32)
+        mesh.loop_triangles.foreach_get("vertices", faces)
+        # ainsi que de l'indice de la face d'origine de chaque triangle (permet de ramener des données par triangle aux faces du maillage)
+        polygon_index = np.empty(number_of_triangles, dtype=np.int32)
+        mesh.loop_triangles.foreach_get("polygon_index", polygon_index)
+        cache = {"signature": signature, "mesh_name": mesh.name, "faces": faces, "polygon_index": polygon_index}
+        Globals.loop_triangles_cache[object.name] = cache
+    else:
+        pass
+    # stockage des résultats dans le dictionnaire des données à envoyer
+    data["faces"] = cache["faces"]
+    data["polygon_index"] = cache["polygon_index"]
+
+
+# Fonction permettant de réparer le maillage côté C++ (alternative native et non destructive à "triangulation" : fusion des sommets proches
+# par hachage spatial, suppression des faces dégénérées, en double ou non manifold et orientation cohérente des faces)
+def repair_mesh(object, data):
+    # Triangulation non destructive du maillage et récupération des coordonnées de ses sommets
+    get_loop_triangles(object, data)
+    get_vertex_coordinates(object, data)
+    cache = Globals.loop_triangles_cache[object.name]
+    tolerance = bpy.context.scene.api_properties.repair_tolerance
+    # Le maillage réparé est conservé avec la triangulation tant que la géométrie et la distance de fusion ne changent pas
+    repair = cache.get("repair", None)
+    if repair is None or repair["tolerance"] != tolerance or not np.array_equal(repair["input_vertices"], data["vertices"]):
+        result = algorithms_api.repair_mesh(data["vertices"], data["faces"], tolerance)
+        repair = {"tolerance": tolerance,
+                  "input_vertices": data["vertices"],
+                  "vertices": result["vertices"],
+                  "faces": result["faces"],
+                  # Indice de la face d'origine de chaque triangle conservé
+                  "polygon_index": cache["polygon_index"][result["face_map"]],
+                  "report": result["report"]}
+        cache["repair"] = repair
+        report = result["report"]
+        print(f"Réparation du maillage '{object.name}' : {report['welded_vertices']} sommets fusionnés, {report['dropped_faces']} faces supprimées "
+              f"({report['degenerate_faces']} dégénérées, {report['duplicate_faces']} en double, {report['non_manifold_faces']} non manifold, "
+              f"{report['non_orientable_faces']} non orientables), {report['flipped_faces']} faces retournées, {report['split_vertices']} sommets dupliqués "
+              f"({result['profile']['phases']['compute'] / 1e6:.1f} ms).")
+    else:
+        pass
+    Globals.last_repair_report = repair["report"]
+    # stockage des résultats dans le dictionnaire des données à envoyer
+    data["vertices"] = repair["vertices"]
+    data["faces"] = repair["faces"]
+    data["polygon_index"] = repair["polygon_index"]
+
+
+# Fonction permettant de récupérer les indices des triangles envoyés dont la face d'origine est sélectionnée (à exécuter après la triangulation
+# ou la réparation du maillage, dont la correspondance entre triangles et faces du maillage est utilisée)
+def get_selected_faces(object, data):
+    # Récupération du maillage associé à l'objet courant
+    mesh = object.data
+    # Récupération de l'état de sélection des faces du maillage (mis à jour lors du passage en mode "OBJET")
+    selected = np.empty(len(mesh.polygons), dtype=bool)
+    mesh.polygons.foreach_get("select", selected)
+    # Face d'origine de chaque triangle (les faces récupérées sans triangulation non destructive correspondent aux faces du maillage)
+    polygon_index = data.get("polygon_index", None)
+    if polygon_index is not None:
+        selected = selected[polygon_index]
+    else:
+        pass
+    # et stockage du résultat dans le dictionnaire des données à envoyer
+    data["selected_faces"] = np.flatnonzero(selected).astype(np.int32)
+
+
+# Gestionnaire appelé après chaque mise à jour du graphe de dépendances de Blender : suppression des triangulations conservées
+# dont la géométrie du maillage a été modifiée
+def invalidate_loop_triangles_cache(scene, depsgraph):
+    if not Globals.loop_triangles_cache:
+        return
+    for update in depsgraph.updates:
+        if not update.is_updated_geometry:
+            continue
+        updated_id = update.id.original
+        if isinstance(updated_id, bpy.types.Object):
+            Globals.loop_triangles_cache.pop(updated_id.name, None)
+        elif isinstance(updated_id, bpy.types.Mesh):
+            for object_name in [name for name, cache in Globals.loop_triangles_cache.items() if cache["mesh_name"] == updated_id.name]:
+                del Globals.loop_triangles_cache[object_name]
+        else:
+            pass
+
+
+def get_vertex_coordinates(object, data):
+    # Récupération du maillage associé à l'objet courant
+    mesh = object.data
+    # Récupération des coordonnées des sommets du maillage (dans leur type natif float32, lu sans conversion côté C++)
+    vertices = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", vertices)
+    # et stockage du résultat dans le dictionnaire des données à envoyer
+    data["vertices"] = vertices
+
+
+def get_face_indices(object, data):
+    # Récupération du maillage associé à l'objet courant
+    mesh = object.data
+    # Récupération des indices des faces du maillage
+    faces = np.empty(len(mesh.polygons) * 3, dtype=np.int32)
+    mesh.polygons.foreach_get("vertices", faces)
+    # et stockage du résultat dans le dictionnaire des données à envoyer
+    data["faces"] = faces
+
+
+def get_color_data(object, data):
+    # Récupération du maillage associé à l'objet courant
+    mesh = object.data
+    # Récupération de l'attribut de couleurs associé aux sommets actif (si présent)
+    active_vertex_colors = mesh.color_attributes.active_color
+    # S'il existe un attribut de couleurs associé aux sommets du maillage
+    if active_vertex_colors:
+        # Création d'un tableau numpy permettant de stocker les couleurs du maillage
+        vertex_color_array = np.zeros(len(mesh.vertices) * 4, dtype=np.float64)
+        # Stockage des couleurs de l'attribut dans le tableau numpy
+        active_vertex_colors.data.foreach_get("color", vertex_color_array)
+        data["vertex_color"] = vertex_color_array
+    # S'il n'y a pas d'attributs associant des couleurs aux sommets du maillage, nous essayons de voir
+    # s'il existe un attribut associant des couleurs aux faces du maillage
+    else:
+        # Récupération des attributs du maillage
+        attributes = mesh.attributes
+        # Parcours des attributs du dernier au premier de sorte à récupérer le dernier attribut créé associant
+        # des couleurs aux faces (si présent)
+        for i in range(len(attributes) - 1, -1, -1):
+            # Si l'attribut courant contient des couleurs (données de type FLOAT_COLOR) et les associe aux faces
+            # alors il s'agit de l'attribut recherché
+            current_attribute = attributes[i]
+            if current_attribute.data_type == "FLOAT_COLOR" and current_attribute.domain == "FACE":
+                # Création d'un tableau numpy permettant de stocker les informations des couleurs
+                face_color_array = np.zeros(len(mesh.polygons) * 4, dtype=np.float64)
+                current_attribute.data.foreach_get("color", face_color_array)
+                data["face_color"] = face_color_array
+                break
+            else:
+                pass
+
+
+## Fonctions permettant de transformer des types de données de Blender en types de données MeshLab
+def get_percentage_value_instance(value):
+    return pymeshlab.PercentageValue(value)
+
+
+def get_pure_value_instance(value):
+    return pymeshlab.PureValue(value)
+
+
+def get_color_instance(value):
+    return pymeshlab.Color(round(value.r * 255), round(value.g * 255), round(value.b * 255))
+
+
+def get_numpy_float_array(value):
+    return np.array(value, dtype=np.float64)
+
+
+# Variables globales
+class Globals:
+    # Fabrique à création de propriétés Blender
+    properties_factory = {"integer": create_integer_property,
+                         "float": create_float_property,
+                         "boolean": create_boolean_property,
+                         "enum": create_enum_property,
+                         "string": create_string_property,
+                         "percentage_value": create_float_property,
+                         "pure_value": create_float_property,
+                         "color": create_float_vector_property,
+                         "float_array": create_float_vector_property}
+    # Fabrique à préparation du maillage et des données à envoyer côté C++
+    inputs_factory = {"triangulation": triangulate_mesh,
+                      "loop_triangles": get_loop_triangles, # Triangulation non destructive (le maillage de l'utilisateur n'est pas modifié)
+                      "native_repair": repair_mesh, # Triangulation non destructive et réparation du maillage côté C++
+                      "vertex_coordinates": get_vertex_coordinates,
+                      "face_indices": get_face_indices,
+                      "face_selection": get_selected_faces, # Indices des triangles issus des faces sélectionnées
+                      "color_data": get_color_data}
+    # Table permettant de gérer les résultats retournés par l'API C++ et d'effectuer les traitements correspondants en fonction
+    # de la nature de la demande initiale de retour des données
+    outputs_table = {"message": display_results, # Affiche un message dans l'API donnant des informations sur les résultats du traitement effectué
+                     "face_coloration": set_mesh_colors, # Définit des nouvelles couleurs pour les faces du maillage
+                     "vertex_coloration": set_mesh_colors, # Définit des nouvelles couleurs pour les sommets du maillage
+                     "replace_mesh": set_new_mesh, # Remplace le maillage sélectionné par un nouveau maillage
+                     "add_mesh": set_new_mesh, # Ajoute le maillage créé dans la scène sans supprimer le maillage sélectionné
+                     "lod_meshes": add_lod_meshes, # Ajoute dans la scène un nouvel objet pour chaque niveau de détail du maillage sélectionné
+                     "face_segments": set_face_segments, # Stocke l'identifiant du segment de chaque face dans un attribut du maillage
+                     "segment_meshes": add_segment_meshes} # Ajoute dans la scène un nouvel objet pour chaque segment du maillage sélectionné
+    # Table permettant d'associer à un attribut (présent sous la forme d'un string) une classe de propriétés (héritant de PropertyGroup) que l'attribut
+    # référencera à l'aide d'un PointerProperty. Exemple : 'segmentation_cgal' : CgalSegmentationProperties
+    # Est utilisée retirer les classes de propriétés du registre de Blender et de supprimer les références à ces dernières par un objet de Blender lors de l'appel de la fonction "unregister"
+    properties_table = {}
+    # Table associant à chaque algorithme une liste contenant l'identifiant du langage de programmation de l'algorithme ainsi que la liste éventuelle de ses propriétes sous forme de dictionnaire et le nom de la function utilisée pour réaliser l'algorithme (cas de MeshLab). 
+    # Exemples : "segmentation_cgal" : [0, {"clusters" : 4, "smoothness" : 0.5, "output_options" : "DEFAULT", "delete_materials" : False}, ["integer", "float", "enum", "boolean"], []]
+    #            "colorize_curvature_apss" : [1, {"filterscale" : 2, "projectionaccuracy" : 0.01, "maxprojectioniters" : 15, "sphericalparameter" : 1, "curvaturetype" : "DEFAULT", "delete_materials" : False}, ["float", "float", "integer", "float", "enum", "boolean"], ["compute_curvature_and_color_apss_per_vertex"]]
+    algorithm_properties = {}
+    # Table associant au nouveau d'un algorithme une liste contenant le nombre d'étapes de l'algorithme (comprendre le nombre de sous-algorithmes utilisés) ainsi que la liste des n indices des sous-algorithmes dans lesquels les m paramètres sont présents
+    # -1 indique que le paramètre n'est pas présent dans un sous-algorithme sinon une valeur d'indice j à la position i dans la liste indique que le i-ème paramètre est présent dans le j-ème sous-algorithme
+    # Exemples : "segmentation_cgal" : [1, [1,1,-1,-1]]
+    #            "colorize_curvature_apss" : [1, [1,1,1,1,1,-1]]
+    algorithm_steps = {}
+    # Table associant à chaque algorithme la liste des opérations à effectuer avant d'envoyer les données côté C++ (traitement prélable du maillage, informations du maillage à récupérer, ...)
+    # Exemple : "segmentation_cgal' : ["triangulation", "vertex_coordinates", "face_indices"]
+    algorithm_input_pipeline = {}
+    # Table associant à chaque algorithme natif les données qu'il consomme (Router.capabilities() : tableaux et types acceptés, structure
+    # de maillage construite, modification de la topologie, prise en charge des threads). None pour les algorithmes MeshLab
+    algorithm_capabilities = {}
+    # Table associant à chaque algorithme de l'API sa description associée
+    algorithm_description = {}
+    # Dernière configuration chargée par l'utilisateur
+    last_loaded_configuration = {}
+    # Table associant au nom d'un objet Blender la session native (MeshSession) conservant son maillage CGAL
+    mesh_sessions = {}
+    # Table associant au nom d'un objet Blender la triangulation non destructive de son maillage (indices des sommets des triangles
+    # et indices des faces d'origine des triangles), conservée tant que la géométrie du maillage n'est pas modifiée
+    loop_triangles_cache = {}
+    # Bilan de la dernière réparation du maillage effectuée côté C++ (opération "native_repair")
+    last_repair_report = None
+    # Tâche d'exécution en arrière-plan de l'algorithme courant (None si aucun algorithme n'est en cours d'exécution)
+    current_job = None
+    # Profil (durées des phases en nanosecondes et compteurs) de la dernière exécution d'un algorithme
+    last_profile = None
+    # Profil du chargement de l'extension (phases de la fonction "register")
+    startup_profile = None
+    # Enchaînements d'algorithmes prédéfinis (fichier "pipelines.json")
+    pipelines = []
+    # Algorithmes pouvant être prévisualisés (champ "preview" de config.json) : la modification de leurs propriétés déclenche un aperçu
+    # calculé sur un maillage réduit de l'objet courant
+    preview_algorithms = set()
+    # Algorithmes modifiant la géométrie du maillage (champ "deviation" de config.json) après lesquels l'écart au maillage d'origine peut être mesuré
+    deviation_algorithms = set()
+    # Algorithmes ne pouvant pas être exécutés sur les seules faces sélectionnées (champ "selection" de config.json) : le maillage qu'ils
+    # retournent ne conserve pas les bords du maillage reçu et ne pourrait pas être raccordé aux faces non sélectionnées
+    non_selection_algorithms = set()
+    # Maillages réduits des objets sur lesquels les aperçus sont calculés
+    preview_proxies = ProxyCache()
+    # Planification (regroupement des demandes et annulation des aperçus obsolètes) des aperçus
+    preview_scheduler = PreviewScheduler()
+    # Table permettant de convertir les valeurs des propriétés Blender vers des types MeshLab
+    meshlab_types = {"percentage_value": get_percentage_value_instance,
+                     "pure_value": get_pure_value_instance,
+                     "color": get_color_instance,
+                     "float_array": get_numpy_float_array}
+
+
+def create_description(content):
+    # Définition du maximum de caractères à afficher par ligne
+    max_row_length = 75
+    # Définition du maximum de caractères à afficher dans l'info-bulle de l'algorithme
+    max_length = max_row_length * 5
+    # Séparation des mots de la description de l'algorithme
+    words = content.split(" ")
+    lines = []
+    current_line = ""
+    # Création d'un compteur sur le nombre de lignes extraites
+    i = 0
+    # Ainsi qu"un compteur sur le nombre de mots lus dans la description
+    word_count = 0
+    while i < (max_length/max_row_length) and word_count < len(words):
+        # Récupération du mot courant
+        word = words[word_count]
+        line_length = len(current_line) + len(word) + 1
+        # Si la somme des caractères de la ligne courante + la longueur du mot courant ne dépasse pas max_row_length
+        if line_length <= max_row_length:
+            # ajout du mot à la ligne courante
+            current_line += (word + " ")
+        else:
+            # Sinon ajout de la ligne courante dans la liste des lignes de la description
+            lines.append(current_line.strip())
+            i += 1
+            # et ajout du mot courant dans la prochaine ligne
+            current_line = word + " "
+        # mise à jour du compteur sur les mots lus
+        word_count += 1
+    # Si la description fait plus de 180 caractères
+    lines.append(current_line.strip())
+    i += 1
+    if i >= (max_length / max_row_length):        
+        # ajout de "..." à la fin de la dernière ligne de la description
+        lines[-1] = lines[-1][:-3] + "..."
+    return lines
+
+    
+# Fonctions d'exécution et d'application des traitements sur le maillage courant
+def prepare_algorithm_data(context):
+    # Récupération de l'objet courant
+    object = context.active_object
+    if not object or object.type != "MESH":
+        raise RuntimeError("Aucun maillage n'est sélectionné")
+    else:
+        # Passage du contexte en mode "OBJET"
+        bpy.ops.object.mode_set(mode="OBJECT")
+        # et du mode de rendu à "SOLID"
+        context.space_data.shading.type = "SOLID"
+        # Préparation du maillage et récupération des données à envoyer à l'algorithme côté C++
+        # Récupération de la scène
+        scene = context.scene
+        # Récupération du groupe de propriétés de l'API Blender
+        api_properties = scene.api_properties
+        # Suppression du message
+        api_properties.result_infos = ""
+        # Récupération du nom de l'algorithme sélectionné par l'utilisateur
+        algorithm_name = api_properties.algorithm_choice.lower()
+        # Création d'un dictionnaire vide qui va contenir l'ensemble des données à envoyer
+        data = {}
+        # et exécution des différentes opérations pré-envoi des données
+        for operation in Globals.algorithm_input_pipeline[algorithm_name]:
+            Globals.inputs_factory[operation](object, data)
+        # Récupération des faces sélectionnées si l'algorithme ne doit traiter que la sélection
+        use_selection = prepare_selection(object, data, api_properties)
+
+        # Récupération des données des propriétés de l'algorithme courant
+        algorithm_data = Globals.algorithm_properties[algorithm_name]
+        # Ajout du nom de la fonction utilisée pour réaliser l'algorithme (pour MeshLab)
+        data["function"] = algorithm_data[3]
+        # Stockage des valeurs de l'ensemble des proprétés dans le dictionnaire data
+        data["params"], data["options"] = get_algorithm_parameters(scene, algorithm_name)
+        # Ajout du temps imparti à l'exécution de l'algorithme (algorithmes C++)
+        if api_properties.time_budget > 0:
+            data["time_budget"] = api_properties.time_budget
+        else:
+            pass
+        # Les algorithmes C++ construisant un maillage CGAL sont exécutés sur la session native de l'objet courant afin de réutiliser le maillage déjà construit
+        # (le maillage traité par l'algorithme n'étant alors pas celui de l'objet lorsque seule la sélection est traitée)
+        capabilities = Globals.algorithm_capabilities.get(algorithm_name, None)
+        if use_selection:
+            pass
+        elif algorithm_data[0] == 0 and capabilities is not None and capabilities["mesh"] == "half_edge" and "vertices" in data and "faces" in data:
+            data["session"] = get_mesh_session(context, object)
+        # Les algorithmes MeshLab réutilisent le MeshSet conservé pour l'objet courant si sa géométrie n'a pas changé
+        elif algorithm_data[0] == 1:
+            if api_properties.use_mesh_sessions:
+                data["pool_key"] = object.name
+            else:
+                py_mesh.PyMeshApi.clear_pool()
+        else:
+            pass
+        return object, algorithm_name, data
+
+
+def get_algorithm_parameters(scene, algorithm_name, values=None):
+    # Construction des paramètres (un dictionnaire par étape de l'algorithme) et des options (propriétés non utilisées par l'algorithme)
+    # à partir des valeurs des propriétés de l'algorithme, éventuellement remplacées par celles de la table "values"
+    values = values or {}
+    # Récupération des données des propriétés de l'algorithme
+    algorithm_data = Globals.algorithm_properties[algorithm_name]
+    # Récupération des étapes de l'algorithme
+    algorithm_steps = Globals.algorithm_steps[algorithm_name]
+    params = [{} for _ in range(algorithm_steps[0])]
+    options = {}
+    # Récupération du groupe de propriété associé à l'algorithme (si présent)
+    property_group = getattr(scene, algorithm_name, None)
+    if property_group is not None:
+        for i, property_name in enumerate(algorithm_data[1].keys()):
+            value = values[property_name] if property_name in values else getattr(property_group, property_name)
+            # Si le paramètre n'est pas utilisé dans l'algorithme
+            if algorithm_steps[1][i] == -1:
+                options[property_name] = value
+            else:
+                # Vérification si la valeur n'est pas de type Meshlab
+                if algorithm_data[2][i] not in ["percentage_value", "pure_value", "color", "float_array"]:
+                    params[algorithm_steps[1][i] - 1][property_name] = value
+                else:
+                    params[algorithm_steps[1][i] - 1][property_name] = Globals.meshlab_types[algorithm_data[2][i]](value)
+    else:
+        pass
+    return params, options
+
+
+def get_pipeline_steps(api_properties):
+    # Récupération des étapes de l'enchaînement choisi par l'utilisateur (enchaînement prédéfini ou saisi par l'utilisateur)
+    if api_properties.pipeline_choice == "CUSTOM":
+        return parse_pipeline(api_properties.custom_pipeline)
+    for pipeline in Globals.pipelines:
+        if pipeline["id_name"].upper() == api_properties.pipeline_choice:
+            return pipeline["steps"]
+    raise RuntimeError("Aucun enchaînement d'algorithmes n'est sélectionné.")
+
+
+def prepare_pipeline_data(context):
+    # Récupération de l'objet courant
+    object = context.active_object
+    if not object or object.type != "MESH":
+        raise RuntimeError("Aucun maillage n'est sélectionné")
+    # Passage du contexte en mode "OBJET" et du mode de rendu à "SOLID"
+    bpy.ops.object.mode_set(mode="OBJECT")
+    context.space_data.shading.type = "SOLID"
+    scene = context.scene
+    api_properties = scene.api_properties
+    # Suppression du message
+    api_properties.result_infos = ""
+    # Récupération et vérification des étapes de l'enchaînement
+    steps = get_pipeline_steps(api_properties)
+    check_pipeline(steps, Globals.algorithm_properties)
+    # Les données du maillage ne sont récupérées qu'une seule fois, pour la première étape de l'enchaînement
+    data = {}
+    for operation in get_pipeline_inputs(steps, Globals.algorithm_input_pipeline):
+        Globals.inputs_factory[operation](object, data)
+    use_selection = prepare_selection(object, data, api_properties)
+    # Paramètres de chaque étape : valeurs des propriétés de l'algorithme dans l'extension, remplacées par celles de l'enchaînement
+    pipeline_steps = []
+    for step in steps:
+        algorithm_name = step["algorithm"]
+        step_data = {"function": Globals.algorithm_properties[algorithm_name][3]}
+        step_data["params"], step_data["options"] = get_algorithm_parameters(scene, algorithm_name, step.get("properties", {}))
+        pipeline_steps.append({"algorithm": algorithm_name, "data": step_data})
+    # La session native et le MeshSet conservés pour l'objet courant sont utilisés par les étapes précédant la première modification du maillage
+    # (sauf si seule la sélection est traitée)
+    if use_selection:
+        pass
+    elif "vertices" in data and "faces" in data:
+        data["session"] = get_mesh_session(context, object)
+    else:
+        pass
+    if use_selection:
+        pass
+    elif api_properties.use_mesh_sessions:
+        data["pool_key"] = object.name
+    else:
+        pass
+    # Le temps imparti est partagé par l'ensemble des étapes de l'enchaînement
+    if api_properties.time_budget > 0:
+        data["time_budget"] = api_properties.time_budget
+    else:
+        pass
+    return object, pipeline_steps, data
+
+
+def prepare_execution(context, use_pipeline):
+    # Préparation de l'exécution d'un algorithme ou d'un enchaînement d'algorithmes : retourne l'objet courant ainsi qu'une fonction
+    # (sans paramètre) instanciant l'algorithme à exécuter. Les données sont récupérées dans le thread principal
+    api_properties = context.scene.api_properties
+    if use_pipeline:
+        object, steps, data = prepare_pipeline_data(context)
+        algorithm_factory = lambda algorithm_data: Pipeline(steps, algorithm_data, create_algorithm)
+        measure_deviation = any(step["algorithm"] in Globals.deviation_algorithms for step in steps)
+        algorithm_names = [step["algorithm"] for step in steps]
+    else:
+        object, algorithm_name, data = prepare_algorithm_data(context)
+        algorithm_factory = lambda algorithm_data: create_algorithm(algorithm_name, algorithm_data)
+        measure_deviation = algorithm_name in Globals.deviation_algorithms
+        algorithm_names = [algorithm_name]
+    # Lorsque seule la sélection est traitée, l'algorithme est exécuté sur le sous-maillage des faces sélectionnées (extrait puis reporté
+    # sur le maillage complet dans le thread d'exécution de l'algorithme)
+    if api_properties.process_selection and "selected_faces" in data:
+        for name in algorithm_names:
+            if name in Globals.non_selection_algorithms:
+                raise RuntimeError(f"L'algorithme '{name}' ne conserve pas les bords du maillage : il ne peut pas être exécuté sur la sélection uniquement.")
+            else:
+                pass
+        subset_factory = algorithm_factory
+        algorithm_factory = lambda algorithm_data: SubsetAlgorithm(algorithm_data, subset_factory)
+    else:
+        pass
+    # L'écart entre le maillage d'origine (données envoyées) et le maillage obtenu est mesuré dans le thread d'exécution de l'algorithme
+    if api_properties.measure_deviation and measure_deviation and "vertices" in data and "faces" in data:
+        return object, lambda: DeviationAlgorithm(data, algorithm_factory, api_properties.deviation_samples, api_properties.deviation_coloration)
+    else:
+        return object, lambda: algorithm_factory(data)
+
+
+def prepare_selection(object, data, api_properties):
+    # Récupération des indices des faces sélectionnées lorsque seule la sélection doit être traitée (uniquement pour les algorithmes
+    # recevant les faces du maillage). Retourne vrai si l'algorithme sera exécuté sur le sous-maillage des faces sélectionnées
+    if not api_properties.process_selection or "faces" not in data:
+        return False
+    if "selected_faces" not in data:
+        get_selected_faces(object, data)
+    else:
+        pass
+    if len(data["selected_faces"]) == 0:
+        raise RuntimeError("Aucune face du maillage n'est sélectionnée (sélectionner les faces à traiter en mode édition).")
+    else:
+        pass
+    return True
+
+
+def get_mesh_session(context, object):
+    # Suppression des sessions dont l'objet Blender associé n'existe plus
+    for object_name in list(Globals.mesh_sessions.keys()):
+        if bpy.data.objects.get(object_name) is None:
+            del Globals.mesh_sessions[object_name]
+    # Si l'utilisateur a désactivé les sessions, toutes les sessions sont libérées
+    if not context.scene.api_properties.use_mesh_sessions:
+        Globals.mesh_sessions.clear()
+        # La réserve de MeshSet n'existe que si MeshLab a déjà été utilisé
+        if is_loaded("api_modules.py_mesh"):
+            py_mesh.PyMeshApi.clear_pool()
+        else:
+            pass
+        return None
+    # Récupération de la session de l'objet courant ou création d'une session vide si elle n'existe pas.
+    # Le maillage de la session est construit (ou reconstruit si la géométrie de l'objet a changé) côté C++ lors de l'instanciation de l'algorithme
+    session = Globals.mesh_sessions.get(object.name, None)
+    if session is None:
+        session = algorithms_api.MeshSession(object.name)
+        Globals.mesh_sessions[object.name] = session
+    else:
+        pass
+    return session
+
+
+def create_algorithm(algorithm_name, data):
+    # Instanciation de l'algorithme de traitement de maillage
+    # Si l'algorithme provient de la bibliothèque MeshLab
+    if Globals.algorithm_properties[algorithm_name][0] == 1:
+        return py_mesh.PyMeshApi(data)
+    # Sinon il provient d'une autre bibliothèque
+    else:
+        return algorithms_api.Router(algorithm_name, data)
+
+
+def get_algorithm_profile(algorithm):
+    # Copie du profil de l'algorithme (Router ou PyMeshApi) : durées des phases en nanosecondes et compteurs
+    profile = getattr(algorithm, "profile", None)
+    if profile is None:
+        return {"phases": {}, "counters": {}}
+    return {"phases": dict(profile["phases"]), "counters": dict(profile["counters"])}
+
+
+def apply_results(context, results, profile=None):
+    if profile is None:
+        profile = {"phases": {}, "counters": {}}
+    # gestion des résultats en fonction de la requête initiale de l'utilisateur
+    output_results = results.get("output_result", [])
+    write_back_start = time.perf_counter_ns()
+    for output_result in output_results:
+        # Le temps d'application des résultats dans Blender est mesuré séparément du temps d'exécution de l'algorithme
+        start = time.perf_counter_ns()
+        Globals.outputs_table[output_result](context, results, output_result)
+        profile["phases"]["write_back." + output_result] = time.perf_counter_ns() - start
+    profile["phases"]["write_back"] = time.perf_counter_ns() - write_back_start
+    Globals.last_profile = profile
+
+
+def compute_algorithm(context, use_pipeline=False):
+    # Récupération des données du maillage courant et des paramètres de l'algorithme (ou de l'enchaînement) choisi
+    object, algorithm_factory = prepare_execution(context, use_pipeline)
+
+    algorithm = algorithm_factory()
+
+    # Exécution ensuite de l'algorithme choisi par l'utilisateur
+    try:
+        algorithm.init()
+    except Exception as err:
+        raise err
+    
+    # Récupération de la structure de données résultante de l'algorithme exécuté avec CGAL côté C++
+    results = algorithm.get_result()
+    apply_results(context, results, get_algorithm_profile(algorithm))
+
+
+def start_background_algorithm(context, use_pipeline=False):
+    # Les données du maillage (ainsi que les paramètres de l'algorithme) sont récupérées dans le thread principal
+    # car l'API de Blender ne peut pas être utilisée depuis un thread secondaire
+    object, algorithm_factory = prepare_execution(context, use_pipeline)
+    # Seules l'instanciation et l'exécution de l'algorithme sont effectuées dans le thread secondaire
+    job = AlgorithmJob(object.name, algorithm_factory)
+    job.start()
+    Globals.current_job = job
+    return job
+
+
+def apply_background_results(context, job):
+    # Récupération de l'objet sur lequel l'algorithme a été exécuté (l'utilisateur a pu changer de sélection entre temps)
+    object = bpy.data.objects.get(job.object_name)
+    if object is None:
+        raise RuntimeError(f"L'objet '{job.object_name}' n'existe plus dans la scène.")
+    # Les traitements de sortie s'appliquent à l'objet actif, nous redéfinissons donc l'objet traité comme objet actif
+    if context.mode != "OBJECT":
+        bpy.ops.object.mode_set(mode="OBJECT")
+    else:
+        pass
+    context.view_layer.objects.active = object
+    apply_results(context, job.result, job.profile)
+
+
+## Fonctions d'aperçu interactif des algorithmes
+# Suffixe du nom de l'objet temporaire affichant l'aperçu d'un objet
+PREVIEW_SUFFIX = "_apercu"
+# Intervalle (en secondes) de vérification de l'état des aperçus
+PREVIEW_POLL_INTERVAL = 0.1
+
+
+def is_preview_object(object):
+    return object.get("api_preview", False)
+
+
+def on_preview_property_update(self, context):
+    # Fonction appelée à chaque modification d'une propriété d'un algorithme prévisualisable
+    if context.scene.api_properties.use_preview:
+        request_preview(context)
+    else:
+        pass
+
+
+def on_use_preview_update(self, context):
+    if self.use_preview:
+        request_preview(context)
+    else:
+        clear_preview()
+
+
+def request_preview(context):
+    # Demande d'un aperçu de l'algorithme courant sur le maillage réduit de l'objet courant : l'aperçu n'est lancé qu'une fois les
+    # modifications des propriétés terminées (voir PreviewScheduler)
+    scene = context.scene
+    api_properties = scene.api_properties
+    algorithm_name = api_properties.algorithm_choice.lower()
+    object = context.active_object
+    if algorithm_name not in Globals.preview_algorithms or object is None or object.type != "MESH" or is_preview_object(object):
+        return
+    # L'aperçu nécessite qu'une option de sortie ait été choisie
+    if not is_option_selected(context, algorithm_name):
+        return
+    mesh = object.data
+    face_count = api_properties.preview_face_count
+    # Le maillage réduit est réparé comme le maillage complet pour les algorithmes dont les données passent par la réparation native
+    repair_tolerance = api_properties.repair_tolerance if "native_repair" in Globals.algorithm_input_pipeline[algorithm_name] else None
+    signature = (mesh.as_pointer(), len(mesh.vertices), len(mesh.loops), len(mesh.polygons), face_count, repair_tolerance)
+    proxy = Globals.preview_proxies.get(object.name, signature)
+    source_data = None
+    if proxy is None:
+        # Les données du maillage complet sont récupérées dans le thread principal (une seule fois par géométrie), la réduction du maillage
+        # étant effectuée dans le thread de l'aperçu
+        source_data = {}
+        get_vertex_coordinates(object, source_data)
+        get_loop_triangles(object, source_data)
+    else:
+        pass
+    algorithm_data = {"function": Globals.algorithm_properties[algorithm_name][3]}
+    algorithm_data["params"], algorithm_data["options"] = get_algorithm_parameters(scene, algorithm_name)
+    # Le maillage réduit utilisé est conservé avec la demande afin d'afficher l'aperçu sur la même géométrie
+    payload = {"proxy": proxy}
+    object_name = object.name
+
+    def algorithm_factory():
+        if payload["proxy"] is None:
+            payload["proxy"] = Globals.preview_proxies.build(object_name, signature, source_data, face_count, repair_tolerance)
+        data = dict(algorithm_data)
+        data.update(payload["proxy"])
+        return create_algorithm(algorithm_name, data)
+
+    Globals.preview_scheduler.request(object_name, algorithm_factory, payload)
+    if not bpy.app.timers.is_registered(update_preview):
+        bpy.app.timers.register(update_preview, first_interval=PREVIEW_POLL_INTERVAL)
+    else:
+        pass
+
+
+def update_preview():
+    # Fonction appelée régulièrement par un timer de Blender tant qu'un aperçu est en attente ou en cours d'exécution
+    finished = Globals.preview_scheduler.update()
+    if finished is not None:
+        job, payload = finished
+        if job.error is not None:
+            print(f"Une erreur s'est produite lors du calcul de l'aperçu : {job.error}")
+        else:
+            # Une erreur lors de l'affichage de l'aperçu ne doit pas interrompre le timer (aperçus suivants)
+            try:
+                show_preview(bpy.context, job, payload["proxy"])
+            except Exception as e:
+                print(f"Une erreur s'est produite lors de l'affichage de l'aperçu : {e}")
+                bpy.context.scene.api_properties.result_infos = f"Aperçu impossible : {e}"
+    else:
+        pass
+    # Le timer est supprimé lorsqu'aucun aperçu n'est en attente
+    return PREVIEW_POLL_INTERVAL if Globals.preview_scheduler.is_active() else None
+
+
+def show_preview(context, job, proxy):
+    # Affichage du résultat d'un aperçu dans un objet temporaire superposé à l'objet d'origine
+    object = bpy.data.objects.get(job.object_name)
+    if object is None or not context.scene.api_properties.use_preview:
+        return
+    results = job.result
+    output_results = results.get("output_result", [])
+    if "message" in output_results:
+        context.scene.api_properties.result_infos = results.get("result_infos", "")
+    else:
+        pass
+    # Géométrie de l'aperçu : maillage retourné par l'algorithme ou maillage réduit sur lequel l'algorithme a été exécuté
+    geometry = results if "replace_mesh" in output_results else proxy
+    preview_name = object.name + PREVIEW_SUFFIX
+    mesh = bpy.data.meshes.new(preview_name)
+    fill_mesh_geometry(mesh, geometry["vertices"], geometry["faces"], False)
+    colors = results.get("colors", None)
+    if colors is not None and ("vertex_coloration" in output_results or "face_coloration" in output_results):
+        colors = np.asarray(colors, dtype=np.float32).reshape(-1, 4)
+        # Les couleurs doivent correspondre aux faces (ou aux sommets) de la géométrie affichée (comme dans get_polygon_values)
+        expected = len(geometry["faces"]) // 3 if "face_coloration" in output_results else len(geometry["vertices"]) // 3
+        if len(colors) != expected:
+            bpy.data.meshes.remove(mesh)
+            raise RuntimeError(f"{len(colors)} couleurs retournées par l'algorithme pour {expected} "
+                               f"{'faces' if 'face_coloration' in output_results else 'sommets'} du maillage réduit.")
+        else:
+            pass
+        if "face_coloration" in output_results:
+            # Les couleurs des faces sont reportées sur les coins des triangles afin d'être affichées en mode "SOLID" sans matériau
+            color_layout = mesh.color_attributes.new(name="Preview_Col", type="FLOAT_COLOR", domain="CORNER")
+            colors = np.repeat(colors, 3, axis=0)
+        else:
+            color_layout = mesh.color_attributes.new(name="Preview_Col", type="FLOAT_COLOR", domain="POINT")
+        color_layout.data.foreach_set("color", colors.reshape(-1))
+        mesh.color_attributes.active_color = color_layout
+    else:
+        pass
+
+    preview = bpy.data.objects.get(preview_name)
+    if preview is None or not is_preview_object(preview):
+        preview = bpy.data.objects.new(preview_name, mesh)
+        preview["api_preview"] = True
+        # L'objet temporaire est affiché devant l'objet d'origine et ne peut pas être sélectionné
+        preview.show_in_front = True
+        preview.hide_select = True
+        context.scene.collection.objects.link(preview)
+    else:
+        old_mesh = preview.data
+        preview.data = mesh
+        bpy.data.meshes.remove(old_mesh)
+    preview.matrix_world = object.matrix_world.copy()
+    # Affichage des couleurs des attributs dans les vues 3D
+    for window in context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == "VIEW_3D":
+                shading = area.spaces.active.shading
+                shading.type = "SOLID"
+                shading.color_type = "ATTRIBUTE"
+                area.tag_redraw()
+
+
+def clear_preview():
+    # Annulation des aperçus en attente et suppression des objets temporaires des aperçus
+    Globals.preview_scheduler.cancel()
+    for object in [object for object in bpy.data.objects if is_preview_object(object)]:
+        mesh = object.data
+        bpy.data.objects.remove(object)
+        if mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+        else:
+            pass
+
+
+# Gestionnaire appelé après chaque mise à jour du graphe de dépendances de Blender : suppression des maillages réduits des objets
+# dont la géométrie a été modifiée
+def invalidate_preview_proxies(scene, depsgraph):
+    for update in depsgraph.updates:
+        if update.is_updated_geometry and isinstance(update.id.original, bpy.types.Object):
+            Globals.preview_proxies.discard(update.id.original.name)
+        else:
+            pass
+
+
+def check_required_modules():
+    # Vérification que le ou les modules nécessaires à l'extension sont bien installés
+    # récupération du chemin absolu vers les modules tiers installés dans Blender
+    modules_path = bpy.utils.user_resource("SCRIPTS", path="modules")
+
+    # Si un des modules est manquant
+    if not os.path.isdir(os.path.join(modules_path, "pymeshlab")):
+        import subprocess
+        import platform
+        # mise à niveau de pip
+        subprocess.run([sys.executable, "-m", "ensurepip", "--user"])
+        subprocess.run([sys.executable, "-m", "pip", "install", "--upgrade", "pip"])
+        # Nous vérifions s'il est bien installé dans l'environnement python de Blender
+        # Cas particulier pour Windows, la dernière version installée avec pip install pymeshlab (2023.12.post2)
+        # fait planter Blender à l'importation. Donc installation de la version précédente sans les dépendances.
+        # numpy est déjà installé dans Blender et il semble qu'il y ait un conflit entre pymeshlab et MSVCP140 causant un plantage
+        # du programme notamment lors de l'appel du constructeur Mesh de pymeshlab.
+        os_name = os.name
+        if os_name == "nt": 
+            subprocess.run([sys.executable, "-m", "pip", "install", "pymeshlab==2023.12.post1", "--no-deps", "-t", modules_path])
+        elif os_name == "posix" and platform.system() == "Linux":
+            subprocess.run([sys.executable, "-m", "pip", "install", "pymeshlab", "-t", modules_path])
+        else:
+            raise RuntimeError("Votre système d'exploitation n'est pas pris en charge par l'extension.")
+        print("Installation des modules requis terminée. Merci de redémarrer Blender pour appliquer les changements...")
+    # Sinon le module est déjà installé
+    else:
+        print("Les modules requis sont déjà installés.")
+
+
+def get_native_capabilities():
+    # Données consommées par les algorithmes natifs (le module natif n'est importé que lorsque le registre doit être recompilé)
+    return dict(algorithms_api.Router.capabilities())
+
+
+def get_native_module_paths():
+    # Fichier du module natif : sa recompilation invalide le registre (les données consommées par les algorithmes ont pu changer)
+    spec = importlib.util.find_spec("api_modules.algorithms_api")
+    return (spec.origin,) if spec is not None and spec.origin is not None else ()
+
+
+def get_registry_cache_path():
+    # Chemin du fichier conservant le registre compilé des algorithmes (dossier de configuration de l'utilisateur de Blender)
+    try:
+        return os.path.join(bpy.utils.user_resource("CONFIG", path="api_traitements_maillage", create=True), "registry.cache")
+    except Exception:
+        return None
+
+
+def load_algorithms(registry):
+    # Récupération du chemin absolu d'où le script est exécuté
+    script_absolute_path = os.path.dirname(os.path.realpath(__file__))
+
+    # Création des items de la liste déroulante permettant à l'utilisateur de choisir quel algorithme appliquer sur son maillage
+    algorithm_items = [("DEFAULT", "--Choix de l'algorithme--", "")]
+
+    # Parcours des algorithmes du registre (configuration "config.json" validée et mise à plat)
+    for algorithm in registry["algorithms"]:
+        # Récupération du nombre de l'algorithme courant
+        algorithm_name = algorithm["id_name"]
+        # Récupération de la description de l'algorithme
+        description = algorithm["description"]
+        # création du choix dans a liste déroulante de l'API
+        algorithm_items.append((algorithm_name.upper(), algorithm["name"], description))
+        # Stockage de la description de l'algorithme pour l'API dans la table algorithm_description de la structure Globals
+        Globals.algorithm_description[algorithm_name] = create_description(description)
+        # récupération de la liste des opérations à effectuer avant d'envoyer les données côté C++ (réduite aux données consommées
+        # par l'algorithme dans le cas des algorithmes natifs)
+        Globals.algorithm_input_pipeline[algorithm_name] = algorithm["input"]
+        Globals.algorithm_capabilities[algorithm_name] = algorithm["capabilities"]
+        # Les propriétés des algorithmes prévisualisables déclenchent un aperçu à chaque modification
+        property_update = None
+        if algorithm["preview"]:
+            Globals.preview_algorithms.add(algorithm_name)
+            property_update = on_preview_property_update
+        else:
+            pass
+        if algorithm["deviation"]:
+            Globals.deviation_algorithms.add(algorithm_name)
+        else:
+            pass
+        if not algorithm["selection"]:
+            Globals.non_selection_algorithms.add(algorithm_name)
+        else:
+            pass
+        # Initialisation de la liste dans la table "algorithm_properties" avec le langage de programmation utilisé et qui contiendra le nom des propriétés de l'algorithme courant et leurs valeurs par défaut associées
+        Globals.algorithm_properties[algorithm_name] = [algorithm["language_id"]]
+        # Initialisation de la liste de la table "algorithm_steps" avec le nombre de sous-algorithmes permettant de mener à bien l'exécution de l'algorithme principal
+        Globals.algorithm_steps[algorithm_name] = [algorithm["steps"]]
+        algorithm_props = Globals.algorithm_properties[algorithm_name]
+        # Initialisation d'un dictionnaire permettant de stocker les propriétés de l'algorithme courant
+        properties_dict = {}
+        # Initialisation d'une liste stockant les types des propriétés de l'algorithme courant
+        properties_types = []
+        # Initialisation d'une liste permettant de stocker si les propriétés de l'algorithme sont utilisées ou non dans l'algorithme et, si oui, dans quel sous-algorithme ce paramètre est utilisé
+        sub_algorithms_parameter = []
+        if algorithm["class_name"] is not None:
+            # Création d'une classe de propriétés vide héritant de PropertyGroup qui englobera l'ensemble des propriétés de l'algorithme courant
+            property_class = type(algorithm["class_name"], (bpy.types.PropertyGroup,), {})
+
+            # Enregistrement de la classe dans le registre de Blender
+            bpy.utils.register_class(property_class)
+            # Ajout des différentes propriétés à la classe
+            for property in algorithm["properties"]:
+                # Création de la propriété
+                property_constructor, default_value = Globals.properties_factory[property["type"]](property["data"], property_update)
+                setattr(property_class, property["id_name"], property_constructor)
+                # Association du nom de la propriété courante à sa valeur par défaut dans la table des propriétés
+                properties_dict[property["id_name"]] = default_value
+                # Ajout du type de la propriété dans le conteneur correspondant
+                properties_types.append(property["type"])
+                # Récupération de la valeur permettant de savoir si la propriété courante est utilisée ou non dans l'algorithme et, si oui, dans quel sous-algorithme
+                sub_algorithms_parameter.append(property.get("algorithm_step", -1))
+            # Stockage de la classe nouvellement créée dans une table permettant de la désinscrire du registre de Blender lors de l'appel de la fonction "unregister"
+            Globals.properties_table[algorithm_name] = property_class
+            # et référencement de la classe par un attribut
+            setattr(bpy.types.Scene, algorithm_name, bpy.props.PointerProperty(type=property_class))
+        else:
+            pass
+        # Ajout du dictionnaire de propriétés, de la liste des types des propriétés dans la table algorithm_properties
+        algorithm_props.append(properties_dict)
+        algorithm_props.append(properties_types)
+        # Ainsi que la liste indiquant si les propriétés précédentes sont utilisées dans l'algorithme
+        Globals.algorithm_steps[algorithm_name].append(sub_algorithms_parameter)
+        # Ajout de la fonction utilisée pour l'algorithme (cas de MeshLab)
+        algorithm_props.append(algorithm["functions_name"])
+
+    # Chargement des enchaînements d'algorithmes prédéfinis (seuls ceux dont tous les algorithmes existent sont proposés)
+    pipeline_items = [("DEFAULT", "--Choix de l'enchaînement--", "")]
+    Globals.pipelines = []
+    for pipeline in load_pipelines(os.path.join(script_absolute_path, "pipelines.json")):
+        try:
+            check_pipeline(pipeline["steps"], Globals.algorithm_properties)
+        except RuntimeError as e:
+            print(f"L'enchaînement '{pipeline['id_name']}' est ignoré : {e}")
+            continue
+        Globals.pipelines.append(pipeline)
+        pipeline_items.append((pipeline["id_name"].upper(), pipeline.get("name", pipeline["id_name"]), pipeline.get("description", "")))
+    pipeline_items.append(("CUSTOM", "Enchaînement personnalisé", "Enchaînement des algorithmes saisis, exécutés avec les valeurs courantes de leurs propriétés"))
+
+    # Création de la classe de propriétés de l'API Blender qui contiendra une liste de choix laissant la possibilité à l'utilisateur
+    # soit de choisir un algorithme à appliquer sur un maillage en lui laissant la possibilité de personnaliser ses paramètres, soit d'importer la configuration
+    # pré-programmée d'un algorithme contenu dans un fichier au format json, la liste déroulante des algorithmes implémentés
+    # ainsi qu'une propriété contenant l'ensemble des messages pouvant être retournés par l'API interne (côté C++)
+    # Création de la classe vide
+    api_class = type("ApiProperties", (bpy.types.PropertyGroup,), {})
+
+    # Enregistrement de la classe dans le registre de Blender
+    bpy.utils.register_class(api_class)
+    
+    # Stockage de l'énumération matérialisant la liste déroulante et stockant tous les choix d'algorithme
+    setattr(api_class, "algorithm_choice", bpy.props.EnumProperty(name="", items=algorithm_items, default="DEFAULT"))
+    # ainsi que la liste déroulante des enchaînements d'algorithmes et la liste des algorithmes d'un enchaînement personnalisé
+    setattr(api_class, "pipeline_choice", bpy.props.EnumProperty(name="", items=pipeline_items, default="DEFAULT"))
+    setattr(api_class, "custom_pipeline", bpy.props.StringProperty(
+        name="Algorithmes",
+        description="Identifiants des algorithmes à exécuter successivement, séparés par des virgules (ex : isotropic_explicit_remeshing, simplification_cgal, segmentation_cgal)",
+        default=""))
+    # ainsi que la propriété gérant les messages
+    setattr(api_class, "result_infos", bpy.props.StringProperty(
+        name="Résultat",
+        description="informations sur le ou les résultats de l'algorithme courant utilisé",
+        default=""))
+    # tout comme une propriété permettant d'afficher et de masquer la description des algorithmes dans l'API Blender
+    setattr(api_class, "description_is_hidden", bpy.props.BoolProperty(name="Afficher/Masquer la description de l'algorithme", default=True))
+    # ainsi qu'une propriété permettant de conserver le maillage CGAL des objets entre deux exécutions d'algorithmes C++
+    setattr(api_class, "use_mesh_sessions", bpy.props.BoolProperty(
+        name="Conserver les maillages C++",
+        description="Conserve en mémoire le maillage construit côté C++ (ou par MeshLab) afin de ne pas le reconstruire lors de l'exécution d'un autre algorithme sur la même géométrie",
+        default=True))
+    # ainsi que des propriétés permettant d'accélérer la mise à jour des maillages résultants des algorithmes
+    setattr(api_class, "validate_mesh", bpy.props.BoolProperty(
+        name="Vérifier les maillages résultants",
+        description="Vérifie (et corrige si besoin) la validité des maillages retournés par les algorithmes. Peut être désactivé pour accélérer la mise à jour des maillages volumineux",
+        default=True))
+    setattr(api_class, "frame_result", bpy.props.BoolProperty(
+        name="Centrer la vue sur le résultat",
+        description="Centre la vue 3D sur le maillage résultant de l'algorithme",
+        default=True))
+    # ainsi qu'une propriété permettant d'afficher le détail des durées de la dernière exécution d'un algorithme
+    setattr(api_class, "show_profile", bpy.props.BoolProperty(
+        name="Afficher le profil d'exécution",
+        description="Affiche les durées des phases (lecture des données, construction du maillage, exécution, exportation et application des résultats) ainsi que les compteurs de la dernière exécution",
+        default=False))
+    # ainsi que des propriétés permettant de prévisualiser le résultat d'un algorithme lors de la modification de ses propriétés
+    setattr(api_class, "use_preview", bpy.props.BoolProperty(
+        name="Aperçu interactif",
+        description="Affiche, à chaque modification des propriétés de l'algorithme, un aperçu calculé en arrière-plan sur un maillage réduit de l'objet courant (l'algorithme n'est appliqué au maillage complet qu'avec le bouton \"Appliquer l'algorithme\")",
+        default=False,
+        update=on_use_preview_update))
+    setattr(api_class, "preview_face_count", bpy.props.IntProperty(
+        name="Faces de l'aperçu",
+        description="Nombre de faces du maillage réduit sur lequel l'aperçu est calculé",
+        default=DEFAULT_PROXY_FACES,
+        min=1000,
+        max=1000000,
+        update=on_preview_property_update))
+    # ainsi qu'une propriété définissant la distance de fusion des sommets lors de la réparation du maillage côté C++
+    setattr(api_class, "repair_tolerance", bpy.props.FloatProperty(
+        name="Distance de fusion",
+        description="Distance en dessous de laquelle les sommets sont fusionnés lors de la réparation du maillage effectuée avant les algorithmes qui la demandent (0 : seuls les sommets confondus sont fusionnés)",
+        default=0.0001,
+        min=0.0,
+        soft_max=0.1,
+        precision=5))
+    # ainsi qu'une propriété permettant de ne traiter que les faces sélectionnées du maillage
+    setattr(api_class, "process_selection", bpy.props.BoolProperty(
+        name="Traiter la sélection uniquement",
+        description="Exécute l'algorithme sur les seules faces sélectionnées en mode édition (sous-maillage extrait puis reporté sur le maillage complet : géométrie remplacée, couleurs et segments des faces sélectionnées, statistiques de la sélection)",
+        default=False))
+    # ainsi que des propriétés permettant de mesurer (et de colorer) l'écart entre le maillage d'origine et le maillage obtenu
+    setattr(api_class, "measure_deviation", bpy.props.BoolProperty(
+        name="Mesurer l'écart au maillage d'origine",
+        description="Estime, après la simplification ou le remaillage, la distance de Hausdorff et l'écart quadratique moyen entre le maillage d'origine et le maillage obtenu à partir de points échantillonnés sur les deux surfaces (affichés avec les résultats)",
+        default=False))
+    setattr(api_class, "deviation_samples", bpy.props.IntProperty(
+        name="Points échantillonnés",
+        description="Nombre de points échantillonnés sur chacune des deux surfaces : la durée de la mesure en dépend mais pas du nombre de faces du maillage d'origine",
+        default=DEFAULT_SAMPLES,
+        min=1000,
+        soft_max=1000000))
+    setattr(api_class, "deviation_coloration", bpy.props.BoolProperty(
+        name="Colorer l'écart",
+        description="Colore les sommets du maillage obtenu selon leur distance au maillage d'origine (du bleu au rouge, attribut \"Vertex_Col\"), sauf si l'algorithme a déjà coloré le maillage",
+        default=False))
+    # ainsi qu'une propriété permettant d'exécuter les algorithmes dans un thread secondaire sans bloquer l'interface de Blender
+    setattr(api_class, "run_in_background", bpy.props.BoolProperty(
+        name="Exécution en arrière-plan",
+        description="Exécute l'algorithme dans un thread secondaire sans bloquer l'interface de Blender",
+        default=True))
+    # ainsi qu'une propriété limitant la durée d'exécution des algorithmes C++ (et des enchaînements)
+    setattr(api_class, "time_budget", bpy.props.FloatProperty(
+        name="Temps imparti (s)",
+        description="Durée maximale d'exécution des algorithmes C++ et des enchaînements (0 : aucune limite). La simplification retourne le maillage obtenu à l'expiration du délai, les autres algorithmes sont interrompus",
+        default=0.0,
+        min=0.0,
+        soft_max=600.0,
+        step=100))
+    # Stockage de la classe nouvellement créée dans une table permettant de la désinscrire du registre de Blender lors de l'appel de la fonction "unregister"
+    Globals.properties_table["api_properties"] = api_class
+    # Référencement du groupe de propriétés par un objet de Blender (ici la scène)
+    bpy.types.Scene.api_properties = bpy.props.PointerProperty(type=api_class)
+
+
+# Fonction permettant de vérifier si l'utilisateur a choisi une option de sortie pour l'algorithme choisi (seulement si cette option est disponible)
+def is_option_selected(context, algorithm_name):
+    # Récupération du groupe de propriétés de l'algorithme courant
+    property_group = getattr(context.scene, algorithm_name.lower(), None)
+    if property_group is not None:
+        for property_name in Globals.algorithm_properties[algorithm_name.lower()][1].keys():
+            # Récupération du choix de l'option de l'utilisateur pour l'algorithme courant
+            if getattr(property_group, property_name) == "DEFAULT":
+                return False
+            else:
+                pass
+        return True
+    else:
+        return True
+    
+
+class VIEW3D_OT_execute_algorithm(bpy.types.Operator):
+    """Applique l'algorithme choisi sur le maillage sélectionné"""
+    bl_idname = "wm.execute_algorithm"
+    bl_label = "Exécution de l'algorithme"     
+    bl_options = {"REGISTER", "UNDO"} 
+
+    # Exécution de l'enchaînement d'algorithmes choisi plutôt que de l'algorithme courant
+    use_pipeline: bpy.props.BoolProperty(default=False, options={"HIDDEN", "SKIP_SAVE"})
+
+    _timer = None
+    
+    def execute(self, context):
+        # L'algorithme est appliqué au maillage complet : l'aperçu éventuel est supprimé
+        clear_preview()
+        compute_algorithm(context, self.use_pipeline)   
+        return {"FINISHED"}
+
+    def invoke(self, context, event):
+        # Un seul algorithme peut être exécuté à la fois : la tâche précédente (y compris annulée) utilise la session native, le MeshSet
+        # ou le cache SDF de l'objet tant que son thread n'a pas terminé son exécution
+        if Globals.current_job is not None:
+            self.report({"WARNING"}, "Un algorithme est déjà en cours d'exécution." if not Globals.current_job.is_cancelled()
+                        else "L'algorithme annulé n'a pas encore terminé son exécution.")
+            return {"CANCELLED"}
+        else:
+            pass
+        # Exécution bloquante de l'algorithme si l'utilisateur n'a pas choisi l'exécution en arrière-plan
+        if not context.scene.api_properties.run_in_background:
+            return self.execute(context)
+        clear_preview()
+        start_background_algorithm(context, self.use_pipeline)
+        # Création d'un timer permettant de vérifier régulièrement si l'algorithme a terminé son exécution
+        window_manager = context.window_manager
+        self._timer = window_manager.event_timer_add(0.1, window=context.window)
+        window_manager.modal_handler_add(self)
+        return {"RUNNING_MODAL"}
+
+    def modal(self, context, event):
+        if event.type != "TIMER":
+            return {"PASS_THROUGH"}
+        job = Globals.current_job
+        # Rafraichissement du panneau pour mettre à jour le temps d'exécution affiché
+        if context.area is not None:
+            context.area.tag_redraw()
+        # Tant que le thread secondaire n'a pas terminé son exécution (y compris après une annulation, les algorithmes MeshLab ne pouvant
+        # pas être interrompus), la tâche reste la tâche courante : aucun autre algorithme ne peut être lancé sur les mêmes données
+        if not job.is_finished():
+            # Affichage de l'avancement de l'algorithme dans la barre d'état
+            context.workspace.status_text_set(get_progress_text(job))
+            return {"PASS_THROUGH"}
+        # Suppression du timer, du texte de la barre d'état et de la tâche courante
+        context.window_manager.event_timer_remove(self._timer)
+        context.workspace.status_text_set(None)
+        Globals.current_job = None
+        # En cas d'annulation, les résultats du thread secondaire ne sont pas appliqués au maillage
+        if job.is_cancelled():
+            context.scene.api_properties.result_infos = "Exécution de l'algorithme annulée."
+            return {"CANCELLED"}
+        elif job.error is not None:
+            self.report({"ERROR"}, f"Une erreur s'est produite lors de l'exécution de l'algorithme : {job.error}")
+            return {"CANCELLED"}
+        else:
+            apply_background_results(context, job)
+            return {"FINISHED"}
+
+
+def get_progress_text(job):
+    # Texte décrivant l'avancement de l'algorithme exécuté en arrière-plan (étape courante, pourcentage et compteurs)
+    if job.is_cancelled():
+        return f"Annulation en cours... ({job.elapsed_time():.1f}s)"
+    else:
+        pass
+    text = f"Exécution en cours... ({job.elapsed_time():.1f}s)"
+    progress = job.progress()
+    if progress is not None:
+        text += f" {progress['fraction'] * 100:.0f}%"
+        if progress["stage"]:
+            text += f" - {progress['stage']}"
+        else:
+            pass
+        for counter, value in progress["counters"].items():
+            text += f" - {counter} : {value}"
+    else:
+        pass
+    return text
+
+
+class VIEW3D_OT_cancel_algorithm(bpy.types.Operator):
+    """Annule l'algorithme en cours d'exécution"""
+    bl_idname = "wm.cancel_algorithm"
+    bl_label = "Annuler l'algorithme"
+
+    @classmethod
+    def poll(cls, context):
+        return Globals.current_job is not None and not Globals.current_job.is_cancelled()
+
+    def execute(self, context):
+        Globals.current_job.cancel()
+        return {"FINISHED"}
+
+
+class VIEW3D_OT_display_description(bpy.types.Operator):
+    """Etendre ou réduire la description de l'algorithme courant"""
+    bl_idname = "wm.display_description"
+    bl_label = "Etendre la description"     
+    bl_options = {"REGISTER", "UNDO"} 
+    
+    def switch_visibility(self, context):
+        context.scene.api_properties.description_is_hidden = not context.scene.api_properties.description_is_hidden
+
+
+    def execute(self, context):
+        self.switch_visibility(context)  
+        return {"FINISHED"}
+    
+
+class VIEW3D_OT_load_configuration(bpy.types.Operator, ImportHelper):
+    """Charger une configuration prédéfinie d'un algorithme au format JSON"""
+    bl_idname = "wm.load_configuration"
+    bl_label = "Charger une configuration"     
+    bl_options = {"REGISTER", "UNDO"} 
+
+    filter_glob: bpy.props.StringProperty(
+        default="*.json",
+        options={"HIDDEN"},
+    )
+
+    def load_configuration(self, context):
+        # Récupération de la configuration chargée
+        config = Globals.last_loaded_configuration
+        # Récupération du nom de l'algorithme utilisé dans la configuration
+        algorithm_name = config.get("algorithm", None)
+        if algorithm_name is not None:
+            setattr(context.scene.api_properties, "algorithm_choice", algorithm_name.upper())
+            # Récupération de la classe de propriétés associée à l'algorithme chargé
+            algorithm_properties = getattr(context.scene, algorithm_name)
+            for property_name, value in config["properties"].items():
+                setattr(algorithm_properties, property_name, value)
+        else:
+            raise RuntimeError("Une erreur s'est produite lors de la lecture du fichier de configuration JSON. Vérifiez que la structure contient bien un champ 'algorithm'.")
+        # Nous forçons le rafraichissement de l'interface de l'extension
+        context.area.tag_redraw()
+
+    def execute(self, context):
+        # Récupération de l'extension du fichier chargé
+        file_extension = self.filepath.rsplit('.')[-1].lower()
+        if file_extension != "json":
+            raise RuntimeError("Le fichier importé doit être au format json.")
+        else:
+            print(f"Chargement du fichier: {self.filepath}...")
+            try:
+                with open(self.filepath) as f:
+                    Globals.last_loaded_configuration = json.load(f)
+                    self.load_configuration(context)
+            except Exception as e:
+                print(f"Une erreur s'est produite lors de la tentative d'ouverture du fichier {self.filepath}.")
+                raise e
+            setattr(context.scene.api_properties, "configuration_is_loaded", True)
+        return {"FINISHED"}
+
+    def invoke(self, context, event):
+        # Ouverture de l'explorateur de fichiers
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+    
+
+class VIEW3D_OT_save_configuration(bpy.types.Operator, ExportHelper):
+    """Exporter la configuration de l'algorithme courant au format JSON"""
+    bl_idname = "wm.export_configuration"
+    bl_label = "Exporter cette configuration"     
+    bl_options = {"REGISTER", "UNDO"} 
+
+    filter_glob: bpy.props.StringProperty(
+        default="*.json",
+        options={"HIDDEN"},
+    )
+    filename_ext = ".json"
+
+    def __init__(self):
+        self.data = {}
+
+    def get_current_configuration(self, context):
+        # Création d'une variable qui contiendra le nom du fichier à exporter
+        filename = ""
+        # Récupération du nom de l'algorithme courant
+        algorithm_name = context.scene.api_properties.algorithm_choice.lower()
+        # Ajout du nom de l'algorithme dans le nom du fichier
+        filename += algorithm_name + "_"
+        # et dans le dictionnaire
+        self.data["algorithm"] = algorithm_name
+        # Récupération de la classe de propriétés associée à l'algorithme sélectionné
+        algorithm_properties = getattr(context.scene, algorithm_name, None)
+        if algorithm_properties is not None:
+            # Création d'un champ dans le dictionnaire contenant l'ensemble des propriétés de l'algorithme
+            self.data["properties"] = {}
+            # Création d'une table permettant de remplacer des caractères par d'autres
+            translation_table = str.maketrans({'[': '_', ']': '_', '.': '_', ',': '_'})
+            # parcours des noms des propriétés associées à l'algorithme courant
+            for prop_attribute in Globals.algorithm_properties[algorithm_name][1].keys():
+                # Récupération de la valeur associée à la propriété courante
+                value = getattr(algorithm_properties, prop_attribute)
+                result = None
+                # Si le paramètre est un nombre à virgule, nous l'arrondissons à deux décimales après la virgule
+                if isinstance(value, (float,)):
+                    result = round(value,2)
+                # sinon si le paramètre est de type Vector ou Color (types issus des propriétés XVectorProperty)
+                elif isinstance(value, (Color, Vector)):
+                    if isinstance(value[0], (float,)):
+                        result = [round(value[0],2), round(value[1],2), round(value[2],2)]
+                    else:
+                        result = [value[0], value[1], value[2]]
+                else:
+                    result = value
+                # stockage de la valeur associée au nom de la propriété dans le dictionnaire des données
+                self.data["properties"][prop_attribute] = result
+                # et mise à jour du nom du fichier
+                filename += prop_attribute + "_" + str(result).translate(translation_table) + "_"
+        else:
+            pass
+        return filename[:-1]
+
+
+    def execute(self, context):
+        try:
+            with open(self.filepath, "w", encoding="utf-8") as f:
+                json.dump(self.data, f, indent=4)
+            print(f"Exportation du fichier: {self.filepath} réussie.")
+            return {"FINISHED"}
+        except Exception as e:
+            print(f"Une erreur s'est produite lors de l'exportation du fichier {self.filepath} : {e}.")
+            return {"CANCELLED"}        
+
+    def invoke(self, context, event):
+        # Récupération du nom du fichier à exporter
+        filename = self.get_current_configuration(context)
+        self.filepath = filename + self.filename_ext
+        # Ouverture du gestionnaire de fichier de Blender
+        context.window_manager.fileselect_add(self)
+        return {"RUNNING_MODAL"}
+    
+
+class VIEW3D_OT_set_properties_to_default(bpy.types.Operator):
+    """Réinitialiser les valeurs des propriétés de l'algorithme courant"""
+    bl_idname = "wm.set_properties_to_default"
+    bl_label = "Réinitialiser les paramètres"     
+    bl_options = {"REGISTER", "UNDO"} 
+
+    def reset_properties(self, context):
+        # Récupération du nom de l'algorithme courant
+        algorithm_name = getattr(context.scene.api_properties, "algorithm_choice").lower()
+        # Récupération de la classe de propriétés associées à l'algorithme courant
+        algorithm_properties = getattr(context.scene, algorithm_name, None)
+        if algorithm_properties is not None:
+            # Pracours du nom des propriétés et des valeurs par défaut de l'algorithme courant
+            for property_name, default_value in Globals.algorithm_properties[algorithm_name][1].items():
+                # remise de la valeur de la propriété courante par défaut
+                setattr(algorithm_properties, property_name, default_value)
+        else:
+            pass
+
+
+    def execute(self, context):
+        self.reset_properties(context)
+        return {"FINISHED"}
+
+class VIEW3D_OT_align_camera_to_view(bpy.types.Operator):
+    """Aligne la vue de la caméra sur la vue de la scène"""
+    bl_idname = "wm.camera_to_scene_view"
+    bl_label = "Aligner la vue caméra sur la vue de la scène"
+    bl_options = {"REGISTER", "UNDO"}
+
+    @classmethod
+    def poll(cls, context):
+        return bpy.ops.view3d.camera_to_view.poll()
+
+    def execute(self, context):
+        # alignement de la vue caméra sur la vue de la scène
+        bpy.ops.view3d.camera_to_view()
+        return {'FINISHED'}         
+
+
+class VIEW3D_PT_stereoscopy_panel(bpy.types.Panel):
+    bl_label = "Stéréoscopie"  # Titre du panneau latéral
+    bl_idname = "VIEW3D_PT_stereoscopy_panel"
+    bl_space_type = "VIEW_3D"  # espace dans lequel est situé le panneau
+    bl_region_type = "UI"  # région dans laquelle le panneau se situe
+
+    bl_category = "API C++"  # Nom de l'onglet auquel attacher le panneau
+
+    def draw(self, context):
+        # Récupération de la scène
+        scene = context.scene
+        layout = self.layout
+        layout.use_property_split = False
+
+        row = layout.row()
+        row.scale_y = 1.4
+        row.prop(scene.render, "use_multiview", text="Activer la stéréoscopie ?")
+        # Si l'utilisateur a choisi d'activer la stéréoscopie
+        if scene.render.use_multiview is True:
+            # Récupération des propriétés gérant les zones de clipping de la scène
+            space_data = context.space_data
+            row = layout.row()
+            row.scale_y = 1.4
+            col = row.column(align=True)
+            col.prop(space_data, "clip_start", text="Début du clipping (Scène)")
+            col.prop(space_data, "clip_end", text="Fin du clipping (Scène)")
+            col = layout.column(align=True)
+            col.scale_y = 1.4
+            col.prop(scene, "camera")
+            # Récupération de la référence contenue dans la propriété scene.camera
+            camera = scene.camera
+            # Si une caméra est sélectionnée
+            if camera is not None:
+                # Affichage des zones de clipping de la caméra courante
+                col.prop(camera.data, "clip_start", text="Début du clipping (Caméra)")
+                col.prop(camera.data, "clip_end", text="Fin du clipping (Caméra)")
+                # Affichage des options de la stéréoscopie de la caméra
+                col.prop(camera.data.stereo, "convergence_distance", text="Distance du plan de convergence")
+                col.prop(camera.data.stereo, "interocular_distance", text="Distance interoculaire")
+                col.prop(space_data, "lock_camera", text="Utiliser la vue caméra comme vue de la scène ?")
+                row = layout.row()
+                row.scale_y = 1.7
+                row.operator(VIEW3D_OT_align_camera_to_view.bl_idname, text="Aligner la vue caméra sur la vue de la scène")
+
+
+def draw_deviation_properties(layout, api_properties):
+    # Options de la mesure de l'écart au maillage d'origine (algorithmes modifiant la géométrie du maillage)
+    row = layout.row()
+    row.prop(api_properties, "measure_deviation")
+    if api_properties.measure_deviation:
+        row = layout.row()
+        row.prop(api_properties, "deviation_samples")
+        row.prop(api_properties, "deviation_coloration")
+    else:
+        pass
+
+
+def draw_profile(layout, profile):
+    # Affichage des durées (en millisecondes) des phases de la dernière exécution et des compteurs associés
+    box = layout.box()
+    col = box.column(align=True)
+    for phase, duration in profile["phases"].items():
+        # Les sous-phases ("compute.<nom>", "write_back.<nom>") sont indentées sous leur phase principale
+        col.label(text=("    " if "." in phase else "") + f"{phase} : {duration / 1e6:.2f} ms")
+    for counter, value in profile["counters"].items():
+        col.label(text=f"{counter} : {value}")
+
+
+def draw_repair_report(layout, report):
+    # Affichage du bilan de la dernière réparation du maillage effectuée côté C++
+    layout.label(text="Réparation du maillage :")
+    draw_profile(layout, {"phases": {}, "counters": report})
+
+
+def draw_startup_profile(layout, profile):
+    # Affichage des durées du chargement de l'extension ainsi que des durées d'importation des modules chargés à la demande
+    layout.label(text="Chargement de l'extension :")
+    phases = dict(profile["phases"])
+    for module_name, duration in import_times.items():
+        phases["import." + module_name.split(".")[-1]] = duration
+    draw_profile(layout, {"phases": phases, "counters": profile["counters"]})
+
+
+class VIEW3D_PT_cpp_api_panel(bpy.types.Panel):
+    bl_label = "Algorithmes de traitements de maillages"  # Titre du panneau latéral
+    bl_idname = "VIEW3D_PT_cpp_api_panel"
+    bl_space_type = "VIEW_3D"  # espace dans lequel est situé le panneau
+    bl_region_type = "UI"  # région dans laquelle le panneau se situe
+
+    bl_category = "API C++"  # Nom de l'onglet auquel attacher le panneau
+
+    def draw(self, context):
+        # Récupération du groupe de propriétés de l'API
+        api_properties = context.scene.api_properties
+        layout = self.layout
+        layout.use_property_split = False
+
+        row = layout.row()
+        row.label(text="Choisissez un algorithme à appliquer sur le maillage courant :")
+        row = layout.row()
+        row.scale_y = 1.4
+        row.prop(api_properties, "algorithm_choice")
+        
+        # affichage des propriétés en fonction de l'algorithme choisi par l'utilisateur
+        # Récupération du nom de l'algorithme courant (provenant soit d'une configuration prédéfinie soit d'un choix de l'utilisateur)
+        algorithm_name = api_properties.algorithm_choice
+        # Globals.algorithm_properties[current_choice.algorithm_choice]["drawing_properties"](layout, context)
+        # création d'une nouvelle ligne dans laquelle nous ajoutons un bouton (instance de la classe VIEW3D_OT_api_cgal)
+        if algorithm_name != "DEFAULT":
+            draw_properties(layout, context, algorithm_name)
+            # Récupération de la description de l'algorithme
+            description = Globals.algorithm_description[algorithm_name.lower()]
+            row = layout.row()
+            row.label(text="Description de l'algorithme :", icon="QUESTION")
+            box = layout.box()
+            col = box.column()
+            # Récupération du booléen gérant l'affichage ou le masquage partiel de la description de l'algorithme
+            description_is_hidden = api_properties.description_is_hidden                 
+            if description_is_hidden:
+                col.label(text=description[0][:-3] + "...")
+            else:
+                for line in description:
+                    col.label(text=line)
+            row = box.row()
+            row.scale_y = 1.2
+            row.operator(VIEW3D_OT_display_description.bl_idname, text="Etendre la description" if description_is_hidden else "Réduire la description")
+
+            if api_properties.result_infos != "":
+                for line in api_properties.result_infos.splitlines():
+                    layout.label(text=line)
+            else:
+                pass
+            # Aperçu interactif (uniquement pour les algorithmes prévisualisables)
+            if algorithm_name.lower() in Globals.preview_algorithms:
+                row = layout.row()
+                row.prop(api_properties, "use_preview")
+                if api_properties.use_preview:
+                    row.prop(api_properties, "preview_face_count", text="Faces")
+                    if Globals.preview_scheduler.is_active():
+                        row.label(text="", icon="TIME")
+                    else:
+                        pass
+                else:
+                    pass
+            else:
+                pass
+            row = layout.row()
+            row.prop(api_properties, "process_selection")
+            if algorithm_name.lower() in Globals.deviation_algorithms:
+                draw_deviation_properties(layout, api_properties)
+            else:
+                pass
+            row = layout.row()
+            row.prop(api_properties, "run_in_background")
+            row = layout.row()
+            row.prop(api_properties, "time_budget")
+            if "native_repair" in Globals.algorithm_input_pipeline[algorithm_name.lower()]:
+                row = layout.row()
+                row.prop(api_properties, "repair_tolerance")
+            else:
+                pass
+            row = layout.row()
+            row.prop(api_properties, "use_mesh_sessions")
+            row = layout.row()
+            row.prop(api_properties, "validate_mesh")
+            row = layout.row()
+            row.prop(api_properties, "frame_result")
+            row = layout.row()
+            row.prop(api_properties, "show_profile")
+            if api_properties.show_profile and Globals.last_profile is not None:
+                draw_profile(layout, Globals.last_profile)
+            else:
+                pass
+            if api_properties.show_profile and Globals.last_repair_report is not None:
+                draw_repair_report(layout, Globals.last_repair_report)
+            else:
+                pass
+            if api_properties.show_profile and Globals.startup_profile is not None:
+                draw_startup_profile(layout, Globals.startup_profile)
+            else:
+                pass
+            job = Globals.current_job
+            # Si un algorithme est en cours d'exécution en arrière-plan, nous affichons son temps d'exécution ainsi qu'un bouton permettant de l'annuler
+            if job is not None:
+                row = layout.row()
+                progress = job.progress()
+                progress_text = f" {progress['fraction'] * 100:.0f}%" if progress is not None else ""
+                row.label(text=f"Annulation en cours... ({job.elapsed_time():.1f}s)" if job.is_cancelled()
+                          else f"Exécution en cours... ({job.elapsed_time():.1f}s){progress_text}", icon="TIME")
+                row = layout.row()
+                row.scale_y = 1.7
+                row.enabled = not job.is_cancelled()
+                row.operator(VIEW3D_OT_cancel_algorithm.bl_idname, text="Annuler l'algorithme")
+            else:
+                row = layout.row()
+                row.enabled = is_option_selected(context, algorithm_name)
+                row.scale_y = 1.7
+                # l'opérateur est référencé par un nom correspondant à la valeur de l'attribut bl_idname de la classe
+                row.operator(VIEW3D_OT_execute_algorithm.bl_idname, text="Appliquer l'algorithme")
+        else:
+            pass
+
+        # Enchaînement de plusieurs algorithmes (les maillages intermédiaires ne sont pas appliqués dans Blender)
+        box = layout.box()
+        box.label(text="Enchaînement d'algorithmes :", icon="LINKED")
+        box.prop(api_properties, "pipeline_choice")
+        if api_properties.pipeline_choice == "CUSTOM":
+            box.prop(api_properties, "custom_pipeline")
+        else:
+            pass
+        draw_deviation_properties(box, api_properties)
+        row = box.row()
+        row.scale_y = 1.4
+        row.enabled = Globals.current_job is None and api_properties.pipeline_choice != "DEFAULT"
+        row.operator(VIEW3D_OT_execute_algorithm.bl_idname, text="Appliquer l'enchaînement").use_pipeline = True
+
+
+
+## Fonctions d'enregistrement, de désincription et de référencement des groupe de propriétés des classes de l'API
+classes = (VIEW3D_PT_cpp_api_panel, VIEW3D_PT_stereoscopy_panel, VIEW3D_OT_align_camera_to_view, VIEW3D_OT_set_properties_to_default, VIEW3D_OT_load_configuration, VIEW3D_OT_save_configuration, VIEW3D_OT_display_description, VIEW3D_OT_execute_algorithm, VIEW3D_OT_cancel_algorithm)
+
+def algorithm_properties_registering():
+    # Enregistrement toutes les classes de propriétés des algorithmes de l'API
+    for property_class in Globals.properties_table.values():
+        bpy.utils.register_class(property_class)
+
+
+def unregister_algorithm_properties():
+    # Désinscription des classes de propriétés des algorithmes de l'API
+    for property_class in reversed(list(Globals.properties_table.values())):
+        bpy.utils.unregister_class(property_class)
+
+
+def create_property_pointers():
+    # et pour tous les algorithmes présents dans l'API
+    for attribute, property_class in Globals.properties_table.items():
+        setattr(bpy.types.Scene, attribute, bpy.props.PointerProperty(type=property_class))
+
+
+def delete_property_pointers():
+    # ainsi que les attributs référençant toutes les classes de propriétés des algorithmes présents dans Blender
+    for attribute in Globals.properties_table.keys():
+        delattr(bpy.types.Scene, attribute)
+
+
+def register():
+    # Mesure des durées des phases du chargement de l'extension (affichées dans le profil d'exécution du panneau)
+    phases = {}
+    start = time.perf_counter_ns()
+    check_required_modules()
+    phases["check_modules"] = time.perf_counter_ns() - start
+    # Enregistrement des classes basiques (panneau, boutons, ...) dans le registre de Blender
+    step_start = time.perf_counter_ns()
+    for cls in classes:
+        bpy.utils.register_class(cls)
+    phases["register_classes"] = time.perf_counter_ns() - step_start
+    # Chargement du registre des algorithmes (le fichier "config.json" n'est relu et validé que s'il a été modifié)
+    step_start = time.perf_counter_ns()
+    try:
+        registry, registry_source = load_registry(os.path.join(os.path.dirname(os.path.realpath(__file__)), "config.json"), get_registry_cache_path(),
+                                                  get_native_capabilities, get_native_module_paths())
+    except Exception as e:
+        print("Une erreur s'est produite lors du chargement du fichier 'config.json'.")
+        raise e
+    phases["load_registry"] = time.perf_counter_ns() - step_start
+    step_start = time.perf_counter_ns()
+    load_algorithms(registry)
+    phases["build_properties"] = time.perf_counter_ns() - step_start
+    # Ajout du gestionnaire invalidant les triangulations conservées lorsque la géométrie d'un maillage est modifiée
+    bpy.app.handlers.depsgraph_update_post.append(invalidate_loop_triangles_cache)
+    # ainsi que les maillages réduits des aperçus
+    bpy.app.handlers.depsgraph_update_post.append(invalidate_preview_proxies)
+    phases["total"] = time.perf_counter_ns() - start
+    Globals.startup_profile = {"phases": phases,
+                               "counters": {"algorithms": len(registry["algorithms"]), "registry": registry_source}}
+    print(f"Extension chargée en {phases['total'] / 1e6:.1f} ms (registre des algorithmes : {registry_source}).")
+    # Enregistrement des classes de propriétés des différents algorithmes de l'API ainsi que la liste déroulante
+    # algorithm_properties_registering()
+    # Création des pointeurs permettant de référencer les propriétés des algorithmes de l'API dans le registre de Blender
+    # create_property_pointers()
+
+
+def unregister():
+    # Libération des maillages conservés dans les sessions natives et dans la réserve de MeshSet
+    Globals.mesh_sessions.clear()
+    if is_loaded("api_modules.py_mesh"):
+        py_mesh.PyMeshApi.clear_pool()
+    else:
+        pass
+    # ainsi que des triangulations conservées
+    if invalidate_loop_triangles_cache in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(invalidate_loop_triangles_cache)
+    Globals.loop_triangles_cache.clear()
+    # Suppression des aperçus et des maillages réduits
+    if bpy.app.timers.is_registered(update_preview):
+        bpy.app.timers.unregister(update_preview)
+    clear_preview()
+    if invalidate_preview_proxies in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(invalidate_preview_proxies)
+    Globals.preview_proxies.clear()
+    # Désinscription des classes de propriétés des algorithmes de l'API
+    unregister_algorithm_properties()
+    # Désinscription de la liste déroulante
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
+    # Suppression des pointeurs référençant les propriétés des algorithmes de l'API
+    delete_property_pointers()
+
+
+if __name__ == "__main__":
+    register()
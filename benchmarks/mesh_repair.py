@@ -0,0 +1,89 @@
+"""Mesure de la réparation native des maillages (fusion des sommets, suppression des faces dégénérées, en double ou non manifold et orientation).
+
+Le tore synthétique est converti en soupe de triangles (sommets dupliqués pour chaque face, légèrement déplacés), dont une partie des faces
+est retournée et dupliquée. Exécuté depuis Blender (blender --background --python benchmarks/mesh_repair.py -- ...), le script mesure
+également la fusion des sommets et la triangulation effectuées auparavant avec BMesh.
+
+Exemple : python benchmarks/mesh_repair.py --major-segments 2048 --minor-segments 1280
+Le module algorithms_api doit avoir été compilé au préalable (setup.bash)."""
+import argparse
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "api_traitements_maillage"))
+# Blender n'ajoute pas le dossier du script aux chemins de recherche des modules
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from api_modules.algorithms_api import repair_mesh
+from synthetic_meshes import torus
+
+
+def triangle_soup(vertices, faces, jitter, flipped_ratio, duplicated_ratio, seed=0):
+    # Chaque face possède ses propres sommets (déplacés d'au plus jitter), une partie des faces est retournée et une autre dupliquée
+    rng = np.random.default_rng(seed)
+    triangles = faces.reshape(-1, 3).copy()
+    flipped = rng.random(len(triangles)) < flipped_ratio
+    triangles[flipped] = triangles[flipped][:, ::-1]
+    triangles = np.concatenate((triangles, triangles[rng.random(len(triangles)) < duplicated_ratio]))
+    soup_vertices = vertices.reshape(-1, 3)[triangles.reshape(-1)]
+    soup_vertices = soup_vertices + rng.uniform(-jitter, jitter, soup_vertices.shape).astype(np.float32)
+    return soup_vertices.astype(np.float32).reshape(-1), np.arange(len(soup_vertices), dtype=np.int32)
+
+
+def run_bmesh(vertices, faces, tolerance):
+    # Route utilisée auparavant par l'extension : fusion des sommets et triangulation avec BMesh
+    import bmesh
+    import bpy
+    mesh = bpy.data.meshes.new("mesh_repair_benchmark")
+    mesh.from_pydata(vertices.reshape(-1, 3).tolist(), [], faces.reshape(-1, 3).tolist())
+    start = time.perf_counter()
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+    bmesh.ops.remove_doubles(bm, verts=bm.verts[:], dist=tolerance)
+    bmesh.ops.triangulate(bm, faces=bm.faces[:])
+    bm.to_mesh(mesh)
+    bm.free()
+    elapsed = time.perf_counter() - start
+    result = (len(mesh.vertices), len(mesh.polygons))
+    bpy.data.meshes.remove(mesh)
+    return elapsed, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--major-segments", type=int, default=2048)
+    parser.add_argument("--minor-segments", type=int, default=1280)
+    parser.add_argument("--tolerance", type=float, default=1e-4)
+    parser.add_argument("--threads", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=1, help="nombre de mesures (la meilleure est conservée)")
+    # Arguments passés après "--" lors d'une exécution depuis Blender
+    args = parser.parse_args(sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else None)
+
+    vertices, faces = torus(args.major_segments, args.minor_segments)
+    soup_vertices, soup_faces = triangle_soup(vertices, faces, args.tolerance / 4, 0.1, 0.01)
+    print(f"Soupe de triangles : {len(soup_vertices) // 3} sommets, {len(soup_faces) // 3} faces")
+
+    best = None
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        result = repair_mesh(soup_vertices, soup_faces, args.tolerance, args.threads)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"Réparation native : {best:.3f} s")
+    for phase, duration in result["profile"]["phases"].items():
+        print(f"    {phase} : {duration / 1e6:.1f} ms")
+    for counter, value in result["report"].items():
+        print(f"    {counter} : {value}")
+
+    try:
+        import bpy
+    except ImportError:
+        print("Le module bpy n'est pas disponible : la route BMesh n'est pas mesurée (exécuter le script depuis Blender).")
+        return
+    elapsed, (number_of_vertices, number_of_faces) = run_bmesh(soup_vertices, soup_faces, args.tolerance)
+    print(f"BMesh (remove_doubles + triangulate) : {elapsed:.3f} s ({number_of_vertices} sommets, {number_of_faces} faces), "
+          f"accélération : {elapsed / best:.1f}")
+
+if __name__ == "__main__":
+    main()
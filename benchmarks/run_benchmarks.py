@@ -0,0 +1,193 @@
+"""Banc d'essai des algorithmes de l'extension exécuté en dehors de Blender sur des maillages synthétiques.
+
+Chaque algorithme natif (Router.algorithms()) et chaque algorithme MeshLab de config.json est exécuté avec les valeurs par défaut
+de ses propriétés. Les durées des phases de lecture des données (ingest), de construction du maillage (build), d'exécution (compute)
+et d'exportation des résultats (export), ainsi que les sous-phases d'exécution (compute.<nom>) et les compteurs du profil de chaque
+algorithme, sont enregistrées dans un rapport JSON.
+
+Exemples :
+    python benchmarks/run_benchmarks.py --sizes 10k,100k,1M --output rapport.json
+    python benchmarks/run_benchmarks.py --sizes 10k,100k --output rapport.json --baseline reference.json
+    python benchmarks/run_benchmarks.py --compare rapport.json --baseline reference.json
+Le module algorithms_api doit avoir été compilé au préalable (setup.bash)."""
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "api_traitements_maillage"))
+from api_modules import registry
+import synthetic_meshes
+
+# Phases mesurées pour chaque algorithme
+PHASES = ("ingest", "build", "compute", "export")
+
+
+def parse_size(text):
+    """Conversion d'un nombre de faces éventuellement suffixé (10k, 1M) en entier"""
+    text = text.strip().lower()
+    multipliers = {"k": 1000, "m": 1000000}
+    if text[-1] in multipliers:
+        return int(float(text[:-1]) * multipliers[text[-1]])
+    return int(text)
+
+
+def profile_to_measure(profile):
+    """Conversion d'un profil d'algorithme (durées en nanosecondes) en mesure : durées des phases en secondes et compteurs"""
+    phases = {phase: duration / 1e9 for phase, duration in profile["phases"].items()}
+    return {"phases": phases, "counters": dict(profile["counters"])}
+
+
+def run_native(algorithms_api, algorithm_name, algorithm, vertices, faces, session, build_time):
+    # La session étant construite une seule fois par maillage, la durée de sa construction est ajoutée à chaque mesure
+    params, options = registry.default_parameters(algorithm) if algorithm is not None else ([{}], {})
+    data = {"vertices": vertices, "faces": faces, "params": params, "options": options, "session": session}
+    # Les valeurs SDF ne doivent pas être réutilisées d'une mesure à l'autre
+    algorithms_api.clear_sdf_cache()
+    router = algorithms_api.Router(algorithm_name, data)
+    router.init()
+    start = time.perf_counter()
+    router.get_result()
+    get_result_time = time.perf_counter() - start
+    measure = profile_to_measure(router.profile)
+    measure["phases"]["build"] = build_time
+    measure["phases"]["export"] += get_result_time
+    return measure
+
+
+def run_meshlab(py_mesh, converters, algorithm, vertices, faces):
+    params, options = registry.default_parameters(algorithm, converters)
+    data = {"vertices": vertices, "params": params, "options": options, "function": algorithm["functions_name"]}
+    # Les indices des faces ne sont envoyés qu'aux algorithmes qui les utilisent (cas des nuages de points)
+    if "face_indices" in algorithm["input"] or "loop_triangles" in algorithm["input"]:
+        data["faces"] = faces
+    api = py_mesh.PyMeshApi(data)
+    api.init()
+    api.get_result()
+    return profile_to_measure(api.profile)
+
+
+def run_benchmarks(args):
+    from api_modules import algorithms_api
+    try:
+        import pymeshlab
+        from api_modules import py_mesh
+        converters = registry.meshlab_converters(pymeshlab)
+    except ImportError:
+        pymeshlab = None
+        print("Le module pymeshlab n'est pas installé : les algorithmes MeshLab ne seront pas mesurés.")
+
+    config = registry.load_config()
+    algorithms = {algorithm["id_name"]: algorithm for algorithm in registry.iter_algorithms(config)}
+    # Algorithmes natifs : tous ceux enregistrés dans la table des algorithmes du Router (décrits ou non dans config.json)
+    benchmarked = [(name, 0, algorithms.get(name, None)) for name in algorithms_api.Router.algorithms()]
+    # Algorithmes MeshLab décrits dans config.json
+    if pymeshlab is not None:
+        benchmarked += [(name, 1, algorithm) for name, algorithm in algorithms.items() if algorithm["language_id"] == 1]
+    if args.algorithms:
+        selection = set(args.algorithms.split(","))
+        benchmarked = [entry for entry in benchmarked if entry[0] in selection]
+
+    results = []
+    for shape in args.shapes.split(","):
+        for target_faces in [parse_size(size) for size in args.sizes.split(",")]:
+            vertices, faces = synthetic_meshes.generate(shape, target_faces)
+            number_of_vertices, number_of_faces = len(vertices) // 3, len(faces) // 3
+            print(f"\n{shape} : {number_of_vertices} sommets, {number_of_faces} faces")
+            # Construction du maillage natif (une seule fois par maillage, comme dans l'extension grâce aux sessions)
+            start = time.perf_counter()
+            session = algorithms_api.MeshSession(shape, {"vertices": vertices, "faces": faces})
+            build_time = time.perf_counter() - start
+
+            for algorithm_name, language_id, algorithm in benchmarked:
+                result = {"shape": shape, "target_faces": target_faces, "faces": number_of_faces, "vertices": number_of_vertices,
+                          "algorithm": algorithm_name, "language_id": language_id, "phases": None, "total": None, "error": None}
+                try:
+                    measures = []
+                    for _ in range(args.repeat):
+                        if language_id == 0:
+                            measures.append(run_native(algorithms_api, algorithm_name, algorithm, vertices, faces, session, build_time))
+                        else:
+                            measures.append(run_meshlab(py_mesh, converters, algorithm, vertices, faces))
+                    # Conservation de la mesure la plus rapide (la moins perturbée par le reste du système)
+                    best = min(measures, key=lambda measure: sum(measure["phases"].get(phase, 0.0) for phase in PHASES))
+                    result["phases"] = {phase: best["phases"].get(phase, 0.0) for phase in PHASES}
+                    result["total"] = sum(result["phases"].values())
+                    # Sous-phases de l'exécution et compteurs (non comparés à la référence)
+                    result["subphases"] = {phase: duration for phase, duration in best["phases"].items() if phase not in PHASES}
+                    result["counters"] = best["counters"]
+                    print(f"  {algorithm_name:<32} " + " ".join(f"{phase} {result['phases'][phase]:.4f}s" for phase in PHASES))
+                except Exception as err:
+                    result["error"] = str(err)
+                    print(f"  {algorithm_name:<32} erreur : {err}")
+                results.append(result)
+
+    return {"metadata": {"date": datetime.datetime.now().isoformat(timespec="seconds"),
+                         "platform": platform.platform(),
+                         "processor": platform.processor(),
+                         "cpu_count": os.cpu_count(),
+                         "python": platform.python_version(),
+                         "repeat": args.repeat},
+            "results": results}
+
+
+def compare_reports(report, baseline, threshold, min_time):
+    """Comparaison d'un rapport avec un rapport de référence : retourne la liste des régressions (phase ou durée totale plus lente
+    que la référence de plus de threshold, les durées de référence inférieures à min_time étant ignorées car trop bruitées)"""
+    key = lambda result: (result["shape"], result["target_faces"], result["algorithm"])
+    baseline_results = {key(result): result for result in baseline["results"] if result["error"] is None}
+    regressions = []
+    for result in report["results"]:
+        reference = baseline_results.get(key(result), None)
+        if reference is None or result["error"] is not None:
+            continue
+        measures = [(phase, result["phases"][phase], reference["phases"][phase]) for phase in PHASES]
+        measures.append(("total", result["total"], reference["total"]))
+        for phase, current, previous in measures:
+            if previous >= min_time and current > previous * (1.0 + threshold):
+                regressions.append({"shape": result["shape"], "target_faces": result["target_faces"], "algorithm": result["algorithm"],
+                                    "phase": phase, "baseline": previous, "current": current, "ratio": current / previous})
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--shapes", default=",".join(synthetic_meshes.SHAPES), help="formes des maillages (icosphere, grid, torus)")
+    parser.add_argument("--sizes", default="10k,100k", help="nombres de faces des maillages (ex : 10k,100k,1M,10M)")
+    parser.add_argument("--algorithms", default="", help="liste des algorithmes à mesurer (tous par défaut)")
+    parser.add_argument("--repeat", type=int, default=1, help="nombre de mesures par algorithme (la plus rapide est conservée)")
+    parser.add_argument("--output", default="benchmark_report.json", help="chemin du rapport JSON généré")
+    parser.add_argument("--compare", default=None, help="rapport existant à comparer à la référence (aucune mesure n'est effectuée)")
+    parser.add_argument("--baseline", default=None, help="rapport de référence servant à détecter les régressions")
+    parser.add_argument("--threshold", type=float, default=0.15, help="ralentissement relatif toléré par rapport à la référence")
+    parser.add_argument("--min-time", type=float, default=0.005, help="durée de référence (en secondes) en dessous de laquelle une phase n'est pas comparée")
+    args = parser.parse_args()
+
+    if args.compare is not None:
+        with open(args.compare, encoding="utf-8") as f:
+            report = json.load(f)
+    else:
+        report = run_benchmarks(args)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=4)
+        print(f"\nRapport enregistré dans {args.output}")
+
+    if args.baseline is not None:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_reports(report, baseline, args.threshold, args.min_time)
+        if regressions:
+            print(f"\n{len(regressions)} régression(s) détectée(s) (seuil : +{args.threshold:.0%}) :")
+            for regression in regressions:
+                print(f"  {regression['algorithm']} / {regression['shape']} ({regression['target_faces']} faces) / {regression['phase']} : "
+                      f"{regression['baseline']:.4f}s -> {regression['current']:.4f}s (x{regression['ratio']:.2f})")
+            sys.exit(1)
+        else:
+            print("\nAucune régression détectée.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Mesure de l'accélération du calcul des valeurs SDF de la segmentation CGAL en fonction du nombre de threads.
+
+Exemple : python benchmarks/sdf_threads.py --max-threads 32 --major-segments 512 --minor-segments 256
+Le module algorithms_api doit avoir été compilé au préalable (setup.bash)."""
+import argparse
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "api_traitements_maillage"))
+from api_modules.algorithms_api import MeshSession, clear_sdf_cache
+from synthetic_meshes import torus
+
+
+def run_segmentation(session, threads, ids_output):
+    data = {"params": [{"clusters": 4, "smoothness": 0.5, "threads": threads}],
+            "options": {"output_option": "SEGMENTS_IDS" if ids_output else "SEGMENTS_NUMBER"}}
+    # Les valeurs SDF ne doivent pas être réutilisées d'une mesure à l'autre
+    clear_sdf_cache()
+    start = time.perf_counter()
+    result = session.run("segmentation_cgal", data)
+    return time.perf_counter() - start, result
+
+
+def same_partition(first, second):
+    # Deux segmentations sont identiques si la correspondance entre leurs identifiants de segments est une bijection
+    pairs = np.unique(np.stack((first, second), axis=-1), axis=0)
+    return len(pairs) == len(np.unique(first)) == len(np.unique(second))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-threads", type=int, default=os.cpu_count())
+    parser.add_argument("--major-segments", type=int, default=384)
+    parser.add_argument("--minor-segments", type=int, default=192)
+    parser.add_argument("--repeat", type=int, default=1, help="nombre de mesures par nombre de threads (la meilleure est conservée)")
+    args = parser.parse_args()
+
+    vertices, faces = torus(args.major_segments, args.minor_segments)
+    session = MeshSession("benchmark", {"vertices": vertices, "faces": faces})
+    print(f"Maillage : {session.number_of_vertices} sommets, {session.number_of_faces} faces")
+
+    # Nombres de threads mesurés : puissances de 2 jusqu'au nombre maximal de threads (inclus)
+    thread_counts = sorted({2 ** k for k in range(args.max_threads.bit_length()) if 2 ** k <= args.max_threads} | {args.max_threads})
+    # Segmentation de référence (calcul séquentiel)
+    reference_partition = np.asarray(run_segmentation(session, 1, True)[1]["segments_ids"])
+    reference_time = None
+    print(f"{'threads':>8} {'temps (s)':>10} {'accélération':>13} {'identique':>10}")
+    for threads in thread_counts:
+        elapsed = min(run_segmentation(session, threads, False)[0] for _ in range(args.repeat))
+        if reference_time is None:
+            reference_time = elapsed
+        identical = same_partition(reference_partition, np.asarray(run_segmentation(session, threads, True)[1]["segments_ids"]))
+        print(f"{threads:>8} {elapsed:>10.3f} {reference_time / elapsed:>13.2f} {str(identical):>10}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Mesure de l'index spatial natif (arbre AABB) : construction, récupération depuis le cache et débit des requêtes par lots.
+
+Les requêtes (points les plus proches, lancer de rayons et distances signées) portent sur des points tirés aléatoirement dans la boîte
+englobante du tore synthétique et sont exécutées avec un nombre croissant de threads.
+
+Exemple : python benchmarks/spatial_index.py --major-segments 1024 --minor-segments 512 --queries 1000000
+Le module algorithms_api doit avoir été compilé au préalable (setup.bash)."""
+import argparse
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "api_traitements_maillage"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from api_modules import algorithms_api
+from synthetic_meshes import torus
+
+
+def measure(function, repeat):
+    # Meilleure durée (en secondes) des exécutions de la fonction et résultat de la dernière exécution
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--major-segments", type=int, default=1024)
+    parser.add_argument("--minor-segments", type=int, default=512)
+    parser.add_argument("--queries", type=int, default=1000000)
+    parser.add_argument("--threads", default="1,2,4,8", help="nombres de threads mesurés, séparés par des virgules")
+    parser.add_argument("--repeat", type=int, default=3, help="nombre de mesures (la meilleure est conservée)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    vertices, faces = torus(args.major_segments, args.minor_segments)
+    print(f"Tore : {len(vertices) // 3} sommets, {len(faces) // 3} faces")
+
+    algorithms_api.clear_spatial_index_cache()
+    start = time.perf_counter()
+    index = algorithms_api.get_spatial_index(vertices, faces)
+    build = time.perf_counter() - start
+    print(f"Construction de l'index : {build:.3f} s (dont arbre : {index.build_time / 1e9:.3f} s), "
+          f"{index.number_of_triangles} triangles, {index.size_in_bytes / 2**20:.1f} Mo")
+    cached, _ = measure(lambda: algorithms_api.get_spatial_index(vertices, faces), args.repeat)
+    print(f"Récupération depuis le cache : {cached * 1e3:.2f} ms (empreinte de la géométrie), "
+          f"{algorithms_api.spatial_index_cache_infos()}")
+
+    rng = np.random.default_rng(args.seed)
+    points = vertices.reshape(-1, 3)
+    lower, upper = points.min(axis=0), points.max(axis=0)
+    queries = rng.uniform(lower, upper, (args.queries, 3))
+    directions = rng.normal(size=(args.queries, 3))
+
+    for threads in [int(value) for value in args.threads.split(",")]:
+        closest, _ = measure(lambda: index.closest_points(queries, threads), args.repeat)
+        rays, result = measure(lambda: index.ray_cast(queries, directions, threads), args.repeat)
+        signed, _ = measure(lambda: index.signed_distances(queries, threads), args.repeat)
+        print(f"{threads} thread(s) : points les plus proches {args.queries / closest / 1e6:.2f} M/s, "
+              f"rayons {args.queries / rays / 1e6:.2f} M/s ({np.count_nonzero(result['hits'])} atteignent le maillage), "
+              f"distances signées {args.queries / signed / 1e6:.2f} M/s")
+
+if __name__ == "__main__":
+    main()
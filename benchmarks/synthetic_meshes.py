@@ -0,0 +1,90 @@
+import numpy as np
+
+def torus(major_segments=256, minor_segments=128, major_radius=1.0, minor_radius=0.35, noise=0.02, seed=0):
+    """Création d'un tore triangulé (maillage fermé et variété) dont la surface est légèrement bruitée.
+    Retourne les coordonnées des sommets (float32, forme (N*3,)) et les indices des sommets des faces (int32, forme (M*3,)),
+    soit le même format que les données envoyées par l'extension Blender"""
+    u = np.linspace(0.0, 2.0 * np.pi, major_segments, endpoint=False)
+    v = np.linspace(0.0, 2.0 * np.pi, minor_segments, endpoint=False)
+    uu, vv = np.meshgrid(u, v, indexing="ij")
+    # Bruit radial reproductible afin d'obtenir des valeurs SDF non uniformes
+    rng = np.random.default_rng(seed)
+    radius = minor_radius * (1.0 + noise * rng.standard_normal(uu.shape))
+    x = (major_radius + radius * np.cos(vv)) * np.cos(uu)
+    y = (major_radius + radius * np.cos(vv)) * np.sin(uu)
+    z = radius * np.sin(vv)
+    vertices = np.stack((x, y, z), axis=-1).astype(np.float32).reshape(-1)
+
+    # Deux triangles par quadrilatère de la grille (les indices bouclent dans les deux directions)
+    i, j = np.meshgrid(np.arange(major_segments), np.arange(minor_segments), indexing="ij")
+    i_next = (i + 1) % major_segments
+    j_next = (j + 1) % minor_segments
+    v00 = i * minor_segments + j
+    v10 = i_next * minor_segments + j
+    v01 = i * minor_segments + j_next
+    v11 = i_next * minor_segments + j_next
+    faces = np.stack((np.stack((v00, v10, v11), axis=-1), np.stack((v00, v11, v01), axis=-1)), axis=2)
+    return vertices, faces.astype(np.int32).reshape(-1)
+
+
+def icosphere(subdivisions=4, radius=1.0):
+    """Création d'une icosphère (20 * 4^subdivisions faces)"""
+    t = (1.0 + np.sqrt(5.0)) / 2.0
+    vertices = np.array([[-1, t, 0], [1, t, 0], [-1, -t, 0], [1, -t, 0],
+                         [0, -1, t], [0, 1, t], [0, -1, -t], [0, 1, -t],
+                         [t, 0, -1], [t, 0, 1], [-t, 0, -1], [-t, 0, 1]], dtype=np.float64)
+    faces = np.array([[0, 11, 5], [0, 5, 1], [0, 1, 7], [0, 7, 10], [0, 10, 11],
+                      [1, 5, 9], [5, 11, 4], [11, 10, 2], [10, 7, 6], [7, 1, 8],
+                      [3, 9, 4], [3, 4, 2], [3, 2, 6], [3, 6, 8], [3, 8, 9],
+                      [4, 9, 5], [2, 4, 11], [6, 2, 10], [8, 6, 7], [9, 8, 1]], dtype=np.int64)
+    for _ in range(subdivisions):
+        # Chaque arête est coupée en son milieu (les arêtes partagées par deux faces ne créent qu'un seul sommet)
+        edges = np.concatenate((faces[:, [0, 1]], faces[:, [1, 2]], faces[:, [2, 0]]))
+        edges.sort(axis=1)
+        unique_edges, edge_index = np.unique(edges, axis=0, return_inverse=True)
+        edge_index = edge_index.reshape(-1)
+        midpoints = (vertices[unique_edges[:, 0]] + vertices[unique_edges[:, 1]]) / 2.0
+        midpoint_index = len(vertices) + edge_index.reshape(3, -1)
+        vertices = np.concatenate((vertices, midpoints))
+        a, b, c = faces[:, 0], faces[:, 1], faces[:, 2]
+        ab, bc, ca = midpoint_index[0], midpoint_index[1], midpoint_index[2]
+        faces = np.concatenate((np.stack((a, ab, ca), axis=-1), np.stack((b, bc, ab), axis=-1),
+                                np.stack((c, ca, bc), axis=-1), np.stack((ab, bc, ca), axis=-1)))
+    vertices = radius * vertices / np.linalg.norm(vertices, axis=1)[:, None]
+    return vertices.astype(np.float32).reshape(-1), faces.astype(np.int32).reshape(-1)
+
+
+def noisy_grid(resolution=256, size=2.0, noise=0.05, seed=0):
+    """Création d'une grille plane (2 * resolution² faces) dont la hauteur des sommets est bruitée (maillage ouvert)"""
+    coordinates = np.linspace(-size / 2.0, size / 2.0, resolution + 1)
+    xx, yy = np.meshgrid(coordinates, coordinates, indexing="ij")
+    rng = np.random.default_rng(seed)
+    zz = noise * rng.standard_normal(xx.shape)
+    vertices = np.stack((xx, yy, zz), axis=-1).astype(np.float32).reshape(-1)
+
+    i, j = np.meshgrid(np.arange(resolution), np.arange(resolution), indexing="ij")
+    v00 = i * (resolution + 1) + j
+    v10 = v00 + resolution + 1
+    v01 = v00 + 1
+    v11 = v10 + 1
+    faces = np.stack((np.stack((v00, v10, v11), axis=-1), np.stack((v00, v11, v01), axis=-1)), axis=2)
+    return vertices, faces.astype(np.int32).reshape(-1)
+
+
+# Formes disponibles pour les bancs d'essai
+SHAPES = ("icosphere", "grid", "torus")
+
+
+def generate(shape, target_faces, seed=0):
+    """Création d'un maillage de la forme demandée dont le nombre de faces est proche de target_faces"""
+    if shape == "icosphere":
+        # Nombre de subdivisions donnant le nombre de faces le plus proche
+        subdivisions = max(0, int(round(np.log(max(target_faces, 20) / 20.0) / np.log(4.0))))
+        return icosphere(subdivisions)
+    elif shape == "grid":
+        return noisy_grid(max(1, int(round(np.sqrt(target_faces / 2.0)))), seed=seed)
+    elif shape == "torus":
+        minor_segments = max(3, int(round(np.sqrt(target_faces / 4.0))))
+        return torus(2 * minor_segments, minor_segments, seed=seed)
+    else:
+        raise ValueError(f"Forme de maillage inconnue : {shape}")
@@ -1,5 +1,33 @@
-#include "Algorithm.hpp"
-
-pybind11::dict Algorithm::get_resulting_data() const {
-    return this->m_output_data;
-}
+#include "Algorithm.hpp"
+
+Algorithm::Algorithm()
+{
+    // Les phases principales sont déclarées dès la création de l'algorithme afin d'apparaître dans cet ordre dans le profil
+    // (les sous-phases de l'exécution, nommées "compute.<nom>", sont mesurées avant la fin de la phase "compute")
+    this->m_profiler.add_phase("ingest", 0);
+    this->m_profiler.add_phase("build", 0);
+    this->m_profiler.add_phase("compute", 0);
+}
+
+pybind11::dict Algorithm::get_resulting_data() const {
+    return this->m_output_data;
+}
+
+Profiler& Algorithm::profiler() {
+    return this->m_profiler;
+}
+
+Progress& Algorithm::progress() {
+    return this->m_progress;
+}
+
+pybind11::dict AlgorithmCapabilities::to_dict() const {
+    pybind11::dict capabilities;
+    capabilities["buffers"] = this->buffers;
+    capabilities["vertex_dtypes"] = this->vertex_dtypes;
+    capabilities["face_dtypes"] = this->face_dtypes;
+    capabilities["mesh"] = this->mesh;
+    capabilities["topology_changing"] = this->topology_changing;
+    capabilities["threads"] = this->threads;
+    return capabilities;
+}
@@ -1,17 +1,49 @@
-#ifndef ALGORITHM_HPP
-#define ALGORITHM_HPP
-
-#include <pybind11/pybind11.h>
-#include <pybind11/stl.h>
-
-class Algorithm{
-public:
-    virtual ~Algorithm() = default;
-    virtual void compute_algorithm() = 0;
-    pybind11::dict get_resulting_data() const;
-
-protected:
-    pybind11::dict m_output_data;
-};
-
-#endif
+#ifndef ALGORITHM_HPP
+#define ALGORITHM_HPP
+
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+#include "Profiler.hpp"
+#include "Progress.hpp"
+#include <string>
+#include <vector>
+
+// Description des données consommées par un algorithme natif : permet au côté Python de ne préparer que les données nécessaires
+// et de vérifier les entrées déclarées dans config.json
+struct AlgorithmCapabilities{
+    // Tableaux du maillage lus par l'algorithme ("vertices", "faces", "vertex_color", "face_color", "selected_faces")
+    std::vector<std::string> buffers;
+    // Types numpy acceptés pour les coordonnées des sommets et les indices des sommets des faces
+    std::vector<std::string> vertex_dtypes;
+    std::vector<std::string> face_dtypes;
+    // Structure construite à partir des tableaux : "half_edge" (maillage CGAL), "triangles" (tableaux parcourus directement) ou "none"
+    std::string mesh;
+    // L'algorithme retourne un maillage dont la topologie diffère de celle du maillage reçu
+    bool topology_changing;
+    // L'algorithme accepte le paramètre "threads"
+    bool threads;
+
+    pybind11::dict to_dict() const;
+};
+
+class Algorithm{
+public:
+    Algorithm();
+    virtual ~Algorithm() = default;
+    // Exécution de l'algorithme. Le GIL est relâché pendant cet appel : aucun objet Python ne doit y être manipulé
+    virtual void compute_algorithm() = 0;
+    // Conversion des résultats natifs de l'algorithme en objets Python (appelée avec le GIL)
+    virtual void export_results() = 0;
+    pybind11::dict get_resulting_data() const;
+    Profiler& profiler();
+    Progress& progress();
+
+protected:
+    pybind11::dict m_output_data;
+    // Durées des phases et compteurs de l'algorithme
+    Profiler m_profiler;
+    // Avancement de l'exécution, demande d'annulation et temps imparti
+    Progress m_progress;
+};
+
+#endif
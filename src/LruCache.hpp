@@ -0,0 +1,101 @@
+#ifndef LRUCACHE_HPP
+#define LRUCACHE_HPP
+
+#include <list>
+#include <unordered_map>
+#include <memory>
+#include <mutex>
+#include <utility>
+
+// Cache associatif à éviction LRU (l'entrée la moins récemment utilisée est supprimée en premier) dont la taille
+// est bornée par une quantité de mémoire. Les accès sont protégés par un mutex afin de pouvoir être utilisés depuis
+// plusieurs threads (les algorithmes sont exécutés sans le GIL)
+template<typename Key, typename Value>
+class LruCache{
+public:
+    explicit LruCache(const size_t capacity_in_bytes) : m_capacity_in_bytes(capacity_in_bytes), m_size_in_bytes(0), m_hits(0), m_misses(0) {}
+
+    // Récupération de la valeur associée à une clé (nullptr si la clé est absente du cache)
+    std::shared_ptr<const Value> get(const Key& key)
+    {
+        std::lock_guard<std::mutex> lock(this->m_mutex);
+        auto it = this->m_index.find(key);
+        if(it == this->m_index.end()){
+            this->m_misses++;
+            return nullptr;
+        }
+        this->m_hits++;
+        // L'entrée devient la plus récemment utilisée
+        this->m_entries.splice(this->m_entries.begin(), this->m_entries, it->second);
+        return it->second->value;
+    }
+
+    // Ajout (ou remplacement) d'une valeur dans le cache
+    void put(const Key& key, std::shared_ptr<const Value> value, const size_t size_in_bytes)
+    {
+        std::lock_guard<std::mutex> lock(this->m_mutex);
+        // Une valeur plus grande que la capacité du cache n'est pas conservée
+        if(size_in_bytes > this->m_capacity_in_bytes){
+            return;
+        }
+        auto it = this->m_index.find(key);
+        if(it != this->m_index.end()){
+            this->m_size_in_bytes -= it->second->size_in_bytes;
+            this->m_entries.erase(it->second);
+            this->m_index.erase(it);
+        }
+        this->m_entries.push_front(Entry{key, std::move(value), size_in_bytes});
+        this->m_index[key] = this->m_entries.begin();
+        this->m_size_in_bytes += size_in_bytes;
+        this->evict();
+    }
+
+    void set_capacity(const size_t capacity_in_bytes)
+    {
+        std::lock_guard<std::mutex> lock(this->m_mutex);
+        this->m_capacity_in_bytes = capacity_in_bytes;
+        this->evict();
+    }
+
+    void clear()
+    {
+        std::lock_guard<std::mutex> lock(this->m_mutex);
+        this->m_entries.clear();
+        this->m_index.clear();
+        this->m_size_in_bytes = 0;
+    }
+
+    size_t capacity_in_bytes() const { std::lock_guard<std::mutex> lock(this->m_mutex); return this->m_capacity_in_bytes; }
+    size_t size_in_bytes() const { std::lock_guard<std::mutex> lock(this->m_mutex); return this->m_size_in_bytes; }
+    size_t number_of_entries() const { std::lock_guard<std::mutex> lock(this->m_mutex); return this->m_entries.size(); }
+    size_t hits() const { std::lock_guard<std::mutex> lock(this->m_mutex); return this->m_hits; }
+    size_t misses() const { std::lock_guard<std::mutex> lock(this->m_mutex); return this->m_misses; }
+
+private:
+    struct Entry{
+        Key key;
+        std::shared_ptr<const Value> value;
+        size_t size_in_bytes;
+    };
+
+    // Suppression des entrées les moins récemment utilisées jusqu'à respecter la capacité du cache (le mutex doit être verrouillé)
+    void evict()
+    {
+        while(this->m_size_in_bytes > this->m_capacity_in_bytes && !this->m_entries.empty()){
+            const Entry& last = this->m_entries.back();
+            this->m_size_in_bytes -= last.size_in_bytes;
+            this->m_index.erase(last.key);
+            this->m_entries.pop_back();
+        }
+    }
+
+    mutable std::mutex m_mutex;
+    std::list<Entry> m_entries;
+    std::unordered_map<Key, typename std::list<Entry>::iterator> m_index;
+    size_t m_capacity_in_bytes;
+    size_t m_size_in_bytes;
+    size_t m_hits;
+    size_t m_misses;
+};
+
+#endif
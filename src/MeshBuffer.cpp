@@ -0,0 +1,182 @@
+#include "MeshBuffer.hpp"
+#include "MeshFile.hpp"
+#include <cstring>
+
+namespace py = pybind11;
+
+MeshBuffer::MeshBuffer(const py::dict& data)
+{
+    // Les tableaux du maillage peuvent être remplacés par le chemin d'un fichier (PLY ou OFF binaire, ou paire de fichiers .npy) :
+    // le fichier est alors projeté en mémoire et les tableaux sont des vues sur les pages projetées (aucune lecture ni copie)
+    py::dict arrays = data;
+    if(!data.contains("vertices") && data.contains("file")){
+        const std::string faces_path = data.contains("faces_file") ? data["faces_file"].cast<std::string>() : std::string();
+        arrays = MeshFile::read(data["file"].cast<std::string>(), faces_path);
+    }
+
+    // Récupération des tableaux numpy des coordonnées des sommets (3 composantes par sommet) et des indices des sommets des faces (3 indices par face)
+    this->m_vertices = get_array(arrays, "vertices", 3, this->m_vertices_layout);
+    this->m_faces = get_array(arrays, "faces", 3, this->m_faces_layout);
+
+    if(this->m_vertices_layout.type != ScalarType::Float32 && this->m_vertices_layout.type != ScalarType::Float64){
+        throw std::invalid_argument("Les coordonnées des sommets doivent être de type float32 ou float64.");
+    }
+    if(this->m_faces_layout.type != ScalarType::Int32 && this->m_faces_layout.type != ScalarType::Int64 && this->m_faces_layout.type != ScalarType::UInt32){
+        throw std::invalid_argument("Les indices des sommets des faces doivent être de type int32, uint32 ou int64.");
+    }
+
+    // Stockage du nombre de sommets et de faces du maillage
+    this->m_number_of_vertices = static_cast<size_t>(this->m_vertices.size()) / 3;
+    this->m_number_of_faces = static_cast<size_t>(this->m_faces.size()) / 3;
+}
+
+py::array MeshBuffer::get_array(const py::dict& data, const char* key, const size_t components, Layout& layout)
+{
+    if(!data.contains(key)){
+        throw std::invalid_argument(std::string("Le dictionnaire des données ne possède pas de champ '") + key + "'.");
+    }
+    py::object object = data[key];
+    // Seuls les tableaux numpy sont acceptés : toute autre séquence nécessiterait une copie de conversion
+    if(!py::isinstance<py::array>(object)){
+        throw std::invalid_argument(std::string("Le champ '") + key + "' doit être un tableau numpy.");
+    }
+    py::array array = py::reinterpret_borrow<py::array>(object);
+
+    // Le tableau doit être à une dimension (taille multiple du nombre de composantes) ou à deux dimensions de forme (N, composantes)
+    const bool is_flat = array.ndim() == 1 && static_cast<size_t>(array.shape(0)) % components == 0;
+    const bool is_matrix = array.ndim() == 2 && static_cast<size_t>(array.shape(1)) == components;
+    if(!is_flat && !is_matrix){
+        throw std::invalid_argument(std::string("Le tableau '") + key + "' doit être de forme (N*" + std::to_string(components) + ",) ou (N, " + std::to_string(components) + ").");
+    }
+
+    // Détermination du type des données du tableau
+    const py::dtype dtype = array.dtype();
+    const char kind = dtype.kind();
+    const py::ssize_t itemsize = dtype.itemsize();
+    if(kind == 'f' && itemsize == 4){
+        layout.type = ScalarType::Float32;
+    }else if(kind == 'f' && itemsize == 8){
+        layout.type = ScalarType::Float64;
+    }else if(kind == 'i' && itemsize == 4){
+        layout.type = ScalarType::Int32;
+    }else if(kind == 'i' && itemsize == 8){
+        layout.type = ScalarType::Int64;
+    }else if(kind == 'u' && itemsize == 4){
+        layout.type = ScalarType::UInt32;
+    }else{
+        throw std::invalid_argument(std::string("Le type des données du tableau '") + key + "' n'est pas pris en charge.");
+    }
+
+    // Les données sont lues directement en mémoire : les enregistrements peuvent être espacés (propriétés entrelacées d'un fichier),
+    // mais les composantes d'un tableau à une dimension doivent être contiguës
+    if(is_flat){
+        if(array.strides(0) != itemsize){
+            throw std::invalid_argument(std::string("Le tableau '") + key + "' doit être contigu en mémoire.");
+        }
+        layout.record_stride = static_cast<size_t>(itemsize) * components;
+        layout.component_stride = static_cast<size_t>(itemsize);
+    }else{
+        if(array.strides(0) < 0 || array.strides(1) < 0){
+            throw std::invalid_argument(std::string("Le tableau '") + key + "' ne doit pas être parcouru en sens inverse.");
+        }
+        layout.record_stride = static_cast<size_t>(array.strides(0));
+        layout.component_stride = static_cast<size_t>(array.strides(1));
+    }
+    layout.data = static_cast<const unsigned char*>(array.data());
+    // Ordre des octets du tableau ('=' : celui de la machine, '|' : sans objet)
+    const char byteorder = dtype.attr("byteorder").cast<std::string>()[0];
+    layout.swap = (byteorder == '<' && !MeshFile::is_little_endian()) || (byteorder == '>' && MeshFile::is_little_endian());
+
+    return array;
+}
+
+const std::vector<std::string>& MeshBuffer::vertex_dtypes()
+{
+    static const std::vector<std::string> dtypes = {"float32", "float64"};
+    return dtypes;
+}
+
+const std::vector<std::string>& MeshBuffer::face_dtypes()
+{
+    static const std::vector<std::string> dtypes = {"int32", "uint32", "int64"};
+    return dtypes;
+}
+
+size_t MeshBuffer::number_of_vertices() const
+{
+    return this->m_number_of_vertices;
+}
+
+size_t MeshBuffer::number_of_faces() const
+{
+    return this->m_number_of_faces;
+}
+
+MeshBuffer::ScalarType MeshBuffer::vertices_type() const
+{
+    return this->m_vertices_layout.type;
+}
+
+MeshBuffer::ScalarType MeshBuffer::faces_type() const
+{
+    return this->m_faces_layout.type;
+}
+
+std::array<double, 3> MeshBuffer::vertex(const size_t index) const
+{
+    return {read<double>(this->m_vertices_layout, index, 0), read<double>(this->m_vertices_layout, index, 1), read<double>(this->m_vertices_layout, index, 2)};
+}
+
+std::array<size_t, 3> MeshBuffer::face(const size_t index) const
+{
+    return {read<size_t>(this->m_faces_layout, index, 0), read<size_t>(this->m_faces_layout, index, 1), read<size_t>(this->m_faces_layout, index, 2)};
+}
+
+uint64_t MeshBuffer::fingerprint() const
+{
+    // Les types des données font partie de l'empreinte : une même géométrie envoyée en float32 ou en float64 possède deux empreintes distinctes
+    const uint64_t types[2] = {static_cast<uint64_t>(this->m_vertices_layout.type), static_cast<uint64_t>(this->m_faces_layout.type)};
+    uint64_t hash = hash_bytes(types, sizeof(types));
+    hash = hash_bytes(this->m_vertices_layout.data, span_in_bytes(this->m_vertices_layout, this->m_number_of_vertices), hash);
+    return hash_bytes(this->m_faces_layout.data, span_in_bytes(this->m_faces_layout, this->m_number_of_faces), hash);
+}
+
+size_t MeshBuffer::span_in_bytes(const Layout& layout, const size_t number_of_records)
+{
+    // Zone mémoire couverte par les enregistrements : dans le cas de propriétés entrelacées, les propriétés situées entre les enregistrements
+    // sont également prises en compte par l'empreinte (ce qui ne peut que provoquer une reconstruction superflue)
+    if(number_of_records == 0){
+        return 0;
+    }
+    const size_t item_size = (layout.type == ScalarType::Float64 || layout.type == ScalarType::Int64) ? 8 : 4;
+    return (number_of_records - 1) * layout.record_stride + 2 * layout.component_stride + item_size;
+}
+
+uint64_t MeshBuffer::hash_bytes(const void* data, const size_t size, const uint64_t seed)
+{
+    // Mélange de mots de 64 bits (inspiré de la fonction de finalisation de MurmurHash3) : bien plus rapide qu'un hachage octet par octet
+    // sur des tableaux de plusieurs centaines de méga-octets
+    const uint64_t prime = 0x9E3779B97F4A7C15ULL;
+    auto mix = [](uint64_t value){
+        value ^= value >> 33;
+        value *= 0xFF51AFD7ED558CCDULL;
+        value ^= value >> 33;
+        value *= 0xC4CEB9FE1A85EC53ULL;
+        value ^= value >> 33;
+        return value;
+    };
+
+    const unsigned char* bytes = static_cast<const unsigned char*>(data);
+    uint64_t hash = seed ^ (static_cast<uint64_t>(size) * prime);
+    const size_t number_of_words = size / sizeof(uint64_t);
+    for(size_t i = 0; i < number_of_words; i++){
+        uint64_t word;
+        std::memcpy(&word, bytes + i * sizeof(uint64_t), sizeof(uint64_t));
+        hash = (hash ^ mix(word)) * prime;
+    }
+    // Prise en compte des octets restants
+    uint64_t tail = 0;
+    std::memcpy(&tail, bytes + number_of_words * sizeof(uint64_t), size % sizeof(uint64_t));
+    hash = (hash ^ mix(tail)) * prime;
+    return mix(hash);
+}
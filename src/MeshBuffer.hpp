@@ -0,0 +1,229 @@
+#ifndef MESHBUFFER_HPP
+#define MESHBUFFER_HPP
+
+#include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
+#include <array>
+#include <vector>
+#include <string>
+#include <stdexcept>
+#include <cstdint>
+#include <cstring>
+#include <algorithm>
+
+// Couche d'entrée/sortie partagée par les algorithmes natifs : lecture sans copie des tableaux numpy envoyés par Blender
+// (coordonnées des sommets et indices des sommets des faces) et exportation des résultats sous forme de tableaux numpy
+// prenant possession de la mémoire des conteneurs natifs. Les tableaux peuvent également être des vues sur un fichier projeté
+// en mémoire (champ "file" des données, voir MeshFile) : les enregistrements y sont alors entrelacés avec d'autres propriétés,
+// éventuellement non alignés et dans un ordre des octets différent de celui de la machine
+class MeshBuffer{
+public:
+    // Types de données acceptés pour les tableaux du maillage
+    enum class ScalarType { Float32, Float64, Int32, Int64, UInt32 };
+
+    explicit MeshBuffer(const pybind11::dict& data);
+
+    // Types numpy acceptés pour les coordonnées des sommets et les indices des sommets des faces
+    static const std::vector<std::string>& vertex_dtypes();
+    static const std::vector<std::string>& face_dtypes();
+
+    size_t number_of_vertices() const;
+    size_t number_of_faces() const;
+    ScalarType vertices_type() const;
+    ScalarType faces_type() const;
+
+    std::array<double, 3> vertex(const size_t index) const;
+    std::array<size_t, 3> face(const size_t index) const;
+
+    // Empreinte (hachage du contenu) des tableaux des sommets et des faces permettant d'identifier une géométrie
+    uint64_t fingerprint() const;
+
+    // Parcours des sommets et des faces du maillage (le type des données n'est testé qu'une seule fois par parcours)
+    template<typename Function>
+    void for_each_vertex(Function function) const;
+    template<typename Function>
+    void for_each_face(Function function) const;
+    // Parcours d'une partie des sommets et des faces du maillage (intervalle [first, last[), utilisé pour répartir un parcours entre plusieurs threads
+    template<typename Function>
+    void for_each_vertex(const size_t first, const size_t last, Function function) const;
+    template<typename Function>
+    void for_each_face(const size_t first, const size_t last, Function function) const;
+
+    // Construction d'un maillage CGAL (Surface_mesh) à partir des données du tampon. Retourne le nombre de faces rejetées par la structure
+    // demi-arêtes (faces non manifold ou d'orientation incompatible, voir MeshRepair)
+    template<typename SurfaceMesh>
+    size_t fill_surface_mesh(SurfaceMesh& surface_mesh) const;
+
+    // Exportation d'un conteneur natif vers un tableau numpy à une dimension sans copie des données
+    template<typename T>
+    static pybind11::array_t<T> to_numpy(std::vector<T>&& values);
+
+    // Hachage 64 bits d'une zone mémoire (peut être chaîné à l'aide du paramètre seed)
+    static uint64_t hash_bytes(const void* data, const size_t size, const uint64_t seed = 0);
+
+private:
+    // Description de la disposition en mémoire d'un tableau (N enregistrements de 3 composantes)
+    struct Layout{
+        const unsigned char* data;
+        ScalarType type;
+        // Nombre d'octets séparant deux enregistrements et deux composantes d'un même enregistrement
+        size_t record_stride;
+        size_t component_stride;
+        // Ordre des octets différent de celui de la machine
+        bool swap;
+    };
+
+    static pybind11::array get_array(const pybind11::dict& data, const char* key, const size_t components, Layout& layout);
+    // Nombre d'octets couverts par les enregistrements d'un tableau
+    static size_t span_in_bytes(const Layout& layout, const size_t number_of_records);
+
+    // Lecture d'une valeur pouvant être non alignée et dans un ordre des octets différent de celui de la machine
+    template<typename T, bool Swap>
+    static T load(const unsigned char* ptr);
+    // Lecture d'une composante d'un enregistrement (le type des données est testé à chaque appel)
+    template<typename Result>
+    static Result read(const Layout& layout, const size_t index, const size_t component);
+    // Parcours des enregistrements [first, last[ d'un tableau : le type et l'ordre des octets ne sont testés qu'une seule fois
+    template<typename Result, typename Function>
+    static void for_each_record(const Layout& layout, const size_t first, const size_t last, Function function);
+    template<typename T, bool Swap, typename Result, typename Function>
+    static void for_each_record(const Layout& layout, const size_t first, const size_t last, Function function);
+
+    // Références sur les tableaux numpy (garantit que la mémoire lue reste valide durant toute la durée de vie du tampon,
+    // y compris lorsque les tableaux sont des vues sur un fichier projeté en mémoire)
+    pybind11::array m_vertices;
+    pybind11::array m_faces;
+    // Disposition en mémoire des données des tableaux
+    Layout m_vertices_layout;
+    Layout m_faces_layout;
+    size_t m_number_of_vertices;
+    size_t m_number_of_faces;
+};
+
+template<typename Function>
+void MeshBuffer::for_each_vertex(Function function) const
+{
+    this->for_each_vertex(0, this->m_number_of_vertices, function);
+}
+
+template<typename Function>
+void MeshBuffer::for_each_face(Function function) const
+{
+    this->for_each_face(0, this->m_number_of_faces, function);
+}
+
+template<typename Function>
+void MeshBuffer::for_each_vertex(const size_t first, const size_t last, Function function) const
+{
+    for_each_record<double>(this->m_vertices_layout, first, last, function);
+}
+
+template<typename Function>
+void MeshBuffer::for_each_face(const size_t first, const size_t last, Function function) const
+{
+    for_each_record<size_t>(this->m_faces_layout, first, last, function);
+}
+
+template<typename T, bool Swap>
+T MeshBuffer::load(const unsigned char* ptr)
+{
+    // La copie octet par octet est traduite par le compilateur en une simple lecture (éventuellement suivie d'une inversion des octets)
+    unsigned char bytes[sizeof(T)];
+    std::memcpy(bytes, ptr, sizeof(T));
+    if(Swap){
+        std::reverse(bytes, bytes + sizeof(T));
+    }
+    T value;
+    std::memcpy(&value, bytes, sizeof(T));
+    return value;
+}
+
+template<typename Result>
+Result MeshBuffer::read(const Layout& layout, const size_t index, const size_t component)
+{
+    const unsigned char* ptr = layout.data + index * layout.record_stride + component * layout.component_stride;
+    switch(layout.type){
+    case ScalarType::Float32: return static_cast<Result>(layout.swap ? load<float, true>(ptr) : load<float, false>(ptr));
+    case ScalarType::Float64: return static_cast<Result>(layout.swap ? load<double, true>(ptr) : load<double, false>(ptr));
+    case ScalarType::Int32: return static_cast<Result>(layout.swap ? load<int32_t, true>(ptr) : load<int32_t, false>(ptr));
+    case ScalarType::Int64: return static_cast<Result>(layout.swap ? load<int64_t, true>(ptr) : load<int64_t, false>(ptr));
+    default: return static_cast<Result>(layout.swap ? load<uint32_t, true>(ptr) : load<uint32_t, false>(ptr));
+    }
+}
+
+template<typename Result, typename Function>
+void MeshBuffer::for_each_record(const Layout& layout, const size_t first, const size_t last, Function function)
+{
+    switch(layout.type){
+    case ScalarType::Float32:
+        layout.swap ? for_each_record<float, true, Result>(layout, first, last, function) : for_each_record<float, false, Result>(layout, first, last, function);
+        break;
+    case ScalarType::Float64:
+        layout.swap ? for_each_record<double, true, Result>(layout, first, last, function) : for_each_record<double, false, Result>(layout, first, last, function);
+        break;
+    case ScalarType::Int32:
+        layout.swap ? for_each_record<int32_t, true, Result>(layout, first, last, function) : for_each_record<int32_t, false, Result>(layout, first, last, function);
+        break;
+    case ScalarType::Int64:
+        layout.swap ? for_each_record<int64_t, true, Result>(layout, first, last, function) : for_each_record<int64_t, false, Result>(layout, first, last, function);
+        break;
+    case ScalarType::UInt32:
+        layout.swap ? for_each_record<uint32_t, true, Result>(layout, first, last, function) : for_each_record<uint32_t, false, Result>(layout, first, last, function);
+        break;
+    }
+}
+
+template<typename T, bool Swap, typename Result, typename Function>
+void MeshBuffer::for_each_record(const Layout& layout, const size_t first, const size_t last, Function function)
+{
+    const size_t record_stride = layout.record_stride;
+    const size_t component_stride = layout.component_stride;
+    const unsigned char* ptr = layout.data + first * record_stride;
+    for(size_t i = first; i < last; i++, ptr += record_stride){
+        function(i, static_cast<Result>(load<T, Swap>(ptr)), static_cast<Result>(load<T, Swap>(ptr + component_stride)), static_cast<Result>(load<T, Swap>(ptr + 2 * component_stride)));
+    }
+}
+
+template<typename SurfaceMesh>
+size_t MeshBuffer::fill_surface_mesh(SurfaceMesh& surface_mesh) const
+{
+    typedef typename SurfaceMesh::Point Point;
+    typedef typename SurfaceMesh::Vertex_index Vertex_index;
+
+    // Réservation de l'espace mémoire nécessaire au maillage (un maillage triangulaire fermé possède environ 3 arêtes par face)
+    surface_mesh.reserve(this->m_number_of_vertices, this->m_number_of_faces * 3 / 2, this->m_number_of_faces);
+
+    // Les sommets sont ajoutés dans l'ordre du tampon : le sommet d'indice i du tampon a donc l'indice i dans le maillage
+    this->for_each_vertex([&surface_mesh](size_t, double x, double y, double z){
+        surface_mesh.add_vertex(Point(x, y, z));
+    });
+
+    const size_t number_of_vertices = this->m_number_of_vertices;
+    size_t rejected_faces = 0;
+    this->for_each_face([&surface_mesh, &rejected_faces, number_of_vertices](size_t index, size_t v0, size_t v1, size_t v2){
+        // Vérification que les indices de la face font bien référence à des sommets existants
+        if(v0 >= number_of_vertices || v1 >= number_of_vertices || v2 >= number_of_vertices){
+            throw std::out_of_range("La face " + std::to_string(index) + " fait référence à un sommet inexistant.");
+        }
+        //Création de la face du maillage
+        const auto face = surface_mesh.add_face(Vertex_index(static_cast<typename Vertex_index::size_type>(v0)),
+                                                Vertex_index(static_cast<typename Vertex_index::size_type>(v1)),
+                                                Vertex_index(static_cast<typename Vertex_index::size_type>(v2)));
+        if(face == SurfaceMesh::null_face()){
+            rejected_faces++;
+        }
+    });
+    return rejected_faces;
+}
+
+template<typename T>
+pybind11::array_t<T> MeshBuffer::to_numpy(std::vector<T>&& values)
+{
+    // Déplacement du conteneur dans le tas afin que sa durée de vie soit gérée par le tableau numpy
+    std::vector<T>* storage = new std::vector<T>(std::move(values));
+    // La capsule libère le conteneur lorsque le tableau numpy est détruit par Python
+    pybind11::capsule owner(storage, [](void* pointer){ delete reinterpret_cast<std::vector<T>*>(pointer); });
+    return pybind11::array_t<T>({static_cast<pybind11::ssize_t>(storage->size())}, {static_cast<pybind11::ssize_t>(sizeof(T))}, storage->data(), owner);
+}
+
+#endif
@@ -0,0 +1,196 @@
+#include "MeshDeviation.hpp"
+#include "Parallel.hpp"
+#include <algorithm>
+#include <cmath>
+#include <random>
+#include <stdexcept>
+
+namespace py = pybind11;
+using namespace spatial_index;
+
+namespace {
+    // Nombre de points échantillonnés (ou de sommets) traités par un thread à chaque récupération d'un bloc
+    const size_t SAMPLES_PER_BLOCK = 1024;
+    // Nombre de faces tirées uniformément parmi lesquelles la face de chaque point échantillonné est choisie selon leur aire
+    const int FACE_CANDIDATES = 4;
+    // Un point échantillonné sur VERTEX_SAMPLE_PERIOD est un sommet du maillage
+    const size_t VERTEX_SAMPLE_PERIOD = 4;
+    // Graines des tirages des points échantillonnés sur le maillage d'origine et sur le maillage obtenu (mesure reproductible)
+    const uint64_t FORWARD_SEED = 0x9e3779b97f4a7c15ULL;
+    const uint64_t BACKWARD_SEED = 0xc2b2ae3d27d4eb4fULL;
+
+    Point_3 to_point(const std::array<double, 3>& coordinates)
+    {
+        return Point_3(coordinates[0], coordinates[1], coordinates[2]);
+    }
+}
+
+void MeshDeviation::Statistics::add(const double distance)
+{
+    this->samples++;
+    this->max = std::max(this->max, distance);
+    this->sum += distance;
+    this->sum_of_squares += distance * distance;
+}
+
+void MeshDeviation::Statistics::merge(const Statistics& other)
+{
+    this->samples += other.samples;
+    this->max = std::max(this->max, other.max);
+    this->sum += other.sum;
+    this->sum_of_squares += other.sum_of_squares;
+}
+
+MeshDeviation::MeshDeviation(const MeshBuffer& original, const MeshBuffer& result, std::shared_ptr<const SpatialIndex> original_index,
+                             std::shared_ptr<const SpatialIndex> result_index, const size_t samples, const unsigned int number_of_threads) :
+    m_original(original), m_result(result), m_original_index(std::move(original_index)), m_result_index(std::move(result_index)), m_samples(samples),
+    m_number_of_threads(number_of_threads), m_forward(), m_backward(), m_vertex_distances(), m_has_vertex_distances(false)
+{
+}
+
+MeshDeviation::Statistics MeshDeviation::sample_distances(const MeshBuffer& mesh_buffer, const SpatialIndex& index, const uint64_t seed) const
+{
+    const size_t number_of_vertices = mesh_buffer.number_of_vertices();
+    const size_t number_of_faces = mesh_buffer.number_of_faces();
+    if(number_of_vertices == 0 || number_of_faces == 0){
+        return Statistics();
+    }
+    // Statistiques de chaque bloc fusionnées dans l'ordre des blocs : la mesure ne dépend pas du nombre de threads
+    std::vector<Statistics> block_statistics((this->m_samples + SAMPLES_PER_BLOCK - 1) / SAMPLES_PER_BLOCK);
+    parallel::for_each_block(this->m_samples, SAMPLES_PER_BLOCK, this->m_number_of_threads, [&](size_t block, size_t first, size_t last){
+        std::mt19937_64 engine(seed + block);
+        std::uniform_int_distribution<size_t> vertex_distribution(0, number_of_vertices - 1);
+        std::uniform_int_distribution<size_t> face_distribution(0, number_of_faces - 1);
+        std::uniform_real_distribution<double> unit(0.0, 1.0);
+        Statistics& statistics = block_statistics[block];
+        int32_t face;
+        for(size_t i = first; i < last; i++){
+            Point_3 point;
+            if(i % VERTEX_SAMPLE_PERIOD == 0){
+                point = to_point(mesh_buffer.vertex(vertex_distribution(engine)));
+            }
+            else{
+                // Tirage pondéré par l'aire parmi les faces candidates : chaque candidate remplace la face retenue avec une probabilité
+                // égale au rapport de son aire à l'aire cumulée des candidates déjà tirées
+                Triangle_3 triangle;
+                double total_area = 0;
+                bool found = false;
+                for(int candidate = 0; candidate < FACE_CANDIDATES; candidate++){
+                    const std::array<size_t, 3> vertices = mesh_buffer.face(face_distribution(engine));
+                    if(vertices[0] >= number_of_vertices || vertices[1] >= number_of_vertices || vertices[2] >= number_of_vertices){
+                        continue;
+                    }
+                    const Triangle_3 current(to_point(mesh_buffer.vertex(vertices[0])), to_point(mesh_buffer.vertex(vertices[1])),
+                                             to_point(mesh_buffer.vertex(vertices[2])));
+                    const double area = std::sqrt(current.squared_area());
+                    total_area += area;
+                    if(area > 0 && unit(engine) * total_area < area){
+                        triangle = current;
+                        found = true;
+                    }
+                }
+                // Seules des faces dégénérées ont été tirées : le point n'est pas échantillonné
+                if(!found){
+                    continue;
+                }
+                // Point tiré uniformément dans le triangle (coordonnées barycentriques)
+                double u = unit(engine);
+                double v = unit(engine);
+                if(u + v > 1.0){
+                    u = 1.0 - u;
+                    v = 1.0 - v;
+                }
+                point = triangle.vertex(0) + u * (triangle.vertex(1) - triangle.vertex(0)) + v * (triangle.vertex(2) - triangle.vertex(0));
+            }
+            statistics.add(std::sqrt(CGAL::squared_distance(point, index.closest_point(point, face))));
+        }
+    });
+    Statistics statistics;
+    for(const auto& block : block_statistics){
+        statistics.merge(block);
+    }
+    return statistics;
+}
+
+void MeshDeviation::run(Profiler& profiler, const bool vertex_distances)
+{
+    {
+        // Distances des points du maillage d'origine au maillage obtenu
+        Profiler::Scope scope(profiler, "forward");
+        this->m_forward = this->sample_distances(this->m_original, *this->m_result_index, FORWARD_SEED);
+    }
+    {
+        // Distances des points du maillage obtenu au maillage d'origine
+        Profiler::Scope scope(profiler, "backward");
+        this->m_backward = this->sample_distances(this->m_result, *this->m_original_index, BACKWARD_SEED);
+    }
+    if(vertex_distances){
+        Profiler::Scope scope(profiler, "vertices");
+        this->m_vertex_distances.assign(this->m_result.number_of_vertices(), 0.0);
+        parallel::for_each_block(this->m_vertex_distances.size(), SAMPLES_PER_BLOCK, this->m_number_of_threads, [&](size_t, size_t first, size_t last){
+            int32_t face;
+            this->m_result.for_each_vertex(first, last, [&](size_t index, double x, double y, double z){
+                const Point_3 point(x, y, z);
+                this->m_vertex_distances[index] = std::sqrt(CGAL::squared_distance(point, this->m_original_index->closest_point(point, face)));
+            });
+        });
+        this->m_has_vertex_distances = true;
+    }
+    profiler.set_counter("forward_samples", static_cast<int64_t>(this->m_forward.samples));
+    profiler.set_counter("backward_samples", static_cast<int64_t>(this->m_backward.samples));
+}
+
+py::dict MeshDeviation::export_results()
+{
+    Statistics total = this->m_forward;
+    total.merge(this->m_backward);
+    const double number_of_samples = static_cast<double>(std::max<size_t>(1, total.samples));
+    py::dict results;
+    results["hausdorff"] = total.max;
+    results["forward_max"] = this->m_forward.max;
+    results["backward_max"] = this->m_backward.max;
+    results["mean"] = total.sum / number_of_samples;
+    results["rms"] = std::sqrt(total.sum_of_squares / number_of_samples);
+    results["samples"] = total.samples;
+    results["diagonal"] = this->m_original_index->diagonal();
+    if(this->m_has_vertex_distances){
+        results["vertex_distances"] = MeshBuffer::to_numpy(std::move(this->m_vertex_distances));
+    }
+    return results;
+}
+
+py::dict MeshDeviation::measure(const py::dict& original, const py::dict& result, const size_t samples, const bool vertex_distances, const int threads)
+{
+    if(samples == 0){
+        throw std::invalid_argument("Le nombre de points échantillonnés doit être strictement positif.");
+    }
+    Profiler profiler;
+    int64_t start = Profiler::now();
+    const MeshBuffer original_buffer(original);
+    const MeshBuffer result_buffer(result);
+    profiler.add_phase("ingest", Profiler::now() - start);
+    // L'index du maillage d'origine est conservé dans le cache : il n'est construit qu'une seule fois pour une même géométrie
+    // (mesures successives après plusieurs exécutions d'un algorithme avec des paramètres différents)
+    bool cache_hit = false;
+    start = Profiler::now();
+    std::shared_ptr<const SpatialIndex> original_index = SpatialIndex::get(original, &cache_hit);
+    profiler.add_phase("original_index", Profiler::now() - start);
+    profiler.set_counter("original_index_cache_hit", cache_hit ? 1 : 0);
+    // L'index du maillage obtenu est également récupéré depuis le cache : les mesures répétées sur le même résultat (changement du nombre
+    // de points échantillonnés, coloration de l'écart) ne le reconstruisent pas
+    start = Profiler::now();
+    std::shared_ptr<const SpatialIndex> result_index = SpatialIndex::get(result, &cache_hit);
+    profiler.add_phase("result_index", Profiler::now() - start);
+    profiler.set_counter("result_index_cache_hit", cache_hit ? 1 : 0);
+    MeshDeviation mesh_deviation(original_buffer, result_buffer, original_index, result_index, samples, parallel::resolve_number_of_threads(threads));
+    {
+        // La mesure ne manipule aucun objet Python : le GIL est relâché pendant sa durée
+        py::gil_scoped_release release;
+        mesh_deviation.run(profiler, vertex_distances);
+    }
+    start = Profiler::now();
+    py::dict results = mesh_deviation.export_results();
+    profiler.add_phase("export", Profiler::now() - start);
+    results["profile"] = profiler.to_dict();
+    return results;
+}
@@ -0,0 +1,66 @@
+#ifndef MESHDEVIATION_HPP
+#define MESHDEVIATION_HPP
+
+#include "MeshBuffer.hpp"
+#include "SpatialIndex.hpp"
+#include "Profiler.hpp"
+
+#include <pybind11/pybind11.h>
+#include <cstdint>
+#include <memory>
+#include <vector>
+
+// Mesure de l'écart entre un maillage d'origine et le maillage obtenu par un algorithme (simplification, remaillage) : distance de Hausdorff
+// symétrique et écart quadratique moyen estimés à partir de points échantillonnés sur chacune des deux surfaces. Le nombre de points
+// échantillonnés est borné : hors construction des index spatiaux des deux maillages (conservés dans le cache des index spatiaux, de sorte
+// que les mesures répétées sur les mêmes maillages ne les reconstruisent pas), le coût de la mesure ne dépend pas du nombre de faces des maillages
+class MeshDeviation{
+public:
+    // Distances des points échantillonnés sur une surface à l'autre surface
+    struct Statistics{
+        size_t samples = 0;
+        double max = 0;
+        double sum = 0;
+        double sum_of_squares = 0;
+
+        void add(const double distance);
+        void merge(const Statistics& other);
+    };
+
+    // Nombre de points échantillonnés par défaut sur chacune des deux surfaces
+    static constexpr size_t DEFAULT_SAMPLES = 100000;
+
+    MeshDeviation(const MeshBuffer& original, const MeshBuffer& result, std::shared_ptr<const SpatialIndex> original_index,
+                  std::shared_ptr<const SpatialIndex> result_index, const size_t samples, const unsigned int number_of_threads);
+
+    // Mesure de l'écart (n'accède à aucun objet Python : peut être exécutée sans le GIL). Les distances au maillage d'origine de chacun
+    // des sommets du maillage obtenu ne sont calculées que si vertex_distances est vrai (coût proportionnel au nombre de ces sommets)
+    void run(Profiler& profiler, const bool vertex_distances);
+
+    // {"hausdorff", "forward_max" (maillage d'origine vers maillage obtenu), "backward_max" (maillage obtenu vers maillage d'origine),
+    // "mean", "rms", "samples", "diagonal" (diagonale de la boîte englobante du maillage d'origine), "vertex_distances" (éventuellement)}
+    pybind11::dict export_results();
+
+    // Mesure de l'écart entre les tableaux "vertices" et "faces" des deux maillages
+    static pybind11::dict measure(const pybind11::dict& original, const pybind11::dict& result, const size_t samples,
+                                  const bool vertex_distances, const int threads);
+
+private:
+    // Distances à l'index des points échantillonnés sur la surface du maillage : les faces sont tirées avec une probabilité approximativement
+    // proportionnelle à leur aire (parmi quelques faces tirées uniformément) et une partie des points sont des sommets du maillage, où se
+    // situent le plus souvent les écarts maximaux. Les tirages dépendent uniquement de seed et de l'indice du bloc de points
+    Statistics sample_distances(const MeshBuffer& mesh_buffer, const SpatialIndex& index, const uint64_t seed) const;
+
+    const MeshBuffer& m_original;
+    const MeshBuffer& m_result;
+    std::shared_ptr<const SpatialIndex> m_original_index;
+    std::shared_ptr<const SpatialIndex> m_result_index;
+    size_t m_samples;
+    unsigned int m_number_of_threads;
+    Statistics m_forward;
+    Statistics m_backward;
+    std::vector<double> m_vertex_distances;
+    bool m_has_vertex_distances;
+};
+
+#endif
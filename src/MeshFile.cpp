@@ -0,0 +1,672 @@
+#include "MeshFile.hpp"
+#include "MeshBuffer.hpp"
+#include <algorithm>
+#include <cctype>
+#include <cstdio>
+#include <cstring>
+#include <limits>
+#include <map>
+#include <sstream>
+#include <stdexcept>
+
+#ifdef _WIN32
+#ifndef NOMINMAX
+#define NOMINMAX
+#endif
+#include <windows.h>
+#else
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#endif
+
+namespace py = pybind11;
+
+// Taille du tampon d'écriture des fichiers
+static const size_t WRITE_BUFFER_SIZE = 1 << 22;
+
+MappedFile::MappedFile(const std::string& path) : m_path(path), m_data(nullptr), m_size(0)
+{
+#ifdef _WIN32
+    this->m_mapping = nullptr;
+    this->m_file = CreateFileA(path.c_str(), GENERIC_READ, FILE_SHARE_READ, nullptr, OPEN_EXISTING, FILE_ATTRIBUTE_NORMAL, nullptr);
+    if(this->m_file == INVALID_HANDLE_VALUE){
+        throw std::runtime_error("Impossible d'ouvrir le fichier '" + path + "'.");
+    }
+    LARGE_INTEGER size;
+    GetFileSizeEx(this->m_file, &size);
+    this->m_size = static_cast<size_t>(size.QuadPart);
+    // Un fichier vide ne peut pas être projeté
+    if(this->m_size > 0){
+        this->m_mapping = CreateFileMappingA(this->m_file, nullptr, PAGE_READONLY, 0, 0, nullptr);
+        if(this->m_mapping != nullptr){
+            this->m_data = static_cast<const unsigned char*>(MapViewOfFile(this->m_mapping, FILE_MAP_READ, 0, 0, 0));
+        }
+        if(this->m_data == nullptr){
+            if(this->m_mapping != nullptr){
+                CloseHandle(this->m_mapping);
+            }
+            CloseHandle(this->m_file);
+            throw std::runtime_error("Impossible de projeter en mémoire le fichier '" + path + "'.");
+        }
+    }
+#else
+    this->m_descriptor = open(path.c_str(), O_RDONLY);
+    if(this->m_descriptor < 0){
+        throw std::runtime_error("Impossible d'ouvrir le fichier '" + path + "'.");
+    }
+    struct stat status;
+    fstat(this->m_descriptor, &status);
+    this->m_size = static_cast<size_t>(status.st_size);
+    if(this->m_size > 0){
+        void* data = mmap(nullptr, this->m_size, PROT_READ, MAP_PRIVATE, this->m_descriptor, 0);
+        if(data == MAP_FAILED){
+            close(this->m_descriptor);
+            throw std::runtime_error("Impossible de projeter en mémoire le fichier '" + path + "'.");
+        }
+        this->m_data = static_cast<const unsigned char*>(data);
+    }
+#endif
+}
+
+MappedFile::~MappedFile()
+{
+#ifdef _WIN32
+    if(this->m_data != nullptr){
+        UnmapViewOfFile(this->m_data);
+        CloseHandle(this->m_mapping);
+    }
+    CloseHandle(this->m_file);
+#else
+    if(this->m_data != nullptr){
+        munmap(const_cast<unsigned char*>(this->m_data), this->m_size);
+    }
+    close(this->m_descriptor);
+#endif
+}
+
+const unsigned char* MappedFile::data() const
+{
+    return this->m_data;
+}
+
+size_t MappedFile::size() const
+{
+    return this->m_size;
+}
+
+const std::string& MappedFile::path() const
+{
+    return this->m_path;
+}
+
+// Ecriture tamponnée d'un fichier binaire dans un ordre des octets donné
+class BinaryWriter{
+public:
+    BinaryWriter(const std::string& path, const bool little_endian) : m_path(path), m_swap(little_endian != MeshFile::is_little_endian())
+    {
+        this->m_file = std::fopen(path.c_str(), "wb");
+        if(this->m_file == nullptr){
+            throw std::runtime_error("Impossible de créer le fichier '" + path + "'.");
+        }
+        this->m_buffer.reserve(WRITE_BUFFER_SIZE);
+    }
+
+    ~BinaryWriter()
+    {
+        if(this->m_file != nullptr){
+            std::fclose(this->m_file);
+        }
+    }
+
+    void write(const void* data, const size_t size)
+    {
+        if(this->m_buffer.size() + size > WRITE_BUFFER_SIZE){
+            this->flush();
+        }
+        const unsigned char* bytes = static_cast<const unsigned char*>(data);
+        this->m_buffer.insert(this->m_buffer.end(), bytes, bytes + size);
+    }
+
+    void write(const std::string& text)
+    {
+        this->write(text.data(), text.size());
+    }
+
+    template<typename T>
+    void put(const T value)
+    {
+        unsigned char bytes[sizeof(T)];
+        std::memcpy(bytes, &value, sizeof(T));
+        if(this->m_swap){
+            std::reverse(bytes, bytes + sizeof(T));
+        }
+        this->write(bytes, sizeof(T));
+    }
+
+    void close()
+    {
+        this->flush();
+        const int status = std::fclose(this->m_file);
+        this->m_file = nullptr;
+        if(status != 0){
+            throw std::runtime_error("Une erreur s'est produite lors de l'écriture du fichier '" + this->m_path + "'.");
+        }
+    }
+
+private:
+    void flush()
+    {
+        if(std::fwrite(this->m_buffer.data(), 1, this->m_buffer.size(), this->m_file) != this->m_buffer.size()){
+            throw std::runtime_error("Une erreur s'est produite lors de l'écriture du fichier '" + this->m_path + "'.");
+        }
+        this->m_buffer.clear();
+    }
+
+    std::string m_path;
+    bool m_swap;
+    std::FILE* m_file;
+    std::vector<unsigned char> m_buffer;
+};
+
+static std::string get_extension(const std::string& path)
+{
+    const size_t position = path.find_last_of('.');
+    std::string extension = position == std::string::npos ? "" : path.substr(position + 1);
+    std::transform(extension.begin(), extension.end(), extension.begin(), [](unsigned char c){ return static_cast<char>(std::tolower(c)); });
+    return extension;
+}
+
+// Lecture d'un entier de taille quelconque (1, 2 ou 4 octets) stocké dans un ordre des octets donné
+static size_t read_unsigned(const unsigned char* ptr, const size_t size, const bool little_endian)
+{
+    size_t value = 0;
+    for(size_t i = 0; i < size; i++){
+        value |= static_cast<size_t>(ptr[little_endian ? i : size - 1 - i]) << (8 * i);
+    }
+    return value;
+}
+
+static void check_bounds(const MappedFile& file, const size_t offset, const size_t size)
+{
+    if(offset > file.size() || size > file.size() - offset){
+        throw std::runtime_error("Le fichier '" + file.path() + "' est tronqué.");
+    }
+}
+
+bool MeshFile::is_little_endian()
+{
+    const uint16_t value = 1;
+    unsigned char first_byte;
+    std::memcpy(&first_byte, &value, 1);
+    return first_byte == 1;
+}
+
+py::dict MeshFile::read(const std::string& path, const std::string& faces_path)
+{
+    std::shared_ptr<MappedFile> file = std::make_shared<MappedFile>(path);
+    std::shared_ptr<MappedFile> faces_file = file;
+    ArrayView vertices;
+    ArrayView faces;
+    const std::string extension = get_extension(path);
+    if(extension == "ply"){
+        parse_ply(*file, vertices, faces);
+    }else if(extension == "off"){
+        parse_off(*file, vertices, faces);
+    }else if(extension == "npy"){
+        if(faces_path.empty()){
+            throw std::invalid_argument("Le chemin du fichier .npy des faces doit être fourni avec celui des sommets.");
+        }
+        vertices = parse_npy(*file);
+        faces_file = std::make_shared<MappedFile>(faces_path);
+        faces = parse_npy(*faces_file);
+    }else{
+        throw std::invalid_argument("Le format du fichier '" + path + "' n'est pas pris en charge (PLY, OFF ou .npy).");
+    }
+
+    py::dict data;
+    data["vertices"] = make_array(file, vertices);
+    data["faces"] = make_array(faces_file, faces);
+    return data;
+}
+
+void MeshFile::parse_ply(const MappedFile& file, ArrayView& vertices, ArrayView& faces)
+{
+    struct Property{
+        std::string name;
+        std::string type;
+        // Type du nombre d'éléments d'une liste (vide si la propriété n'est pas une liste)
+        std::string count_type;
+    };
+    struct Element{
+        std::string name;
+        size_t count;
+        std::vector<Property> properties;
+    };
+    // Taille et type numpy (sans l'ordre des octets) des types PLY
+    static const std::map<std::string, std::pair<size_t, std::string>> types = {
+        {"char", {1, "i1"}}, {"int8", {1, "i1"}}, {"uchar", {1, "u1"}}, {"uint8", {1, "u1"}},
+        {"short", {2, "i2"}}, {"int16", {2, "i2"}}, {"ushort", {2, "u2"}}, {"uint16", {2, "u2"}},
+        {"int", {4, "i4"}}, {"int32", {4, "i4"}}, {"uint", {4, "u4"}}, {"uint32", {4, "u4"}},
+        {"float", {4, "f4"}}, {"float32", {4, "f4"}}, {"double", {8, "f8"}}, {"float64", {8, "f8"}}
+    };
+    auto type_size = [&file](const std::string& type){
+        const auto it = types.find(type);
+        if(it == types.end()){
+            throw std::runtime_error("Le type PLY '" + type + "' du fichier '" + file.path() + "' est inconnu.");
+        }
+        return it->second.first;
+    };
+
+    // Lecture de l'en-tête (texte) du fichier
+    const char* text = reinterpret_cast<const char*>(file.data());
+    const size_t header_size = std::min<size_t>(file.size(), 1 << 16);
+    const std::string header(text, header_size);
+    const size_t end_header = header.find("end_header");
+    if(header.compare(0, 3, "ply") != 0 || end_header == std::string::npos){
+        throw std::runtime_error("Le fichier '" + file.path() + "' n'est pas un fichier PLY valide.");
+    }
+    // Les données binaires commencent après la fin de la ligne "end_header" (absente si l'en-tête est tronqué ou mal formé)
+    const size_t end_of_header_line = header.find('\n', end_header);
+    if(end_of_header_line == std::string::npos){
+        throw std::runtime_error("Le fichier '" + file.path() + "' n'est pas un fichier PLY valide.");
+    }
+    const size_t data_offset = end_of_header_line + 1;
+
+    std::istringstream lines(header.substr(0, end_header));
+    std::string line;
+    std::string format;
+    std::vector<Element> elements;
+    while(std::getline(lines, line)){
+        std::istringstream tokens(line);
+        std::string keyword;
+        tokens >> keyword;
+        if(keyword == "format"){
+            tokens >> format;
+        }else if(keyword == "element"){
+            Element element;
+            tokens >> element.name >> element.count;
+            elements.push_back(element);
+        }else if(keyword == "property" && !elements.empty()){
+            Property property;
+            tokens >> property.type;
+            if(property.type == "list"){
+                tokens >> property.count_type >> property.type;
+            }
+            tokens >> property.name;
+            elements.back().properties.push_back(property);
+        }
+    }
+    if(format != "binary_little_endian" && format != "binary_big_endian"){
+        throw std::invalid_argument("Le fichier '" + file.path() + "' n'est pas un fichier PLY binaire : seuls les fichiers binaires peuvent être projetés en mémoire.");
+    }
+    const bool little_endian = format == "binary_little_endian";
+    const std::string byteorder = little_endian ? "<" : ">";
+
+    bool has_vertices = false;
+    bool has_faces = false;
+    faces = ArrayView{data_offset, 0, 12, 4, byteorder + "i4"};
+    size_t offset = data_offset;
+    for(const Element& element : elements){
+        // Taille d'un enregistrement de l'élément et position de chaque propriété dans l'enregistrement
+        size_t record_size = 0;
+        std::map<std::string, size_t> positions;
+        for(const Property& property : element.properties){
+            positions[property.name] = record_size;
+            if(property.count_type.empty()){
+                record_size += type_size(property.type);
+            }else if(element.name == "face" && (property.name == "vertex_indices" || property.name == "vertex_index")){
+                // La liste des indices des sommets d'une face triangulaire est de taille fixe (vérifiée ci-dessous)
+                record_size += type_size(property.count_type) + 3 * type_size(property.type);
+            }else{
+                throw std::invalid_argument("La liste '" + property.name + "' de l'élément '" + element.name + "' du fichier '" + file.path() + "' n'est pas prise en charge.");
+            }
+        }
+        check_bounds(file, offset, element.count * record_size);
+
+        if(element.name == "vertex"){
+            const auto x = positions.find("x");
+            const auto y = positions.find("y");
+            const auto z = positions.find("z");
+            if(x == positions.end() || y == positions.end() || z == positions.end()){
+                throw std::runtime_error("Les sommets du fichier '" + file.path() + "' ne possèdent pas de coordonnées.");
+            }
+            // Les coordonnées doivent être du même type et régulièrement espacées dans l'enregistrement
+            std::string coordinates_type;
+            for(const Property& property : element.properties){
+                if(property.name == "x"){
+                    coordinates_type = property.type;
+                }
+            }
+            for(const Property& property : element.properties){
+                if((property.name == "y" || property.name == "z") && property.type != coordinates_type){
+                    throw std::invalid_argument("Les coordonnées des sommets du fichier '" + file.path() + "' doivent être du même type.");
+                }
+            }
+            if(y->second <= x->second || z->second - y->second != y->second - x->second){
+                throw std::invalid_argument("Les coordonnées des sommets du fichier '" + file.path() + "' doivent être stockées dans l'ordre x, y, z.");
+            }
+            vertices = ArrayView{offset + x->second, element.count, record_size, y->second - x->second, byteorder + types.at(coordinates_type).second};
+            has_vertices = true;
+        }else if(element.name == "face"){
+            const Property* indices = nullptr;
+            for(const Property& property : element.properties){
+                if(!property.count_type.empty()){
+                    indices = &property;
+                }
+            }
+            if(indices == nullptr){
+                throw std::runtime_error("Les faces du fichier '" + file.path() + "' ne possèdent pas d'indices de sommets.");
+            }
+            const size_t count_size = type_size(indices->count_type);
+            const size_t list_position = positions[indices->name];
+            // Vérification que toutes les faces sont des triangles (la taille des enregistrements n'est constante que dans ce cas)
+            const unsigned char* record = file.data() + offset + list_position;
+            for(size_t i = 0; i < element.count; i++, record += record_size){
+                if(read_unsigned(record, count_size, little_endian) != 3){
+                    throw std::invalid_argument("La face " + std::to_string(i) + " du fichier '" + file.path() + "' n'est pas un triangle : seuls les maillages triangulaires peuvent être projetés en mémoire.");
+                }
+            }
+            faces = ArrayView{offset + list_position + count_size, element.count, record_size, type_size(indices->type), byteorder + types.at(indices->type).second};
+            has_faces = true;
+        }
+        offset += element.count * record_size;
+        if(has_vertices && has_faces){
+            break;
+        }
+    }
+    if(!has_vertices){
+        throw std::runtime_error("Le fichier '" + file.path() + "' ne contient aucun sommet.");
+    }
+}
+
+void MeshFile::parse_off(const MappedFile& file, ArrayView& vertices, ArrayView& faces)
+{
+    // Seul le format OFF binaire est projetable : en-tête "OFF BINARY" suivi des nombres de sommets, de faces et d'arêtes, des coordonnées
+    // des sommets (float32) puis des faces (nombre de sommets, indices, nombre de composantes de couleur et couleur), en big-endian
+    const char* text = reinterpret_cast<const char*>(file.data());
+    const std::string header(text, std::min<size_t>(file.size(), 64));
+    const size_t end_line = header.find('\n');
+    if(end_line == std::string::npos || header.find("OFF") >= end_line){
+        throw std::runtime_error("Le fichier '" + file.path() + "' n'est pas un fichier OFF valide.");
+    }
+    // Les variantes du format (normales, couleurs ou coordonnées de texture des sommets : NOFF, COFF, STOFF, ...) ne sont pas prises en charge
+    if(header.compare(0, 3, "OFF") != 0 || header.substr(0, end_line).find("BINARY") == std::string::npos){
+        throw std::invalid_argument("Le fichier '" + file.path() + "' n'est pas un fichier OFF binaire : seuls les fichiers 'OFF BINARY' peuvent être projetés en mémoire.");
+    }
+    size_t offset = end_line + 1;
+    check_bounds(file, offset, 12);
+    const size_t number_of_vertices = read_unsigned(file.data() + offset, 4, false);
+    const size_t number_of_faces = read_unsigned(file.data() + offset + 4, 4, false);
+    offset += 12;
+    check_bounds(file, offset, number_of_vertices * 12);
+    vertices = ArrayView{offset, number_of_vertices, 12, 4, ">f4"};
+    offset += number_of_vertices * 12;
+
+    // Nombre de composantes de couleur des faces (identique pour toutes les faces afin que la taille des enregistrements soit constante)
+    size_t number_of_colors = 0;
+    if(number_of_faces > 0){
+        check_bounds(file, offset, 20);
+        number_of_colors = read_unsigned(file.data() + offset + 16, 4, false);
+    }
+    const size_t record_size = 4 * (5 + number_of_colors);
+    check_bounds(file, offset, number_of_faces * record_size);
+    const unsigned char* record = file.data() + offset;
+    for(size_t i = 0; i < number_of_faces; i++, record += record_size){
+        if(read_unsigned(record, 4, false) != 3 || read_unsigned(record + 16, 4, false) != number_of_colors){
+            throw std::invalid_argument("La face " + std::to_string(i) + " du fichier '" + file.path() + "' n'est pas un triangle de même format que les autres faces : seuls les maillages triangulaires peuvent être projetés en mémoire.");
+        }
+    }
+    faces = ArrayView{offset + 4, number_of_faces, record_size, 4, ">i4"};
+}
+
+MeshFile::ArrayView MeshFile::parse_npy(const MappedFile& file)
+{
+    // En-tête d'un fichier .npy : chaîne magique, version, taille de l'en-tête puis dictionnaire Python décrivant le tableau
+    check_bounds(file, 0, 10);
+    const unsigned char* data = file.data();
+    if(std::memcmp(data, "\x93NUMPY", 6) != 0){
+        throw std::runtime_error("Le fichier '" + file.path() + "' n'est pas un fichier .npy valide.");
+    }
+    const size_t length_size = data[6] == 1 ? 2 : 4;
+    check_bounds(file, 8, length_size);
+    const size_t header_size = read_unsigned(data + 8, length_size, true);
+    const size_t data_offset = 8 + length_size + header_size;
+    check_bounds(file, 8 + length_size, header_size);
+    const std::string header(reinterpret_cast<const char*>(data) + 8 + length_size, header_size);
+
+    auto field = [&header, &file](const std::string& name){
+        const size_t position = header.find("'" + name + "'");
+        const size_t separator = position == std::string::npos ? std::string::npos : header.find(':', position);
+        if(separator == std::string::npos){
+            throw std::runtime_error("L'en-tête du fichier '" + file.path() + "' ne possède pas de champ '" + name + "'.");
+        }
+        return header.substr(separator + 1);
+    };
+    std::string descr = field("descr");
+    descr = descr.substr(descr.find('\'') + 1);
+    descr = descr.substr(0, descr.find('\''));
+    // Type numpy : ordre des octets, genre et taille en octets (par exemple "<f4")
+    if(descr.size() < 3){
+        throw std::runtime_error("L'en-tête du fichier '" + file.path() + "' ne décrit pas un type de données valide.");
+    }
+    const std::string fortran_order = field("fortran_order");
+    if(fortran_order.substr(0, fortran_order.find(',')).find("True") != std::string::npos){
+        throw std::invalid_argument("Le tableau du fichier '" + file.path() + "' doit être stocké dans l'ordre C.");
+    }
+    // Forme du tableau : (N*3,) ou (N, 3)
+    std::string shape = field("shape");
+    shape = shape.substr(shape.find('(') + 1);
+    shape = shape.substr(0, shape.find(')'));
+    std::replace(shape.begin(), shape.end(), ',', ' ');
+    std::istringstream dimensions(shape);
+    std::vector<size_t> sizes;
+    size_t size;
+    while(dimensions >> size){
+        sizes.push_back(size);
+    }
+    const bool is_flat = sizes.size() == 1 && sizes[0] % 3 == 0;
+    const bool is_matrix = sizes.size() == 2 && sizes[1] == 3;
+    if(!is_flat && !is_matrix){
+        throw std::invalid_argument("Le tableau du fichier '" + file.path() + "' doit être de forme (N*3,) ou (N, 3).");
+    }
+    const size_t count = is_flat ? sizes[0] / 3 : sizes[0];
+    const size_t item_size = std::stoul(descr.substr(2));
+    check_bounds(file, data_offset, count * 3 * item_size);
+    return ArrayView{data_offset, count, 3 * item_size, item_size, descr};
+}
+
+py::array MeshFile::make_array(const std::shared_ptr<MappedFile>& file, const ArrayView& view)
+{
+    // La capsule conserve une référence sur le fichier projeté : la projection est libérée à la destruction de la dernière vue
+    std::shared_ptr<MappedFile>* holder = new std::shared_ptr<MappedFile>(file);
+    py::capsule owner(holder, [](void* pointer){ delete reinterpret_cast<std::shared_ptr<MappedFile>*>(pointer); });
+    const py::dtype dtype = py::module_::import("numpy").attr("dtype")(view.dtype);
+    py::array array(dtype,
+                    {static_cast<py::ssize_t>(view.count), static_cast<py::ssize_t>(3)},
+                    {static_cast<py::ssize_t>(view.record_stride), static_cast<py::ssize_t>(view.component_stride)},
+                    file->data() + view.offset, owner);
+    // Les pages sont projetées en lecture seule
+    array.attr("setflags")(py::arg("write") = false);
+    return array;
+}
+
+std::vector<float> MeshFile::get_colors(const py::dict& data, const char* key, const size_t count)
+{
+    std::vector<float> colors;
+    if(!data.contains(key) || data[key].is_none()){
+        return colors;
+    }
+    const py::array_t<float, py::array::c_style | py::array::forcecast> array = py::array_t<float, py::array::c_style | py::array::forcecast>::ensure(data[key]);
+    if(!array || static_cast<size_t>(array.size()) != count * 4){
+        throw std::invalid_argument(std::string("Le tableau '") + key + "' doit contenir 4 composantes (RGBA) par élément.");
+    }
+    colors.assign(array.data(), array.data() + array.size());
+    return colors;
+}
+
+// Conversion d'une composante de couleur (entre 0 et 1) en octet
+static unsigned char to_byte(const float value)
+{
+    return static_cast<unsigned char>(std::min(std::max(value, 0.0f), 1.0f) * 255.0f + 0.5f);
+}
+
+static void write_ply(const std::string& path, const MeshBuffer& mesh_buffer, const std::vector<float>& vertex_colors, const std::vector<float>& face_colors)
+{
+    const bool use_double = mesh_buffer.vertices_type() == MeshBuffer::ScalarType::Float64;
+    std::ostringstream header;
+    header << "ply\nformat binary_little_endian 1.0\n";
+    header << "element vertex " << mesh_buffer.number_of_vertices() << "\n";
+    for(const char* coordinate : {"x", "y", "z"}){
+        header << "property " << (use_double ? "double " : "float ") << coordinate << "\n";
+    }
+    if(!vertex_colors.empty()){
+        header << "property uchar red\nproperty uchar green\nproperty uchar blue\nproperty uchar alpha\n";
+    }
+    header << "element face " << mesh_buffer.number_of_faces() << "\nproperty list uchar int vertex_indices\n";
+    if(!face_colors.empty()){
+        header << "property uchar red\nproperty uchar green\nproperty uchar blue\nproperty uchar alpha\n";
+    }
+    header << "end_header\n";
+
+    BinaryWriter writer(path, true);
+    writer.write(header.str());
+    mesh_buffer.for_each_vertex([&writer, &vertex_colors, use_double](size_t index, double x, double y, double z){
+        if(use_double){
+            writer.put(x);
+            writer.put(y);
+            writer.put(z);
+        }else{
+            writer.put(static_cast<float>(x));
+            writer.put(static_cast<float>(y));
+            writer.put(static_cast<float>(z));
+        }
+        if(!vertex_colors.empty()){
+            for(size_t i = 0; i < 4; i++){
+                writer.put(to_byte(vertex_colors[4 * index + i]));
+            }
+        }
+    });
+    mesh_buffer.for_each_face([&writer, &face_colors](size_t index, size_t v0, size_t v1, size_t v2){
+        writer.put(static_cast<unsigned char>(3));
+        writer.put(static_cast<int32_t>(v0));
+        writer.put(static_cast<int32_t>(v1));
+        writer.put(static_cast<int32_t>(v2));
+        if(!face_colors.empty()){
+            for(size_t i = 0; i < 4; i++){
+                writer.put(to_byte(face_colors[4 * index + i]));
+            }
+        }
+    });
+    writer.close();
+}
+
+static void write_off(const std::string& path, const MeshBuffer& mesh_buffer, const std::vector<float>& face_colors)
+{
+    // Format OFF binaire (big-endian) : les coordonnées des sommets sont stockées en simple précision
+    BinaryWriter writer(path, false);
+    writer.write(std::string("OFF BINARY\n"));
+    writer.put(static_cast<int32_t>(mesh_buffer.number_of_vertices()));
+    writer.put(static_cast<int32_t>(mesh_buffer.number_of_faces()));
+    writer.put(static_cast<int32_t>(0));
+    mesh_buffer.for_each_vertex([&writer](size_t, double x, double y, double z){
+        writer.put(static_cast<float>(x));
+        writer.put(static_cast<float>(y));
+        writer.put(static_cast<float>(z));
+    });
+    mesh_buffer.for_each_face([&writer, &face_colors](size_t index, size_t v0, size_t v1, size_t v2){
+        writer.put(static_cast<int32_t>(3));
+        writer.put(static_cast<int32_t>(v0));
+        writer.put(static_cast<int32_t>(v1));
+        writer.put(static_cast<int32_t>(v2));
+        writer.put(static_cast<int32_t>(face_colors.empty() ? 0 : 4));
+        if(!face_colors.empty()){
+            for(size_t i = 0; i < 4; i++){
+                writer.put(face_colors[4 * index + i]);
+            }
+        }
+    });
+    writer.close();
+}
+
+static void write_npy_header(BinaryWriter& writer, const std::string& descr, const size_t count)
+{
+    // En-tête de la version 1.0 du format : la taille totale de l'en-tête doit être un multiple de 64 octets
+    std::string header = "{'descr': '" + descr + "', 'fortran_order': False, 'shape': (" + std::to_string(count) + ", 3), }";
+    const size_t padding = 64 - (10 + header.size() + 1) % 64;
+    header += std::string(padding % 64, ' ') + "\n";
+    writer.write("\x93NUMPY\x01\x00", 8);
+    writer.put(static_cast<uint16_t>(header.size()));
+    writer.write(header);
+}
+
+static void write_npy(const std::string& path, const std::string& faces_path, const MeshBuffer& mesh_buffer)
+{
+    // Les tableaux sont écrits dans l'ordre des octets de la machine (aucune conversion lors d'une lecture ultérieure)
+    const std::string byteorder = MeshFile::is_little_endian() ? "<" : ">";
+    const bool use_double = mesh_buffer.vertices_type() == MeshBuffer::ScalarType::Float64;
+    BinaryWriter vertices_writer(path, MeshFile::is_little_endian());
+    write_npy_header(vertices_writer, byteorder + (use_double ? "f8" : "f4"), mesh_buffer.number_of_vertices());
+    mesh_buffer.for_each_vertex([&vertices_writer, use_double](size_t, double x, double y, double z){
+        if(use_double){
+            vertices_writer.put(x);
+            vertices_writer.put(y);
+            vertices_writer.put(z);
+        }else{
+            vertices_writer.put(static_cast<float>(x));
+            vertices_writer.put(static_cast<float>(y));
+            vertices_writer.put(static_cast<float>(z));
+        }
+    });
+    vertices_writer.close();
+
+    const bool use_int64 = mesh_buffer.faces_type() == MeshBuffer::ScalarType::Int64;
+    BinaryWriter faces_writer(faces_path, MeshFile::is_little_endian());
+    write_npy_header(faces_writer, byteorder + (use_int64 ? "i8" : "i4"), mesh_buffer.number_of_faces());
+    mesh_buffer.for_each_face([&faces_writer, use_int64](size_t, size_t v0, size_t v1, size_t v2){
+        if(use_int64){
+            faces_writer.put(static_cast<int64_t>(v0));
+            faces_writer.put(static_cast<int64_t>(v1));
+            faces_writer.put(static_cast<int64_t>(v2));
+        }else{
+            faces_writer.put(static_cast<int32_t>(v0));
+            faces_writer.put(static_cast<int32_t>(v1));
+            faces_writer.put(static_cast<int32_t>(v2));
+        }
+    });
+    faces_writer.close();
+}
+
+void MeshFile::write(const std::string& path, const py::dict& data, const std::string& faces_path)
+{
+    // Lecture sans copie des tableaux du maillage (qui peuvent eux-mêmes être des vues sur un fichier projeté)
+    const MeshBuffer mesh_buffer(data);
+    const std::vector<float> vertex_colors = get_colors(data, "vertex_color", mesh_buffer.number_of_vertices());
+    const std::vector<float> face_colors = get_colors(data, "face_color", mesh_buffer.number_of_faces());
+    if(mesh_buffer.number_of_vertices() > static_cast<size_t>(std::numeric_limits<int32_t>::max())){
+        throw std::invalid_argument("Le nombre de sommets du maillage dépasse la capacité des formats d'écriture.");
+    }
+    const std::string extension = get_extension(path);
+
+    // L'écriture ne manipule aucun objet Python : le GIL est relâché pendant sa durée
+    py::gil_scoped_release release;
+    if(extension == "ply"){
+        write_ply(path, mesh_buffer, vertex_colors, face_colors);
+    }else if(extension == "off"){
+        if(!vertex_colors.empty()){
+            throw std::invalid_argument("Les couleurs des sommets ne peuvent pas être écrites au format OFF.");
+        }
+        write_off(path, mesh_buffer, face_colors);
+    }else if(extension == "npy"){
+        if(faces_path.empty()){
+            throw std::invalid_argument("Le chemin du fichier .npy des faces doit être fourni avec celui des sommets.");
+        }
+        if(!vertex_colors.empty() || !face_colors.empty()){
+            throw std::invalid_argument("Les couleurs ne peuvent pas être écrites au format .npy.");
+        }
+        write_npy(path, faces_path, mesh_buffer);
+    }else{
+        throw std::invalid_argument("Le format du fichier '" + path + "' n'est pas pris en charge (PLY, OFF ou .npy).");
+    }
+}
@@ -0,0 +1,69 @@
+#ifndef MESHFILE_HPP
+#define MESHFILE_HPP
+
+#include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
+#include <memory>
+#include <string>
+#include <vector>
+
+// Fichier projeté en mémoire en lecture seule : les pages du fichier ne sont chargées par le système qu'au moment où elles sont lues
+// et peuvent être libérées à tout moment sous la contrainte de la mémoire (aucune copie du fichier n'est conservée par le processus)
+class MappedFile{
+public:
+    explicit MappedFile(const std::string& path);
+    ~MappedFile();
+    MappedFile(const MappedFile&) = delete;
+    MappedFile& operator=(const MappedFile&) = delete;
+
+    const unsigned char* data() const;
+    size_t size() const;
+    const std::string& path() const;
+
+private:
+    std::string m_path;
+    const unsigned char* m_data;
+    size_t m_size;
+#ifdef _WIN32
+    void* m_file;
+    void* m_mapping;
+#else
+    int m_descriptor;
+#endif
+};
+
+// Lecture et écriture de maillages triangulaires binaires (PLY, OFF binaire ou paire de fichiers .npy des sommets et des faces) sans passer
+// par Blender ni par des objets Python : les fichiers lus sont projetés en mémoire et exposés sous la forme de tableaux numpy en lecture
+// seule pointant directement sur les pages du fichier, lus ensuite sans copie par MeshBuffer (le maillage CGAL est donc construit
+// directement à partir des pages projetées)
+class MeshFile{
+public:
+    // Projection en mémoire d'un maillage : retourne un dictionnaire contenant les tableaux "vertices" (N, 3) et "faces" (M, 3).
+    // Dans le cas d'un fichier .npy (sommets), le chemin du fichier .npy des faces doit être fourni
+    static pybind11::dict read(const std::string& path, const std::string& faces_path = "");
+    // Ecriture d'un maillage (champs "vertices" et "faces" des données, ainsi que les éventuelles couleurs RGBA "vertex_color" ou "face_color").
+    // Le format est déduit de l'extension du fichier (.ply, .off ou .npy, les faces étant alors écrites dans le fichier faces_path)
+    static void write(const std::string& path, const pybind11::dict& data, const std::string& faces_path = "");
+
+    static bool is_little_endian();
+
+private:
+    // Position d'un tableau de N enregistrements de 3 composantes dans un fichier projeté
+    struct ArrayView{
+        size_t offset;
+        size_t count;
+        size_t record_stride;
+        size_t component_stride;
+        // Type numpy des composantes (ex : "<f4")
+        std::string dtype;
+    };
+
+    static void parse_ply(const MappedFile& file, ArrayView& vertices, ArrayView& faces);
+    static void parse_off(const MappedFile& file, ArrayView& vertices, ArrayView& faces);
+    static ArrayView parse_npy(const MappedFile& file);
+    // Création d'une vue numpy en lecture seule sur un fichier projeté (la projection est conservée tant que la vue existe)
+    static pybind11::array make_array(const std::shared_ptr<MappedFile>& file, const ArrayView& view);
+    static std::vector<float> get_colors(const pybind11::dict& data, const char* key, const size_t count);
+};
+
+#endif
@@ -0,0 +1,547 @@
+#include "MeshRepair.hpp"
+#include "Parallel.hpp"
+#include <pybind11/numpy.h>
+#include <algorithm>
+#include <array>
+#include <cmath>
+#include <cstring>
+#include <limits>
+#include <stdexcept>
+#include <string>
+
+namespace py = pybind11;
+
+// Nombre de faces d'un bloc traité par un thread lors de la recherche des faces voisines
+static const size_t REPAIR_FACES_PER_BLOCK = 1 << 15;
+
+// Mélange des bits d'une clé 64 bits (splitmix64) utilisé par les tables de hachage de la réparation
+static inline uint64_t mix(uint64_t key)
+{
+    key += 0x9e3779b97f4a7c15ULL;
+    key = (key ^ (key >> 30)) * 0xbf58476d1ce4e5b9ULL;
+    key = (key ^ (key >> 27)) * 0x94d049bb133111ebULL;
+    return key ^ (key >> 31);
+}
+
+// Capacité (puissance de 2) d'une table de hachage à adressage ouvert contenant au plus number_of_items éléments
+static size_t table_capacity(const size_t number_of_items)
+{
+    size_t capacity = 16;
+    while(capacity < 2 * number_of_items){
+        capacity <<= 1;
+    }
+    return capacity;
+}
+
+static inline uint64_t double_bits(const double value)
+{
+    uint64_t bits;
+    std::memcpy(&bits, &value, sizeof(bits));
+    return bits;
+}
+
+size_t MeshRepair::Report::dropped_faces() const
+{
+    return this->degenerate_faces + this->duplicate_faces + this->non_manifold_faces + this->non_orientable_faces;
+}
+
+py::dict MeshRepair::Report::to_dict() const
+{
+    py::dict report;
+    report["input_vertices"] = this->input_vertices;
+    report["input_faces"] = this->input_faces;
+    report["welded_vertices"] = this->welded_vertices;
+    report["degenerate_faces"] = this->degenerate_faces;
+    report["duplicate_faces"] = this->duplicate_faces;
+    report["non_manifold_faces"] = this->non_manifold_faces;
+    report["non_orientable_faces"] = this->non_orientable_faces;
+    report["dropped_faces"] = this->dropped_faces();
+    report["flipped_faces"] = this->flipped_faces;
+    report["split_vertices"] = this->split_vertices;
+    report["output_vertices"] = this->output_vertices;
+    report["output_faces"] = this->output_faces;
+    return report;
+}
+
+MeshRepair::MeshRepair(const MeshBuffer& mesh_buffer, const double tolerance, const unsigned int number_of_threads) : m_mesh_buffer(mesh_buffer), m_tolerance(tolerance), m_number_of_threads(number_of_threads)
+{
+    if(!(tolerance >= 0.0)){
+        throw std::invalid_argument("La distance de fusion des sommets doit être positive ou nulle.");
+    }
+    if(mesh_buffer.number_of_vertices() > static_cast<size_t>(std::numeric_limits<int32_t>::max()) || mesh_buffer.number_of_faces() > static_cast<size_t>(std::numeric_limits<int32_t>::max())){
+        throw std::invalid_argument("Le maillage possède trop de sommets ou de faces pour être réparé.");
+    }
+}
+
+void MeshRepair::run(Profiler& profiler)
+{
+    this->m_report.input_vertices = this->m_mesh_buffer.number_of_vertices();
+    this->m_report.input_faces = this->m_mesh_buffer.number_of_faces();
+    {
+        Profiler::Scope scope(profiler, "compute.weld");
+        this->weld_vertices();
+    }
+    {
+        Profiler::Scope scope(profiler, "compute.faces");
+        this->filter_faces();
+    }
+    {
+        Profiler::Scope scope(profiler, "compute.adjacency");
+        this->build_incidences();
+        this->compute_neighbors();
+    }
+    {
+        Profiler::Scope scope(profiler, "compute.orientation");
+        this->orient_faces();
+    }
+    {
+        Profiler::Scope scope(profiler, "compute.split");
+        this->split_non_manifold_vertices();
+    }
+    this->m_report.output_vertices = this->m_vertices.size() / 3;
+    this->m_report.output_faces = this->m_report.input_faces - this->m_report.dropped_faces();
+    profiler.set_counter("faces_in", static_cast<int64_t>(this->m_report.input_faces));
+    profiler.set_counter("faces_out", static_cast<int64_t>(this->m_report.output_faces));
+    profiler.set_counter("welded_vertices", static_cast<int64_t>(this->m_report.welded_vertices));
+    profiler.set_counter("dropped_faces", static_cast<int64_t>(this->m_report.dropped_faces()));
+}
+
+void MeshRepair::weld_vertices()
+{
+    // Hachage spatial : chaque sommet représentant est rangé dans la cellule (de côté 4 * tolérance) qui le contient. Un sommet situé
+    // à une distance inférieure à la tolérance d'un représentant se trouve dans la même cellule ou, s'il est proche du bord de sa cellule,
+    // dans la cellule voisine de ce côté : au plus 8 cellules (3,4 en moyenne) sont donc parcourues par sommet. Avec une tolérance nulle,
+    // seuls les sommets de coordonnées identiques sont fusionnés
+    const size_t number_of_vertices = this->m_mesh_buffer.number_of_vertices();
+    const double tolerance = this->m_tolerance;
+    const double squared_tolerance = tolerance * tolerance;
+    const double inverse_cell_size = tolerance > 0.0 ? 0.25 / tolerance : 0.0;
+
+    // Table de hachage des cellules : clé de la cellule et premier représentant de la cellule (-1 : emplacement libre), stockés côte à côte
+    // afin que chaque emplacement parcouru ne coûte qu'un seul accès mémoire
+    struct Cell{
+        uint64_t key;
+        int32_t head;
+    };
+    const size_t capacity = table_capacity(number_of_vertices);
+    const size_t mask = capacity - 1;
+    std::vector<Cell> cells(capacity, Cell{0, -1});
+    // Représentant suivant de la même cellule
+    std::vector<int32_t> next;
+    next.reserve(number_of_vertices);
+
+    this->m_vertices.clear();
+    this->m_vertices.reserve(number_of_vertices * 3);
+    this->m_vertex_map.assign(number_of_vertices, -1);
+
+    auto find_slot = [&cells, mask](const uint64_t key){
+        size_t slot = key & mask;
+        while(cells[slot].head != -1 && cells[slot].key != key){
+            slot = (slot + 1) & mask;
+        }
+        return slot;
+    };
+    auto cell_key = [](const int64_t x, const int64_t y, const int64_t z){
+        return mix(static_cast<uint64_t>(x) * 0x9e3779b97f4a7c15ULL ^ static_cast<uint64_t>(y) * 0xc2b2ae3d27d4eb4fULL ^ static_cast<uint64_t>(z) * 0x165667b19e3779f9ULL);
+    };
+
+    const std::vector<double>& vertices = this->m_vertices;
+    this->m_mesh_buffer.for_each_vertex([&](size_t index, double x, double y, double z){
+        // Les zéros négatifs sont confondus avec les zéros positifs
+        x += 0.0;
+        y += 0.0;
+        z += 0.0;
+        int32_t representative = -1;
+        uint64_t key;
+        if(tolerance > 0.0){
+            const double position[3] = {x * inverse_cell_size, y * inverse_cell_size, z * inverse_cell_size};
+            int64_t cell[3];
+            // Cellule voisine à parcourir sur chaque axe (0 : le sommet est à plus d'une tolérance des bords de la cellule sur cet axe)
+            int64_t side[3];
+            for(int axis = 0; axis < 3; axis++){
+                const double floor = std::floor(position[axis]);
+                const double fraction = position[axis] - floor;
+                cell[axis] = static_cast<int64_t>(floor);
+                side[axis] = fraction < 0.25 ? -1 : (fraction >= 0.75 ? 1 : 0);
+            }
+            key = cell_key(cell[0], cell[1], cell[2]);
+            for(int neighbor = 0; neighbor < 8 && representative == -1; neighbor++){
+                // Cellules voisines identiques à une cellule déjà parcourue
+                if(((neighbor & 1) && side[0] == 0) || ((neighbor & 2) && side[1] == 0) || ((neighbor & 4) && side[2] == 0)){
+                    continue;
+                }
+                const uint64_t neighbor_key = cell_key(cell[0] + ((neighbor & 1) ? side[0] : 0), cell[1] + ((neighbor & 2) ? side[1] : 0), cell[2] + ((neighbor & 4) ? side[2] : 0));
+                const size_t slot = find_slot(neighbor_key);
+                for(int32_t candidate = cells[slot].head; candidate != -1; candidate = next[candidate]){
+                    const double dx = vertices[3 * candidate] - x, dy = vertices[3 * candidate + 1] - y, dz = vertices[3 * candidate + 2] - z;
+                    if(dx * dx + dy * dy + dz * dz <= squared_tolerance){
+                        representative = candidate;
+                        break;
+                    }
+                }
+            }
+        }
+        else{
+            key = mix(double_bits(x) ^ mix(double_bits(y) ^ mix(double_bits(z))));
+            const size_t slot = find_slot(key);
+            for(int32_t candidate = cells[slot].head; candidate != -1; candidate = next[candidate]){
+                if(vertices[3 * candidate] == x && vertices[3 * candidate + 1] == y && vertices[3 * candidate + 2] == z){
+                    representative = candidate;
+                    break;
+                }
+            }
+        }
+        if(representative == -1){
+            // Le sommet devient le représentant de sa cellule
+            representative = static_cast<int32_t>(next.size());
+            const size_t slot = find_slot(key);
+            next.push_back(cells[slot].head);
+            cells[slot] = Cell{key, representative};
+            this->m_vertices.push_back(x);
+            this->m_vertices.push_back(y);
+            this->m_vertices.push_back(z);
+        }
+        else{
+            this->m_report.welded_vertices++;
+        }
+        this->m_vertex_map[index] = representative;
+    });
+}
+
+void MeshRepair::filter_faces()
+{
+    // Suppression des faces dégénérées (sommets confondus après la fusion ou aire nulle) et des faces en double (mêmes sommets,
+    // quelle que soit leur orientation). Les faces en double sont détectées à l'aide d'une table de hachage des sommets triés de chaque face
+    const size_t number_of_faces = this->m_mesh_buffer.number_of_faces();
+    const size_t number_of_vertices = this->m_mesh_buffer.number_of_vertices();
+    this->m_faces.clear();
+    this->m_faces.reserve(number_of_faces * 3);
+    this->m_face_map.clear();
+    this->m_face_map.reserve(number_of_faces);
+
+    // Table de hachage des faces conservées : indice de la face (-1 : emplacement libre) et bits de poids fort de son hachage (évite
+    // la lecture des sommets de la face lorsque deux faces différentes se trouvent dans le même voisinage de la table)
+    struct Entry{
+        int32_t face;
+        uint32_t tag;
+    };
+    const size_t capacity = table_capacity(number_of_faces);
+    const size_t mask = capacity - 1;
+    std::vector<Entry> table(capacity, Entry{-1, 0});
+
+    auto sorted = [](int32_t a, int32_t b, int32_t c){
+        if(a > b) std::swap(a, b);
+        if(b > c) std::swap(b, c);
+        if(a > b) std::swap(a, b);
+        return std::array<int32_t, 3>{a, b, c};
+    };
+
+    this->m_mesh_buffer.for_each_face([&](size_t index, size_t v0, size_t v1, size_t v2){
+        // Vérification que les indices de la face font bien référence à des sommets existants
+        if(v0 >= number_of_vertices || v1 >= number_of_vertices || v2 >= number_of_vertices){
+            throw std::out_of_range("La face " + std::to_string(index) + " fait référence à un sommet inexistant.");
+        }
+        const int32_t a = this->m_vertex_map[v0], b = this->m_vertex_map[v1], c = this->m_vertex_map[v2];
+        if(a == b || b == c || a == c){
+            this->m_report.degenerate_faces++;
+            return;
+        }
+        const double* pa = &this->m_vertices[3 * a];
+        const double* pb = &this->m_vertices[3 * b];
+        const double* pc = &this->m_vertices[3 * c];
+        const double u[3] = {pb[0] - pa[0], pb[1] - pa[1], pb[2] - pa[2]};
+        const double v[3] = {pc[0] - pa[0], pc[1] - pa[1], pc[2] - pa[2]};
+        if(u[1] * v[2] - u[2] * v[1] == 0.0 && u[2] * v[0] - u[0] * v[2] == 0.0 && u[0] * v[1] - u[1] * v[0] == 0.0){
+            this->m_report.degenerate_faces++;
+            return;
+        }
+        const std::array<int32_t, 3> key = sorted(a, b, c);
+        const uint64_t hash = mix(static_cast<uint64_t>(key[0]) << 32 ^ mix(static_cast<uint64_t>(key[1]) << 32 | static_cast<uint32_t>(key[2])));
+        const uint32_t tag = static_cast<uint32_t>(hash >> 32);
+        size_t slot = hash & mask;
+        for(; table[slot].face != -1; slot = (slot + 1) & mask){
+            if(table[slot].tag != tag){
+                continue;
+            }
+            const int32_t* face = &this->m_faces[3 * static_cast<size_t>(table[slot].face)];
+            if(sorted(face[0], face[1], face[2]) == key){
+                this->m_report.duplicate_faces++;
+                return;
+            }
+        }
+        table[slot] = Entry{static_cast<int32_t>(this->m_face_map.size()), tag};
+        this->m_faces.push_back(a);
+        this->m_faces.push_back(b);
+        this->m_faces.push_back(c);
+        this->m_face_map.push_back(static_cast<int32_t>(index));
+    });
+    this->m_removed.assign(this->m_face_map.size(), 0);
+}
+
+void MeshRepair::build_incidences()
+{
+    // Tri par dénombrement des faces selon leurs sommets
+    const size_t number_of_vertices = this->m_vertices.size() / 3;
+    const size_t number_of_faces = this->m_face_map.size();
+    this->m_incidence_offsets.assign(number_of_vertices + 1, 0);
+    for(const int32_t vertex : this->m_faces){
+        this->m_incidence_offsets[vertex + 1]++;
+    }
+    for(size_t v = 0; v < number_of_vertices; v++){
+        this->m_incidence_offsets[v + 1] += this->m_incidence_offsets[v];
+    }
+    std::vector<size_t> positions(this->m_incidence_offsets.begin(), this->m_incidence_offsets.end() - 1);
+    this->m_incidences.resize(this->m_faces.size());
+    for(size_t f = 0; f < number_of_faces; f++){
+        for(int k = 0; k < 3; k++){
+            this->m_incidences[positions[this->m_faces[3 * f + k]]++] = static_cast<int32_t>(f);
+        }
+    }
+}
+
+int MeshRepair::edge_index(const size_t face, const int32_t u, const int32_t v) const
+{
+    const int32_t* vertices = &this->m_faces[3 * face];
+    for(int k = 0; k < 3; k++){
+        const int32_t a = vertices[k], b = vertices[(k + 1) % 3];
+        if((a == u && b == v) || (a == v && b == u)){
+            return k;
+        }
+    }
+    return -1;
+}
+
+void MeshRepair::compute_neighbors()
+{
+    // Recherche de la face voisine par chaque arête parmi les faces incidentes à l'un de ses sommets. Une arête d'une structure demi-arêtes
+    // ne pouvant être partagée que par deux faces, seules les deux faces de plus petits indices sont conservées sur une arête non manifold
+    // (les voisines sont alors recherchées de nouveau parmi les faces restantes). Chaque thread n'écrit que les données des faces de ses blocs
+    const size_t number_of_faces = this->m_face_map.size();
+    this->m_neighbors.assign(number_of_faces * 3, -1);
+    std::vector<char> non_manifold(number_of_faces, 0);
+    auto find_neighbors = [this, &non_manifold](size_t, size_t first, size_t last){
+        for(size_t f = first; f < last; f++){
+            if(this->m_removed[f]){
+                continue;
+            }
+            for(int k = 0; k < 3; k++){
+                const int32_t u = this->m_faces[3 * f + k], v = this->m_faces[3 * f + (k + 1) % 3];
+                int32_t neighbor = -1;
+                // Nombre de faces partageant l'arête et nombre de faces d'indices inférieurs parmi elles
+                int other_faces = 0, smaller_faces = 0;
+                for(size_t i = this->m_incidence_offsets[u]; i < this->m_incidence_offsets[u + 1]; i++){
+                    const size_t other = static_cast<size_t>(this->m_incidences[i]);
+                    if(other != f && !this->m_removed[other] && this->edge_index(other, u, v) != -1){
+                        neighbor = static_cast<int32_t>(other);
+                        other_faces++;
+                        smaller_faces += other < f;
+                    }
+                }
+                this->m_neighbors[3 * f + k] = other_faces == 1 ? neighbor : -1;
+                if(smaller_faces >= 2){
+                    non_manifold[f] = 1;
+                }
+            }
+        }
+    };
+    parallel::for_each_block(number_of_faces, REPAIR_FACES_PER_BLOCK, this->m_number_of_threads, find_neighbors);
+
+    size_t non_manifold_faces = 0;
+    for(size_t f = 0; f < number_of_faces; f++){
+        if(non_manifold[f]){
+            this->m_removed[f] = 1;
+            non_manifold_faces++;
+        }
+    }
+    if(non_manifold_faces > 0){
+        this->m_report.non_manifold_faces += non_manifold_faces;
+        parallel::for_each_block(number_of_faces, REPAIR_FACES_PER_BLOCK, this->m_number_of_threads, find_neighbors);
+    }
+}
+
+void MeshRepair::orient_faces()
+{
+    // Parcours en largeur de chaque composante connexe : l'orientation d'une face est propagée à ses voisines (une arête partagée doit
+    // être parcourue dans des sens opposés par ses deux faces). Une voisine déjà orientée de façon incompatible (surface non orientable)
+    // est supprimée. L'orientation majoritaire des faces d'origine est conservée dans chaque composante
+    const size_t number_of_faces = this->m_face_map.size();
+    this->m_flipped.assign(number_of_faces, 0);
+    std::vector<char> visited(number_of_faces, 0);
+    std::vector<int32_t> component;
+    component.reserve(number_of_faces);
+
+    for(size_t seed = 0; seed < number_of_faces; seed++){
+        if(visited[seed] || this->m_removed[seed]){
+            continue;
+        }
+        component.clear();
+        component.push_back(static_cast<int32_t>(seed));
+        visited[seed] = 1;
+        for(size_t position = 0; position < component.size(); position++){
+            const size_t f = static_cast<size_t>(component[position]);
+            if(this->m_removed[f]){
+                continue;
+            }
+            for(int k = 0; k < 3; k++){
+                const int32_t neighbor = this->m_neighbors[3 * f + k];
+                if(neighbor == -1 || this->m_removed[neighbor]){
+                    continue;
+                }
+                const int32_t u = this->m_faces[3 * f + k], v = this->m_faces[3 * f + (k + 1) % 3];
+                // Sens de parcours de l'arête {u, v} par la face courante et par sa voisine (true : de u vers v)
+                const bool face_direction = !this->m_flipped[f];
+                const int neighbor_edge = this->edge_index(neighbor, u, v);
+                const bool neighbor_from_u = this->m_faces[3 * static_cast<size_t>(neighbor) + neighbor_edge] == u;
+                if(!visited[neighbor]){
+                    visited[neighbor] = 1;
+                    this->m_flipped[neighbor] = neighbor_from_u == face_direction;
+                    component.push_back(neighbor);
+                }
+                else if((neighbor_from_u != static_cast<bool>(this->m_flipped[neighbor])) == face_direction){
+                    this->m_removed[neighbor] = 1;
+                    this->m_report.non_orientable_faces++;
+                }
+            }
+        }
+        size_t flipped_faces = 0, kept_faces = 0;
+        for(const int32_t f : component){
+            if(!this->m_removed[f]){
+                kept_faces++;
+                flipped_faces += this->m_flipped[f];
+            }
+        }
+        const bool invert = 2 * flipped_faces > kept_faces;
+        for(const int32_t f : component){
+            if(invert){
+                this->m_flipped[f] = !this->m_flipped[f];
+            }
+            if(!this->m_removed[f] && this->m_flipped[f]){
+                this->m_report.flipped_faces++;
+            }
+        }
+    }
+}
+
+void MeshRepair::split_non_manifold_vertices()
+{
+    // Un sommet dont les faces incidentes forment plusieurs éventails (reliés entre eux uniquement par ce sommet) n'est pas représentable
+    // dans une structure demi-arêtes : le sommet est dupliqué pour chaque éventail supplémentaire
+    const size_t number_of_vertices = this->m_vertices.size() / 3;
+    std::vector<int32_t> faces;
+    std::vector<int32_t> parents;
+    auto find = [&parents](int32_t i){
+        while(parents[i] != i){
+            i = parents[i] = parents[parents[i]];
+        }
+        return i;
+    };
+
+    for(size_t vertex = 0; vertex < number_of_vertices; vertex++){
+        faces.clear();
+        for(size_t i = this->m_incidence_offsets[vertex]; i < this->m_incidence_offsets[vertex + 1]; i++){
+            if(!this->m_removed[this->m_incidences[i]]){
+                faces.push_back(this->m_incidences[i]);
+            }
+        }
+        if(faces.size() < 2){
+            continue;
+        }
+        parents.resize(faces.size());
+        for(size_t i = 0; i < faces.size(); i++){
+            parents[i] = static_cast<int32_t>(i);
+        }
+        // Regroupement des faces reliées par une arête incidente au sommet
+        for(size_t i = 0; i < faces.size(); i++){
+            const size_t f = static_cast<size_t>(faces[i]);
+            const int corner = this->m_faces[3 * f] == static_cast<int32_t>(vertex) ? 0 : (this->m_faces[3 * f + 1] == static_cast<int32_t>(vertex) ? 1 : 2);
+            for(const int edge : {corner, (corner + 2) % 3}){
+                const int32_t neighbor = this->m_neighbors[3 * f + edge];
+                if(neighbor == -1 || this->m_removed[neighbor]){
+                    continue;
+                }
+                const auto position = std::find(faces.begin(), faces.end(), neighbor);
+                if(position != faces.end()){
+                    parents[find(static_cast<int32_t>(i))] = find(static_cast<int32_t>(position - faces.begin()));
+                }
+            }
+        }
+        // Les faces de l'éventail de la première face conservent le sommet, un nouveau sommet est créé pour chacun des autres éventails
+        const int32_t first_fan = find(0);
+        std::vector<std::pair<int32_t, int32_t>> fans;
+        for(size_t i = 1; i < faces.size(); i++){
+            const int32_t fan = find(static_cast<int32_t>(i));
+            if(fan == first_fan){
+                continue;
+            }
+            auto it = std::find_if(fans.begin(), fans.end(), [fan](const std::pair<int32_t, int32_t>& entry){ return entry.first == fan; });
+            if(it == fans.end()){
+                const int32_t new_vertex = static_cast<int32_t>(this->m_vertices.size() / 3);
+                for(int c = 0; c < 3; c++){
+                    this->m_vertices.push_back(this->m_vertices[3 * vertex + c]);
+                }
+                fans.emplace_back(fan, new_vertex);
+                it = fans.end() - 1;
+                this->m_report.split_vertices++;
+            }
+            int32_t* face = &this->m_faces[3 * static_cast<size_t>(faces[i])];
+            for(int c = 0; c < 3; c++){
+                if(face[c] == static_cast<int32_t>(vertex)){
+                    face[c] = it->second;
+                }
+            }
+        }
+    }
+}
+
+const MeshRepair::Report& MeshRepair::report() const
+{
+    return this->m_report;
+}
+
+py::dict MeshRepair::export_results()
+{
+    // Construction des faces conservées (en appliquant leur éventuel retournement)
+    std::vector<int32_t> faces;
+    faces.reserve(this->m_report.output_faces * 3);
+    std::vector<int32_t> face_map;
+    face_map.reserve(this->m_report.output_faces);
+    for(size_t f = 0; f < this->m_face_map.size(); f++){
+        if(this->m_removed[f]){
+            continue;
+        }
+        const int32_t* face = &this->m_faces[3 * f];
+        faces.push_back(face[0]);
+        faces.push_back(this->m_flipped[f] ? face[2] : face[1]);
+        faces.push_back(this->m_flipped[f] ? face[1] : face[2]);
+        face_map.push_back(this->m_face_map[f]);
+    }
+
+    py::dict results;
+    results["vertices"] = MeshBuffer::to_numpy(std::move(this->m_vertices));
+    results["faces"] = MeshBuffer::to_numpy(std::move(faces));
+    results["vertex_map"] = MeshBuffer::to_numpy(std::move(this->m_vertex_map));
+    results["face_map"] = MeshBuffer::to_numpy(std::move(face_map));
+    results["report"] = this->m_report.to_dict();
+    return results;
+}
+
+py::dict MeshRepair::repair(const py::dict& data, const double tolerance, const int threads)
+{
+    Profiler profiler;
+    const int64_t start = Profiler::now();
+    const MeshBuffer mesh_buffer(data);
+    profiler.add_phase("ingest", Profiler::now() - start);
+    profiler.add_phase("compute", 0);
+    MeshRepair mesh_repair(mesh_buffer, tolerance, parallel::resolve_number_of_threads(threads));
+    {
+        // La réparation ne manipule aucun objet Python : le GIL est relâché pendant sa durée
+        py::gil_scoped_release release;
+        Profiler::Scope scope(profiler, "compute");
+        mesh_repair.run(profiler);
+    }
+    const int64_t export_start = Profiler::now();
+    py::dict results = mesh_repair.export_results();
+    profiler.add_phase("export", Profiler::now() - export_start);
+    results["profile"] = profiler.to_dict();
+    return results;
+}
@@ -0,0 +1,82 @@
+#ifndef MESHREPAIR_HPP
+#define MESHREPAIR_HPP
+
+#include "MeshBuffer.hpp"
+#include "Profiler.hpp"
+
+#include <pybind11/pybind11.h>
+#include <cstdint>
+#include <vector>
+
+// Réparation native d'une soupe de triangles (tableaux envoyés par Blender ou projetés depuis un fichier) avant la construction
+// d'un maillage CGAL : fusion des sommets proches (hachage spatial), suppression des faces dégénérées et des faces en double,
+// suppression des faces en excès sur les arêtes non manifold, orientation cohérente des faces et duplication des sommets non manifold.
+// Les faces résultantes peuvent ainsi toutes être ajoutées à une structure demi-arêtes (Surface_mesh::add_face ne les rejette pas)
+class MeshRepair{
+public:
+    // Bilan de la réparation (nombre de sommets fusionnés, de faces supprimées par motif, de faces retournées, ...)
+    struct Report{
+        size_t input_vertices = 0;
+        size_t input_faces = 0;
+        size_t welded_vertices = 0;
+        size_t degenerate_faces = 0;
+        size_t duplicate_faces = 0;
+        size_t non_manifold_faces = 0;
+        size_t non_orientable_faces = 0;
+        size_t flipped_faces = 0;
+        size_t split_vertices = 0;
+        size_t output_vertices = 0;
+        size_t output_faces = 0;
+
+        size_t dropped_faces() const;
+        pybind11::dict to_dict() const;
+    };
+
+    // Distance de fusion des sommets (identique à celle utilisée auparavant avec bmesh.ops.remove_doubles)
+    static constexpr double DEFAULT_TOLERANCE = 1e-4;
+
+    MeshRepair(const MeshBuffer& mesh_buffer, const double tolerance, const unsigned int number_of_threads);
+
+    // Réparation du maillage (n'accède à aucun objet Python : peut être exécutée sans le GIL)
+    void run(Profiler& profiler);
+
+    const Report& report() const;
+    // Exportation du maillage réparé : {"vertices" (float64), "faces" (int32), "vertex_map" (indice du sommet résultant de chaque sommet
+    // d'entrée), "face_map" (indice de la face d'entrée de chaque face résultante), "report"}. Les conteneurs natifs sont déplacés
+    pybind11::dict export_results();
+
+    // Réparation des tableaux "vertices" et "faces" (ou du fichier projeté "file") des données
+    static pybind11::dict repair(const pybind11::dict& data, const double tolerance, const int threads);
+
+private:
+    void weld_vertices();
+    void filter_faces();
+    void build_incidences();
+    void compute_neighbors();
+    void orient_faces();
+    void split_non_manifold_vertices();
+
+    // Indice de l'arête {u, v} dans la face (-1 si la face ne la contient pas)
+    int edge_index(const size_t face, const int32_t u, const int32_t v) const;
+
+    const MeshBuffer& m_mesh_buffer;
+    double m_tolerance;
+    unsigned int m_number_of_threads;
+    Report m_report;
+
+    // Coordonnées des sommets conservés (sommets représentants de la fusion puis sommets dupliqués)
+    std::vector<double> m_vertices;
+    std::vector<int32_t> m_vertex_map;
+    // Faces conservées (indices des sommets conservés), indice de la face d'entrée correspondante et faces supprimées
+    std::vector<int32_t> m_faces;
+    std::vector<int32_t> m_face_map;
+    std::vector<char> m_removed;
+    // Faces incidentes à chaque sommet (stockage compressé : faces de offsets[v] à offsets[v + 1])
+    std::vector<size_t> m_incidence_offsets;
+    std::vector<int32_t> m_incidences;
+    // Face voisine par chaque arête de chaque face (-1 : arête de bord ou voisine supprimée)
+    std::vector<int32_t> m_neighbors;
+    std::vector<char> m_flipped;
+};
+
+#endif
@@ -0,0 +1,170 @@
+#include "MeshSession.hpp"
+#include "SpatialIndex.hpp"
+#include <stdexcept>
+
+namespace py = pybind11;
+using namespace mesh_session;
+
+MeshSession::MeshSession(const std::string& object_name) : m_object_name(object_name), m_surface_mesh(), m_fingerprint(0), m_number_of_input_faces(0), m_number_of_rejected_faces(0), m_number_of_builds(0), m_is_valid(false),
+                                                          m_spatial_index(), m_sdf_values(), m_sdf_values_key(0)
+{}
+
+MeshSession::MeshSession(const std::string& object_name, const py::dict& data, Profiler* profiler) : MeshSession(object_name)
+{
+    this->update(data, profiler);
+}
+
+bool MeshSession::matches(const py::dict& data) const
+{
+    return this->m_is_valid && MeshBuffer(data).fingerprint() == this->m_fingerprint;
+}
+
+bool MeshSession::update(const py::dict& data, Profiler* profiler)
+{
+    // Lecture sans copie des tableaux du maillage et calcul de l'empreinte de la géométrie
+    const MeshBuffer mesh_buffer(data);
+    const uint64_t fingerprint = mesh_buffer.fingerprint();
+    // Si la géométrie n'a pas changé, le maillage de la session est conservé
+    if(this->m_is_valid && fingerprint == this->m_fingerprint){
+        return false;
+    }
+    const int64_t start = Profiler::now();
+    this->build(mesh_buffer);
+    this->m_fingerprint = fingerprint;
+    if(profiler != nullptr){
+        profiler->add_phase("build", Profiler::now() - start);
+        profiler->add_counter("mesh_builds", 1);
+        profiler->set_counter("rejected_faces", static_cast<int64_t>(this->m_number_of_rejected_faces));
+    }
+    return true;
+}
+
+void MeshSession::build(const MeshBuffer& mesh_buffer)
+{
+    // La construction de la structure demi-arêtes ne manipule aucun objet Python : le GIL est relâché pendant sa durée.
+    // Il est relâché avant le verrouillage du mutex afin de ne pas bloquer un algorithme en cours d'exécution sur la session
+    py::gil_scoped_release release;
+    std::lock_guard<std::mutex> lock(this->m_mutex);
+    this->m_is_valid = false;
+    this->release_derived_structures();
+    this->m_surface_mesh.clear();
+    // Stockage du nombre de faces du maillage envoyé par Blender
+    this->m_number_of_input_faces = mesh_buffer.number_of_faces();
+    // Construction du maillage à partir des données du tampon
+    this->m_number_of_rejected_faces = mesh_buffer.fill_surface_mesh(this->m_surface_mesh);
+    this->m_number_of_builds++;
+    this->m_is_valid = true;
+}
+
+void MeshSession::invalidate()
+{
+    py::gil_scoped_release release;
+    std::lock_guard<std::mutex> lock(this->m_mutex);
+    this->m_is_valid = false;
+    // Libération de la mémoire occupée par le maillage et par les structures qui en sont dérivées
+    this->release_derived_structures();
+    this->m_surface_mesh = Surface_mesh();
+}
+
+void MeshSession::release_derived_structures()
+{
+    this->m_spatial_index.reset();
+    this->m_sdf_values.reset();
+    this->m_sdf_values_key = 0;
+}
+
+std::shared_ptr<const SpatialIndex> MeshSession::spatial_index(bool* cache_hit)
+{
+    if(this->m_spatial_index != nullptr){
+        if(cache_hit != nullptr){
+            *cache_hit = true;
+        }
+        return this->m_spatial_index;
+    }
+    // Clé de l'index dans le cache des index spatiaux : l'empreinte des tableaux envoyés si toutes leurs faces ont été ajoutées au maillage
+    // (les indices des faces sont alors identiques et l'index est partagé avec celui construit à partir des tableaux), une empreinte propre
+    // au maillage de la session sinon
+    uint64_t key = this->m_fingerprint;
+    if(this->m_number_of_rejected_faces != 0){
+        const uint64_t rejected_faces = static_cast<uint64_t>(this->m_number_of_rejected_faces);
+        key = MeshBuffer::hash_bytes(&rejected_faces, sizeof(rejected_faces), this->m_fingerprint);
+    }
+    this->m_spatial_index = SpatialIndex::get(this->m_surface_mesh, key, cache_hit);
+    return this->m_spatial_index;
+}
+
+std::shared_ptr<const std::vector<double>> MeshSession::sdf_values(const uint64_t key) const
+{
+    if(this->m_sdf_values != nullptr && this->m_sdf_values_key == key){
+        return this->m_sdf_values;
+    }
+    return nullptr;
+}
+
+void MeshSession::set_sdf_values(const uint64_t key, const std::shared_ptr<const std::vector<double>>& sdf_values)
+{
+    this->m_sdf_values = sdf_values;
+    this->m_sdf_values_key = key;
+}
+
+bool MeshSession::is_valid() const
+{
+    return this->m_is_valid;
+}
+
+const std::string& MeshSession::object_name() const
+{
+    return this->m_object_name;
+}
+
+uint64_t MeshSession::fingerprint() const
+{
+    return this->m_fingerprint;
+}
+
+size_t MeshSession::number_of_input_faces() const
+{
+    return this->m_number_of_input_faces;
+}
+
+size_t MeshSession::number_of_rejected_faces() const
+{
+    return this->m_number_of_rejected_faces;
+}
+
+size_t MeshSession::number_of_builds() const
+{
+    return this->m_number_of_builds;
+}
+
+Surface_mesh& MeshSession::mesh()
+{
+    return this->m_surface_mesh;
+}
+
+const Surface_mesh& MeshSession::mesh() const
+{
+    return this->m_surface_mesh;
+}
+
+std::mutex& MeshSession::mutex()
+{
+    return this->m_mutex;
+}
+
+std::shared_ptr<MeshSession> MeshSession::from_data(const py::dict& data, Profiler* profiler)
+{
+    if(data.contains("session") && !data["session"].is_none()){
+        std::shared_ptr<MeshSession> session = data["session"].cast<std::shared_ptr<MeshSession>>();
+        // Si les tableaux du maillage sont également fournis, la session est reconstruite dans le cas où la géométrie a changé
+        if((data.contains("vertices") && data.contains("faces")) || data.contains("file")){
+            session->update(data, profiler);
+        }
+        else if(!session->is_valid()){
+            throw std::runtime_error("La session du maillage '" + session->object_name() + "' a été invalidée et aucune donnée ne permet de la reconstruire.");
+        }
+        return session;
+    }
+    // Aucune session fournie : création d'une session temporaire propre à l'algorithme
+    return std::make_shared<MeshSession>("", data, profiler);
+}
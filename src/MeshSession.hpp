@@ -0,0 +1,82 @@
+#ifndef MESHSESSION_HPP
+#define MESHSESSION_HPP
+
+#include "MeshBuffer.hpp"
+#include "Profiler.hpp"
+
+#include <CGAL/Exact_predicates_inexact_constructions_kernel.h>
+#include <CGAL/Surface_mesh.h>
+#include <memory>
+#include <mutex>
+#include <string>
+#include <vector>
+#include <cstdint>
+
+namespace mesh_session{
+    typedef CGAL::Exact_predicates_inexact_constructions_kernel      Kernel;
+    typedef Kernel::Point_3                                          Point_3;
+    typedef CGAL::Surface_mesh<Point_3>                              Surface_mesh;
+}
+
+class SpatialIndex;
+
+// Session native associée à un objet Blender : conserve en mémoire le maillage CGAL (structure demi-arêtes) construit à partir
+// des données envoyées par Blender afin que plusieurs algorithmes puissent être exécutés successivement sur le même maillage
+// sans le reconstruire. La session est identifiée par le nom de l'objet Blender et l'empreinte de sa géométrie : elle est
+// automatiquement reconstruite lorsque la géométrie reçue ne correspond plus à celle du maillage conservé.
+// La session possède également les structures dérivées de son maillage (index spatial des faces, valeurs SDF de la segmentation) : elles sont
+// construites à la demande par les algorithmes, conservées tant que la géométrie ne change pas et libérées avec le maillage (reconstruction ou invalidation)
+class MeshSession{
+public:
+    explicit MeshSession(const std::string& object_name);
+    MeshSession(const std::string& object_name, const pybind11::dict& data, Profiler* profiler = nullptr);
+
+    // Vérifie si la géométrie contenue dans les données correspond à celle du maillage de la session
+    bool matches(const pybind11::dict& data) const;
+    // Met à jour la session à partir des données (reconstruction uniquement si la géométrie a changé). Retourne true si le maillage a été reconstruit.
+    // La durée de la construction est ajoutée à la phase "build" du profileur éventuellement fourni
+    bool update(const pybind11::dict& data, Profiler* profiler = nullptr);
+    // Libère le maillage de la session et ses structures dérivées
+    void invalidate();
+
+    bool is_valid() const;
+    const std::string& object_name() const;
+    uint64_t fingerprint() const;
+    size_t number_of_input_faces() const;
+    // Nombre de faces envoyées par Blender rejetées lors de la dernière construction du maillage
+    size_t number_of_rejected_faces() const;
+    size_t number_of_builds() const;
+    mesh_session::Surface_mesh& mesh();
+    const mesh_session::Surface_mesh& mesh() const;
+    // Mutex à verrouiller par les algorithmes pendant leur exécution sur le maillage de la session
+    std::mutex& mutex();
+
+    // Structures dérivées du maillage (le mutex de la session doit être verrouillé par l'appelant).
+    // Index spatial des faces du maillage : récupéré depuis le cache des index spatiaux (ou construit) lors du premier appel puis conservé par la session
+    std::shared_ptr<const SpatialIndex> spatial_index(bool* cache_hit = nullptr);
+    // Valeurs SDF des faces du maillage calculées avec les paramètres identifiés par la clé (nullptr si elles n'ont pas été calculées)
+    std::shared_ptr<const std::vector<double>> sdf_values(const uint64_t key) const;
+    void set_sdf_values(const uint64_t key, const std::shared_ptr<const std::vector<double>>& sdf_values);
+
+    // Récupération de la session contenue dans les données d'un algorithme (champ "session"),
+    // ou création d'une session temporaire à partir des tableaux du maillage (ou du fichier projeté en mémoire, champ "file") si aucune session n'est fournie
+    static std::shared_ptr<MeshSession> from_data(const pybind11::dict& data, Profiler* profiler = nullptr);
+
+private:
+    void build(const MeshBuffer& mesh_buffer);
+    void release_derived_structures();
+
+    std::string m_object_name;
+    mesh_session::Surface_mesh m_surface_mesh;
+    uint64_t m_fingerprint;
+    size_t m_number_of_input_faces;
+    size_t m_number_of_rejected_faces;
+    size_t m_number_of_builds;
+    bool m_is_valid;
+    std::shared_ptr<const SpatialIndex> m_spatial_index;
+    std::shared_ptr<const std::vector<double>> m_sdf_values;
+    uint64_t m_sdf_values_key;
+    std::mutex m_mutex;
+};
+
+#endif
@@ -0,0 +1,259 @@
+#include "MeshStatistics.hpp"
+#include "Parallel.hpp"
+#include <pybind11/numpy.h>
+#include <boost/format.hpp>
+#include <algorithm>
+#include <atomic>
+#include <cmath>
+#include <limits>
+#include <stdexcept>
+#include <string>
+
+namespace py = pybind11;
+using namespace mesh_statistics;
+
+// Nombre de faces (ou de sommets) d'un bloc traité par un thread. Le découpage en blocs étant indépendant du nombre de threads,
+// les sommes partielles sont fusionnées dans le même ordre et les résultats ne dépendent pas du nombre de threads
+static const size_t STATISTICS_ITEMS_PER_BLOCK = 1 << 16;
+
+void Face_statistics::merge(const Face_statistics& other)
+{
+    if(other.number_of_edges > 0){
+        this->min_edge_length = this->number_of_edges > 0 ? std::min(this->min_edge_length, other.min_edge_length) : other.min_edge_length;
+        this->max_edge_length = std::max(this->max_edge_length, other.max_edge_length);
+    }
+    this->area += other.area;
+    this->volume += other.volume;
+    for(int i = 0; i < 3; i++){
+        this->weighted_centroid[i] += other.weighted_centroid[i];
+    }
+    this->sum_edge_lengths += other.sum_edge_lengths;
+    this->number_of_edges += other.number_of_edges;
+    this->number_of_degenerate_faces += other.number_of_degenerate_faces;
+    for(const auto& bin : other.area_histogram){
+        this->area_histogram[bin.first] += bin.second;
+    }
+}
+
+void Vertex_statistics::merge(const Vertex_statistics& other)
+{
+    if(other.number_of_vertices == 0){
+        return;
+    }
+    for(int i = 0; i < 3; i++){
+        this->min[i] = this->number_of_vertices > 0 ? std::min(this->min[i], other.min[i]) : other.min[i];
+        this->max[i] = this->number_of_vertices > 0 ? std::max(this->max[i], other.max[i]) : other.max[i];
+        this->sum[i] += other.sum[i];
+    }
+    this->number_of_vertices += other.number_of_vertices;
+}
+
+MeshStatistics::MeshStatistics(const py::dict& data) : m_mesh_buffer(data), m_threads(1)
+{
+    // Récupération éventuelle du nombre de threads (0 : nombre de threads matériels de la machine)
+    int threads = parallel::DEFAULT_NUMBER_OF_THREADS;
+    if(data.contains("params")){
+        py::list params = data["params"].cast<py::list>();
+        if(!params.empty()){
+            py::dict algorithm_parameters = params[0].cast<py::dict>();
+            if(algorithm_parameters.contains("threads")){
+                threads = py::int_(algorithm_parameters["threads"]);
+            }
+        }
+    }
+    this->m_threads = parallel::resolve_number_of_threads(threads);
+    this->m_profiler.set_counter("faces_in", static_cast<int64_t>(this->m_mesh_buffer.number_of_faces()));
+    this->m_profiler.set_counter("vertices_in", static_cast<int64_t>(this->m_mesh_buffer.number_of_vertices()));
+    this->m_profiler.set_counter("threads", static_cast<int64_t>(this->m_threads));
+}
+
+void MeshStatistics::compute_algorithm()
+{
+    // Statistiques des faces : une structure de résultats partiels par bloc de faces
+    const size_t number_of_faces = this->m_mesh_buffer.number_of_faces();
+    std::vector<Face_statistics> face_blocks((number_of_faces + STATISTICS_ITEMS_PER_BLOCK - 1) / STATISTICS_ITEMS_PER_BLOCK);
+    {
+        Profiler::Scope faces_scope(this->m_profiler, "compute.faces");
+        this->m_progress.set_stage("faces");
+        std::atomic<size_t> processed_faces(0);
+        parallel::for_each_block(number_of_faces, STATISTICS_ITEMS_PER_BLOCK, this->m_threads, [this, &face_blocks, &processed_faces, number_of_faces](size_t block, size_t first, size_t last){
+            // Arrêt du calcul si l'annulation a été demandée ou si le temps imparti est dépassé
+            this->m_progress.check();
+            face_blocks[block] = this->compute_face_statistics(first, last);
+            // Le parcours des faces représente l'essentiel du calcul
+            this->m_progress.set_fraction(0.9 * (processed_faces += last - first) / number_of_faces);
+        });
+        this->m_face_statistics = Face_statistics();
+        for(const auto& face_block : face_blocks){
+            this->m_face_statistics.merge(face_block);
+        }
+    }
+    this->m_profiler.set_counter("degenerate_faces", static_cast<int64_t>(this->m_face_statistics.number_of_degenerate_faces));
+
+    // et de même pour les sommets (boîte englobante et centre des sommets)
+    const size_t number_of_vertices = this->m_mesh_buffer.number_of_vertices();
+    std::vector<Vertex_statistics> vertex_blocks((number_of_vertices + STATISTICS_ITEMS_PER_BLOCK - 1) / STATISTICS_ITEMS_PER_BLOCK);
+    Profiler::Scope vertices_scope(this->m_profiler, "compute.vertices");
+    this->m_progress.set_stage("vertices");
+    parallel::for_each_block(number_of_vertices, STATISTICS_ITEMS_PER_BLOCK, this->m_threads, [this, &vertex_blocks](size_t block, size_t first, size_t last){
+        this->m_progress.check();
+        vertex_blocks[block] = this->compute_vertex_statistics(first, last);
+    });
+    this->m_vertex_statistics = Vertex_statistics();
+    for(const auto& vertex_block : vertex_blocks){
+        this->m_vertex_statistics.merge(vertex_block);
+    }
+}
+
+Face_statistics MeshStatistics::compute_face_statistics(const size_t first, const size_t last) const
+{
+    Face_statistics statistics;
+    statistics.min_edge_length = std::numeric_limits<double>::max();
+    const size_t number_of_vertices = this->m_mesh_buffer.number_of_vertices();
+
+    this->m_mesh_buffer.for_each_face(first, last, [&](size_t index, size_t v0, size_t v1, size_t v2){
+        // Vérification que les indices de la face font bien référence à des sommets existants
+        if(v0 >= number_of_vertices || v1 >= number_of_vertices || v2 >= number_of_vertices){
+            throw std::out_of_range("La face " + std::to_string(index) + " fait référence à un sommet inexistant.");
+        }
+        const std::array<double, 3> p0 = this->m_mesh_buffer.vertex(v0);
+        const std::array<double, 3> p1 = this->m_mesh_buffer.vertex(v1);
+        const std::array<double, 3> p2 = this->m_mesh_buffer.vertex(v2);
+
+        // Vecteurs des arêtes de la face
+        const double e0[3] = {p1[0] - p0[0], p1[1] - p0[1], p1[2] - p0[2]};
+        const double e1[3] = {p2[0] - p1[0], p2[1] - p1[1], p2[2] - p1[2]};
+        const double e2[3] = {p0[0] - p2[0], p0[1] - p2[1], p0[2] - p2[2]};
+        const double squared_lengths[3] = {e0[0]*e0[0] + e0[1]*e0[1] + e0[2]*e0[2],
+                                           e1[0]*e1[0] + e1[1]*e1[1] + e1[2]*e1[2],
+                                           e2[0]*e2[0] + e2[1]*e2[1] + e2[2]*e2[2]};
+        // Longueurs des arêtes (les arêtes partagées par deux faces sont comptées deux fois)
+        for(const double squared_length : squared_lengths){
+            const double length = std::sqrt(squared_length);
+            statistics.min_edge_length = std::min(statistics.min_edge_length, length);
+            statistics.max_edge_length = std::max(statistics.max_edge_length, length);
+            statistics.sum_edge_lengths += length;
+        }
+        statistics.number_of_edges += 3;
+
+        // Aire de la face : la moitié de la norme du produit vectoriel de deux de ses arêtes
+        const double normal[3] = {e0[1]*e2[2] - e0[2]*e2[1], e0[2]*e2[0] - e0[0]*e2[2], e0[0]*e2[1] - e0[1]*e2[0]};
+        const double area = std::sqrt(normal[0]*normal[0] + normal[1]*normal[1] + normal[2]*normal[2]) / 2.0;
+        statistics.area += area;
+
+        // Volume signé du tétraèdre formé par l'origine et la face (la somme n'a de sens que pour un maillage fermé)
+        statistics.volume += (p0[0] * (p1[1]*p2[2] - p1[2]*p2[1]) - p0[1] * (p1[0]*p2[2] - p1[2]*p2[0]) + p0[2] * (p1[0]*p2[1] - p1[1]*p2[0])) / 6.0;
+
+        // Centre de la face pondéré par son aire
+        for(int i = 0; i < 3; i++){
+            statistics.weighted_centroid[i] += area * (p0[i] + p1[i] + p2[i]) / 3.0;
+        }
+
+        // Une face est considérée comme dégénérée si son aire est négligeable devant le carré de sa plus grande arête
+        // (sommets confondus ou alignés), le critère étant indépendant de l'échelle du maillage
+        const double max_squared_length = std::max({squared_lengths[0], squared_lengths[1], squared_lengths[2]});
+        if(v0 == v1 || v1 == v2 || v2 == v0 || 2.0 * area <= std::numeric_limits<double>::epsilon() * max_squared_length){
+            statistics.number_of_degenerate_faces++;
+        }
+        else{
+            // Classe de l'histogramme : exposant e tel que l'aire appartient à [2^(e-1), 2^e[ (bornes indépendantes du maillage, ce qui permet
+            // de construire l'histogramme en une seule passe)
+            int exponent = 0;
+            std::frexp(area, &exponent);
+            statistics.area_histogram[exponent]++;
+        }
+    });
+
+    if(statistics.number_of_edges == 0){
+        statistics.min_edge_length = 0.0;
+    }
+    return statistics;
+}
+
+Vertex_statistics MeshStatistics::compute_vertex_statistics(const size_t first, const size_t last) const
+{
+    Vertex_statistics statistics;
+    statistics.min = {std::numeric_limits<double>::max(), std::numeric_limits<double>::max(), std::numeric_limits<double>::max()};
+    statistics.max = {std::numeric_limits<double>::lowest(), std::numeric_limits<double>::lowest(), std::numeric_limits<double>::lowest()};
+    this->m_mesh_buffer.for_each_vertex(first, last, [&statistics](size_t, double x, double y, double z){
+        const double coordinates[3] = {x, y, z};
+        for(int i = 0; i < 3; i++){
+            statistics.min[i] = std::min(statistics.min[i], coordinates[i]);
+            statistics.max[i] = std::max(statistics.max[i], coordinates[i]);
+            statistics.sum[i] += coordinates[i];
+        }
+    });
+    statistics.number_of_vertices = last - first;
+    return statistics;
+}
+
+void MeshStatistics::export_results()
+{
+    const Face_statistics& faces = this->m_face_statistics;
+    const Vertex_statistics& vertices = this->m_vertex_statistics;
+
+    // Centre de gravité de la surface (ou centre des sommets si l'aire du maillage est nulle)
+    std::array<double, 3> centroid = {0.0, 0.0, 0.0};
+    for(int i = 0; i < 3; i++){
+        if(faces.area > 0.0){
+            centroid[i] = faces.weighted_centroid[i] / faces.area;
+        }
+        else if(vertices.number_of_vertices > 0){
+            centroid[i] = vertices.sum[i] / static_cast<double>(vertices.number_of_vertices);
+        }
+    }
+    const double mean_edge_length = faces.number_of_edges > 0 ? faces.sum_edge_lengths / static_cast<double>(faces.number_of_edges) : 0.0;
+    std::array<double, 3> size = {0.0, 0.0, 0.0};
+    for(int i = 0; i < 3; i++){
+        size[i] = vertices.max[i] - vertices.min[i];
+    }
+
+    // Structure de données contenant l'ensemble des statistiques
+    py::dict statistics;
+    statistics["number_of_vertices"] = this->m_mesh_buffer.number_of_vertices();
+    statistics["number_of_faces"] = this->m_mesh_buffer.number_of_faces();
+    statistics["area"] = faces.area;
+    statistics["volume"] = faces.volume;
+    py::dict bounding_box;
+    bounding_box["min"] = vertices.min;
+    bounding_box["max"] = vertices.max;
+    bounding_box["size"] = size;
+    statistics["bounding_box"] = bounding_box;
+    statistics["centroid"] = centroid;
+    py::dict edge_length;
+    edge_length["min"] = faces.min_edge_length;
+    edge_length["mean"] = mean_edge_length;
+    edge_length["max"] = faces.max_edge_length;
+    statistics["edge_length"] = edge_length;
+    statistics["degenerate_faces"] = faces.number_of_degenerate_faces;
+    // Histogramme des aires des faces (classes contiguës entre la plus petite et la plus grande aire)
+    py::list area_histogram;
+    if(!faces.area_histogram.empty()){
+        for(int exponent = faces.area_histogram.begin()->first; exponent <= faces.area_histogram.rbegin()->first; exponent++){
+            const auto bin = faces.area_histogram.find(exponent);
+            py::dict histogram_bin;
+            histogram_bin["min"] = std::ldexp(1.0, exponent - 1);
+            histogram_bin["max"] = std::ldexp(1.0, exponent);
+            histogram_bin["count"] = bin != faces.area_histogram.end() ? bin->second : 0;
+            area_histogram.append(histogram_bin);
+        }
+    }
+    statistics["area_histogram"] = area_histogram;
+    this->m_output_data["statistics"] = statistics;
+
+    // Création du message de résultat
+    boost::format message = boost::format("Aire du maillage : %1% m².\n"
+                                          "Volume (signé) : %2% m³.\n"
+                                          "Boîte englobante : %3% x %4% x %5% m.\n"
+                                          "Centre de gravité : (%6%, %7%, %8%).\n"
+                                          "Longueur des arêtes : min %9%, moyenne %10%, max %11%.\n"
+                                          "Faces dégénérées : %12% / %13%.")
+                            % faces.area
+                            % faces.volume
+                            % size[0] % size[1] % size[2]
+                            % centroid[0] % centroid[1] % centroid[2]
+                            % faces.min_edge_length % mean_edge_length % faces.max_edge_length
+                            % faces.number_of_degenerate_faces % this->m_mesh_buffer.number_of_faces();
+    this->m_output_data["result_infos"] = message.str();
+    this->m_output_data["output_result"] = std::array<std::string,1>{"message"};
+}
@@ -0,0 +1,59 @@
+#ifndef MESHSTATISTICS_HPP
+#define MESHSTATISTICS_HPP
+
+#include "Algorithm.hpp"
+#include "MeshBuffer.hpp"
+#include <array>
+#include <map>
+#include <vector>
+
+namespace mesh_statistics{
+    // Statistiques partielles calculées sur un bloc de faces (fusionnées ensuite dans l'ordre des blocs)
+    struct Face_statistics{
+        double area = 0.0;
+        double volume = 0.0;
+        // Somme des centres des faces pondérés par leur aire
+        std::array<double, 3> weighted_centroid = {0.0, 0.0, 0.0};
+        double min_edge_length = 0.0;
+        double max_edge_length = 0.0;
+        double sum_edge_lengths = 0.0;
+        size_t number_of_edges = 0;
+        size_t number_of_degenerate_faces = 0;
+        // Histogramme des aires des faces : nombre de faces dont l'aire appartient à l'intervalle [2^(e-1), 2^e[ pour chaque exposant e
+        std::map<int, size_t> area_histogram;
+
+        void merge(const Face_statistics& other);
+    };
+
+    // Statistiques partielles calculées sur un bloc de sommets
+    struct Vertex_statistics{
+        std::array<double, 3> min = {0.0, 0.0, 0.0};
+        std::array<double, 3> max = {0.0, 0.0, 0.0};
+        std::array<double, 3> sum = {0.0, 0.0, 0.0};
+        size_t number_of_vertices = 0;
+
+        void merge(const Vertex_statistics& other);
+    };
+}
+
+// Calcul en une seule passe des statistiques d'un maillage triangulaire (aire, volume signé, boîte englobante, centre de gravité,
+// longueurs des arêtes, histogramme des aires des faces et nombre de faces dégénérées). Les tableaux envoyés par Blender sont lus
+// directement (aucune copie des triangles ni construction d'un maillage CGAL) et le parcours est réparti entre plusieurs threads
+class MeshStatistics : public Algorithm{
+public:
+    explicit MeshStatistics(const pybind11::dict& data);
+    void compute_algorithm() override;
+    void export_results() override;
+
+private:
+    mesh_statistics::Face_statistics compute_face_statistics(const size_t first, const size_t last) const;
+    mesh_statistics::Vertex_statistics compute_vertex_statistics(const size_t first, const size_t last) const;
+
+    // Accès sans copie aux coordonnées des sommets et aux indices des sommets des faces
+    MeshBuffer m_mesh_buffer;
+    unsigned int m_threads;
+    mesh_statistics::Face_statistics m_face_statistics;
+    mesh_statistics::Vertex_statistics m_vertex_statistics;
+};
+
+#endif
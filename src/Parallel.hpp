@@ -0,0 +1,71 @@
+#ifndef PARALLEL_HPP
+#define PARALLEL_HPP
+
+#include <algorithm>
+#include <atomic>
+#include <exception>
+#include <stdexcept>
+#include <thread>
+#include <vector>
+
+// Outils de parallélisation des algorithmes natifs (exécutés sans le GIL) à l'aide de threads standards
+namespace parallel{
+    // Nombre de threads utilisé lorsque le paramètre "threads" n'est pas fourni (0 : nombre de threads matériels de la machine). Valeur par défaut
+    // identique pour l'ensemble des algorithmes, des fonctions du module et des propriétés "threads" de config.json
+    const int DEFAULT_NUMBER_OF_THREADS = 0;
+
+    // Nombre de threads à utiliser à partir du nombre demandé par l'utilisateur (0 : nombre de threads matériels de la machine)
+    inline unsigned int resolve_number_of_threads(const int requested_threads)
+    {
+        if(requested_threads < 0){
+            throw std::invalid_argument("Le nombre de threads doit être positif ou nul.");
+        }
+        return requested_threads > 0 ? static_cast<unsigned int>(requested_threads) : std::max(1u, std::thread::hardware_concurrency());
+    }
+
+    // Découpage de l'intervalle [0, number_of_items[ en blocs de block_size éléments distribués dynamiquement entre les threads
+    // (équilibrage de la charge lorsque le coût de traitement varie selon les éléments).
+    // La fonction est appelée avec l'indice du bloc ainsi que le premier et le dernier (exclu) élément du bloc. Le découpage en blocs
+    // ne dépend pas du nombre de threads : des résultats partiels stockés par bloc puis fusionnés dans l'ordre des blocs sont donc
+    // identiques quel que soit le nombre de threads
+    template<typename Function>
+    void for_each_block(const size_t number_of_items, const size_t block_size, const unsigned int number_of_threads, Function function)
+    {
+        const size_t number_of_blocks = (number_of_items + block_size - 1) / block_size;
+        std::atomic<size_t> next_block(0);
+        std::vector<std::exception_ptr> errors(std::max(1u, number_of_threads));
+
+        auto worker = [&](const unsigned int thread_index){
+            try{
+                for(size_t block = next_block++; block < number_of_blocks; block = next_block++){
+                    function(block, block * block_size, std::min(number_of_items, (block + 1) * block_size));
+                }
+            }catch(...){
+                errors[thread_index] = std::current_exception();
+                // Les blocs restants ne sont pas traités
+                next_block = number_of_blocks;
+            }
+        };
+
+        // Inutile de créer plus de threads que de blocs
+        const unsigned int threads_to_create = static_cast<unsigned int>(std::min<size_t>(errors.size(), number_of_blocks));
+        std::vector<std::thread> threads;
+        threads.reserve(threads_to_create > 0 ? threads_to_create - 1 : 0);
+        for(unsigned int i = 1; i < threads_to_create; i++){
+            threads.emplace_back(worker, i);
+        }
+        // Le thread courant participe également au calcul
+        worker(0);
+        for(auto& thread : threads){
+            thread.join();
+        }
+        // Propagation de la première erreur rencontrée par l'un des threads
+        for(const auto& error : errors){
+            if(error){
+                std::rethrow_exception(error);
+            }
+        }
+    }
+}
+
+#endif
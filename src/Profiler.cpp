@@ -0,0 +1,75 @@
+#include "Profiler.hpp"
+#include <chrono>
+
+namespace py = pybind11;
+
+Profiler::Scope::Scope(Profiler& profiler, std::string name) : m_profiler(profiler), m_name(std::move(name)), m_start(Profiler::now())
+{}
+
+Profiler::Scope::~Scope()
+{
+    this->m_profiler.add_phase(this->m_name, Profiler::now() - this->m_start);
+}
+
+void Profiler::add_phase(const std::string& name, const int64_t nanoseconds)
+{
+    std::lock_guard<std::mutex> lock(this->m_mutex);
+    accumulate(this->m_phases, name, nanoseconds, false);
+}
+
+void Profiler::set_counter(const std::string& name, const int64_t value)
+{
+    std::lock_guard<std::mutex> lock(this->m_mutex);
+    accumulate(this->m_counters, name, value, true);
+}
+
+void Profiler::add_counter(const std::string& name, const int64_t value)
+{
+    std::lock_guard<std::mutex> lock(this->m_mutex);
+    accumulate(this->m_counters, name, value, false);
+}
+
+int64_t Profiler::phase(const std::string& name) const
+{
+    std::lock_guard<std::mutex> lock(this->m_mutex);
+    for(const auto& phase : this->m_phases){
+        if(phase.first == name){
+            return phase.second;
+        }
+    }
+    return 0;
+}
+
+py::dict Profiler::to_dict() const
+{
+    std::lock_guard<std::mutex> lock(this->m_mutex);
+    py::dict phases;
+    for(const auto& phase : this->m_phases){
+        phases[py::str(phase.first)] = phase.second;
+    }
+    py::dict counters;
+    for(const auto& counter : this->m_counters){
+        counters[py::str(counter.first)] = counter.second;
+    }
+    py::dict profile;
+    profile["phases"] = phases;
+    profile["counters"] = counters;
+    return profile;
+}
+
+int64_t Profiler::now()
+{
+    return std::chrono::duration_cast<std::chrono::nanoseconds>(std::chrono::steady_clock::now().time_since_epoch()).count();
+}
+
+void Profiler::accumulate(std::vector<std::pair<std::string, int64_t>>& values, const std::string& name, const int64_t value, const bool replace)
+{
+    // Le nombre de phases et de compteurs étant faible, une recherche linéaire suffit (et conserve l'ordre d'insertion)
+    for(auto& entry : values){
+        if(entry.first == name){
+            entry.second = replace ? value : entry.second + value;
+            return;
+        }
+    }
+    values.emplace_back(name, value);
+}
@@ -0,0 +1,52 @@
+#ifndef PROFILER_HPP
+#define PROFILER_HPP
+
+#include <pybind11/pybind11.h>
+#include <cstdint>
+#include <mutex>
+#include <string>
+#include <utility>
+#include <vector>
+
+// Mesure des durées (en nanosecondes) des phases d'un algorithme natif (lecture des données, construction du maillage, exécution,
+// exportation des résultats et éventuelles sous-phases de l'exécution nommées "compute.<nom>") ainsi que de compteurs (nombre de
+// faces en entrée et en sortie, nombre d'arêtes contractées, nombre de segments, ...)
+class Profiler{
+public:
+    // Mesure de la durée d'une portée : la durée est ajoutée à la phase lors de la destruction de l'objet
+    class Scope{
+    public:
+        Scope(Profiler& profiler, std::string name);
+        ~Scope();
+        Scope(const Scope&) = delete;
+        Scope& operator=(const Scope&) = delete;
+
+    private:
+        Profiler& m_profiler;
+        std::string m_name;
+        int64_t m_start;
+    };
+
+    // Ajout d'une durée à une phase (les durées d'une même phase s'additionnent)
+    void add_phase(const std::string& name, const int64_t nanoseconds);
+    void set_counter(const std::string& name, const int64_t value);
+    void add_counter(const std::string& name, const int64_t value);
+    // Durée totale d'une phase (0 si la phase n'a pas été mesurée)
+    int64_t phase(const std::string& name) const;
+
+    // Conversion en dictionnaire Python {"phases": {nom: durée en ns}, "counters": {nom: valeur}} (les phases sont
+    // ordonnées selon leur première mesure)
+    pybind11::dict to_dict() const;
+
+    // Instant courant (en nanosecondes) d'une horloge monotone
+    static int64_t now();
+
+private:
+    static void accumulate(std::vector<std::pair<std::string, int64_t>>& values, const std::string& name, const int64_t value, const bool replace);
+
+    mutable std::mutex m_mutex;
+    std::vector<std::pair<std::string, int64_t>> m_phases;
+    std::vector<std::pair<std::string, int64_t>> m_counters;
+};
+
+#endif
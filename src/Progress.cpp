@@ -0,0 +1,131 @@
+#include "Progress.hpp"
+#include "Profiler.hpp"
+#include <algorithm>
+
+namespace py = pybind11;
+
+Progress::Progress() : m_cancelled(false), m_fraction(0.0), m_deadline(0), m_time_budget(0.0), m_listener(), m_listener_interval(0), m_last_notification(0)
+{}
+
+void Progress::set_time_budget(const double seconds)
+{
+    if(seconds < 0.0){
+        throw std::invalid_argument("Le temps imparti doit être positif ou nul.");
+    }
+    this->m_time_budget = seconds;
+}
+
+double Progress::time_budget() const
+{
+    return this->m_time_budget;
+}
+
+void Progress::start()
+{
+    this->m_deadline = this->m_time_budget > 0.0 ? Profiler::now() + static_cast<int64_t>(this->m_time_budget * 1e9) : 0;
+}
+
+void Progress::set_stage(const std::string& stage)
+{
+    {
+        std::lock_guard<std::mutex> lock(this->m_mutex);
+        this->m_stage = stage;
+    }
+    this->notify();
+}
+
+void Progress::set_fraction(const double fraction)
+{
+    this->m_fraction = std::min(1.0, std::max(0.0, fraction));
+    this->notify();
+}
+
+double Progress::fraction() const
+{
+    return this->m_fraction;
+}
+
+void Progress::set_counter(const std::string& name, const int64_t value)
+{
+    std::lock_guard<std::mutex> lock(this->m_mutex);
+    for(auto& counter : this->m_counters){
+        if(counter.first == name){
+            counter.second = value;
+            return;
+        }
+    }
+    this->m_counters.emplace_back(name, value);
+}
+
+void Progress::cancel()
+{
+    this->m_cancelled = true;
+}
+
+bool Progress::is_cancelled() const
+{
+    return this->m_cancelled;
+}
+
+bool Progress::is_deadline_reached() const
+{
+    const int64_t deadline = this->m_deadline;
+    return deadline > 0 && Profiler::now() >= deadline;
+}
+
+bool Progress::should_stop() const
+{
+    return this->is_cancelled() || this->is_deadline_reached();
+}
+
+void Progress::check() const
+{
+    if(this->is_cancelled()){
+        throw AlgorithmCancelled("Exécution de l'algorithme annulée.");
+    }
+    if(this->is_deadline_reached()){
+        throw AlgorithmCancelled("Le temps imparti à l'exécution de l'algorithme a été dépassé.");
+    }
+}
+
+void Progress::set_listener(Listener listener, const int64_t interval_in_nanoseconds)
+{
+    this->m_listener = std::move(listener);
+    this->m_listener_interval = interval_in_nanoseconds;
+}
+
+void Progress::notify()
+{
+    if(!this->m_listener){
+        return;
+    }
+    const int64_t now = Profiler::now();
+    if(now - this->m_last_notification < this->m_listener_interval){
+        return;
+    }
+    // Un seul thread notifie l'avancement à la fois (les autres threads poursuivent leur calcul)
+    std::unique_lock<std::mutex> lock(this->m_listener_mutex, std::try_to_lock);
+    if(!lock.owns_lock()){
+        return;
+    }
+    this->m_last_notification = now;
+    this->m_listener(*this);
+}
+
+py::dict Progress::to_dict() const
+{
+    py::dict progress;
+    progress["fraction"] = this->fraction();
+    py::dict counters;
+    {
+        std::lock_guard<std::mutex> lock(this->m_mutex);
+        progress["stage"] = this->m_stage;
+        for(const auto& counter : this->m_counters){
+            counters[py::str(counter.first)] = counter.second;
+        }
+    }
+    progress["counters"] = counters;
+    progress["cancelled"] = this->is_cancelled();
+    progress["deadline_reached"] = this->is_deadline_reached();
+    return progress;
+}
@@ -0,0 +1,73 @@
+#ifndef PROGRESS_HPP
+#define PROGRESS_HPP
+
+#include <pybind11/pybind11.h>
+#include <atomic>
+#include <cstdint>
+#include <functional>
+#include <mutex>
+#include <stdexcept>
+#include <string>
+#include <utility>
+#include <vector>
+
+// Exception levée par un algorithme interrompu (annulation demandée par l'utilisateur ou temps imparti dépassé)
+class AlgorithmCancelled : public std::runtime_error{
+public:
+    using std::runtime_error::runtime_error;
+};
+
+// Avancement d'un algorithme natif : fraction de l'exécution effectuée, étape courante et compteurs, ainsi que la demande d'annulation
+// et le temps imparti à l'exécution. L'annulation est coopérative : l'algorithme vérifie régulièrement (entre deux blocs de faces,
+// entre deux contractions d'arêtes, ...) s'il doit s'arrêter. Toutes les méthodes peuvent être appelées depuis n'importe quel thread
+class Progress{
+public:
+    // Fonction appelée (au plus une fois par intervalle) lors de la mise à jour de l'avancement
+    typedef std::function<void(Progress&)> Listener;
+
+    Progress();
+    Progress(const Progress&) = delete;
+    Progress& operator=(const Progress&) = delete;
+
+    // Temps imparti (en secondes) à l'exécution de l'algorithme (0 : aucune limite). Le décompte ne commence qu'à l'appel de start()
+    void set_time_budget(const double seconds);
+    double time_budget() const;
+    void start();
+
+    void set_stage(const std::string& stage);
+    void set_fraction(const double fraction);
+    double fraction() const;
+    void set_counter(const std::string& name, const int64_t value);
+
+    void cancel();
+    bool is_cancelled() const;
+    bool is_deadline_reached() const;
+    // L'algorithme doit s'arrêter (annulation demandée ou temps imparti dépassé)
+    bool should_stop() const;
+    // Levée d'une exception AlgorithmCancelled si l'algorithme doit s'arrêter (algorithmes ne pouvant pas retourner de résultat partiel)
+    void check() const;
+
+    void set_listener(Listener listener, const int64_t interval_in_nanoseconds);
+    // Conversion en dictionnaire Python {"fraction", "stage", "counters", "cancelled", "deadline_reached"} (nécessite le GIL)
+    pybind11::dict to_dict() const;
+
+private:
+    void notify();
+
+    std::atomic<bool> m_cancelled;
+    std::atomic<double> m_fraction;
+    // Instant (horloge de Profiler::now) au-delà duquel l'algorithme doit s'arrêter (0 : aucune limite)
+    std::atomic<int64_t> m_deadline;
+    double m_time_budget;
+
+    mutable std::mutex m_mutex;
+    std::string m_stage;
+    std::vector<std::pair<std::string, int64_t>> m_counters;
+
+    Listener m_listener;
+    int64_t m_listener_interval;
+    std::atomic<int64_t> m_last_notification;
+    std::mutex m_listener_mutex;
+};
+
+#endif
@@ -1,54 +1,290 @@
-#include "Router.hpp"
-#include "SurfaceMeshSimplification.hpp"
-#include "SurfaceMeshSegmentation.hpp"
-#include "SurfaceAreaComputation.hpp"
-#include <stdexcept>
-#include <iostream>
-#include "TestCpp.hpp"
-
-namespace py = pybind11;
-
-std::map<std::string, std::function<std::unique_ptr<Algorithm>(const pybind11::dict&)>> Router::algorithms_table = 
-                                                            {
-                                                                {
-                                                                    {"segmentation_cgal", [](const py::dict& data){ return std::make_unique<SurfaceMeshSegmentation>(data); }},
-                                                                    {"simplification_cgal", [](const py::dict& data){ return std::make_unique<SurfaceMeshSimplification>(data); }},
-                                                                    {"area_computation_cgal", [](const py::dict& data){ return std::make_unique<SurfaceAreaComputation>(data); }},
-                                                                    {"test_cpp", [](const py::dict& data){ return std::make_unique<TestCpp>(data); }}
-                                                                }
-                                                            };
-
-
-Router::Router(std::string algorithm_name, py::dict data): m_current_algorithm(algorithms_table[algorithm_name](data))
-{}
-
-Router::~Router()
-{
-    //delete m_current_algorithm;
-    // débogage
-    //std::cout << "La mémoire allouée au router a bien été liberée" << std::endl;
-}
-
-void Router::init()
-{
-    try{
-        this->m_current_algorithm->compute_algorithm();
-    }catch(const std::exception& e){
-        std::cerr << "Une erreur s'est produite lors de l'exécution d'un algorithme de l'API C++ : " << e.what() << std::endl;
-        throw;
-    }
-}
-
-py::dict Router::get_result()
-{
-    return this->m_current_algorithm->get_resulting_data();
-}
-
-PYBIND11_MODULE(algorithms_api, handle){
-    handle.doc() = "Classe implémentant divers algorithmes CGAL permettant d'effectuer des taritements sur des maillages";
-
-    py::class_<Router>(handle, "Router")
-        .def(py::init<std::string, py::dict>())
-        .def("init", &Router::init)
-        .def("get_result", &Router::get_result);
-}
+#include "Router.hpp"
+#include "SurfaceMeshSimplification.hpp"
+#include "SurfaceMeshSegmentation.hpp"
+#include "SurfaceMeshRemeshing.hpp"
+#include "MeshStatistics.hpp"
+#include "MeshSession.hpp"
+#include "MeshFile.hpp"
+#include "MeshRepair.hpp"
+#include "MeshBuffer.hpp"
+#include "SpatialIndex.hpp"
+#include "MeshDeviation.hpp"
+#include "Parallel.hpp"
+#include <stdexcept>
+#include <iostream>
+#include "TestCpp.hpp"
+
+namespace py = pybind11;
+
+// Intervalle minimal (en nanosecondes) entre deux appels de la fonction de progression fournie par Python
+static const int64_t PROGRESS_CALLBACK_INTERVAL = 100000000;
+
+// Description des données consommées par un algorithme lisant les tableaux des sommets et des faces
+static AlgorithmCapabilities mesh_capabilities(const std::string& mesh, const bool topology_changing, const bool threads)
+{
+    return AlgorithmCapabilities{{"vertices", "faces"}, MeshBuffer::vertex_dtypes(), MeshBuffer::face_dtypes(), mesh, topology_changing, threads};
+}
+
+std::map<std::string, Router::AlgorithmEntry> Router::algorithms_table = 
+                                                            {
+                                                                {
+                                                                    {"segmentation_cgal", {[](const py::dict& data){ return std::make_unique<SurfaceMeshSegmentation>(data); },
+                                                                                           mesh_capabilities("half_edge", false, true)}},
+                                                                    {"simplification_cgal", {[](const py::dict& data){ return std::make_unique<SurfaceMeshSimplification>(data); },
+                                                                                             mesh_capabilities("half_edge", true, false)}},
+                                                                    // Le remaillage lit également les indices des faces sélectionnées (remaillage de la sélection uniquement)
+                                                                    {"isotropic_remeshing_cgal", {[](const py::dict& data){ return std::make_unique<SurfaceMeshRemeshing>(data); },
+                                                                                                  AlgorithmCapabilities{{"vertices", "faces", "selected_faces"}, MeshBuffer::vertex_dtypes(),
+                                                                                                                        MeshBuffer::face_dtypes(), "half_edge", true, true}}},
+                                                                    {"area_computation_cgal", {[](const py::dict& data){ return std::make_unique<MeshStatistics>(data); },
+                                                                                               mesh_capabilities("triangles", false, true)}},
+                                                                    // L'algorithme de test ne lit aucune donnée du maillage
+                                                                    {"test_cpp", {[](const py::dict& data){ return std::make_unique<TestCpp>(data); },
+                                                                                  AlgorithmCapabilities{{}, {}, {}, "none", false, false}}}
+                                                                }
+                                                            };
+
+
+// Instanciation d'un algorithme à partir de son nom
+static std::unique_ptr<Algorithm> create_algorithm(const std::map<std::string, Router::AlgorithmEntry>& algorithms_table,
+                                                   const std::string& algorithm_name, const py::dict& data)
+{
+    const auto it = algorithms_table.find(algorithm_name);
+    if(it == algorithms_table.end()){
+        throw std::invalid_argument("L'algorithme '" + algorithm_name + "' n'existe pas dans l'API C++.");
+    }
+    return it->second.factory(data);
+}
+
+Router::Router(std::string algorithm_name, py::dict data): m_current_algorithm()
+{
+    // L'instanciation de l'algorithme comprend la lecture des données envoyées et la construction éventuelle du maillage,
+    // dont la durée est mesurée séparément (phase "build") par la session du maillage
+    const int64_t start_time = Profiler::now();
+    this->m_current_algorithm = create_algorithm(algorithms_table, algorithm_name, data);
+    Profiler& profiler = this->m_current_algorithm->profiler();
+    profiler.add_phase("ingest", Profiler::now() - start_time - profiler.phase("build"));
+
+    // Temps imparti (en secondes) à l'exécution de l'algorithme et fonction de progression optionnels
+    Progress& progress = this->m_current_algorithm->progress();
+    if(data.contains("time_budget") && !data["time_budget"].is_none()){
+        progress.set_time_budget(py::float_(data["time_budget"]));
+    }
+    if(data.contains("progress_callback") && !data["progress_callback"].is_none()){
+        py::function callback = data["progress_callback"].cast<py::function>();
+        progress.set_listener([callback](Progress& progress){
+            // La fonction est appelée depuis un thread exécutant l'algorithme (sans le GIL)
+            py::gil_scoped_acquire acquire;
+            try{
+                callback(progress.to_dict());
+            }catch(py::error_already_set& e){
+                // Une exception levée par la fonction de progression annule l'algorithme
+                std::cerr << "Une erreur s'est produite dans la fonction de progression : " << e.what() << std::endl;
+                progress.cancel();
+            }
+        }, PROGRESS_CALLBACK_INTERVAL);
+    }
+}
+
+Router::~Router()
+{
+    //delete m_current_algorithm;
+    // débogage
+    //std::cout << "La mémoire allouée au router a bien été liberée" << std::endl;
+}
+
+void Router::init()
+{
+    try{
+        // Relâchement du GIL pendant l'exécution de l'algorithme afin que l'interpréteur Python (et donc l'interface de Blender)
+        // ne soit pas bloqué lorsque l'algorithme est exécuté dans un thread secondaire
+        py::gil_scoped_release release;
+        Profiler::Scope compute_scope(this->m_current_algorithm->profiler(), "compute");
+        // Le décompte du temps imparti commence au lancement de l'exécution
+        this->m_current_algorithm->progress().start();
+        this->m_current_algorithm->compute_algorithm();
+        this->m_current_algorithm->progress().set_fraction(1.0);
+    }catch(const AlgorithmCancelled&){
+        throw;
+    }catch(const std::exception& e){
+        std::cerr << "Une erreur s'est produite lors de l'exécution d'un algorithme de l'API C++ : " << e.what() << std::endl;
+        throw;
+    }
+    // Le GIL est de nouveau détenu : conversion des résultats de l'algorithme en objets Python
+    Profiler::Scope export_scope(this->m_current_algorithm->profiler(), "export");
+    this->m_current_algorithm->export_results();
+}
+
+py::dict Router::get_result()
+{
+    return this->m_current_algorithm->get_resulting_data();
+}
+
+py::dict Router::get_profile() const
+{
+    return this->m_current_algorithm->profiler().to_dict();
+}
+
+py::dict Router::get_progress() const
+{
+    return this->m_current_algorithm->progress().to_dict();
+}
+
+void Router::cancel()
+{
+    this->m_current_algorithm->progress().cancel();
+}
+
+std::vector<std::string> Router::algorithms()
+{
+    std::vector<std::string> algorithm_names;
+    for(const auto& algorithm : algorithms_table){
+        algorithm_names.push_back(algorithm.first);
+    }
+    return algorithm_names;
+}
+
+py::dict Router::capabilities()
+{
+    py::dict capabilities;
+    for(const auto& algorithm : algorithms_table){
+        capabilities[py::str(algorithm.first)] = algorithm.second.capabilities.to_dict();
+    }
+    return capabilities;
+}
+
+PYBIND11_MODULE(algorithms_api, handle){
+    handle.doc() = "Classe implémentant divers algorithmes CGAL permettant d'effectuer des taritements sur des maillages";
+
+    py::class_<Router>(handle, "Router")
+        .def(py::init<std::string, py::dict>())
+        .def("init", &Router::init)
+        .def("get_result", &Router::get_result)
+        .def_property_readonly("profile", &Router::get_profile, "Durées (en nanosecondes) des phases de l'algorithme et compteurs associés")
+        .def_property_readonly("progress", &Router::get_progress, "Avancement de l'exécution : fraction effectuée, étape courante et compteurs")
+        .def("cancel", &Router::cancel, "Demande l'arrêt de l'algorithme en cours d'exécution (vérifiée régulièrement par l'algorithme)")
+        .def_static("algorithms", &Router::algorithms, "Liste des noms des algorithmes disponibles")
+        .def_static("capabilities", &Router::capabilities, "Données consommées (tableaux et types acceptés, structure de maillage construite) et propriétés de chaque algorithme");
+
+    // Exception levée par un algorithme interrompu (annulation ou temps imparti dépassé)
+    py::register_exception<AlgorithmCancelled>(handle, "AlgorithmCancelled", PyExc_RuntimeError);
+
+    py::class_<MeshSession, std::shared_ptr<MeshSession>>(handle, "MeshSession")
+        .def(py::init<std::string>(), py::arg("object_name"))
+        .def(py::init<std::string, py::dict>(), py::arg("object_name"), py::arg("data"))
+        .def("matches", &MeshSession::matches, "Vérifie si la géométrie des données correspond au maillage de la session", py::arg("data"))
+        .def("update", [](MeshSession& self, py::dict data){ return self.update(data); }, "Reconstruit le maillage de la session si la géométrie des données a changé", py::arg("data"))
+        .def("invalidate", &MeshSession::invalidate, "Libère le maillage de la session et ses structures dérivées (index spatial, valeurs SDF)")
+        .def("run", [](std::shared_ptr<MeshSession> self, std::string algorithm_name, py::dict data){
+            // Exécution d'un algorithme de l'API sur le maillage de la session. La session est ajoutée à une copie (superficielle) des données :
+            // le dictionnaire de l'appelant, éventuellement réutilisé pour d'autres exécutions, n'est pas modifié
+            py::dict session_data;
+            for(const auto& item : data){
+                session_data[item.first] = item.second;
+            }
+            session_data["session"] = self;
+            Router router(algorithm_name, session_data);
+            router.init();
+            return router.get_result();
+        }, "Exécute un algorithme de l'API sur le maillage de la session", py::arg("algorithm_name"), py::arg("data"))
+        .def_property_readonly("object_name", &MeshSession::object_name)
+        .def_property_readonly("fingerprint", &MeshSession::fingerprint)
+        .def_property_readonly("is_valid", &MeshSession::is_valid)
+        .def_property_readonly("number_of_builds", &MeshSession::number_of_builds)
+        .def_property_readonly("number_of_rejected_faces", &MeshSession::number_of_rejected_faces, "Nombre de faces rejetées par la structure demi-arêtes lors de la dernière construction du maillage")
+        .def_property_readonly("number_of_vertices", [](const MeshSession& self){ return static_cast<size_t>(self.mesh().number_of_vertices()); })
+        .def_property_readonly("number_of_faces", [](const MeshSession& self){ return static_cast<size_t>(self.mesh().number_of_faces()); });
+
+    // Gestion du cache des valeurs SDF de l'algorithme de segmentation
+    handle.def("sdf_cache_infos", [](){
+        const auto& cache = SurfaceMeshSegmentation::sdf_cache();
+        py::dict infos;
+        infos["entries"] = cache.number_of_entries();
+        infos["size_in_bytes"] = cache.size_in_bytes();
+        infos["capacity_in_bytes"] = cache.capacity_in_bytes();
+        infos["hits"] = cache.hits();
+        infos["misses"] = cache.misses();
+        return infos;
+    }, "Informations sur l'état du cache des valeurs SDF");
+    handle.def("set_sdf_cache_capacity", [](size_t capacity_in_bytes){ SurfaceMeshSegmentation::sdf_cache().set_capacity(capacity_in_bytes); },
+               "Définit la quantité maximale de mémoire (en octets) utilisée par le cache des valeurs SDF", py::arg("capacity_in_bytes"));
+    handle.def("clear_sdf_cache", [](){ SurfaceMeshSegmentation::sdf_cache().clear(); }, "Vide le cache des valeurs SDF");
+
+    // Index spatial (arbre AABB) d'un maillage, conservé dans un cache et partagé par les requêtes de proximité successives
+    py::class_<SpatialIndex, std::shared_ptr<SpatialIndex>>(handle, "SpatialIndex")
+        .def("closest_points", &SpatialIndex::closest_points,
+             "Points du maillage les plus proches des points (tableau de N*3 coordonnées). Retourne les tableaux 'points', 'faces' et 'distances'",
+             py::arg("points"), py::arg("threads") = parallel::DEFAULT_NUMBER_OF_THREADS)
+        .def("ray_cast", &SpatialIndex::ray_cast,
+             "Premier point d'intersection de chaque rayon avec le maillage. Retourne les tableaux 'hits', 'points', 'faces' (-1 si aucune) et 'distances'",
+             py::arg("origins"), py::arg("directions"), py::arg("threads") = parallel::DEFAULT_NUMBER_OF_THREADS)
+        .def("signed_distances", &SpatialIndex::signed_distances,
+             "Distances signées (négatives à l'intérieur d'un maillage fermé) des points au maillage. Retourne les tableaux 'distances', 'points' et 'faces'",
+             py::arg("points"), py::arg("threads") = parallel::DEFAULT_NUMBER_OF_THREADS)
+        .def_property_readonly("fingerprint", &SpatialIndex::fingerprint)
+        .def_property_readonly("number_of_faces", &SpatialIndex::number_of_faces)
+        .def_property_readonly("number_of_triangles", &SpatialIndex::number_of_triangles, "Nombre de triangles indexés (faces non dégénérées)")
+        .def_property_readonly("size_in_bytes", &SpatialIndex::size_in_bytes)
+        .def_property_readonly("build_time", &SpatialIndex::build_time, "Durée (en nanosecondes) de la construction de l'index")
+        .def_property_readonly("diagonal", &SpatialIndex::diagonal, "Longueur de la diagonale de la boîte englobante du maillage");
+    handle.def("get_spatial_index", [](py::object vertices, py::object faces){
+        py::dict data;
+        data["vertices"] = vertices;
+        data["faces"] = faces;
+        return std::const_pointer_cast<SpatialIndex>(SpatialIndex::get(data));
+    }, "Retourne l'index spatial du maillage (récupéré depuis le cache ou construit sans le GIL)", py::arg("vertices"), py::arg("faces"));
+    handle.def("spatial_index_cache_infos", [](){
+        const auto& cache = SpatialIndex::cache();
+        py::dict infos;
+        infos["entries"] = cache.number_of_entries();
+        infos["size_in_bytes"] = cache.size_in_bytes();
+        infos["capacity_in_bytes"] = cache.capacity_in_bytes();
+        infos["hits"] = cache.hits();
+        infos["misses"] = cache.misses();
+        return infos;
+    }, "Informations sur l'état du cache des index spatiaux");
+    handle.def("set_spatial_index_cache_capacity", [](size_t capacity_in_bytes){ SpatialIndex::cache().set_capacity(capacity_in_bytes); },
+               "Définit la quantité maximale de mémoire (en octets) utilisée par le cache des index spatiaux", py::arg("capacity_in_bytes"));
+    handle.def("clear_spatial_index_cache", [](){ SpatialIndex::cache().clear(); }, "Vide le cache des index spatiaux");
+
+    // Mesure de l'écart entre un maillage et le maillage obtenu par un algorithme (distance de Hausdorff et écart quadratique moyen échantillonnés)
+    handle.def("measure_deviation", [](py::object original_vertices, py::object original_faces, py::object vertices, py::object faces,
+                                       size_t samples, bool vertex_distances, int threads){
+        py::dict original;
+        original["vertices"] = original_vertices;
+        original["faces"] = original_faces;
+        py::dict result;
+        result["vertices"] = vertices;
+        result["faces"] = faces;
+        return MeshDeviation::measure(original, result, samples, vertex_distances, threads);
+    }, "Estime, à partir de points échantillonnés sur les deux surfaces (au plus 'samples' par surface), la distance de Hausdorff symétrique "
+       "et l'écart quadratique moyen entre le maillage d'origine et le maillage obtenu. Retourne 'hausdorff', 'forward_max', 'backward_max', "
+       "'mean', 'rms', 'samples', 'diagonal', les distances au maillage d'origine des sommets du maillage obtenu ('vertex_distances', "
+       "si demandées) et le profil de la mesure ('profile')",
+       py::arg("original_vertices"), py::arg("original_faces"), py::arg("vertices"), py::arg("faces"),
+       py::arg("samples") = MeshDeviation::DEFAULT_SAMPLES, py::arg("vertex_distances") = false, py::arg("threads") = parallel::DEFAULT_NUMBER_OF_THREADS);
+
+    // Réparation native d'une soupe de triangles (remplace la fusion des sommets effectuée par BMesh dans Blender)
+    handle.def("repair_mesh", [](py::object vertices, py::object faces, double tolerance, int threads){
+        py::dict data;
+        data["vertices"] = vertices;
+        data["faces"] = faces;
+        return MeshRepair::repair(data, tolerance, threads);
+    }, "Fusionne les sommets proches, supprime les faces dégénérées, en double ou non manifold et oriente les faces de façon cohérente. "
+       "Retourne les tableaux 'vertices', 'faces', 'vertex_map' et 'face_map', le bilan de la réparation ('report') et son profil ('profile')",
+       py::arg("vertices"), py::arg("faces"), py::arg("tolerance") = MeshRepair::DEFAULT_TOLERANCE, py::arg("threads") = parallel::DEFAULT_NUMBER_OF_THREADS);
+
+    // Lecture et écriture de maillages binaires projetés en mémoire (sans passer par Blender)
+    handle.def("read_mesh_file", &MeshFile::read,
+               "Projette en mémoire un maillage (PLY ou OFF binaire, ou paire de fichiers .npy) et retourne ses tableaux 'vertices' et 'faces' (vues en lecture seule sur le fichier)",
+               py::arg("path"), py::arg("faces_path") = "");
+    handle.def("write_mesh_file", [](const std::string& path, py::array vertices, py::array faces, py::object vertex_color, py::object face_color, const std::string& faces_path){
+        py::dict data;
+        data["vertices"] = vertices;
+        data["faces"] = faces;
+        data["vertex_color"] = vertex_color;
+        data["face_color"] = face_color;
+        MeshFile::write(path, data, faces_path);
+    }, "Ecrit un maillage au format PLY ou OFF binaire, ou sous la forme d'une paire de fichiers .npy (format déduit de l'extension)",
+       py::arg("path"), py::arg("vertices"), py::arg("faces"), py::arg("vertex_color") = py::none(), py::arg("face_color") = py::none(), py::arg("faces_path") = "");
+}
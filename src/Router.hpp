@@ -1,22 +1,39 @@
-#ifndef ROUTER_HPP
-#define ROUTER_HPP
-
-#include "Algorithm.hpp"
-#include <vector>
-#include <map>
-#include <functional>
-#include <memory>
-
-class Router{
-public:
-    Router(std::string algorithm_name, pybind11::dict data);
-    ~Router();
-    void init();
-    pybind11::dict get_result();
-
-private:
-    static std::map<std::string, std::function<std::unique_ptr<Algorithm>(const pybind11::dict&)>> algorithms_table;
-    std::unique_ptr<Algorithm> m_current_algorithm;
-};
-
-#endif
+#ifndef ROUTER_HPP
+#define ROUTER_HPP
+
+#include "Algorithm.hpp"
+#include <vector>
+#include <map>
+#include <functional>
+#include <memory>
+#include <string>
+
+class Router{
+public:
+    // Fonction d'instanciation d'un algorithme et description des données qu'il consomme
+    struct AlgorithmEntry{
+        std::function<std::unique_ptr<Algorithm>(const pybind11::dict&)> factory;
+        AlgorithmCapabilities capabilities;
+    };
+    Router(std::string algorithm_name, pybind11::dict data);
+    ~Router();
+    void init();
+    pybind11::dict get_result();
+    // Profil de l'exécution : durées (en nanosecondes) des phases de lecture des données ("ingest"), de construction du maillage ("build"),
+    // d'exécution ("compute" et ses sous-phases "compute.<nom>") et d'exportation des résultats ("export"), ainsi que les compteurs de l'algorithme
+    pybind11::dict get_profile() const;
+    // Avancement de l'exécution (fraction effectuée, étape courante et compteurs) et demande d'annulation (peut être appelée depuis un autre
+    // thread pendant l'exécution de l'algorithme, qui s'arrête dès sa prochaine vérification)
+    pybind11::dict get_progress() const;
+    void cancel();
+    // Liste des noms des algorithmes disponibles
+    static std::vector<std::string> algorithms();
+    // Données consommées et propriétés de chaque algorithme (dictionnaire indexé par le nom des algorithmes, voir AlgorithmCapabilities)
+    static pybind11::dict capabilities();
+
+private:
+    static std::map<std::string, AlgorithmEntry> algorithms_table;
+    std::unique_ptr<Algorithm> m_current_algorithm;
+};
+
+#endif
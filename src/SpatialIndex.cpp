@@ -0,0 +1,315 @@
+#include "SpatialIndex.hpp"
+#include "Parallel.hpp"
+#include "Profiler.hpp"
+#include <pybind11/numpy.h>
+#include <cmath>
+#include <limits>
+#include <stdexcept>
+#include <string>
+
+namespace py = pybind11;
+using namespace spatial_index;
+
+namespace {
+    // Capacité par défaut du cache des index spatiaux (512 Mo, soit quelques millions de triangles)
+    const size_t SPATIAL_INDEX_CACHE_DEFAULT_CAPACITY = 512 * 1024 * 1024;
+    // Nombre de requêtes traitées par un thread à chaque récupération d'un bloc de requêtes
+    const size_t QUERIES_PER_BLOCK = 1024;
+    // Directions (quelconques, non alignées sur les axes) des rayons utilisés pour déterminer si un point est à l'intérieur du maillage :
+    // la parité du nombre d'intersections est faussée lorsqu'un rayon passe par une arête ou un sommet, le résultat est donc celui de la
+    // majorité des trois rayons
+    const double INSIDE_RAY_DIRECTIONS[3][3] = {{1.0, 0.3716, 0.5187}, {-0.2417, 1.0, 0.6634}, {0.4431, -0.7183, 1.0}};
+
+    typedef py::array_t<double, py::array::c_style | py::array::forcecast> Point_array;
+
+    // Lecture d'un tableau numpy de points (N*3 coordonnées, converties si nécessaire en double précision)
+    Point_array get_points(const py::object& points, const char* name)
+    {
+        Point_array array = Point_array::ensure(points);
+        if(!array || array.size() % 3 != 0){
+            throw std::invalid_argument(std::string("Le tableau '") + name + "' doit contenir les coordonnées (x, y, z) de points.");
+        }
+        return array;
+    }
+
+    Point_3 get_point(const double* coordinates, const size_t index)
+    {
+        return Point_3(coordinates[3 * index], coordinates[3 * index + 1], coordinates[3 * index + 2]);
+    }
+
+    void set_point(std::vector<double>& coordinates, const size_t index, const Point_3& point)
+    {
+        coordinates[3 * index] = point.x();
+        coordinates[3 * index + 1] = point.y();
+        coordinates[3 * index + 2] = point.z();
+    }
+}
+
+SpatialIndex::SpatialIndex(const MeshBuffer& mesh_buffer) : m_triangles(), m_face_ids(), m_tree(), m_fingerprint(mesh_buffer.fingerprint()),
+                                                            m_number_of_faces(mesh_buffer.number_of_faces()), m_build_time(0), m_diagonal(0)
+{
+    const int64_t start = Profiler::now();
+    std::vector<Point_3> points;
+    points.reserve(mesh_buffer.number_of_vertices());
+    mesh_buffer.for_each_vertex([&](size_t, double x, double y, double z){
+        points.emplace_back(x, y, z);
+    });
+    // Les faces dégénérées (ou dont un indice de sommet est invalide) ne sont pas indexées
+    this->m_triangles.reserve(this->m_number_of_faces);
+    this->m_face_ids.reserve(this->m_number_of_faces);
+    mesh_buffer.for_each_face([&](size_t index, size_t v0, size_t v1, size_t v2){
+        if(v0 < points.size() && v1 < points.size() && v2 < points.size()){
+            const Triangle_3 triangle(points[v0], points[v1], points[v2]);
+            if(!triangle.is_degenerate()){
+                this->m_triangles.push_back(triangle);
+                this->m_face_ids.push_back(static_cast<int32_t>(index));
+            }
+        }
+    });
+    this->build_tree(start);
+}
+
+SpatialIndex::SpatialIndex(const mesh_session::Surface_mesh& surface_mesh, const uint64_t fingerprint) : m_triangles(), m_face_ids(), m_tree(),
+                                                                                                    m_fingerprint(fingerprint),
+                                                                                                    m_number_of_faces(surface_mesh.number_of_faces()),
+                                                                                                    m_build_time(0), m_diagonal(0)
+{
+    const int64_t start = Profiler::now();
+    this->m_triangles.reserve(this->m_number_of_faces);
+    this->m_face_ids.reserve(this->m_number_of_faces);
+    for(const auto& face : surface_mesh.faces()){
+        const auto halfedge = surface_mesh.halfedge(face);
+        const Triangle_3 triangle(surface_mesh.point(surface_mesh.source(halfedge)), surface_mesh.point(surface_mesh.target(halfedge)),
+                                  surface_mesh.point(surface_mesh.target(surface_mesh.next(halfedge))));
+        if(!triangle.is_degenerate()){
+            this->m_triangles.push_back(triangle);
+            this->m_face_ids.push_back(static_cast<int32_t>(face.idx()));
+        }
+    }
+    this->build_tree(start);
+}
+
+void SpatialIndex::build_tree(const int64_t start)
+{
+    if(this->m_triangles.empty()){
+        throw std::invalid_argument("Le maillage ne contient aucune face non dégénérée : l'index spatial ne peut pas être construit.");
+    }
+    this->m_tree.insert(this->m_triangles.cbegin(), this->m_triangles.cend());
+    this->m_tree.build();
+    this->m_tree.accelerate_distance_queries();
+    // Première requête forçant la construction des structures construites à la demande par CGAL (arbre de recherche des distances) :
+    // l'index n'est ensuite plus modifié par les requêtes concurrentes
+    this->m_tree.closest_point(this->m_triangles.front().vertex(0));
+    const CGAL::Bbox_3 bbox = this->m_tree.bbox();
+    this->m_diagonal = std::sqrt(CGAL::square(bbox.xmax() - bbox.xmin()) + CGAL::square(bbox.ymax() - bbox.ymin()) + CGAL::square(bbox.zmax() - bbox.zmin()));
+    this->m_build_time = Profiler::now() - start;
+}
+
+std::shared_ptr<const SpatialIndex> SpatialIndex::get(const py::dict& data, bool* cache_hit)
+{
+    const MeshBuffer mesh_buffer(data);
+    // Le calcul de l'empreinte (parcours de l'ensemble des tableaux), la recherche dans le cache et la construction de l'index ne manipulent
+    // aucun objet Python : le GIL est relâché pendant leur durée
+    py::gil_scoped_release release;
+    const uint64_t fingerprint = mesh_buffer.fingerprint();
+    std::shared_ptr<const SpatialIndex> index = cache().get(fingerprint);
+    if(cache_hit != nullptr){
+        *cache_hit = index != nullptr;
+    }
+    if(index == nullptr){
+        std::shared_ptr<SpatialIndex> built = std::make_shared<SpatialIndex>(mesh_buffer);
+        cache().put(fingerprint, built, built->size_in_bytes());
+        index = built;
+    }
+    return index;
+}
+
+std::shared_ptr<const SpatialIndex> SpatialIndex::get(const mesh_session::Surface_mesh& surface_mesh, const uint64_t fingerprint, bool* cache_hit)
+{
+    std::shared_ptr<const SpatialIndex> index = cache().get(fingerprint);
+    if(cache_hit != nullptr){
+        *cache_hit = index != nullptr;
+    }
+    if(index == nullptr){
+        std::shared_ptr<SpatialIndex> built = std::make_shared<SpatialIndex>(surface_mesh, fingerprint);
+        cache().put(fingerprint, built, built->size_in_bytes());
+        index = built;
+    }
+    return index;
+}
+
+LruCache<uint64_t, SpatialIndex>& SpatialIndex::cache()
+{
+    static LruCache<uint64_t, SpatialIndex> cache(SPATIAL_INDEX_CACHE_DEFAULT_CAPACITY);
+    return cache;
+}
+
+uint64_t SpatialIndex::fingerprint() const
+{
+    return this->m_fingerprint;
+}
+
+size_t SpatialIndex::number_of_faces() const
+{
+    return this->m_number_of_faces;
+}
+
+size_t SpatialIndex::number_of_triangles() const
+{
+    return this->m_triangles.size();
+}
+
+size_t SpatialIndex::size_in_bytes() const
+{
+    // Estimation : triangles et indices des faces, primitives et noeuds de l'arbre, points de l'arbre de recherche des distances
+    const size_t number_of_triangles = this->m_triangles.size();
+    return number_of_triangles * (sizeof(Triangle_3) + sizeof(int32_t) + sizeof(Primitive) + sizeof(CGAL::AABB_node<Traits>)
+                                  + sizeof(Point_3) + sizeof(Primitive::Id));
+}
+
+int64_t SpatialIndex::build_time() const
+{
+    return this->m_build_time;
+}
+
+double SpatialIndex::diagonal() const
+{
+    return this->m_diagonal;
+}
+
+Point_3 SpatialIndex::closest_point(const Point_3& point, int32_t& face) const
+{
+    const Tree::Point_and_primitive_id closest = this->m_tree.closest_point_and_primitive(point);
+    face = this->m_face_ids[closest.second - this->m_triangles.cbegin()];
+    return closest.first;
+}
+
+bool SpatialIndex::first_hit(const Ray_3& ray, Point_3& hit, int32_t& face, const int32_t ignored_face) const
+{
+    if(ray.is_degenerate()){
+        return false;
+    }
+    const auto intersection = this->m_tree.first_intersection(ray, [this, ignored_face](const Primitive::Id& id){
+        return this->m_face_ids[id - this->m_triangles.cbegin()] == ignored_face;
+    });
+    if(!intersection){
+        return false;
+    }
+    face = this->m_face_ids[intersection->second - this->m_triangles.cbegin()];
+    if(const Point_3* point = boost::get<Point_3>(&(intersection->first))){
+        hit = *point;
+    }
+    else{
+        // Rayon coplanaire au triangle : le point d'intersection retenu est l'extrémité du segment la plus proche de l'origine du rayon
+        const Kernel::Segment_3& segment = boost::get<Kernel::Segment_3>(intersection->first);
+        hit = CGAL::squared_distance(ray.source(), segment.source()) <= CGAL::squared_distance(ray.source(), segment.target()) ? segment.source() : segment.target();
+    }
+    return true;
+}
+
+bool SpatialIndex::is_inside(const Point_3& point) const
+{
+    int odd_rays = 0;
+    for(const auto& direction : INSIDE_RAY_DIRECTIONS){
+        const Ray_3 ray(point, Vector_3(direction[0], direction[1], direction[2]));
+        if(this->m_tree.number_of_intersected_primitives(ray) % 2 == 1){
+            odd_rays++;
+        }
+    }
+    return odd_rays >= 2;
+}
+
+py::dict SpatialIndex::closest_points(const py::object& points, const int threads) const
+{
+    const Point_array queries = get_points(points, "points");
+    const size_t number_of_queries = static_cast<size_t>(queries.size() / 3);
+    const unsigned int number_of_threads = parallel::resolve_number_of_threads(threads);
+    std::vector<double> closest(3 * number_of_queries);
+    std::vector<int32_t> faces(number_of_queries);
+    std::vector<double> distances(number_of_queries);
+    {
+        // Les requêtes ne manipulent aucun objet Python : le GIL est relâché pendant leur durée
+        py::gil_scoped_release release;
+        const double* coordinates = queries.data();
+        parallel::for_each_block(number_of_queries, QUERIES_PER_BLOCK, number_of_threads, [&](size_t, size_t first, size_t last){
+            for(size_t i = first; i < last; i++){
+                const Point_3 query = get_point(coordinates, i);
+                const Point_3 point = this->closest_point(query, faces[i]);
+                set_point(closest, i, point);
+                distances[i] = std::sqrt(CGAL::squared_distance(query, point));
+            }
+        });
+    }
+    py::dict results;
+    results["points"] = MeshBuffer::to_numpy(std::move(closest));
+    results["faces"] = MeshBuffer::to_numpy(std::move(faces));
+    results["distances"] = MeshBuffer::to_numpy(std::move(distances));
+    return results;
+}
+
+py::dict SpatialIndex::ray_cast(const py::object& origins, const py::object& directions, const int threads) const
+{
+    const Point_array ray_origins = get_points(origins, "origins");
+    const Point_array ray_directions = get_points(directions, "directions");
+    if(ray_origins.size() != ray_directions.size()){
+        throw std::invalid_argument("Les tableaux des origines et des directions des rayons doivent être de même taille.");
+    }
+    const size_t number_of_queries = static_cast<size_t>(ray_origins.size() / 3);
+    const unsigned int number_of_threads = parallel::resolve_number_of_threads(threads);
+    std::vector<char> hits(number_of_queries, 0);
+    std::vector<double> points(3 * number_of_queries, std::numeric_limits<double>::quiet_NaN());
+    std::vector<int32_t> faces(number_of_queries, -1);
+    std::vector<double> distances(number_of_queries, std::numeric_limits<double>::infinity());
+    {
+        py::gil_scoped_release release;
+        const double* origin_coordinates = ray_origins.data();
+        const double* direction_coordinates = ray_directions.data();
+        parallel::for_each_block(number_of_queries, QUERIES_PER_BLOCK, number_of_threads, [&](size_t, size_t first, size_t last){
+            for(size_t i = first; i < last; i++){
+                const Point_3 origin = get_point(origin_coordinates, i);
+                const Vector_3 direction(direction_coordinates[3 * i], direction_coordinates[3 * i + 1], direction_coordinates[3 * i + 2]);
+                Point_3 hit;
+                if(this->first_hit(Ray_3(origin, direction), hit, faces[i])){
+                    hits[i] = 1;
+                    set_point(points, i, hit);
+                    distances[i] = std::sqrt(CGAL::squared_distance(origin, hit));
+                }
+            }
+        });
+    }
+    py::dict results;
+    results["hits"] = py::array_t<bool>(static_cast<py::ssize_t>(number_of_queries), reinterpret_cast<const bool*>(hits.data()));
+    results["points"] = MeshBuffer::to_numpy(std::move(points));
+    results["faces"] = MeshBuffer::to_numpy(std::move(faces));
+    results["distances"] = MeshBuffer::to_numpy(std::move(distances));
+    return results;
+}
+
+py::dict SpatialIndex::signed_distances(const py::object& points, const int threads) const
+{
+    const Point_array queries = get_points(points, "points");
+    const size_t number_of_queries = static_cast<size_t>(queries.size() / 3);
+    const unsigned int number_of_threads = parallel::resolve_number_of_threads(threads);
+    std::vector<double> closest(3 * number_of_queries);
+    std::vector<int32_t> faces(number_of_queries);
+    std::vector<double> distances(number_of_queries);
+    {
+        py::gil_scoped_release release;
+        const double* coordinates = queries.data();
+        parallel::for_each_block(number_of_queries, QUERIES_PER_BLOCK, number_of_threads, [&](size_t, size_t first, size_t last){
+            for(size_t i = first; i < last; i++){
+                const Point_3 query = get_point(coordinates, i);
+                const Point_3 point = this->closest_point(query, faces[i]);
+                set_point(closest, i, point);
+                const double distance = std::sqrt(CGAL::squared_distance(query, point));
+                // Le signe (négatif à l'intérieur du maillage) n'a de sens que pour un maillage fermé
+                distances[i] = distance > 0.0 && this->is_inside(query) ? -distance : distance;
+            }
+        });
+    }
+    py::dict results;
+    results["distances"] = MeshBuffer::to_numpy(std::move(distances));
+    results["points"] = MeshBuffer::to_numpy(std::move(closest));
+    results["faces"] = MeshBuffer::to_numpy(std::move(faces));
+    return results;
+}
@@ -0,0 +1,90 @@
+#ifndef SPATIALINDEX_HPP
+#define SPATIALINDEX_HPP
+
+#include "MeshBuffer.hpp"
+#include "LruCache.hpp"
+#include "MeshSession.hpp"
+
+#include <CGAL/Exact_predicates_inexact_constructions_kernel.h>
+#include <CGAL/AABB_tree.h>
+#include <CGAL/AABB_traits.h>
+#include <CGAL/AABB_triangle_primitive.h>
+#include <pybind11/pybind11.h>
+#include <cstdint>
+#include <memory>
+#include <vector>
+
+namespace spatial_index{
+    typedef CGAL::Exact_predicates_inexact_constructions_kernel         Kernel;
+    typedef Kernel::Point_3                                             Point_3;
+    typedef Kernel::Vector_3                                            Vector_3;
+    typedef Kernel::Ray_3                                               Ray_3;
+    typedef Kernel::Triangle_3                                          Triangle_3;
+    typedef std::vector<Triangle_3>::const_iterator                     Triangle_iterator;
+    typedef CGAL::AABB_triangle_primitive<Kernel, Triangle_iterator>    Primitive;
+    typedef CGAL::AABB_traits<Kernel, Primitive>                        Traits;
+    typedef CGAL::AABB_tree<Traits>                                     Tree;
+}
+
+// Index spatial (arbre AABB de CGAL) des triangles d'un maillage, construit une seule fois par géométrie et conservé dans un cache
+// (clé : empreinte des tableaux des sommets et des faces) afin d'être partagé par les requêtes de proximité successives (point le plus proche,
+// lancer de rayons, distance signée). Une fois construit, l'index n'est plus modifié : les requêtes peuvent être effectuées depuis plusieurs
+// threads simultanément et sans le GIL
+class SpatialIndex{
+public:
+    explicit SpatialIndex(const MeshBuffer& mesh_buffer);
+    // Index des faces d'un maillage CGAL (l'indice de face retourné par les requêtes est l'indice de la face dans le maillage)
+    SpatialIndex(const mesh_session::Surface_mesh& surface_mesh, const uint64_t fingerprint);
+    SpatialIndex(const SpatialIndex&) = delete;
+    SpatialIndex& operator=(const SpatialIndex&) = delete;
+
+    // Récupération de l'index de la géométrie des données ("vertices" et "faces") depuis le cache ou construction de l'index (sans le GIL)
+    static std::shared_ptr<const SpatialIndex> get(const pybind11::dict& data, bool* cache_hit = nullptr);
+    // Récupération depuis le cache (clé : fingerprint) ou construction de l'index des faces d'un maillage CGAL. Les indices des faces du maillage
+    // devant correspondre à ceux des faces du tampon d'empreinte fingerprint, l'empreinte d'une session dont des faces ont été rejetées
+    // doit être distinguée de celle des tableaux envoyés
+    static std::shared_ptr<const SpatialIndex> get(const mesh_session::Surface_mesh& surface_mesh, const uint64_t fingerprint, bool* cache_hit = nullptr);
+    static LruCache<uint64_t, SpatialIndex>& cache();
+
+    uint64_t fingerprint() const;
+    size_t number_of_faces() const;
+    // Nombre de triangles indexés (les faces dégénérées ne sont pas indexées)
+    size_t number_of_triangles() const;
+    size_t size_in_bytes() const;
+    // Durée (en nanosecondes) de la construction de l'index
+    int64_t build_time() const;
+    // Longueur de la diagonale de la boîte englobante des triangles indexés
+    double diagonal() const;
+
+    // Requêtes unitaires (utilisables par les algorithmes natifs). L'indice de la face d'entrée concernée est retourné dans face
+    spatial_index::Point_3 closest_point(const spatial_index::Point_3& point, int32_t& face) const;
+    // Premier point d'intersection du rayon avec le maillage (false si le rayon n'atteint pas le maillage). La face d'indice ignored_face
+    // n'est pas intersectée (rayon lancé depuis un point de cette face)
+    bool first_hit(const spatial_index::Ray_3& ray, spatial_index::Point_3& hit, int32_t& face, const int32_t ignored_face = -1) const;
+    // Le point est à l'intérieur du volume délimité par le maillage (parité du nombre d'intersections de rayons, maillage fermé)
+    bool is_inside(const spatial_index::Point_3& point) const;
+
+    // Requêtes par lots sur des tableaux numpy de points (N*3 valeurs) exécutées en parallèle et sans le GIL
+    // {"points" (points les plus proches), "faces", "distances"}
+    pybind11::dict closest_points(const pybind11::object& points, const int threads) const;
+    // {"hits" (le rayon atteint le maillage), "points", "faces" (-1 si aucune), "distances" (infini si aucune)}
+    pybind11::dict ray_cast(const pybind11::object& origins, const pybind11::object& directions, const int threads) const;
+    // {"distances" (négatives à l'intérieur du maillage), "points", "faces"}
+    pybind11::dict signed_distances(const pybind11::object& points, const int threads) const;
+
+private:
+    // Construction de l'arbre à partir des triangles indexés
+    void build_tree(const int64_t start);
+
+    // Triangles indexés (référencés par les primitives de l'arbre : le conteneur ne doit plus être modifié après la construction de l'arbre)
+    // et indice de la face d'entrée de chaque triangle
+    std::vector<spatial_index::Triangle_3> m_triangles;
+    std::vector<int32_t> m_face_ids;
+    spatial_index::Tree m_tree;
+    uint64_t m_fingerprint;
+    size_t m_number_of_faces;
+    int64_t m_build_time;
+    double m_diagonal;
+};
+
+#endif
@@ -0,0 +1,343 @@
+#include "SurfaceMeshRemeshing.hpp"
+#include "MeshBuffer.hpp"
+#include "Parallel.hpp"
+#include <pybind11/numpy.h>
+#include <CGAL/Polygon_mesh_processing/measure.h>
+#include <CGAL/Bbox_3.h>
+#include <array>
+#include <mutex>
+#include <vector>
+#include <iostream>
+#include <stdexcept>
+#include <algorithm>
+#include <cmath>
+#include <boost/format.hpp>
+
+namespace PMP = CGAL::Polygon_mesh_processing;
+namespace py = pybind11;
+using namespace remeshing;
+
+namespace {
+    // Nombre d'éléments (arêtes, faces ou sommets) traités par un thread à chaque récupération d'un bloc lors des parcours parallèles
+    const size_t REMESHING_ITEMS_PER_BLOCK = 65536;
+    // Les arêtes contraintes ne doivent pas être plus longues que 4/3 de la longueur cible (précondition de isotropic_remeshing lorsque
+    // les contraintes sont protégées)
+    const double MAX_CONSTRAINED_EDGE_RATIO = 4.0 / 3.0;
+}
+
+SurfaceMeshRemeshing::SurfaceMeshRemeshing(const py::dict& data) : m_session(), m_surface_mesh(), m_target_edge_length(0.0), m_completed_iterations(0),
+                                                                   m_selection_only(false), m_selected_faces(), m_threads(1), m_region_faces_in(0),
+                                                                   m_region_faces_out(0), m_split_constrained_edges(0), m_time_budget_reached(false),
+                                                                   m_protect_borders(false)
+{
+    //Toutes les données, provenant de notre structure de données python, sont castées vers leurs types C++ idoines
+    py::list params = data["params"].cast<py::list>();
+    py::dict algorithm_parameters = params[0].cast<py::dict>();
+    this->m_target_edge_length_percentage = py::float_(algorithm_parameters["target_edge_length"]);
+    this->m_iterations = py::int_(algorithm_parameters["iterations"]);
+    if(algorithm_parameters.contains("selection_only")){
+        this->m_selection_only = py::bool_(algorithm_parameters["selection_only"]);
+    }
+    if(this->m_target_edge_length_percentage < 0.0){
+        throw std::invalid_argument("La longueur cible des arêtes doit être positive ou nulle.");
+    }
+    if(this->m_iterations < 1){
+        throw std::invalid_argument("Le nombre d'itérations du remaillage doit être au moins égal à 1.");
+    }
+    // Nombre de threads des parcours du maillage précédant le remaillage (0 : nombre de threads matériels de la machine)
+    this->m_threads = parallel::resolve_number_of_threads(algorithm_parameters.contains("threads") ? py::int_(algorithm_parameters["threads"]).cast<int>() : parallel::DEFAULT_NUMBER_OF_THREADS);
+
+    // Récupération de la session du maillage (le maillage n'est construit que s'il n'est pas déjà présent dans la session)
+    this->m_session = MeshSession::from_data(data, &this->m_profiler);
+    const size_t number_of_faces = this->m_session->number_of_input_faces();
+    this->m_profiler.set_counter("faces_in", static_cast<int64_t>(number_of_faces));
+    this->m_profiler.set_counter("threads", static_cast<int64_t>(this->m_threads));
+
+    if(data.contains("protect_borders")){
+        this->m_protect_borders = py::bool_(data["protect_borders"]);
+    }
+    if(this->m_selection_only){
+        if(!data.contains("selected_faces")){
+            throw std::invalid_argument("Le remaillage de la sélection nécessite les indices des faces sélectionnées (opération \"face_selection\").");
+        }
+        // Les indices des faces sélectionnées correspondent aux indices des faces du maillage CGAL uniquement si aucune face n'a été rejetée
+        if(this->m_session->number_of_rejected_faces() > 0){
+            throw std::invalid_argument((boost::format("%1% faces n'ont pas pu être ajoutées au maillage : la sélection ne peut pas être remaillée "
+                                                       "(utiliser la réparation native du maillage).") % this->m_session->number_of_rejected_faces()).str());
+        }
+        const py::array_t<int32_t, py::array::c_style | py::array::forcecast> selected_faces = py::array_t<int32_t, py::array::c_style | py::array::forcecast>::ensure(data["selected_faces"]);
+        if(!selected_faces){
+            throw std::invalid_argument("Les indices des faces sélectionnées doivent être un tableau d'entiers.");
+        }
+        this->m_selected_faces.assign(selected_faces.data(), selected_faces.data() + selected_faces.size());
+        for(const int32_t face : this->m_selected_faces){
+            if(face < 0 || static_cast<size_t>(face) >= number_of_faces){
+                throw std::out_of_range((boost::format("L'indice de face sélectionnée %1% n'appartient pas au maillage (%2% faces).") % face % number_of_faces).str());
+            }
+        }
+        if(this->m_selected_faces.empty()){
+            throw std::invalid_argument("Aucune face du maillage n'est sélectionnée.");
+        }
+    }
+}
+
+void SurfaceMeshRemeshing::compute_algorithm()
+{
+    try{
+        this->m_progress.check();
+        // Le remaillage modifiant le maillage, il est effectué sur une copie du maillage de la session
+        {
+            Profiler::Scope copy_scope(this->m_profiler, "compute.copy");
+            std::lock_guard<std::mutex> lock(this->m_session->mutex());
+            this->m_surface_mesh = this->m_session->mesh();
+        }
+        Surface_mesh& surface_mesh = this->m_surface_mesh;
+
+        // Zone remaillée (indexée par l'indice des faces), arêtes contraintes et longueur cible
+        std::vector<char> in_region(surface_mesh.number_of_faces(), this->m_selection_only ? 0 : 1);
+        std::vector<char> constrained_edges;
+        {
+            Profiler::Scope region_scope(this->m_profiler, "compute.region");
+            this->m_progress.set_stage("region");
+            for(const int32_t face : this->m_selected_faces){
+                in_region[face] = 1;
+            }
+            this->m_region_faces_in = static_cast<size_t>(std::count(in_region.begin(), in_region.end(), 1));
+            constrained_edges = this->mark_constrained_edges(in_region);
+            this->m_target_edge_length = this->compute_target_edge_length(in_region);
+        }
+        this->m_progress.check();
+        Edge_bool_map is_constrained = surface_mesh.add_property_map<edge_descriptor, bool>("e:is_constrained", false).first;
+        for(const auto& edge : surface_mesh.edges()){
+            is_constrained[edge] = constrained_edges[edge.idx()] != 0;
+        }
+
+        // Découpage des arêtes contraintes bordant la zone remaillée trop longues pour la longueur cible (les sous-arêtes restent contraintes).
+        // Les faces voisines non sélectionnées sont découpées sans que leur géométrie ne soit modifiée
+        {
+            Profiler::Scope split_scope(this->m_profiler, "compute.split_constraints");
+            this->m_progress.set_stage("split_constraints");
+            const double max_length = MAX_CONSTRAINED_EDGE_RATIO * this->m_target_edge_length;
+            std::vector<edge_descriptor> long_edges;
+            size_t long_borders = 0;
+            for(const auto& edge : surface_mesh.edges()){
+                if(!is_constrained[edge]){
+                    continue;
+                }
+                const halfedge_descriptor halfedge = surface_mesh.halfedge(edge);
+                const face_descriptor face = surface_mesh.face(halfedge);
+                const face_descriptor opposite_face = surface_mesh.face(surface_mesh.opposite(halfedge));
+                const bool borders_region = (face != Surface_mesh::null_face() && in_region[face.idx()])
+                                         || (opposite_face != Surface_mesh::null_face() && in_region[opposite_face.idx()]);
+                if(borders_region && PMP::edge_length(halfedge, surface_mesh) > max_length){
+                    // Les bords protégés ne sont pas découpés : le sommet ajouté ne serait pas partagé par les faces voisines du maillage complet
+                    if(this->m_protect_borders && (face == Surface_mesh::null_face() || opposite_face == Surface_mesh::null_face())){
+                        long_borders++;
+                    }
+                    else{
+                        long_edges.push_back(edge);
+                    }
+                }
+            }
+            if(long_borders > 0){
+                throw std::invalid_argument((boost::format("%1% arêtes de la frontière de la sélection sont plus longues que 4/3 de la longueur cible : elles ne "
+                                                           "peuvent pas être découpées sans séparer la sélection du reste du maillage (augmenter la longueur cible "
+                                                           "ou utiliser l'option \"Sélection uniquement\" de l'algorithme sans l'option \"Traiter la sélection uniquement\").") % long_borders).str());
+            }
+            this->m_split_constrained_edges = long_edges.size();
+            if(!long_edges.empty()){
+                PMP::split_long_edges(long_edges, max_length, surface_mesh, CGAL::parameters::edge_is_constrained_map(is_constrained));
+            }
+        }
+        this->m_progress.check();
+
+        // Faces n'appartenant pas à la zone remaillée. Les faces créées lors du remaillage (ou réutilisant l'emplacement d'une face supprimée,
+        // nécessairement remaillée) appartiennent à la zone : la propriété reste donc valide au fil des itérations
+        Face_bool_map is_outside = surface_mesh.add_property_map<face_descriptor, bool>("f:is_outside", false).first;
+        if(this->m_selection_only){
+            // Parcours de la zone depuis les faces sélectionnées sans franchir d'arête contrainte (les faces issues du découpage des arêtes
+            // contraintes sont ainsi rattachées à la zone de la face découpée)
+            std::vector<char> reached(surface_mesh.number_of_faces() + surface_mesh.number_of_removed_faces(), 0);
+            std::vector<face_descriptor> stack;
+            for(const int32_t face : this->m_selected_faces){
+                reached[face] = 1;
+                stack.push_back(face_descriptor(face));
+            }
+            while(!stack.empty()){
+                const face_descriptor face = stack.back();
+                stack.pop_back();
+                for(const halfedge_descriptor halfedge : halfedges_around_face(surface_mesh.halfedge(face), surface_mesh)){
+                    const face_descriptor neighbor = surface_mesh.face(surface_mesh.opposite(halfedge));
+                    if(neighbor != Surface_mesh::null_face() && !is_constrained[surface_mesh.edge(halfedge)] && !reached[neighbor.idx()]){
+                        reached[neighbor.idx()] = 1;
+                        stack.push_back(neighbor);
+                    }
+                }
+            }
+            for(const auto& face : surface_mesh.faces()){
+                is_outside[face] = !reached[face.idx()];
+            }
+        }
+
+        // Remaillage itération par itération : l'annulation et le temps imparti sont vérifiés entre deux itérations
+        {
+            Profiler::Scope remeshing_scope(this->m_profiler, "compute.remeshing");
+            this->m_progress.set_stage("remeshing");
+            std::vector<face_descriptor> region;
+            for(int iteration = 0; iteration < this->m_iterations; iteration++){
+                region.clear();
+                for(const auto& face : surface_mesh.faces()){
+                    if(!is_outside[face]){
+                        region.push_back(face);
+                    }
+                }
+                PMP::isotropic_remeshing(region, this->m_target_edge_length, surface_mesh,
+                                         CGAL::parameters::number_of_iterations(1)
+                                         .protect_constraints(true)
+                                         .edge_is_constrained_map(is_constrained));
+                this->m_completed_iterations++;
+                this->m_progress.set_counter("iterations", this->m_completed_iterations);
+                this->m_progress.set_counter("faces", static_cast<int64_t>(surface_mesh.number_of_faces()));
+                this->m_progress.set_fraction(static_cast<double>(this->m_completed_iterations) / this->m_iterations);
+                if(this->m_progress.should_stop()){
+                    // L'annulation interrompt l'algorithme sans résultat (le temps imparti dépassé conserve le maillage obtenu jusqu'ici)
+                    if(this->m_progress.is_cancelled()){
+                        this->m_progress.check();
+                    }
+                    break;
+                }
+            }
+        }
+        this->m_time_budget_reached = this->m_completed_iterations < this->m_iterations;
+
+        // Extraction du maillage obtenu ainsi que des indices (dans l'ordre d'extraction) des faces de la zone remaillée
+        this->m_result = SurfaceMeshSimplification::extract_level(surface_mesh, 1.0);
+        if(this->m_selection_only){
+            int32_t face_index = 0;
+            for(const auto& face : surface_mesh.faces()){
+                if(!is_outside[face]){
+                    this->m_result_selected_faces.push_back(face_index);
+                }
+                face_index++;
+            }
+            this->m_region_faces_out = this->m_result_selected_faces.size();
+        }
+        else{
+            this->m_region_faces_out = surface_mesh.number_of_faces();
+        }
+        this->m_profiler.set_counter("region_faces_in", static_cast<int64_t>(this->m_region_faces_in));
+        this->m_profiler.set_counter("region_faces_out", static_cast<int64_t>(this->m_region_faces_out));
+        this->m_profiler.set_counter("split_constrained_edges", static_cast<int64_t>(this->m_split_constrained_edges));
+        this->m_profiler.set_counter("iterations", this->m_completed_iterations);
+        this->m_profiler.set_counter("time_budget_reached", this->m_time_budget_reached ? 1 : 0);
+        this->m_profiler.set_counter("faces_out", static_cast<int64_t>(surface_mesh.number_of_faces()));
+    }catch(const AlgorithmCancelled&){
+        throw;
+    }catch(const std::exception& e){
+        std::cerr << "Une erreur s'est produite lors de l'éxécution de l'algorithme de remaillage isotrope de CGAL : " << e.what() << std::endl;
+        throw;
+    }
+}
+
+void SurfaceMeshRemeshing::export_results()
+{
+    //Ajout des tableaux dans la structure de données qui sera retournée à Blender (les tableaux numpy prennent possession des données des conteneurs)
+    this->m_output_data["vertices"] = MeshBuffer::to_numpy(std::move(this->m_result.vertices));
+    this->m_output_data["faces"] = MeshBuffer::to_numpy(std::move(this->m_result.faces));
+    // Les faces issues du remaillage de la sélection restent sélectionnées
+    if(this->m_selection_only){
+        this->m_output_data["selected_faces"] = MeshBuffer::to_numpy(std::move(this->m_result_selected_faces));
+    }
+    std::string infos = (boost::format("Remaillage isotrope (CGAL) %1% :\n"
+                                       "- longueur cible des arêtes : %2%\n"
+                                       "- itérations : %3% / %4%\n"
+                                       "- faces remaillées : %5% -> %6%\n"
+                                       "- arêtes contraintes découpées : %7%")
+                         % (this->m_selection_only ? "de la sélection" : "du maillage")
+                         % this->m_target_edge_length
+                         % this->m_completed_iterations % this->m_iterations
+                         % this->m_region_faces_in % this->m_region_faces_out
+                         % this->m_split_constrained_edges).str();
+    if(this->m_time_budget_reached){
+        infos += (boost::format("\nTemps imparti (%1% s) dépassé : remaillage interrompu après %2% itération(s).") % this->m_progress.time_budget() % this->m_completed_iterations).str();
+    }
+    this->m_output_data["result_infos"] = infos;
+    this->m_output_data["output_result"] = std::array<std::string,2>{"replace_mesh", "message"};
+}
+
+std::vector<char> SurfaceMeshRemeshing::mark_constrained_edges(const std::vector<char>& in_region) const
+{
+    const Surface_mesh& surface_mesh = this->m_surface_mesh;
+    std::vector<char> constrained(surface_mesh.number_of_edges() + surface_mesh.number_of_removed_edges(), 0);
+    // Chaque arête n'est écrite que par le thread traitant son bloc
+    parallel::for_each_block(constrained.size(), REMESHING_ITEMS_PER_BLOCK, this->m_threads, [&](size_t, size_t first, size_t last){
+        for(size_t index = first; index < last; index++){
+            const edge_descriptor edge(static_cast<Surface_mesh::size_type>(index));
+            if(surface_mesh.is_removed(edge)){
+                continue;
+            }
+            const halfedge_descriptor halfedge = surface_mesh.halfedge(edge);
+            const face_descriptor face = surface_mesh.face(halfedge);
+            const face_descriptor opposite_face = surface_mesh.face(surface_mesh.opposite(halfedge));
+            // Arête de bord du maillage ou séparant une face de la zone remaillée d'une face qui n'en fait pas partie
+            constrained[index] = face == Surface_mesh::null_face() || opposite_face == Surface_mesh::null_face()
+                                 || in_region[face.idx()] != in_region[opposite_face.idx()];
+        }
+    });
+    return constrained;
+}
+
+double SurfaceMeshRemeshing::compute_target_edge_length(const std::vector<char>& in_region) const
+{
+    const Surface_mesh& surface_mesh = this->m_surface_mesh;
+    double target_edge_length = 0.0;
+    if(this->m_target_edge_length_percentage > 0.0){
+        // Boîte englobante du maillage calculée par blocs de sommets puis fusionnée dans l'ordre des blocs
+        const size_t number_of_vertices = surface_mesh.number_of_vertices() + surface_mesh.number_of_removed_vertices();
+        std::vector<CGAL::Bbox_3> boxes((number_of_vertices + REMESHING_ITEMS_PER_BLOCK - 1) / REMESHING_ITEMS_PER_BLOCK);
+        parallel::for_each_block(number_of_vertices, REMESHING_ITEMS_PER_BLOCK, this->m_threads, [&](size_t block, size_t first, size_t last){
+            for(size_t index = first; index < last; index++){
+                const vertex_descriptor vertex(static_cast<Surface_mesh::size_type>(index));
+                if(!surface_mesh.is_removed(vertex)){
+                    boxes[block] += surface_mesh.point(vertex).bbox();
+                }
+            }
+        });
+        CGAL::Bbox_3 box;
+        for(const auto& block_box : boxes){
+            box += block_box;
+        }
+        const double diagonal = std::sqrt(CGAL::square(box.xmax() - box.xmin()) + CGAL::square(box.ymax() - box.ymin()) + CGAL::square(box.zmax() - box.zmin()));
+        target_edge_length = this->m_target_edge_length_percentage / 100.0 * diagonal;
+    }
+    else{
+        // Longueur moyenne des arêtes des faces de la zone remaillée (les arêtes intérieures sont comptées deux fois), sommée par blocs de faces
+        const size_t number_of_faces = surface_mesh.number_of_faces() + surface_mesh.number_of_removed_faces();
+        const size_t number_of_blocks = (number_of_faces + REMESHING_ITEMS_PER_BLOCK - 1) / REMESHING_ITEMS_PER_BLOCK;
+        std::vector<double> sums(number_of_blocks, 0.0);
+        std::vector<size_t> counts(number_of_blocks, 0);
+        parallel::for_each_block(number_of_faces, REMESHING_ITEMS_PER_BLOCK, this->m_threads, [&](size_t block, size_t first, size_t last){
+            for(size_t index = first; index < last; index++){
+                const face_descriptor face(static_cast<Surface_mesh::size_type>(index));
+                if(surface_mesh.is_removed(face) || !in_region[index]){
+                    continue;
+                }
+                for(const halfedge_descriptor halfedge : halfedges_around_face(surface_mesh.halfedge(face), surface_mesh)){
+                    sums[block] += PMP::edge_length(halfedge, surface_mesh);
+                    counts[block]++;
+                }
+            }
+        });
+        double sum = 0.0;
+        size_t count = 0;
+        for(size_t block = 0; block < number_of_blocks; block++){
+            sum += sums[block];
+            count += counts[block];
+        }
+        target_edge_length = count > 0 ? sum / count : 0.0;
+    }
+    if(!(target_edge_length > 0.0)){
+        throw std::invalid_argument("La longueur cible des arêtes du remaillage est nulle (maillage dégénéré ?).");
+    }
+    return target_edge_length;
+}
@@ -0,0 +1,67 @@
+#ifndef SURFACEMESHREMESHING_HPP
+#define SURFACEMESHREMESHING_HPP
+
+#include "Algorithm.hpp"
+#include "MeshSession.hpp"
+#include "SurfaceMeshSimplification.hpp"
+#include <cstdint>
+#include <vector>
+#include <memory>
+
+#include <CGAL/Polygon_mesh_processing/remesh.h>
+
+namespace remeshing {
+    typedef mesh_session::Kernel                                        Kernel;
+    typedef mesh_session::Point_3                                       Point_3;
+    typedef mesh_session::Surface_mesh                                  Surface_mesh;
+    typedef Surface_mesh::Vertex_index                                  vertex_descriptor;
+    typedef Surface_mesh::Halfedge_index                                halfedge_descriptor;
+    typedef Surface_mesh::Edge_index                                    edge_descriptor;
+    typedef Surface_mesh::Face_index                                    face_descriptor;
+    typedef Surface_mesh::Property_map<edge_descriptor, bool>           Edge_bool_map;
+    typedef Surface_mesh::Property_map<face_descriptor, bool>           Face_bool_map;
+}
+
+// Remaillage isotrope de CGAL (Polygon_mesh_processing::isotropic_remeshing) de l'ensemble du maillage ou des seules faces sélectionnées.
+// Les bords du maillage et la frontière de la zone remaillée sont protégés : les faces non sélectionnées ne sont pas modifiées
+class SurfaceMeshRemeshing : public Algorithm{
+public:
+    explicit SurfaceMeshRemeshing(const pybind11::dict& data);
+    void compute_algorithm() override;
+    void export_results() override;
+
+private:
+    // Marquage des arêtes contraintes (bords du maillage et frontière de la zone remaillée), indexé par l'indice des arêtes
+    std::vector<char> mark_constrained_edges(const std::vector<char>& in_region) const;
+    // Longueur cible des arêtes : pourcentage de la diagonale de la boîte englobante du maillage ou, à défaut, longueur moyenne des arêtes
+    // des faces de la zone remaillée
+    double compute_target_edge_length(const std::vector<char>& in_region) const;
+
+    // Session contenant le maillage d'origine (non modifié par le remaillage)
+    std::shared_ptr<MeshSession> m_session;
+    // Copie du maillage de la session sur laquelle le remaillage est effectué
+    remeshing::Surface_mesh m_surface_mesh;
+    // Longueur cible des arêtes en pourcentage de la diagonale de la boîte englobante (0 : longueur moyenne des arêtes de la zone remaillée)
+    double m_target_edge_length_percentage;
+    double m_target_edge_length;
+    int m_iterations;
+    int m_completed_iterations;
+    // Seules les faces sélectionnées (indices des triangles envoyés par Blender) sont remaillées
+    bool m_selection_only;
+    std::vector<int32_t> m_selected_faces;
+    unsigned int m_threads;
+    size_t m_region_faces_in;
+    size_t m_region_faces_out;
+    // Nombre d'arêtes contraintes découpées avant le remaillage (arêtes plus longues que 4/3 de la longueur cible)
+    size_t m_split_constrained_edges;
+    // Le remaillage a été interrompu avant d'avoir effectué toutes les itérations (temps imparti dépassé)
+    bool m_time_budget_reached;
+    // Les bords du maillage ne sont pas découpés (champ "protect_borders" des données : maillage formé des faces sélectionnées, reporté
+    // ensuite sur le maillage complet)
+    bool m_protect_borders;
+    // Maillage obtenu et indices de ses faces issues du remaillage de la sélection
+    simplification::Mesh_level m_result;
+    std::vector<int32_t> m_result_selected_faces;
+};
+
+#endif
@@ -1,187 +1,502 @@
-#include "SurfaceMeshSegmentation.hpp"
-#include <pybind11/numpy.h>
-#include <vector>
-#include <chrono>
-#include <iostream>
-#include <boost/format.hpp>
-#include <stdexcept>
-#include <random>
-
-namespace py = pybind11;
-using namespace segmentation;
-
-SurfaceMeshSegmentation::SurfaceMeshSegmentation(const py::dict& data) : m_surface_mesh(){
-    //Toutes les données, provenant de notre structure de données python, sont castées vers leurs types C++ idoines
-    py::array_t<int> faces = data["faces"].cast<py::array_t<int>>();
-    py::array_t<double> vertices = data["vertices"].cast<py::array_t<double>>();
-    py::list params = data["params"].cast<py::list>();
-    py::dict algorithm_parameters = params[0].cast<py::dict>();
-    this->m_clusters = py::int_(algorithm_parameters["clusters"]);
-    this->m_smoothness = py::float_(algorithm_parameters["smoothness"]);
-    this->m_output_option = py::str(data["options"]["output_option"]);
-
-    // Stockage du nombre de faces du maillage envoyé par Blender
-    this->m_number_of_faces = faces.size() / 3;
-
-    // Récupération des tailles des conteneurs des coordonnées des sommets et des indices des sommets des faces
-    size_t vertices_size = static_cast<size_t>(vertices.shape(0));
-    size_t faces_size = static_cast<size_t>(faces.shape(0));
-
-    // Ainsi qu'un pointeur sur leurs données
-    auto vertices_ptr = vertices.data();
-    auto faces_ptr = faces.data();
-
-    //création d"un tableau de vector_descriptor qui va contenir les informations des coordonnées des sommets du maillage
-    std::vector<vertex_descriptor> vertices_descriptor;
-    //et réservation de l"espace mémoire adéquat
-    vertices_descriptor.reserve(vertices_size / 3);
-
-    for(int i = 0; i < vertices_size; i+=3){
-        vertices_descriptor.push_back(this->m_surface_mesh.add_vertex(Point_3(vertices_ptr[i], vertices_ptr[i+1], vertices_ptr[i+2])));
-    }
-
-    for(int i = 0; i < faces_size; i+=3){
-        //Création de la face du maillage
-        this->m_surface_mesh.add_face(vertices_descriptor[faces_ptr[i]], vertices_descriptor[faces_ptr[i+1]], vertices_descriptor[faces_ptr[i+2]]);
-    }
-
-    std::cout << "Nombre de faces du maillage original " << this->m_number_of_faces << std::endl;
-}
-
-void SurfaceMeshSegmentation::compute_algorithm(){
-
-    /*if(!CGAL::is_triangle_mesh(this->m_surface_mesh))
-    {
-        throw std::runtime_error("Le maillage n"est pas composé que de faces triangulaires...");
-    }*/
-    try{
-        std::chrono::steady_clock::time_point start_time = std::chrono::steady_clock::now();
-        Facet_double_map sdf_property_map;
-        sdf_property_map = this->m_surface_mesh.add_property_map<face_descriptor, double>("f:sdf").first;
-
-        // compute SDF values
-        // We can"t use default parameters for number of rays, and cone angle
-        // and the postprocessing
-        CGAL::sdf_values(this->m_surface_mesh, sdf_property_map, 2.0 / 3.0 * CGAL_PI, 25, true);
-
-        // create a property-map for segment-ids
-        Facet_int_map segment_property_map = this->m_surface_mesh.add_property_map<face_descriptor,std::size_t>("f:sid").first;
-
-        // segment the mesh using default parameters for number of levels, and smoothing lambda
-        // Any other scalar values can be used instead of using SDF values computed using the CGAL function
-        std::size_t number_of_segments = CGAL::segmentation_from_sdf_values(this->m_surface_mesh, sdf_property_map, segment_property_map, this->m_clusters, this->m_smoothness);
-        std::chrono::steady_clock::time_point end_time = std::chrono::steady_clock::now();
-        std::cout << "Number of segments: " << number_of_segments << std::endl;
-        std::cout << "Time elapsed: " << std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time).count() << "ms" << std::endl;
- 
-        if(this->m_output_option == "SEGMENTS_COLOR"){
-            //this->m_output_data["colors_number"] = number_of_segments; 
-            this->set_segments_ids_to_colors(number_of_segments);
-        }
-        else{
-            // Création du message de résultat
-            boost::format message = boost::format("Paramètres utilisés :\n"
-                                                "- nombre de clusters : %1%\n"
-                                                "- finesse : %2%\n\n"
-                                                "Nombre de segments obtenus : %3%.") 
-                                    % this->m_clusters 
-                                    % this->m_smoothness 
-                                    % number_of_segments;
-            this->m_output_data["result_infos"] = message.str();
-            this->m_output_data["output_result"] = std::array<std::string,1>{"message"};
-        }
-    }catch(const std::exception& e){
-        std::cerr << "Une erreur s'est produite lors de l'exécution de l'algorithme de segmentation de CGAL : " << e.what() << std::endl;
-        throw;
-    }
-}
-
-void SurfaceMeshSegmentation::set_segments_ids_to_colors(const size_t color_number){
-    // Création d'un tableau contenant les opérations à exécuter sur l'algorithme une fois l'algorithme effectué
-    std::vector<std::string> output_result;
-    // Vérification si le nombre de faces reçu par Blender correspond bien au nombre de faces du maillage sur lequel l'algorithme a été effectué
-    if (this->m_number_of_faces != this->m_surface_mesh.faces().size())
-    {
-        // Demande de recréer le maillage dans Blender
-        output_result.push_back("replace_mesh");
-        // et stockage des coordonnées des sommets ainsi que des indices des sommets des faces dans le dictionnaire des données exportées
-        // Récupération de la propriété contenant les coordonnées des sommets du maillage
-        const auto& location = this->m_surface_mesh.property_map<vertex_descriptor, Point_3>("v:point").first;
-
-        py::array_t<double> vertex_coordinates({static_cast<py::ssize_t>(this->m_surface_mesh.vertices().size() * 3)});
-        // Récupération d'un pointeur sur le tableau des données
-        auto vertex_coordinates_ptr = vertex_coordinates.mutable_data();
-        // Création d'un compteur sur le nombre de données stockées
-        size_t v = 0;
-
-        for(const auto& vertex : this->m_surface_mesh.vertices()) {
-            // Récupération des coordonnées du sommet courant
-            const auto& coords = location[vertex];
-            // Ajout des données dans le conteneur adéquat
-            vertex_coordinates_ptr[v] = coords.x();
-            vertex_coordinates_ptr[v+1] = coords.y();
-            vertex_coordinates_ptr[v+2] = coords.z();
-            // Mise à jour du compteur
-            v += 3;
-        }
-
-        this->m_output_data["vertices"] = std::move(vertex_coordinates);
-
-        // et de même pour les faces
-        py::array_t<int> face_indices({static_cast<py::ssize_t>(this->m_surface_mesh.faces().size() * 3)});
-        // Récupération d'un pointeur sur le tableau des données
-        auto face_indices_ptr = face_indices.mutable_data();
-        // Création d'un compteur sur le nombre de données stockées
-        size_t f = 0;
-        for(const auto& face: this->m_surface_mesh.faces()){
-            for(const auto& vertex: vertices_around_face(this->m_surface_mesh.halfedge(face), this->m_surface_mesh)){
-                // Ajout de l'indice dans le tableau
-                face_indices_ptr[f] = vertex.idx();
-                // Incrémentation du compteur
-                f++;
-            }
-        }
-
-        this->m_output_data["faces"] = std::move(face_indices);
-    }
-    //Récupération de la property_map contenant les identifiants des segments obtenus
-    const auto& segment_property_map = this->m_surface_mesh.property_map<face_descriptor, std::size_t>("f:sid").first;
-    output_result.push_back("face_coloration");
-    // Création des couleurs de façon aléatoire et permettant de remplir le tableau des couleurs des faces du maillage ultérieurement
-    std::vector<std::array<float, 3>> colors;
-    colors.reserve(color_number);
-
-    // Génération aléatoire des couleurs
-    // Initialisation de la génération de nombres psudo-aléatoires
-    std::random_device rd;
-    // Création du moteur de génération
-    std::default_random_engine engine(rd());
-    // Création de la méthode de génération des nombres entre 0 et 1 (ici une distribution uniforme)
-    std::uniform_real_distribution<float> distribution(0, 1);
-
-    // Génération des couleurs
-    for (int i = 0; i < color_number; i++){
-        // Ajout de la nouvelle couleur avec l'alpha dans le tableau des couleurs
-        colors.emplace_back(std::array<float, 3>{distribution(engine), distribution(engine), distribution(engine)});
-    }
-    // Création d'un tableau pour stocker les couleurs associées aux faces du maillage
-    py::array_t<float> face_colors({static_cast<py::ssize_t>(this->m_surface_mesh.faces().size() * 4)});
-    // Récupération d'un pointeur sur le tableau des données
-    auto face_colors_ptr = face_colors.mutable_data();
-    // Et d'un compteur sur les données stockées
-    size_t c = 0;
-
-    // Remplissage du tableau des couleurs des faces à partir des couleurs générées précédemment
-    for(const auto& fd : faces(this->m_surface_mesh)){
-        auto color = colors[segment_property_map[fd]];
-        face_colors_ptr[c] = color[0];
-        face_colors_ptr[c+1] = color[1];
-        face_colors_ptr[c+2] = color[2];
-        face_colors_ptr[c+3] = 1.0f;
-        // Mise à jour du compteur
-        c += 4;
-    }
-
-    this->m_output_data["colors"] = std::move(face_colors);
-    this->m_output_data["output_result"] = output_result;
-}
+#include "SurfaceMeshSegmentation.hpp"
+#include "MeshBuffer.hpp"
+#include "Parallel.hpp"
+#include <pybind11/numpy.h>
+#include <vector>
+#include <iostream>
+#include <boost/format.hpp>
+#include <stdexcept>
+#include <random>
+#include <cmath>
+#include <atomic>
+#include <memory>
+#include <mutex>
+#include <algorithm>
+#include <utility>
+#include <limits>
+
+namespace py = pybind11;
+using namespace segmentation;
+
+// Paramètres du calcul des valeurs SDF
+// We can"t use default parameters for number of rays, and cone angle
+static const double SDF_CONE_ANGLE = 2.0 / 3.0 * CGAL_PI;
+static const std::size_t SDF_NUMBER_OF_RAYS = 25;
+// Capacité par défaut du cache des valeurs SDF (256 Mo, soit environ 33 millions de faces)
+static const size_t SDF_CACHE_DEFAULT_CAPACITY = 256 * 1024 * 1024;
+// Nombre de faces traitées par un thread à chaque récupération d'un bloc de faces lors du calcul parallèle des valeurs SDF
+static const size_t SDF_FACES_PER_BLOCK = 512;
+// Part de l'avancement de la segmentation attribuée au calcul des valeurs SDF (le reste correspondant à la segmentation des valeurs)
+static const double SDF_PROGRESS_SHARE = 0.9;
+// Angle d'or (en radians) de l'échantillonnage des directions des rayons dans le cône (disque de Vogel)
+static const double SDF_GOLDEN_ANGLE = CGAL_PI * (3.0 - std::sqrt(5.0));
+
+namespace {
+    typedef spatial_index::Vector_3 Vector_3;
+
+    // Normale (non normalisée) d'une face triangulaire
+    Vector_3 face_normal(const Surface_mesh& surface_mesh, const face_descriptor face)
+    {
+        const auto halfedge = surface_mesh.halfedge(face);
+        const Point_3& p0 = surface_mesh.point(surface_mesh.source(halfedge));
+        const Point_3& p1 = surface_mesh.point(surface_mesh.target(halfedge));
+        const Point_3& p2 = surface_mesh.point(surface_mesh.target(surface_mesh.next(halfedge)));
+        return CGAL::cross_product(p1 - p0, p2 - p0);
+    }
+
+    // Valeur SDF brute d'une face, selon la méthode de CGAL::sdf_values : rayons lancés depuis le centre de la face dans un cône orienté vers
+    // l'intérieur du maillage, seuls les rayons atteignant une face vue de l'intérieur étant retenus. La valeur est la moyenne des longueurs
+    // des rayons (pondérées par le cosinus de leur angle à l'axe du cône) ne s'écartant pas de la médiane de plus d'un écart type.
+    // Retourne -1 si aucun rayon n'est retenu (valeur complétée par CGAL::sdf_values_postprocessing)
+    double compute_sdf_value(const Surface_mesh& surface_mesh, const SpatialIndex& index, const face_descriptor face, std::vector<std::pair<double, double>>& lengths)
+    {
+        const Vector_3 normal = face_normal(surface_mesh, face);
+        const double norm = std::sqrt(normal.squared_length());
+        if(norm == 0.0){
+            return -1.0;
+        }
+        const auto halfedge = surface_mesh.halfedge(face);
+        const Point_3 center = CGAL::centroid(surface_mesh.point(surface_mesh.source(halfedge)), surface_mesh.point(surface_mesh.target(halfedge)),
+                                              surface_mesh.point(surface_mesh.target(surface_mesh.next(halfedge))));
+        // Axe du cône (opposé de la normale) et base orthonormée du plan qui lui est orthogonal
+        const Vector_3 axis = -normal / norm;
+        Vector_3 u = std::abs(axis.x()) < 0.9 ? CGAL::cross_product(axis, Vector_3(1.0, 0.0, 0.0)) : CGAL::cross_product(axis, Vector_3(0.0, 1.0, 0.0));
+        u = u / std::sqrt(u.squared_length());
+        const Vector_3 v = CGAL::cross_product(axis, u);
+        const double tan_half_angle = std::tan(SDF_CONE_ANGLE / 2.0);
+
+        lengths.clear();
+        for(std::size_t ray = 0; ray < SDF_NUMBER_OF_RAYS; ray++){
+            // Points du disque de Vogel (répartis uniformément) sur la base du cône de hauteur 1
+            const double radius = std::sqrt((ray + 0.5) / SDF_NUMBER_OF_RAYS) * tan_half_angle;
+            const double theta = ray * SDF_GOLDEN_ANGLE;
+            const Vector_3 direction = axis + radius * (std::cos(theta) * u + std::sin(theta) * v);
+            Point_3 hit;
+            int32_t hit_face;
+            if(!index.first_hit(spatial_index::Ray_3(center, direction), hit, hit_face, static_cast<int32_t>(face.idx()))){
+                continue;
+            }
+            // La face atteinte doit être vue de l'intérieur du maillage
+            if(face_normal(surface_mesh, face_descriptor(static_cast<Surface_mesh::size_type>(hit_face))) * direction <= 0.0){
+                continue;
+            }
+            lengths.emplace_back(std::sqrt(CGAL::squared_distance(center, hit)), 1.0 / std::sqrt(1.0 + radius * radius));
+        }
+        if(lengths.empty()){
+            return -1.0;
+        }
+        // Suppression des longueurs aberrantes : écart à la médiane supérieur à l'écart type (autour de la médiane)
+        std::nth_element(lengths.begin(), lengths.begin() + lengths.size() / 2, lengths.end());
+        const double median = lengths[lengths.size() / 2].first;
+        double squared_deviation = 0.0;
+        for(const auto& length : lengths){
+            squared_deviation += (length.first - median) * (length.first - median);
+        }
+        const double deviation = std::sqrt(squared_deviation / lengths.size());
+        double sum = 0.0;
+        double weights = 0.0;
+        for(const auto& length : lengths){
+            if(std::abs(length.first - median) <= deviation){
+                sum += length.second * length.first;
+                weights += length.second;
+            }
+        }
+        return weights > 0.0 ? sum / weights : median;
+    }
+}
+
+Sdf_cache& SurfaceMeshSegmentation::sdf_cache(){
+    static Sdf_cache cache(SDF_CACHE_DEFAULT_CAPACITY);
+    return cache;
+}
+
+SurfaceMeshSegmentation::SurfaceMeshSegmentation(const py::dict& data) : m_session(), m_threads(1), m_number_of_segments(0), m_sdf_cache_hit(false){
+    //Toutes les données, provenant de notre structure de données python, sont castées vers leurs types C++ idoines
+    py::list params = data["params"].cast<py::list>();
+    py::dict algorithm_parameters = params[0].cast<py::dict>();
+    this->m_clusters = py::int_(algorithm_parameters["clusters"]);
+    this->m_smoothness = py::float_(algorithm_parameters["smoothness"]);
+    this->m_output_option = py::str(data["options"]["output_option"]);
+    // Nombre de threads du calcul des valeurs SDF (0 : nombre de threads matériels de la machine)
+    this->m_threads = parallel::resolve_number_of_threads(algorithm_parameters.contains("threads") ? py::int_(algorithm_parameters["threads"]).cast<int>() : parallel::DEFAULT_NUMBER_OF_THREADS);
+
+    // Récupération de la session du maillage (le maillage n'est construit que s'il n'est pas déjà présent dans la session)
+    this->m_session = MeshSession::from_data(data, &this->m_profiler);
+
+    // Stockage du nombre de faces du maillage envoyé par Blender
+    this->m_number_of_faces = this->m_session->number_of_input_faces();
+    this->m_profiler.set_counter("faces_in", static_cast<int64_t>(this->m_number_of_faces));
+    this->m_profiler.set_counter("threads", static_cast<int64_t>(this->m_threads));
+
+    // Calcul de l'empreinte de la géométrie (et des paramètres du calcul des valeurs SDF) servant de clé au cache des valeurs SDF
+    const uint64_t sdf_parameters[2] = {static_cast<uint64_t>(SDF_NUMBER_OF_RAYS), static_cast<uint64_t>(SDF_CONE_ANGLE * 1e6)};
+    this->m_fingerprint = MeshBuffer::hash_bytes(sdf_parameters, sizeof(sdf_parameters), this->m_session->fingerprint());
+}
+
+void SurfaceMeshSegmentation::compute_algorithm(){
+
+    /*if(!CGAL::is_triangle_mesh(this->m_session->mesh()))
+    {
+        throw std::runtime_error("Le maillage n"est pas composé que de faces triangulaires...");
+    }*/
+    try{
+        this->m_progress.check();
+        // Verrouillage de la session pendant l'exécution de l'algorithme (des propriétés sont ajoutées au maillage)
+        std::lock_guard<std::mutex> lock(this->m_session->mutex());
+        Surface_mesh& surface_mesh = this->m_session->mesh();
+        Facet_double_map sdf_property_map;
+        sdf_property_map = surface_mesh.add_property_map<face_descriptor, double>("f:sdf").first;
+
+        // Les valeurs SDF ne dépendant que de la géométrie, elles sont réutilisées si le maillage n'a pas changé depuis une exécution
+        // précédente (seuls les paramètres de la segmentation ont pu être modifiés) : celles conservées par la session du maillage,
+        // sinon celles du cache (sessions temporaires, session reconstruite à l'identique)
+        {
+            Profiler::Scope sdf_scope(this->m_profiler, "compute.sdf");
+            this->m_progress.set_stage("sdf");
+            std::shared_ptr<const std::vector<double>> cached_sdf_values = this->m_session->sdf_values(this->m_fingerprint);
+            if(cached_sdf_values == nullptr){
+                cached_sdf_values = sdf_cache().get(this->m_fingerprint);
+            }
+            this->m_sdf_cache_hit = cached_sdf_values != nullptr && cached_sdf_values->size() == surface_mesh.number_of_faces();
+            if(this->m_sdf_cache_hit){
+                for(const auto& fd : faces(surface_mesh)){
+                    sdf_property_map[fd] = (*cached_sdf_values)[fd.idx()];
+                }
+                this->m_session->set_sdf_values(this->m_fingerprint, cached_sdf_values);
+            }
+            else{
+                // Les rayons sont lancés dans l'index spatial des faces du maillage, conservé par la session et dans le cache des index spatiaux
+                // (partagé avec les requêtes de proximité et la mesure de l'écart) : il n'est construit qu'une seule fois par géométrie
+                bool index_cache_hit = false;
+                std::shared_ptr<const SpatialIndex> index;
+                {
+                    Profiler::Scope index_scope(this->m_profiler, "compute.spatial_index");
+                    index = this->m_session->spatial_index(&index_cache_hit);
+                }
+                this->m_profiler.set_counter("spatial_index_cache_hit", index_cache_hit ? 1 : 0);
+                // Lancer de rayons réparti par blocs de faces sur un ou plusieurs threads (l'annulation et le temps imparti sont vérifiés
+                // entre deux blocs) puis post-traitement (identique à celui effectué par CGAL::sdf_values)
+                compute_sdf_values_in_parallel(surface_mesh, *index, sdf_property_map, this->m_threads, this->m_progress);
+                CGAL::sdf_values_postprocessing(surface_mesh, sdf_property_map);
+
+                // Stockage des valeurs calculées dans la session et dans le cache
+                auto sdf_values = std::make_shared<std::vector<double>>(surface_mesh.number_of_faces());
+                for(const auto& fd : faces(surface_mesh)){
+                    (*sdf_values)[fd.idx()] = sdf_property_map[fd];
+                }
+                const size_t size_in_bytes = sdf_values->size() * sizeof(double);
+                this->m_session->set_sdf_values(this->m_fingerprint, sdf_values);
+                sdf_cache().put(this->m_fingerprint, std::move(sdf_values), size_in_bytes);
+            }
+        }
+        this->m_profiler.set_counter("sdf_cache_hit", this->m_sdf_cache_hit ? 1 : 0);
+        // La segmentation des valeurs SDF ne pouvant pas être interrompue, l'arrêt éventuel est vérifié avant son lancement
+        this->m_progress.check();
+        this->m_progress.set_stage("segmentation");
+        this->m_progress.set_fraction(SDF_PROGRESS_SHARE);
+
+        // create a property-map for segment-ids
+        Facet_int_map segment_property_map = surface_mesh.add_property_map<face_descriptor,std::size_t>("f:sid").first;
+
+        // segment the mesh using default parameters for number of levels, and smoothing lambda
+        // Any other scalar values can be used instead of using SDF values computed using the CGAL function
+        {
+            Profiler::Scope segmentation_scope(this->m_profiler, "compute.segmentation");
+            this->m_number_of_segments = CGAL::segmentation_from_sdf_values(surface_mesh, sdf_property_map, segment_property_map, this->m_clusters, this->m_smoothness);
+        }
+        this->m_profiler.set_counter("segments", static_cast<int64_t>(this->m_number_of_segments));
+    }catch(const AlgorithmCancelled&){
+        throw;
+    }catch(const std::exception& e){
+        std::cerr << "Une erreur s'est produite lors de l'exécution de l'algorithme de segmentation de CGAL : " << e.what() << std::endl;
+        throw;
+    }
+}
+
+void SurfaceMeshSegmentation::export_results(){
+    // Informations sur l'utilisation du cache des valeurs SDF
+    py::dict sdf_cache_infos;
+    sdf_cache_infos["hit"] = this->m_sdf_cache_hit;
+    sdf_cache_infos["hits"] = sdf_cache().hits();
+    sdf_cache_infos["misses"] = sdf_cache().misses();
+    sdf_cache_infos["threads"] = this->m_threads;
+    this->m_output_data["sdf_cache"] = sdf_cache_infos;
+
+    if(this->m_output_option == "SEGMENTS_COLOR"){
+        //this->m_output_data["colors_number"] = number_of_segments; 
+        this->set_segments_ids_to_colors(this->m_number_of_segments);
+    }
+    else if(this->m_output_option == "SEGMENTS_IDS"){
+        this->set_segments_ids();
+    }
+    else if(this->m_output_option == "SEGMENTS_STATS"){
+        this->set_segments_statistics();
+    }
+    else if(this->m_output_option == "SEGMENTS_SPLIT"){
+        this->split_segments();
+    }
+    else{
+        // Création du message de résultat
+        boost::format message = boost::format("Paramètres utilisés :\n"
+                                            "- nombre de clusters : %1%\n"
+                                            "- finesse : %2%\n"
+                                            "- threads (calcul des valeurs SDF) : %3%\n\n"
+                                            "Nombre de segments obtenus : %4%.\n"
+                                            "Valeurs SDF : %5%.") 
+                                % this->m_clusters 
+                                % this->m_smoothness 
+                                % this->m_threads
+                                % this->m_number_of_segments
+                                % (this->m_sdf_cache_hit ? "réutilisées depuis le cache" : "calculées");
+        this->m_output_data["result_infos"] = message.str();
+        this->m_output_data["output_result"] = std::array<std::string,1>{"message"};
+    }
+}
+
+void SurfaceMeshSegmentation::compute_sdf_values_in_parallel(const Surface_mesh& surface_mesh, const SpatialIndex& index, Facet_double_map sdf_property_map,
+                                                              const unsigned int number_of_threads, Progress& progress){
+    // La valeur SDF d'une face ne dépend que de la géométrie du maillage : les faces peuvent donc être traitées dans n'importe quel ordre
+    // et le résultat ne dépend pas du nombre de threads. L'index spatial n'étant plus modifié après sa construction, il est parcouru
+    // simultanément par tous les threads
+    // Liste des faces du maillage (accès direct à un bloc de faces)
+    const std::vector<face_descriptor> face_list(surface_mesh.faces().begin(), surface_mesh.faces().end());
+    // Les blocs de faces sont distribués dynamiquement afin d'équilibrer la charge (le coût du lancer de rayons varie selon les faces)
+    std::atomic<size_t> processed_faces(0);
+    parallel::for_each_block(face_list.size(), SDF_FACES_PER_BLOCK, number_of_threads, [&](size_t, size_t first, size_t last){
+        // Arrêt du calcul (les blocs restants ne sont pas traités) si l'annulation a été demandée ou si le temps imparti est dépassé
+        progress.check();
+        std::vector<std::pair<double, double>> lengths;
+        lengths.reserve(SDF_NUMBER_OF_RAYS);
+        // Chaque face n'étant traitée que par un seul thread, les écritures dans la property_map ne se chevauchent pas
+        for(size_t i = first; i < last; i++){
+            sdf_property_map[face_list[i]] = compute_sdf_value(surface_mesh, index, face_list[i], lengths);
+        }
+        const size_t faces_done = processed_faces += last - first;
+        progress.set_fraction(SDF_PROGRESS_SHARE * faces_done / face_list.size());
+    });
+    progress.set_counter("sdf_faces", static_cast<int64_t>(face_list.size()));
+}
+
+void SurfaceMeshSegmentation::export_mesh_if_modified(std::vector<std::string>& output_result){
+    const Surface_mesh& surface_mesh = this->m_session->mesh();
+    // Vérification si le nombre de faces reçu par Blender correspond bien au nombre de faces du maillage sur lequel l'algorithme a été effectué
+    if (this->m_number_of_faces != surface_mesh.faces().size())
+    {
+        // Demande de recréer le maillage dans Blender
+        output_result.push_back("replace_mesh");
+        // et stockage des coordonnées des sommets ainsi que des indices des sommets des faces dans le dictionnaire des données exportées
+        // Récupération de la propriété contenant les coordonnées des sommets du maillage
+        const auto& location = surface_mesh.property_map<vertex_descriptor, Point_3>("v:point").first;
+
+        std::vector<double> vertex_coordinates;
+        // Réservation de l'espace mémoire nécessaire
+        vertex_coordinates.reserve(surface_mesh.number_of_vertices() * 3);
+
+        for(const auto& vertex : surface_mesh.vertices()) {
+            // Récupération des coordonnées du sommet courant
+            const auto& coords = location[vertex];
+            // Ajout des données dans le conteneur adéquat
+            vertex_coordinates.push_back(coords.x());
+            vertex_coordinates.push_back(coords.y());
+            vertex_coordinates.push_back(coords.z());
+        }
+
+        // Le tableau numpy prend possession des données du conteneur (aucune copie)
+        this->m_output_data["vertices"] = MeshBuffer::to_numpy(std::move(vertex_coordinates));
+
+        // et de même pour les faces
+        std::vector<int> face_indices;
+        face_indices.reserve(surface_mesh.number_of_faces() * 3);
+        for(const auto& face: surface_mesh.faces()){
+            for(const auto& vertex: vertices_around_face(surface_mesh.halfedge(face), surface_mesh)){
+                // Ajout de l'indice dans le tableau
+                face_indices.push_back(static_cast<int>(vertex.idx()));
+            }
+        }
+
+        this->m_output_data["faces"] = MeshBuffer::to_numpy(std::move(face_indices));
+    }
+}
+
+std::vector<int32_t> SurfaceMeshSegmentation::get_segments_ids() const{
+    const Surface_mesh& surface_mesh = this->m_session->mesh();
+    //Récupération de la property_map contenant les identifiants des segments obtenus
+    const auto& segment_property_map = surface_mesh.property_map<face_descriptor, std::size_t>("f:sid").first;
+    std::vector<int32_t> segments_ids;
+    segments_ids.reserve(surface_mesh.number_of_faces());
+    for(const auto& fd : faces(surface_mesh)){
+        segments_ids.push_back(static_cast<int32_t>(segment_property_map[fd]));
+    }
+    return segments_ids;
+}
+
+void SurfaceMeshSegmentation::set_segments_ids_to_colors(const size_t color_number){
+    const Surface_mesh& surface_mesh = this->m_session->mesh();
+    // Création d'un tableau contenant les opérations à exécuter sur l'algorithme une fois l'algorithme effectué
+    std::vector<std::string> output_result;
+    this->export_mesh_if_modified(output_result);
+    //Récupération de la property_map contenant les identifiants des segments obtenus
+    const auto& segment_property_map = surface_mesh.property_map<face_descriptor, std::size_t>("f:sid").first;
+    output_result.push_back("face_coloration");
+    // Création des couleurs de façon aléatoire et permettant de remplir le tableau des couleurs des faces du maillage ultérieurement
+    std::vector<std::array<float, 3>> colors;
+    colors.reserve(color_number);
+
+    // Génération aléatoire des couleurs
+    // Initialisation de la génération de nombres psudo-aléatoires
+    std::random_device rd;
+    // Création du moteur de génération
+    std::default_random_engine engine(rd());
+    // Création de la méthode de génération des nombres entre 0 et 1 (ici une distribution uniforme)
+    std::uniform_real_distribution<float> distribution(0, 1);
+
+    // Génération des couleurs
+    for (int i = 0; i < color_number; i++){
+        // Ajout de la nouvelle couleur avec l'alpha dans le tableau des couleurs
+        colors.emplace_back(std::array<float, 3>{distribution(engine), distribution(engine), distribution(engine)});
+    }
+    // Création d'un tableau pour stocker les couleurs associées aux faces du maillage
+    std::vector<float> face_colors;
+    face_colors.reserve(surface_mesh.number_of_faces() * 4);
+
+    // Remplissage du tableau des couleurs des faces à partir des couleurs générées précédemment
+    for(const auto& fd : faces(surface_mesh)){
+        const auto& color = colors[segment_property_map[fd]];
+        face_colors.push_back(color[0]);
+        face_colors.push_back(color[1]);
+        face_colors.push_back(color[2]);
+        face_colors.push_back(1.0f);
+    }
+
+    this->m_output_data["colors"] = MeshBuffer::to_numpy(std::move(face_colors));
+    this->m_output_data["output_result"] = output_result;
+}
+
+void SurfaceMeshSegmentation::set_segments_ids(){
+    std::vector<std::string> output_result;
+    this->export_mesh_if_modified(output_result);
+    // Un identifiant de segment (entier sur 32 bits) par face du maillage
+    output_result.push_back("face_segments");
+    this->m_output_data["segments_ids"] = MeshBuffer::to_numpy(this->get_segments_ids());
+    this->m_output_data["segments_number"] = this->m_number_of_segments;
+    this->m_output_data["output_result"] = output_result;
+}
+
+void SurfaceMeshSegmentation::set_segments_statistics(){
+    const Surface_mesh& surface_mesh = this->m_session->mesh();
+    const auto& segment_property_map = surface_mesh.property_map<face_descriptor, std::size_t>("f:sid").first;
+    const size_t number_of_segments = this->m_number_of_segments;
+
+    // Nombre de faces, aire et centre de gravité (pondéré par l'aire des faces) de chaque segment
+    std::vector<int64_t> face_count(number_of_segments, 0);
+    std::vector<double> area(number_of_segments, 0.0);
+    std::vector<double> centroid(number_of_segments * 3, 0.0);
+    // Somme des centres des faces (centre de gravité des segments dont l'aire est nulle)
+    std::vector<double> center_sum(number_of_segments * 3, 0.0);
+
+    for(const auto& fd : faces(surface_mesh)){
+        const size_t segment = segment_property_map[fd];
+        const auto halfedge = surface_mesh.halfedge(fd);
+        const Point_3& p = surface_mesh.point(surface_mesh.source(halfedge));
+        const Point_3& q = surface_mesh.point(surface_mesh.target(halfedge));
+        const Point_3& r = surface_mesh.point(surface_mesh.target(surface_mesh.next(halfedge)));
+        const double face_area = std::sqrt(CGAL::squared_area(p, q, r));
+        const double center[3] = {(p.x() + q.x() + r.x()) / 3.0, (p.y() + q.y() + r.y()) / 3.0, (p.z() + q.z() + r.z()) / 3.0};
+        face_count[segment]++;
+        area[segment] += face_area;
+        for(size_t i = 0; i < 3; i++){
+            centroid[segment * 3 + i] += face_area * center[i];
+            center_sum[segment * 3 + i] += center[i];
+        }
+    }
+    for(size_t segment = 0; segment < number_of_segments; segment++){
+        for(size_t i = 0; i < 3; i++){
+            if(area[segment] > 0.0){
+                centroid[segment * 3 + i] /= area[segment];
+            }
+            else if(face_count[segment] > 0){
+                centroid[segment * 3 + i] = center_sum[segment * 3 + i] / static_cast<double>(face_count[segment]);
+            }
+        }
+    }
+
+    // Création du message de résultat (les statistiques de l'ensemble des segments sont également exportées sous la forme de tableaux)
+    std::string message = (boost::format("Nombre de segments obtenus : %1%.\n\n") % number_of_segments).str();
+    for(size_t segment = 0; segment < number_of_segments; segment++){
+        message += (boost::format("Segment %1% : %2% faces, aire %3$.4g, centre (%4$.4g, %5$.4g, %6$.4g)\n")
+                    % segment % face_count[segment] % area[segment]
+                    % centroid[segment * 3] % centroid[segment * 3 + 1] % centroid[segment * 3 + 2]).str();
+    }
+
+    py::dict segments_statistics;
+    segments_statistics["face_count"] = MeshBuffer::to_numpy(std::move(face_count));
+    segments_statistics["area"] = MeshBuffer::to_numpy(std::move(area));
+    segments_statistics["centroid"] = MeshBuffer::to_numpy(std::move(centroid));
+    this->m_output_data["segments_statistics"] = segments_statistics;
+    this->m_output_data["result_infos"] = message;
+    this->m_output_data["output_result"] = std::array<std::string,1>{"message"};
+}
+
+void SurfaceMeshSegmentation::split_segments(){
+    const Surface_mesh& surface_mesh = this->m_session->mesh();
+    const auto& segment_property_map = surface_mesh.property_map<face_descriptor, std::size_t>("f:sid").first;
+    const size_t number_of_segments = this->m_number_of_segments;
+
+    // Tri des faces par segment (tri par dénombrement) : les faces de chaque segment sont ensuite parcourues de façon contiguë
+    std::vector<size_t> offsets(number_of_segments + 1, 0);
+    for(const auto& fd : faces(surface_mesh)){
+        offsets[segment_property_map[fd] + 1]++;
+    }
+    for(size_t segment = 0; segment < number_of_segments; segment++){
+        offsets[segment + 1] += offsets[segment];
+    }
+    std::vector<face_descriptor> sorted_faces(offsets[number_of_segments]);
+    {
+        std::vector<size_t> positions(offsets.begin(), offsets.end() - 1);
+        for(const auto& fd : faces(surface_mesh)){
+            sorted_faces[positions[segment_property_map[fd]]++] = fd;
+        }
+    }
+
+    // Renumérotation des sommets de chaque segment : l'indice local d'un sommet n'est valide que si le segment qui l'a numéroté est le segment
+    // courant (les tableaux de correspondance ne sont donc jamais réinitialisés et l'ensemble du découpage est en O(nombre de faces))
+    const size_t invalid_segment = std::numeric_limits<size_t>::max();
+    std::vector<size_t> vertex_segment(surface_mesh.num_vertices(), invalid_segment);
+    std::vector<int> vertex_index(surface_mesh.num_vertices(), 0);
+
+    py::list segments;
+    for(size_t segment = 0; segment < number_of_segments; segment++){
+        const size_t first = offsets[segment];
+        const size_t last = offsets[segment + 1];
+        if(first == last){
+            continue;
+        }
+        std::vector<double> vertex_coordinates;
+        std::vector<int> face_indices;
+        face_indices.reserve((last - first) * 3);
+        for(size_t i = first; i < last; i++){
+            for(const auto& vertex : vertices_around_face(surface_mesh.halfedge(sorted_faces[i]), surface_mesh)){
+                const size_t index = vertex.idx();
+                if(vertex_segment[index] != segment){
+                    vertex_segment[index] = segment;
+                    vertex_index[index] = static_cast<int>(vertex_coordinates.size() / 3);
+                    const Point_3& point = surface_mesh.point(vertex);
+                    vertex_coordinates.push_back(point.x());
+                    vertex_coordinates.push_back(point.y());
+                    vertex_coordinates.push_back(point.z());
+                }
+                face_indices.push_back(vertex_index[index]);
+            }
+        }
+        py::dict segment_data;
+        segment_data["vertices"] = MeshBuffer::to_numpy(std::move(vertex_coordinates));
+        segment_data["faces"] = MeshBuffer::to_numpy(std::move(face_indices));
+        segment_data["name_suffix"] = (boost::format("_segment_%1%") % segment).str();
+        segment_data["segment_id"] = segment;
+        segments.append(segment_data);
+    }
+    this->m_profiler.set_counter("segments_out", static_cast<int64_t>(py::len(segments)));
+
+    this->m_output_data["segments"] = segments;
+    this->m_output_data["output_result"] = std::array<std::string,1>{"segment_meshes"};
+}
@@ -1,36 +1,61 @@
-#ifndef SURFACEMESHSEGMENTATION_HPP
-#define SURFACEMESHSEGMENTATION_HPP
-
-#include "Algorithm.hpp"
-
-#include <CGAL/Exact_predicates_inexact_constructions_kernel.h>
-#include <CGAL/Surface_mesh.h>
-#include <CGAL/mesh_segmentation.h>
-#include <CGAL/Polygon_mesh_processing/IO/polygon_mesh_io.h>
-#include <CGAL/property_map.h>
-
-namespace segmentation{
-    typedef CGAL::Exact_predicates_inexact_constructions_kernel      Kernel;
-    typedef Kernel::Point_3                                          Point_3;
-    typedef CGAL::Surface_mesh<Point_3>                              Surface_mesh;
-    typedef boost::graph_traits<Surface_mesh>::vertex_descriptor     vertex_descriptor;
-    typedef boost::graph_traits<Surface_mesh>::face_descriptor       face_descriptor;
-    typedef Surface_mesh::Property_map<face_descriptor,double>       Facet_double_map;
-    typedef Surface_mesh::Property_map<face_descriptor, std::size_t> Facet_int_map;
-}
-
-class SurfaceMeshSegmentation : public Algorithm{
-public:
-    explicit SurfaceMeshSegmentation(const pybind11::dict& data);
-    void compute_algorithm() override;
-    void set_segments_ids_to_colors(const size_t color_number);
-
-private:
-    segmentation::Surface_mesh m_surface_mesh;
-    int m_clusters;
-    double m_smoothness;
-    std::string m_output_option;
-    size_t m_number_of_faces;
-};
-
-#endif
+#ifndef SURFACEMESHSEGMENTATION_HPP
+#define SURFACEMESHSEGMENTATION_HPP
+
+#include "Algorithm.hpp"
+#include "LruCache.hpp"
+#include "MeshSession.hpp"
+#include "SpatialIndex.hpp"
+#include <vector>
+#include <memory>
+#include <cstdint>
+
+#include <CGAL/mesh_segmentation.h>
+#include <CGAL/Polygon_mesh_processing/IO/polygon_mesh_io.h>
+#include <CGAL/property_map.h>
+
+namespace segmentation{
+    typedef mesh_session::Kernel                                     Kernel;
+    typedef mesh_session::Point_3                                    Point_3;
+    typedef mesh_session::Surface_mesh                               Surface_mesh;
+    typedef boost::graph_traits<Surface_mesh>::vertex_descriptor     vertex_descriptor;
+    typedef boost::graph_traits<Surface_mesh>::face_descriptor       face_descriptor;
+    typedef Surface_mesh::Property_map<face_descriptor,double>       Facet_double_map;
+    typedef Surface_mesh::Property_map<face_descriptor, std::size_t> Facet_int_map;
+    // Cache des valeurs SDF (une valeur par face) indexé par l'empreinte de la géométrie et des paramètres du calcul
+    typedef LruCache<uint64_t, std::vector<double>>                  Sdf_cache;
+}
+
+class SurfaceMeshSegmentation : public Algorithm{
+public:
+    explicit SurfaceMeshSegmentation(const pybind11::dict& data);
+    void compute_algorithm() override;
+    void export_results() override;
+    void set_segments_ids_to_colors(const size_t color_number);
+    void set_segments_ids();
+    void set_segments_statistics();
+    void split_segments();
+    // Calcul des valeurs SDF brutes (sans post-traitement) par lancer de rayons dans l'index spatial des faces du maillage
+    static void compute_sdf_values_in_parallel(const segmentation::Surface_mesh& surface_mesh, const SpatialIndex& index, segmentation::Facet_double_map sdf_property_map,
+                                               const unsigned int number_of_threads, Progress& progress);
+    static segmentation::Sdf_cache& sdf_cache();
+
+private:
+    // Exportation des sommets et des faces du maillage si ce dernier ne correspond plus à celui envoyé par Blender
+    void export_mesh_if_modified(std::vector<std::string>& output_result);
+    // Identifiants des segments des faces du maillage (dans l'ordre des faces)
+    std::vector<int32_t> get_segments_ids() const;
+
+    // Session contenant le maillage sur lequel la segmentation est effectuée
+    std::shared_ptr<MeshSession> m_session;
+    int m_clusters;
+    double m_smoothness;
+    std::string m_output_option;
+    // Nombre de threads utilisés pour le calcul des valeurs SDF
+    unsigned int m_threads;
+    size_t m_number_of_faces;
+    size_t m_number_of_segments;
+    uint64_t m_fingerprint;
+    bool m_sdf_cache_hit;
+};
+
+#endif
@@ -1,134 +1,311 @@
-#include "SurfaceMeshSimplification.hpp"
-#include <pybind11/numpy.h>
-#include <vector>
-#include <chrono>
-#include <iostream>
-#include <stdexcept>
-#include <algorithm>
-
-namespace SMS = CGAL::Surface_mesh_simplification;
-namespace py = pybind11;
-using namespace simplification;
-
-SurfaceMeshSimplification::SurfaceMeshSimplification(const py::dict& data) : m_surface_mesh()
-{
-    //On caste toutes les données provenant de notre structure de données python vers des types C++
-    py::array_t<int> faces = data["faces"].cast<py::array_t<int>>();
-    py::array_t<double> vertices = data["vertices"].cast<py::array_t<double>>();
-    py::list params = data["params"].cast<py::list>();
-    py::dict algorithm_parameters = params[0].cast<py::dict>();
-    this->m_stop_ratio = py::float_(algorithm_parameters["decimation_factor"]);
-
-    // Récupération des tailles des conteneurs des coordonnées des sommets et des indices des sommets des faces
-    size_t vertices_size = static_cast<size_t>(vertices.shape(0));
-    size_t faces_size = static_cast<size_t>(faces.shape(0));
-
-    // Ainsi qu'un pointeur sur leurs données
-    auto vertices_ptr = vertices.data();
-    auto faces_ptr = faces.data();
-
-    //création d"un tableau de vector_descriptor qui va contenir les informations des coordonnées des sommets du maillage
-    std::vector<vertex_descriptor> vertices_descriptor;
-    //et réservation de l"espace mémoire adéquat
-    vertices_descriptor.reserve(vertices_size / 3);
-
-    for(int i = 0; i < vertices_size; i+=3){
-        vertices_descriptor.push_back(this->m_surface_mesh.add_vertex(Point_3(vertices_ptr[i], vertices_ptr[i+1], vertices_ptr[i+2])));
-    }
-
-    for(int i = 0; i < faces_size; i+=3){
-        //Création de la face du maillage
-        this->m_surface_mesh.add_face(vertices_descriptor[faces_ptr[i]], vertices_descriptor[faces_ptr[i+1]], vertices_descriptor[faces_ptr[i+2]]);
-    }
-}
-
-void SurfaceMeshSimplification::compute_algorithm()
-{
-    /*
-    if(!CGAL::is_triangle_mesh(this->m_surface_mesh))
-    {
-        throw std::runtime_error("Le maillage n"est pas composé que de faces triangulaires...");
-    }*/
-    try{
-        std::chrono::steady_clock::time_point start_time = std::chrono::steady_clock::now();
-        // In this example, the simplification stops when the number of undirected edges
-        // drops below 10% of the initial count
-        SMS::Edge_count_ratio_stop_predicate<Surface_mesh> stop(this->m_stop_ratio);
-        int r = SMS::edge_collapse(this->m_surface_mesh, stop);
-        std::chrono::steady_clock::time_point end_time = std::chrono::steady_clock::now();
-        std::cout << "\nFinished!\n" << r << " edges removed.\n" << this->m_surface_mesh.number_of_edges() << " final edges.\n";
-        std::cout << "Time elapsed: " << std::chrono::duration_cast<std::chrono::milliseconds>(end_time - start_time).count() << "ms" << std::endl;
-    }catch(const std::exception& e){
-        std::cerr << "Une erreur s'est produite lors de l'éxécution de l'algorithme de décimation de CGAL : " << e.what() << std::endl;
-        throw;
-    }
-
-    // Mise à jour des indices des sommets restants dans le maillage de sorte à ce que le premier sommet du maillage restant ait bien l"indice 0, le second l"indice 1, ...
-    std::map<vertex_descriptor, int> vertex_reindexing = this->get_vertex_reindexing();
-
-    this->update_vertex_coordinates(); 
-    this->update_face_indices(vertex_reindexing);
-    this->m_output_data["output_result"] = std::array<std::string,1>{"replace_mesh"};
-}
-
-void SurfaceMeshSimplification::update_vertex_coordinates()
-{
-    //Création d'un tableau qui va contenir les coordonnées de nos nouveaux résultant de l'algorithme de décimation
-    py::array_t<double> vertices_coordinates({static_cast<py::ssize_t>(this->m_surface_mesh.vertices().size() * 3)});
-    // Récupération d'un pointeur sur le conteneur des données
-    auto vertices_coordinates_ptr = vertices_coordinates.mutable_data();
-    // Création d'un compteur sur le nombre de données stockées
-    size_t v = 0;
-
-    //utilisation de propriétés : "location" référence les positions
-    const auto& location = this->m_surface_mesh.property_map<vertex_descriptor, Point_3>("v:point").first;
-
-    for(const auto& vertex : this->m_surface_mesh.vertices()) {
-        // Récupération des coordonnées du sommet courant
-        const auto& coords = location[vertex];
-        vertices_coordinates_ptr[v] = coords.x();
-        vertices_coordinates_ptr[v+1] = coords.y();
-        vertices_coordinates_ptr[v+2] = coords.z();
-        // Mise à jour du compteur
-        v += 3;
-    }
-
-    //Ajout du tableau dans la structure de données qui sera retournée à Blender
-    this->m_output_data["vertices"] = std::move(vertices_coordinates);
-}
-
-void SurfaceMeshSimplification::update_face_indices(std::map<vertex_descriptor, int>& vertex_reindexing)
-{
-    //Création d'un tableau qui va contenir les indices des sommets des faces résultant de l'algorithme de décimation
-    py::array_t<int> face_indices({static_cast<py::ssize_t>(this->m_surface_mesh.faces().size() * 3)});
-    // Récupération d'un pointeur sur le conteneur des données
-    auto face_indices_ptr = face_indices.mutable_data();
-    // Création d'un compteur sur le nombre de données stockées
-    size_t f = 0;
-
-    // Parcours des faces du maillage
-    for(const auto& face : this->m_surface_mesh.faces()) {
-        // Parcours des sommets appartenant à la face courante
-        for(const auto& vertex : vertices_around_face(this->m_surface_mesh.halfedge(face), this->m_surface_mesh)) {
-            // ajout du nouvel indice (obtenu par ré-indexation) du sommet dans le conteneur des indices de face
-            face_indices_ptr[f] = vertex_reindexing[vertex];
-            // Incrémentation du compteur
-            f++;
-        }
-    }
-    //Ajout du tableau dans la structure de données qui sera retournée à Blender
-    this->m_output_data["faces"] = std::move(face_indices);
-}
-
-std::map<vertex_descriptor, int> SurfaceMeshSimplification::get_vertex_reindexing()
-{   
-    std::map<vertex_descriptor, int> vertex_reindexing;
-    // Pour ré-indexer le maillage, nous allons parcourir l"ensemble des sommets du maillage
-    // et associer pour chacun d"entre eux un indice qui ira de 0 au nombre de sommets du maillage - 1
-    int new_index = 0;
-    for (const auto& vertex : this->m_surface_mesh.vertices()) {
-        vertex_reindexing[vertex] = new_index++;
-    }
-
-    return vertex_reindexing;
-}
+#include "SurfaceMeshSimplification.hpp"
+#include "MeshBuffer.hpp"
+#include <mutex>
+#include <pybind11/numpy.h>
+#include <vector>
+#include <iostream>
+#include <sstream>
+#include <stdexcept>
+#include <algorithm>
+#include <functional>
+#include <boost/format.hpp>
+
+namespace SMS = CGAL::Surface_mesh_simplification;
+namespace py = pybind11;
+using namespace simplification;
+
+namespace {
+    // Nombre de contractions d'arêtes entre deux mises à jour de l'avancement de la décimation
+    const std::size_t PROGRESS_COLLAPSES_INTERVAL = 1024;
+
+    // Visiteur de la décimation mettant à jour l'avancement de la décimation et capturant le maillage à chaque fois qu'un seuil de niveau
+    // de détail est franchi. Le visiteur étant copié par CGAL, les niveaux capturés sont stockés dans un conteneur référencé par pointeur
+    struct Lod_visitor : SMS::Edge_collapse_visitor_base<Surface_mesh>{
+        Lod_visitor(const std::vector<double>& ratios, std::vector<Mesh_level>& levels, const double stop_ratio, Progress& progress)
+            : m_ratios(&ratios), m_levels(&levels), m_stop_ratio(stop_ratio), m_progress(&progress), m_surface_mesh(nullptr), m_initial_edge_count(0), m_collapsed_edges(0) {}
+
+        void OnStarted(Surface_mesh& surface_mesh){
+            this->m_surface_mesh = &surface_mesh;
+            this->m_initial_edge_count = surface_mesh.number_of_edges();
+            this->m_progress->set_stage("edge_collapse");
+            // Les niveaux de ratio 1 correspondent au maillage d'origine (capturés avant la première contraction)
+            while(this->m_levels->size() < this->m_ratios->size() && (*this->m_ratios)[this->m_levels->size()] >= 1.0){
+                this->m_levels->push_back(SurfaceMeshSimplification::extract_level(surface_mesh, (*this->m_ratios)[this->m_levels->size()]));
+            }
+        }
+
+        void OnCollapsed(const Profile&, const vertex_descriptor&){
+            const double current_edge_count = static_cast<double>(this->m_surface_mesh->number_of_edges());
+            // Capture de tous les niveaux dont le seuil vient d'être franchi (même critère que le prédicat d'arrêt Edge_count_ratio_stop_predicate)
+            while(this->m_levels->size() < this->m_ratios->size() && current_edge_count < (*this->m_ratios)[this->m_levels->size()] * this->m_initial_edge_count){
+                this->m_levels->push_back(SurfaceMeshSimplification::extract_level(*this->m_surface_mesh, (*this->m_ratios)[this->m_levels->size()]));
+            }
+            // Avancement : fraction des arêtes à contracter qui l'ont été
+            if(++this->m_collapsed_edges % PROGRESS_COLLAPSES_INTERVAL == 0){
+                const double edges_to_collapse = (1.0 - this->m_stop_ratio) * this->m_initial_edge_count;
+                this->m_progress->set_counter("collapsed_edges", static_cast<int64_t>(this->m_collapsed_edges));
+                this->m_progress->set_counter("edges", static_cast<int64_t>(current_edge_count));
+                this->m_progress->set_fraction(edges_to_collapse > 0.0 ? (this->m_initial_edge_count - current_edge_count) / edges_to_collapse : 1.0);
+            }
+        }
+
+        // Fin de la décimation (nombre d'arêtes cible atteint, plus aucune arête contractable ou arrêt demandé) : l'avancement est complet
+        // même si aucune arête n'a été contractée ou si le nombre de contractions n'est pas un multiple de l'intervalle de mise à jour
+        void OnFinished(Surface_mesh& surface_mesh){
+            this->m_progress->set_counter("collapsed_edges", static_cast<int64_t>(this->m_collapsed_edges));
+            this->m_progress->set_counter("edges", static_cast<int64_t>(surface_mesh.number_of_edges()));
+            this->m_progress->set_fraction(1.0);
+        }
+
+        const std::vector<double>* m_ratios;
+        std::vector<Mesh_level>* m_levels;
+        double m_stop_ratio;
+        Progress* m_progress;
+        Surface_mesh* m_surface_mesh;
+        std::size_t m_initial_edge_count;
+        std::size_t m_collapsed_edges;
+    };
+
+    // Prédicat d'arrêt de la décimation : nombre d'arêtes cible atteint (Edge_count_ratio_stop_predicate), annulation demandée ou temps imparti
+    // dépassé. Dans ces deux derniers cas, la décimation s'arrête sur le maillage (valide) obtenu jusqu'ici
+    struct Progress_stop_predicate{
+        Progress_stop_predicate(const double ratio, const Progress& progress) : m_ratio_stop(ratio), m_progress(&progress) {}
+
+        template<typename F, typename Profile>
+        bool operator()(const F& current_cost, const Profile& profile, const std::size_t initial_edge_count, const std::size_t current_edge_count) const{
+            return this->m_ratio_stop(current_cost, profile, initial_edge_count, current_edge_count) || this->m_progress->should_stop();
+        }
+
+        SMS::Edge_count_ratio_stop_predicate<Surface_mesh> m_ratio_stop;
+        const Progress* m_progress;
+    };
+
+    // Lecture de la liste des ratios des niveaux de détail (chaîne de caractères "0.5, 0.25, 0.1" ou séquence de nombres)
+    std::vector<double> parse_lod_ratios(const py::handle& value){
+        std::vector<double> ratios;
+        if(py::isinstance<py::str>(value)){
+            std::string text = value.cast<std::string>();
+            std::replace(text.begin(), text.end(), ',', ' ');
+            std::replace(text.begin(), text.end(), ';', ' ');
+            std::istringstream stream(text);
+            double ratio;
+            while(stream >> ratio){
+                ratios.push_back(ratio);
+            }
+            if(!stream.eof()){
+                throw std::invalid_argument("La liste des ratios des niveaux de détail est invalide : " + value.cast<std::string>());
+            }
+        }else{
+            ratios = value.cast<std::vector<double>>();
+        }
+        for(const double ratio : ratios){
+            if(ratio <= 0.0 || ratio > 1.0){
+                throw std::invalid_argument("Les ratios des niveaux de détail doivent être compris dans l'intervalle ]0, 1].");
+            }
+        }
+        // Les niveaux sont capturés du plus détaillé au moins détaillé
+        std::sort(ratios.begin(), ratios.end(), std::greater<double>());
+        ratios.erase(std::unique(ratios.begin(), ratios.end()), ratios.end());
+        return ratios;
+    }
+}
+
+SurfaceMeshSimplification::SurfaceMeshSimplification(const py::dict& data) : m_session(), m_surface_mesh(), m_lod_ratios(), m_levels(), m_time_budget_reached(false),
+                                                                             m_protect_borders(false)
+{
+    //On caste toutes les données provenant de notre structure de données python vers des types C++
+    py::list params = data["params"].cast<py::list>();
+    py::dict algorithm_parameters = params[0].cast<py::dict>();
+    this->m_stop_ratio = py::float_(algorithm_parameters["decimation_factor"]);
+    // Récupération éventuelle des ratios des niveaux de détail à produire en une seule passe de décimation
+    if(algorithm_parameters.contains("lod_ratios")){
+        this->m_lod_ratios = parse_lod_ratios(algorithm_parameters["lod_ratios"]);
+    }
+    if(data.contains("protect_borders")){
+        this->m_protect_borders = py::bool_(data["protect_borders"]);
+    }
+
+    // Récupération de la session du maillage (le maillage n'est construit que s'il n'est pas déjà présent dans la session)
+    this->m_session = MeshSession::from_data(data, &this->m_profiler);
+    this->m_profiler.set_counter("faces_in", static_cast<int64_t>(this->m_session->number_of_input_faces()));
+}
+
+void SurfaceMeshSimplification::compute_algorithm()
+{
+    /*
+    if(!CGAL::is_triangle_mesh(this->m_surface_mesh))
+    {
+        throw std::runtime_error("Le maillage n"est pas composé que de faces triangulaires...");
+    }*/
+    try{
+        this->m_progress.check();
+        // La décimation modifiant le maillage, elle est effectuée sur une copie du maillage de la session
+        // (la copie des tableaux de propriétés est bien moins coûteuse que la reconstruction de la structure demi-arêtes)
+        {
+            Profiler::Scope copy_scope(this->m_profiler, "compute.copy");
+            std::lock_guard<std::mutex> lock(this->m_session->mutex());
+            this->m_surface_mesh = this->m_session->mesh();
+        }
+        Profiler::Scope edge_collapse_scope(this->m_profiler, "compute.edge_collapse");
+        int r = 0;
+        // Contraction des arêtes jusqu'à l'arrêt de la décimation. Lorsque les bords sont protégés, leurs arêtes sont contraintes (jamais
+        // contractées) et une arête ayant une extrémité sur un bord est contractée vers cette extrémité (placement contraint) : les sommets
+        // des bords conservent leurs coordonnées
+        auto collapse_edges = [this](Progress_stop_predicate& stop, Lod_visitor& visitor){
+            if(!this->m_protect_borders){
+                return SMS::edge_collapse(this->m_surface_mesh, stop, CGAL::parameters::visitor(visitor));
+            }
+            Edge_bool_map is_constrained = this->m_surface_mesh.add_property_map<edge_descriptor, bool>("e:is_constrained", false).first;
+            for(const auto& edge : this->m_surface_mesh.edges()){
+                is_constrained[edge] = this->m_surface_mesh.is_border(edge);
+            }
+            SMS::Constrained_placement<SMS::LindstromTurk_placement<Surface_mesh>, Edge_bool_map> placement(is_constrained);
+            return SMS::edge_collapse(this->m_surface_mesh, stop, CGAL::parameters::visitor(visitor)
+                                                                                   .edge_is_constrained_map(is_constrained)
+                                                                                   .get_placement(placement));
+        };
+        // Ratio cible de la décimation (plus petit ratio des niveaux de détail). Un ratio supérieur ou égal à 1 ne demande aucune contraction :
+        // la décimation n'est pas lancée (le critère du prédicat d'arrêt, nombre d'arêtes strictement inférieur au ratio du nombre initial,
+        // ne serait vérifié qu'après une première contraction) et le maillage est retourné tel quel
+        const double target_ratio = this->m_lod_ratios.empty() ? this->m_stop_ratio : this->m_lod_ratios.back();
+        if(target_ratio >= 1.0){
+            this->m_progress.set_counter("collapsed_edges", 0);
+            this->m_progress.set_fraction(1.0);
+            for(const double ratio : this->m_lod_ratios){
+                this->m_levels.push_back(extract_level(this->m_surface_mesh, ratio));
+            }
+            if(this->m_lod_ratios.empty()){
+                this->m_levels.push_back(extract_level(this->m_surface_mesh, this->m_stop_ratio));
+            }
+        }
+        else if(this->m_lod_ratios.empty()){
+            // In this example, the simplification stops when the number of undirected edges
+            // drops below 10% of the initial count
+            Progress_stop_predicate stop(this->m_stop_ratio, this->m_progress);
+            Lod_visitor visitor(this->m_lod_ratios, this->m_levels, this->m_stop_ratio, this->m_progress);
+            r = collapse_edges(stop, visitor);
+            // L'annulation interrompt l'algorithme sans résultat (le temps imparti dépassé conserve le maillage obtenu jusqu'ici)
+            if(this->m_progress.is_cancelled()){
+                this->m_progress.check();
+            }
+            // Un seul niveau de détail : le maillage final
+            this->m_levels.push_back(extract_level(this->m_surface_mesh, this->m_stop_ratio));
+        }
+        else{
+            // Une seule séquence de contractions d'arêtes jusqu'au plus petit ratio, le maillage étant capturé à chaque seuil franchi
+            Progress_stop_predicate stop(this->m_lod_ratios.back(), this->m_progress);
+            Lod_visitor visitor(this->m_lod_ratios, this->m_levels, this->m_lod_ratios.back(), this->m_progress);
+            r = collapse_edges(stop, visitor);
+            if(this->m_progress.is_cancelled()){
+                this->m_progress.check();
+            }
+            // Les niveaux dont le seuil n'a pas été atteint (plus aucune arête ne pouvant être contractée ou temps imparti dépassé) correspondent au maillage final
+            while(this->m_levels.size() < this->m_lod_ratios.size()){
+                this->m_levels.push_back(extract_level(this->m_surface_mesh, this->m_lod_ratios[this->m_levels.size()]));
+            }
+        }
+        this->m_time_budget_reached = this->m_progress.is_deadline_reached();
+        this->m_profiler.set_counter("time_budget_reached", this->m_time_budget_reached ? 1 : 0);
+        this->m_profiler.set_counter("collapsed_edges", r);
+        this->m_profiler.set_counter("protected_borders", this->m_protect_borders ? 1 : 0);
+        this->m_profiler.set_counter("faces_out", static_cast<int64_t>(this->m_surface_mesh.number_of_faces()));
+        this->m_profiler.set_counter("levels", static_cast<int64_t>(this->m_levels.size()));
+    }catch(const AlgorithmCancelled&){
+        throw;
+    }catch(const std::exception& e){
+        std::cerr << "Une erreur s'est produite lors de l'éxécution de l'algorithme de décimation de CGAL : " << e.what() << std::endl;
+        throw;
+    }
+}
+
+void SurfaceMeshSimplification::export_results()
+{
+    if(this->m_lod_ratios.empty()){
+        Mesh_level& level = this->m_levels.front();
+        //Ajout des tableaux dans la structure de données qui sera retournée à Blender (les tableaux numpy prennent possession des données des conteneurs)
+        this->m_output_data["vertices"] = MeshBuffer::to_numpy(std::move(level.vertices));
+        this->m_output_data["faces"] = MeshBuffer::to_numpy(std::move(level.faces));
+        if(this->m_time_budget_reached){
+            this->m_output_data["result_infos"] = (boost::format("Temps imparti (%1% s) dépassé : décimation interrompue à %2% faces.")
+                                                   % this->m_progress.time_budget() % this->m_surface_mesh.number_of_faces()).str();
+            this->m_output_data["output_result"] = std::array<std::string,2>{"replace_mesh", "message"};
+        }
+        else{
+            this->m_output_data["output_result"] = std::array<std::string,1>{"replace_mesh"};
+        }
+    }
+    else{
+        // Chaque niveau de détail est retourné sous la forme d'un dictionnaire contenant son ratio ainsi que ses sommets et ses faces
+        py::list levels;
+        std::string infos = "Niveaux de détail obtenus :";
+        for(size_t i = 0; i < this->m_levels.size(); i++){
+            Mesh_level& level = this->m_levels[i];
+            const size_t number_of_faces = level.faces.size() / 3;
+            py::dict level_data;
+            level_data["ratio"] = level.ratio;
+            level_data["name_suffix"] = "_LOD" + std::to_string(i + 1);
+            level_data["vertices"] = MeshBuffer::to_numpy(std::move(level.vertices));
+            level_data["faces"] = MeshBuffer::to_numpy(std::move(level.faces));
+            levels.append(level_data);
+            infos += (boost::format("\n- LOD%1% (ratio %2%) : %3% faces") % (i + 1) % level.ratio % number_of_faces).str();
+        }
+        if(this->m_time_budget_reached){
+            infos += (boost::format("\nTemps imparti (%1% s) dépassé : les derniers niveaux correspondent au maillage obtenu à l'arrêt de la décimation.") % this->m_progress.time_budget()).str();
+        }
+        this->m_output_data["levels"] = levels;
+        this->m_output_data["result_infos"] = infos;
+        this->m_output_data["output_result"] = std::array<std::string,2>{"lod_meshes", "message"};
+    }
+}
+
+Mesh_level SurfaceMeshSimplification::extract_level(const Surface_mesh& surface_mesh, const double ratio)
+{
+    Mesh_level level;
+    level.ratio = ratio;
+
+    // Mise à jour des indices des sommets restants dans le maillage de sorte à ce que le premier sommet du maillage restant ait bien l"indice 0, le second l"indice 1, ...
+    const std::vector<int> vertex_reindexing = get_vertex_reindexing(surface_mesh);
+
+    //Création d'un tableau qui va contenir les coordonnées de nos nouveaux résultant de l'algorithme de décimation
+    // Réservation de l'espace mémoire nécessaire
+    level.vertices.reserve(surface_mesh.number_of_vertices() * 3);
+
+    //utilisation de propriétés : "location" référence les positions
+    const auto& location = surface_mesh.points();
+
+    for(const auto& vertex : surface_mesh.vertices()) {
+        // Récupération des coordonnées du sommet courant
+        const auto& coords = location[vertex];
+        level.vertices.push_back(coords.x());
+        level.vertices.push_back(coords.y());
+        level.vertices.push_back(coords.z());
+    }
+
+    //Création d'un tableau qui va contenir les indices des sommets des faces résultant de l'algorithme de décimation
+    level.faces.reserve(surface_mesh.number_of_faces() * 3);
+
+    // Parcours des faces du maillage
+    for(const auto& face : surface_mesh.faces()) {
+        // Parcours des sommets appartenant à la face courante
+        for(const auto& vertex : vertices_around_face(surface_mesh.halfedge(face), surface_mesh)) {
+            // ajout du nouvel indice (obtenu par ré-indexation) du sommet dans le conteneur des indices de face
+            level.faces.push_back(vertex_reindexing[vertex.idx()]);
+        }
+    }
+    return level;
+}
+
+std::vector<int> SurfaceMeshSimplification::get_vertex_reindexing(const Surface_mesh& surface_mesh)
+{   
+    // Tableau indexé par l'indice des sommets du maillage (y compris les sommets supprimés lors de la décimation, qui conservent leur emplacement
+    // tant que le maillage n'a pas été nettoyé) : l'accès au nouvel indice d'un sommet se fait en temps constant
+    std::vector<int> vertex_reindexing(surface_mesh.number_of_vertices() + surface_mesh.number_of_removed_vertices(), -1);
+    // Pour ré-indexer le maillage, nous allons parcourir l"ensemble des sommets du maillage
+    // et associer pour chacun d"entre eux un indice qui ira de 0 au nombre de sommets du maillage - 1
+    int new_index = 0;
+    for (const auto& vertex : surface_mesh.vertices()) {
+        vertex_reindexing[vertex.idx()] = new_index++;
+    }
+
+    return vertex_reindexing;
+}
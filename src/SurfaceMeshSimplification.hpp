@@ -1,34 +1,58 @@
-#ifndef SURFACEMESHSIMPLIFICATION_HPP
-#define SURFACEMESHSIMPLIFICATION_HPP
-
-#include "Algorithm.hpp"
-#include <map>
-
-#include <CGAL/Simple_cartesian.h>
-#include <CGAL/Surface_mesh.h>
-#include <CGAL/Surface_mesh_simplification/edge_collapse.h>
-#include <CGAL/Surface_mesh_simplification/Policies/Edge_collapse/Edge_count_ratio_stop_predicate.h>
-#include <CGAL/boost/graph/generators.h>
-
-namespace simplification {
-    typedef CGAL::Simple_cartesian<double>          Kernel;
-    typedef Kernel::Point_3                         Point_3;
-    typedef CGAL::Surface_mesh<Point_3>             Surface_mesh;
-    typedef Surface_mesh::Vertex_index              vertex_descriptor;
-    typedef Surface_mesh::Face_index                face_descriptor;
-}
-
-class SurfaceMeshSimplification : public Algorithm{
-public:
-    explicit SurfaceMeshSimplification(const pybind11::dict& data);
-    void compute_algorithm() override;
-    void update_vertex_coordinates();
-    void update_face_indices(std::map<simplification::vertex_descriptor, int>& vertex_reindexing);
-    std::map<simplification::vertex_descriptor, int> get_vertex_reindexing();
-
-private:
-    simplification::Surface_mesh m_surface_mesh;
-    double m_stop_ratio;
-};
-
-#endif
+#ifndef SURFACEMESHSIMPLIFICATION_HPP
+#define SURFACEMESHSIMPLIFICATION_HPP
+
+#include "Algorithm.hpp"
+#include "MeshSession.hpp"
+#include <vector>
+#include <memory>
+
+#include <CGAL/Surface_mesh_simplification/edge_collapse.h>
+#include <CGAL/Surface_mesh_simplification/Edge_collapse_visitor_base.h>
+#include <CGAL/Surface_mesh_simplification/Policies/Edge_collapse/Edge_count_ratio_stop_predicate.h>
+#include <CGAL/Surface_mesh_simplification/Policies/Edge_collapse/LindstromTurk_placement.h>
+#include <CGAL/Surface_mesh_simplification/Policies/Edge_collapse/Constrained_placement.h>
+#include <CGAL/boost/graph/generators.h>
+
+namespace simplification {
+    typedef mesh_session::Kernel                    Kernel;
+    typedef mesh_session::Point_3                   Point_3;
+    typedef mesh_session::Surface_mesh              Surface_mesh;
+    typedef Surface_mesh::Vertex_index              vertex_descriptor;
+    typedef Surface_mesh::Edge_index                edge_descriptor;
+    typedef Surface_mesh::Face_index                face_descriptor;
+    typedef Surface_mesh::Property_map<edge_descriptor, bool>   Edge_bool_map;
+
+    // Niveau de détail obtenu lors de la décimation (coordonnées des sommets et indices des sommets des faces ré-indexés)
+    struct Mesh_level{
+        double ratio;
+        std::vector<double> vertices;
+        std::vector<int> faces;
+    };
+}
+
+class SurfaceMeshSimplification : public Algorithm{
+public:
+    explicit SurfaceMeshSimplification(const pybind11::dict& data);
+    void compute_algorithm() override;
+    void export_results() override;
+    static simplification::Mesh_level extract_level(const simplification::Surface_mesh& surface_mesh, const double ratio);
+    static std::vector<int> get_vertex_reindexing(const simplification::Surface_mesh& surface_mesh);
+
+private:
+    // Session contenant le maillage d'origine (non modifié par la décimation)
+    std::shared_ptr<MeshSession> m_session;
+    // Copie du maillage de la session sur laquelle la décimation est effectuée
+    simplification::Surface_mesh m_surface_mesh;
+    double m_stop_ratio;
+    // Ratios des niveaux de détail à extraire lors d'une même passe de décimation (triés par ordre décroissant, vide si un seul niveau est demandé)
+    std::vector<double> m_lod_ratios;
+    // Niveaux de détail obtenus
+    std::vector<simplification::Mesh_level> m_levels;
+    // La décimation a été interrompue avant d'atteindre le nombre d'arêtes cible (temps imparti dépassé)
+    bool m_time_budget_reached;
+    // Les bords du maillage sont protégés (champ "protect_borders" des données) : leurs arêtes ne sont pas contractées et leurs sommets
+    // ne sont pas déplacés (maillage formé des faces sélectionnées, reporté ensuite sur le maillage complet)
+    bool m_protect_borders;
+};
+
+#endif